@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import filecmp
 import hashlib
-import io
 import json
 import logging
 from datetime import date
@@ -59,10 +59,16 @@ def audit_export(csv_path: Path, db_path: Path, report_path: Path, json_path: Pa
         has_utf8_bom = handle.read(3) == b"\xef\xbb\xbf"
 
     csv_df = pd.read_csv(csv_path, dtype=str, keep_default_na=False, low_memory=False)
-    fresh_csv_bytes, fresh_csv_rows = exporter.export_full_dataset_csv_bytes(query_sql)
-    fresh_csv_df = pd.read_csv(
-        io.BytesIO(fresh_csv_bytes), dtype=str, keep_default_na=False, low_memory=False
-    )
+    fresh_csv_path, fresh_csv_rows = exporter.export_full_dataset_to_file(query_sql, "csv")
+    try:
+        fresh_csv_df = pd.read_csv(
+            fresh_csv_path, dtype=str, keep_default_na=False, low_memory=False
+        )
+        fresh_csv_size = fresh_csv_path.stat().st_size
+        fresh_csv_sha256 = _sha256_file(fresh_csv_path)
+        fresh_csv_matches_file = filecmp.cmp(fresh_csv_path, csv_path, shallow=False)
+    finally:
+        fresh_csv_path.unlink(missing_ok=True)
 
     with duckdb.connect(db_path.as_posix(), read_only=True) as con:
         warehouse_counts = con.execute(
@@ -329,9 +335,9 @@ def audit_export(csv_path: Path, db_path: Path, report_path: Path, json_path: Pa
         "row_count_matches_query": len(csv_df) == len(query_df) == query_count,
         "columns_match_query": list(csv_df.columns) == list(query_df.columns),
         "fresh_streaming_export_rows": fresh_csv_rows,
-        "fresh_streaming_export_size_bytes": len(fresh_csv_bytes),
-        "fresh_streaming_export_sha256": hashlib.sha256(fresh_csv_bytes).hexdigest(),
-        "fresh_streaming_export_matches_file": fresh_csv_bytes == csv_path.read_bytes(),
+        "fresh_streaming_export_size_bytes": fresh_csv_size,
+        "fresh_streaming_export_sha256": fresh_csv_sha256,
+        "fresh_streaming_export_matches_file": fresh_csv_matches_file,
         "csv_cells_match_fresh_streaming_export": _frame_digest(csv_df)
         == _frame_digest(fresh_csv_df),
         "cell_digest_matches_query": _frame_digest(csv_df) == _frame_digest(query_df),
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the hyperlink Excel export against the previous openpyxl path.
+
+The previous path wrote the frame with ``df.to_excel`` and then set
+``.hyperlink`` and a ``Font`` on every URL cell one by one. The current
+path (``utils.excel_writer.HyperlinkExcelWriter``) writes values and
+HYPERLINK cells in one write-only pass.
+
+Uses the "Bills & Legislation (Full Details)" result from the warehouse when
+it exists, otherwise a synthetic bills-shaped frame:
+    python scripts/benchmark_excel_export.py
+    python scripts/benchmark_excel_export.py --rows 50000 --db data/warehouse.duckdb
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import duckdb
+import pandas as pd
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+from data.queries.predefined_queries import get_query_sql  # noqa: E402
+from utils.excel_writer import HyperlinkExcelWriter  # noqa: E402
+
+
+def legacy_excel_with_hyperlinks(df: pd.DataFrame) -> io.BytesIO:
+    """The cell-by-cell path DocumentHandler used before HyperlinkExcelWriter."""
+    from openpyxl.styles import Font
+
+    buffer = io.BytesIO()
+    url_columns = [col for col in df.columns if "URL" in col or "Link" in col]
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False, sheet_name="Results")
+        worksheet = writer.sheets["Results"]
+        for col_idx, col_name in enumerate(df.columns, start=1):
+            if col_name in url_columns:
+                for row_idx, url in enumerate(df[col_name], start=2):
+                    if pd.notna(url) and url:
+                        cell = worksheet.cell(row=row_idx, column=col_idx)
+                        cell.value = "Open Link"
+                        cell.hyperlink = str(url)
+                        cell.font = Font(color="0563C1", underline="single")
+    buffer.seek(0)
+    return buffer
+
+
+def load_bills(db_path: Path, rows: int) -> pd.DataFrame:
+    if db_path.exists():
+        sql = get_query_sql("Bills & Legislation (Full Details)").strip().rstrip(";")
+        sql = sql.rsplit("LIMIT", 1)[0] + f"LIMIT {rows}"
+        with duckdb.connect(str(db_path), read_only=True) as con:
+            df = con.execute(sql).df()
+        if len(df) >= rows:
+            return df
+        print(f"Warehouse has only {len(df):,} bills; using synthetic rows")
+    return synthetic_bills(rows)
+
+
+def synthetic_bills(rows: int) -> pd.DataFrame:
+    ids = range(rows)
+    return pd.DataFrame(
+        {
+            "BillID": list(ids),
+            "KnessetNum": [25 - (i % 5) for i in ids],
+            "BillName": [f"הצעת חוק מספר {i}" for i in ids],
+            "BillStatusDesc": ["עברה בקריאה ראשונה"] * rows,
+            "BillPrimaryDocumentURL": [
+                f"https://fs.knesset.gov.il/25/law/25_lst_{i}.pdf" if i % 4 else None for i in ids
+            ],
+            "BillKnessetWebsiteURL": [
+                f"https://main.knesset.gov.il/Activity/Legislation/Laws/Pages/LawBill.aspx?t=lawsuggestionssearch&lawitemid={i}"
+                for i in ids
+            ],
+            "BillDocumentLinks": [f"https://fs.knesset.gov.il/25/law/{i}.doc" for i in ids],
+            "BillSubmitDate": pd.date_range("2015-01-01", periods=rows, freq="h"),
+            "BillDocumentCount": [i % 7 for i in ids],
+        }
+    )
+
+
+def measure(label: str, build: Callable[[], io.BytesIO]) -> tuple[float, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = len(build().getvalue())
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {elapsed:8.2f}s  peak {peak / 2**20:8.1f} MiB  file {size / 2**20:6.1f} MiB")
+    return elapsed, peak, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--db", type=Path, default=_REPO_ROOT / "data" / "warehouse.duckdb")
+    args = parser.parse_args()
+
+    df = load_bills(args.db, args.rows)
+    print(f"Benchmarking {len(df):,} rows x {len(df.columns)} columns")
+
+    legacy_time, legacy_peak, _ = measure("to_excel + cell loop", lambda: legacy_excel_with_hyperlinks(df))
+    fast_time, fast_peak, _ = measure("HyperlinkExcelWriter", lambda: HyperlinkExcelWriter().to_buffer(df))
+
+    print(f"Speedup: {legacy_time / fast_time:.1f}x, peak memory {fast_peak / legacy_peak:.0%} of before")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
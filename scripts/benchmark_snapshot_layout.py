@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark consumer-style reads of snapshot files before and after layout tuning.
+
+Each snapshot is exported twice from the warehouse: once with the bare
+``(FORMAT PARQUET, COMPRESSION ZSTD)`` layout in the query's own order, and
+once with its ``SNAPSHOT_LAYOUTS`` entry. Both files are then read the way the
+API does — a point lookup on ``mk_id`` / ``vote_id`` and a ``knesset_num``
+range — and the median read time, file size and row groups are reported:
+    python scripts/benchmark_snapshot_layout.py
+    python scripts/benchmark_snapshot_layout.py --snapshots mk_votes mk_bills --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+from data.snapshots.exporter import SNAPSHOT_LAYOUTS, SNAPSHOTS, export_snapshot  # noqa: E402
+from data.snapshots.layout import DEFAULT_LAYOUT  # noqa: E402
+
+_POINT_COLUMNS = ("mk_id", "vote_id")
+
+
+def consumer_reads(con: duckdb.DuckDBPyConnection, path: Path) -> dict[str, str]:
+    """Point and range predicates the API issues, with values from the file."""
+    columns = {r[0] for r in con.execute(f"DESCRIBE SELECT * FROM '{path}'").fetchall()}
+    reads = {}
+    for column in _POINT_COLUMNS:
+        if column in columns:
+            (value,) = con.execute(
+                f"SELECT {column} FROM '{path}' WHERE {column} IS NOT NULL "
+                f"ORDER BY {column} LIMIT 1 OFFSET (SELECT COUNT(*) // 2 FROM '{path}')"
+            ).fetchone() or (None,)
+            if value is not None:
+                reads[f"{column} = {value}"] = (
+                    f"SELECT * FROM '{path}' WHERE {column} = {value}"
+                )
+    if "knesset_num" in columns:
+        (high,) = con.execute(f"SELECT MAX(knesset_num) FROM '{path}'").fetchone()
+        if high is not None:
+            reads[f"knesset_num >= {high - 1}"] = (
+                f"SELECT * FROM '{path}' WHERE knesset_num >= {high - 1}"
+            )
+    return reads
+
+
+def time_read(con: duckdb.DuckDBPyConnection, sql: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        con.execute(sql).arrow().read_all()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def row_groups(con: duckdb.DuckDBPyConnection, path: Path) -> int:
+    (count,) = con.execute(
+        f"SELECT COUNT(DISTINCT row_group_id) FROM parquet_metadata('{path}')"
+    ).fetchone()
+    return int(count)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--warehouse", type=Path, default=_REPO_ROOT / "data" / "warehouse.duckdb"
+    )
+    parser.add_argument("--snapshots", nargs="+", default=sorted(SNAPSHOT_LAYOUTS))
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if not args.warehouse.exists():
+        print(f"warehouse not found: {args.warehouse}", file=sys.stderr)
+        return 2
+
+    queries = dict(SNAPSHOTS)
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        duckdb.connect(str(args.warehouse), read_only=True) as con,
+    ):
+        for name in args.snapshots:
+            layouts = {
+                "before": DEFAULT_LAYOUT,
+                "after": SNAPSHOT_LAYOUTS.get(name, DEFAULT_LAYOUT),
+            }
+            paths = {}
+            for label, layout in layouts.items():
+                out = Path(tmp) / label
+                out.mkdir(exist_ok=True)
+                entry = export_snapshot(con, name, queries[name], out, layout)
+                paths[label] = out / f"{name}.parquet"
+                print(
+                    f"{name} [{label}]: {entry.rows:,} rows, {entry.bytes / 2**20:.1f} MiB, "
+                    f"{row_groups(con, paths[label])} row groups"
+                )
+
+            reader = duckdb.connect(":memory:")
+            for read, sql in consumer_reads(reader, paths["before"]).items():
+                before = time_read(reader, sql, args.repeat)
+                after = time_read(
+                    reader,
+                    sql.replace(str(paths["before"]), str(paths["after"])),
+                    args.repeat,
+                )
+                print(
+                    f"  {read:<24} before {before * 1000:8.2f} ms  after {after * 1000:8.2f} ms  "
+                    f"({before / after:.1f}x)"
+                )
+            reader.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
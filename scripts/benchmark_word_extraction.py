@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark in-process Word text extraction against the ``textutil`` path.
+
+``extract_text`` used to spawn macOS ``textutil`` for every .doc/.docx
+file; it now reads them in-process (``data.recurring_bills.word_text``).
+This runs both over the cached bill documents and reports time per file,
+how many files each path could read, and how often the two agree once
+whitespace is normalized. Where ``textutil`` is not installed (Linux),
+only the in-process timings are shown.
+
+    python scripts/benchmark_word_extraction.py
+    python scripts/benchmark_word_extraction.py --limit 200 --cache-dir data/external/knesset_docs
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+from data.recurring_bills.knesset_docs import _textutil_text  # noqa: E402
+from data.recurring_bills.word_text import WordExtractionError, word_text  # noqa: E402
+
+
+def in_process(path: Path) -> str | None:
+    try:
+        return word_text(path)
+    except WordExtractionError:
+        return None
+
+
+def measure(label: str, extract: Callable[[Path], str | None], paths: list[Path]) -> tuple[float, list]:
+    started = time.perf_counter()
+    texts = [extract(path) for path in paths]
+    elapsed = time.perf_counter() - started
+    read = sum(text is not None for text in texts)
+    print(
+        f"{label:<12} {elapsed:8.2f}s  {elapsed / len(paths) * 1000:7.1f} ms/file  "
+        f"read {read:,}/{len(paths):,}"
+    )
+    return elapsed, texts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cache-dir", type=Path, default=_REPO_ROOT / "data" / "external" / "knesset_docs")
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args()
+
+    paths = sorted(p for p in args.cache_dir.glob("*") if p.suffix.lower() in (".doc", ".docx"))[: args.limit]
+    if not paths:
+        print(f"No .doc/.docx files in {args.cache_dir}; run scripts/scan_all_bills.py first")
+        return 1
+    print(f"Benchmarking {len(paths):,} Word documents from {args.cache_dir}")
+
+    fast_time, fast_texts = measure("in-process", in_process, paths)
+    if shutil.which("textutil") is None:
+        print("textutil not installed; skipping the subprocess path")
+        return 0
+    slow_time, slow_texts = measure("textutil", _textutil_text, paths)
+
+    both = [(a, b) for a, b in zip(fast_texts, slow_texts) if a is not None and b is not None]
+    agree = sum(" ".join(a.split()) == " ".join(b.split()) for a, b in both)
+    print(f"Speedup: {slow_time / fast_time:.1f}x, identical text on {agree:,}/{len(both):,} files both read")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@
     PYTHONPATH="./src" python scripts/scan_all_bills.py         # K1-K25
     PYTHONPATH="./src" python scripts/scan_all_bills.py --knessets 1 2 3
     PYTHONPATH="./src" python scripts/scan_all_bills.py --force # re-scan all
+    PYTHONPATH="./src" python scripts/scan_all_bills.py --workers 8  # classify on 8 cores
 """
 
 from __future__ import annotations
@@ -30,6 +31,10 @@
 
 import duckdb  # noqa: E402
 
+from data.recurring_bills.doc_download import (  # noqa: E402
+    DEFAULT_DOWNLOAD_WORKERS,
+    DEFAULT_REQUESTS_PER_S,
+)
 from data.recurring_bills.full_scan import (  # noqa: E402
     _default_progress_cb,
     build_doc_based_full,
@@ -70,8 +75,12 @@ def main() -> int:
     p.add_argument("--knessets", type=int, nargs="+",
                    default=list(range(1, 26)),
                    help="Knessets to scan (default: 1-25)")
-    p.add_argument("--delay", type=float, default=0.3,
-                   help="Seconds between fresh downloads")
+    p.add_argument("--download-workers", type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+                   help="Concurrent document downloads")
+    p.add_argument("--rate", type=float, default=DEFAULT_REQUESTS_PER_S,
+                   help="Maximum download requests per second (all workers)")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Processes classifying bills in parallel (default: 1)")
     p.add_argument("--force", action="store_true",
                    help="Re-scan Knessets already fully covered")
     p.add_argument("--log-level", default="INFO")
@@ -100,7 +109,9 @@ def main() -> int:
             warehouse_path=args.db,
             cache_dir=args.cache_dir,
             knessets=[k],
-            delay_s=args.delay,
+            download_workers=args.download_workers,
+            requests_per_s=args.rate,
+            workers=args.workers,
             progress_cb=_default_progress_cb,
         )
         write_full_scan_table(df, db_path=args.db)
@@ -7,6 +7,7 @@
     from api.error_handling import ErrorCategory, categorize_error
 """
 
+from .adaptive_paging import AdaptivePageSize
 from .circuit_breaker import CircuitBreaker
 
-__all__ = ["CircuitBreaker"]
\ No newline at end of file
+__all__ = ["AdaptivePageSize", "CircuitBreaker"]
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Adaptive ``$top`` sizing for paged OData downloads."""
+
+from typing import Optional
+
+from config.api import APIConfig
+
+
+class AdaptivePageSize:
+    """Grow the page size while requests stay fast, shrink it when they do not.
+
+    The size doubles after ``grow_after`` consecutive pages that each came
+    back within ``target_latency`` seconds and halves on a slow page or a
+    failed request (typically a timeout), always staying within
+    ``[minimum, maximum]``. If the server returns fewer rows than requested
+    for a page that is not the last one it is capping ``$top``; ``cap``
+    lowers the ceiling to that size so the controller stops asking for more.
+    """
+
+    def __init__(
+        self,
+        initial: Optional[int] = None,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        grow_after: Optional[int] = None,
+    ):
+        start = initial or APIConfig.PAGE_SIZE
+        # A deliberately small initial size also lowers the floor.
+        self.minimum = min(minimum or APIConfig.MIN_PAGE_SIZE, start)
+        self.maximum = max(self.minimum, maximum or APIConfig.MAX_PAGE_SIZE)
+        self.target_latency = target_latency or APIConfig.PAGE_LATENCY_TARGET
+        self.grow_after = grow_after or APIConfig.PAGE_GROW_AFTER
+        self._size = min(start, self.maximum)
+        self._fast_streak = 0
+
+    @property
+    def current(self) -> int:
+        """Page size to request next."""
+        return self._size
+
+    def record_success(self, latency: float) -> None:
+        """Account for a page that arrived after ``latency`` seconds."""
+        if latency > self.target_latency:
+            self._shrink()
+            return
+        self._fast_streak += 1
+        if self._fast_streak >= self.grow_after:
+            self._size = min(self._size * 2, self.maximum)
+            self._fast_streak = 0
+
+    def record_failure(self) -> None:
+        """Account for a failed or timed-out page request."""
+        self._shrink()
+
+    def cap(self, served: int) -> None:
+        """The server returned only ``served`` rows for a full page."""
+        if served < 1:
+            return
+        self.maximum = max(self.minimum, min(self.maximum, served))
+        self._size = min(self._size, self.maximum)
+
+    def _shrink(self) -> None:
+        self._size = max(self._size // 2, self.minimum)
+        self._fast_streak = 0
@@ -1,11 +1,13 @@
 """OData API client for Knesset data."""
 
 import asyncio
+import json
 import sys
 import inspect
-from contextlib import contextmanager
-from math import ceil
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, cast
 from urllib.parse import urlparse
 import logging
 
@@ -17,12 +19,29 @@
 
 from config.api import APIConfig
 from config.database import DatabaseConfig
+from .adaptive_paging import AdaptivePageSize
 from .error_handling import categorize_error, ErrorCategory
 from .circuit_breaker import circuit_breaker_manager
 
 # Module-level logger for backoff handler (can't use self in decorator)
 _module_logger = logging.getLogger(__name__)
 
+# Optional faster JSON decoder (pip install "knesset-refactor[fast]")
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Receives each downloaded page in streaming mode instead of the client
+# accumulating pages in memory.
+PageHandler = Callable[[pd.DataFrame], Awaitable[None]]
+
+# Receives ``(table, page)`` for every cursor page downloaded in memory so the
+# caller can persist checkpoints while the table is still being fetched.
+CheckpointHandler = Callable[[str, pd.DataFrame], Awaitable[None]]
+
 
 def _backoff_handler(details: Details) -> None:
     """Module-level handler for logging backoff attempts with error categorization.
@@ -85,6 +104,25 @@ def __init__(self, logger_obj: Optional[logging.Logger] = None, disable_progress
         self.logger = logger_obj or logging.getLogger(__name__)
         self.config = APIConfig()
         self._disable_progress = disable_progress or not self._is_tty_available()
+        # Optional semaphore shared by every request this client makes; set by
+        # callers that run several table downloads at once.
+        self._request_budget: Optional[asyncio.Semaphore] = None
+        # Optional hook that sees every in-memory cursor page; see
+        # set_checkpoint_handler.
+        self._checkpoint_handler: Optional[CheckpointHandler] = None
+
+    def set_request_budget(self, budget: Optional[asyncio.Semaphore]) -> None:
+        """Cap in-flight requests across concurrent downloads (``None`` to lift)."""
+        self._request_budget = budget
+
+    def set_checkpoint_handler(self, handler: Optional[CheckpointHandler]) -> None:
+        """Hand each in-memory cursor page to ``handler`` as it arrives (``None`` to remove).
+
+        Pages are still accumulated and returned as usual; the handler only
+        gets the chance to persist them so an interrupted download can resume.
+        Errors raised by the handler abort the download.
+        """
+        self._checkpoint_handler = handler
 
     def _is_tty_available(self) -> bool:
         """Check if stderr is available for tqdm output."""
@@ -136,9 +174,15 @@ async def fetch_json(
         
         try:
             timeout = aiohttp.ClientTimeout(total=self.config.REQUEST_TIMEOUT)
-            async with session.get(url, timeout=timeout) as resp:
+            # The shared budget is held only for the request itself; backoff
+            # sleeps between retries happen outside it.
+            budget = self._request_budget or nullcontext()
+            async with budget, session.get(url, timeout=timeout) as resp:
                 await _raise_for_status(resp)
-                result = await resp.json(content_type=None)
+                body = await resp.read()
+                # Large pages take long enough to decode that doing it on the
+                # event loop would stall the other in-flight requests.
+                result = await asyncio.to_thread(_json_loads, body)
                 if not isinstance(result, dict):
                     raise ValueError("Unexpected JSON payload type: expected object")
                 
@@ -157,154 +201,318 @@ async def fetch_json(
             # Re-raise to trigger backoff retry
             raise
     
-    async def download_table(self, table: str, resume_state: Optional[Dict] = None) -> pd.DataFrame:
-        """Download a specific table from the OData API."""
+    @staticmethod
+    def _since_filter(since: Optional[str]) -> Optional[str]:
+        """Build the OData watermark predicate for delta downloads.
+
+        ``since`` is an ISO-8601 timestamp (``YYYY-MM-DDTHH:MM:SS``); the
+        ParliamentInfo service is OData v3, so it needs the ``datetime'...'``
+        literal form.
+        """
+        if not since:
+            return None
+        column = DatabaseConfig.WATERMARK_COLUMN
+        return f"{column}%20gt%20datetime'{since}'"
+
+    @staticmethod
+    def _select_param(table: str) -> str:
+        """``&$select=`` query fragment for tables with a declared projection."""
+        columns = DatabaseConfig.get_select_columns(table)
+        return f"&$select={','.join(columns)}" if columns else ""
+
+    async def download_table(
+        self,
+        table: str,
+        resume_state: Optional[Dict] = None,
+        since: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Download a specific table from the OData API.
+
+        When ``since`` is given only rows whose ``LastUpdatedDate`` is past
+        that timestamp are requested (delta mode).
+        """
         entity = f"{table}()"
-        self.logger.info(f"Starting download for table: {table}")
+        if since:
+            self.logger.info(f"Starting delta download for table: {table} (since {since})")
+        else:
+            self.logger.info(f"Starting download for table: {table}")
         
         async with aiohttp.ClientSession() as session:
             if DatabaseConfig.is_cursor_table(table):
-                return await self._download_cursor_table(session, table, entity, resume_state)
+                return await self._download_cursor_table(session, table, entity, resume_state, since=since)
+            else:
+                return await self._download_skip_table(session, table, entity, since=since)
+
+    async def stream_table(
+        self,
+        table: str,
+        on_page: PageHandler,
+        resume_state: Optional[Dict] = None,
+        since: Optional[str] = None,
+    ) -> int:
+        """Download a table page by page, handing each page to ``on_page``.
+
+        Nothing is accumulated here, so peak memory is bounded by what the
+        handler keeps. Errors raised by the handler abort the download.
+        Returns the number of rows delivered.
+        """
+        entity = f"{table}()"
+        delivered = 0
+
+        async def counting_handler(df: pd.DataFrame) -> None:
+            nonlocal delivered
+            await on_page(df)
+            delivered += len(df)
+
+        self.logger.info(f"Starting streaming download for table: {table}")
+        async with aiohttp.ClientSession() as session:
+            if DatabaseConfig.is_cursor_table(table):
+                await self._download_cursor_table(
+                    session, table, entity, resume_state, since=since, on_page=counting_handler
+                )
             else:
-                return await self._download_skip_table(session, table, entity)
+                await self._download_skip_table(
+                    session, table, entity, since=since, on_page=counting_handler
+                )
+        return delivered
     
     async def _download_cursor_table(
         self, 
         session: aiohttp.ClientSession, 
         table: str, 
         entity: str,
-        resume_state: Optional[Dict] = None
+        resume_state: Optional[Dict] = None,
+        since: Optional[str] = None,
+        on_page: Optional[PageHandler] = None,
     ) -> pd.DataFrame:
-        """Download table using cursor-based paging."""
+        """Download table using cursor-based paging.
+
+        Requests are pipelined: the next page is requested as soon as the
+        current page's last key is known, while the current page is turned
+        into a DataFrame on a worker thread and handed on. With ``on_page``
+        each page is handed off as it arrives and an empty DataFrame is
+        returned.
+        """
         pk, chunk_size = DatabaseConfig.get_cursor_config(table)
+        page_size = AdaptivePageSize(initial=chunk_size)
+        select_param = self._select_param(table)
         last_val = resume_state.get("last_pk", -1) if resume_state else -1
         total_rows_fetched = resume_state.get("total_rows", 0) if resume_state else 0
+        since_filter = self._since_filter(since)
         
         if last_val > -1:
             self.logger.info(f"Resuming {table} from PK {last_val} (previously fetched {total_rows_fetched:,} rows)")
-        
+
+        def page_url(after: int) -> str:
+            filter_expr = f"{pk}%20gt%20{after}"
+            if since_filter:
+                filter_expr = f"{filter_expr}%20and%20{since_filter}"
+            return (
+                f"{self.config.BASE_URL}/{entity}"
+                f"?$format=json&$top={page_size.current}"
+                f"&$filter={filter_expr}"
+                f"&$orderby={pk}%20asc"
+                f"{select_param}"
+            )
+
+        async def timed_fetch(url: str) -> Tuple[dict[str, Any], float]:
+            started = time.monotonic()
+            data = await self.fetch_json(session, url)
+            return data, time.monotonic() - started
+
         dfs: List[pd.DataFrame] = []
+        in_flight = asyncio.create_task(timed_fetch(page_url(last_val)))
         
-        with self._get_progress_bar(desc=f"Fetching {table} (cursor)", initial=total_rows_fetched) as pbar:
-            while True:
-                url = (
-                    f"{self.config.BASE_URL}/{entity}"
-                    f"?$format=json&$top={chunk_size}"
-                    f"&$filter={pk}%20gt%20{last_val}"
-                    f"&$orderby={pk}%20asc"
-                )
-                
-                try:
-                    data = await self.fetch_json(session, url)
-                except Exception as e:
-                    self.logger.error(f"Error fetching chunk for {table} (PK > {last_val}): {e}")
-                    await asyncio.sleep(5)
-                    continue
-                
-                rows = data.get("value", [])
-                if not rows:
-                    break
-                
-                current_df = pd.DataFrame.from_records(rows)
+        try:
+            with self._get_progress_bar(desc=f"Fetching {table} (cursor)", initial=total_rows_fetched) as pbar:
+                while True:
+                    try:
+                        data, latency = await in_flight
+                    except Exception as e:
+                        page_size.record_failure()
+                        self.logger.error(f"Error fetching chunk for {table} (PK > {last_val}): {e}")
+                        await asyncio.sleep(5)
+                        in_flight = asyncio.create_task(timed_fetch(page_url(last_val)))
+                        continue
+                    page_size.record_success(latency)
+                    
+                    rows = data.get("value", [])
+                    if not rows:
+                        break
 
-                # Check for empty DataFrame before accessing iloc[-1]
-                if current_df.empty:
-                    self.logger.warning(f"Empty DataFrame received for {table}, ending pagination")
-                    break
+                    # The cursor only needs the last key, so the next request
+                    # goes out before this page is converted and stored.
+                    last_val = int(rows[-1][pk])
+                    in_flight = asyncio.create_task(timed_fetch(page_url(last_val)))
 
-                dfs.append(current_df)
+                    current_df = await asyncio.to_thread(pd.DataFrame.from_records, rows)
+                    if on_page is not None:
+                        await on_page(current_df)
+                    else:
+                        dfs.append(current_df)
+                        if self._checkpoint_handler is not None:
+                            await self._checkpoint_handler(table, current_df)
 
-                # Update last_val - safe now because we checked for empty
-                last_val = int(current_df[pk].iloc[-1])
-                total_rows_fetched += len(rows)
-                pbar.update(len(rows))
+                    total_rows_fetched += len(rows)
+                    pbar.update(len(rows))
+        finally:
+            if not in_flight.done():
+                in_flight.cancel()
+                await asyncio.gather(in_flight, return_exceptions=True)
         
         self.logger.info(f"Fetched {total_rows_fetched:,} rows for {table}")
         return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
     
-    async def _download_skip_table(self, session: aiohttp.ClientSession, table: str, entity: str) -> pd.DataFrame:
-        """Download table using skip-based paging with parallel requests."""
+    async def _download_skip_table(
+        self,
+        session: aiohttp.ClientSession,
+        table: str,
+        entity: str,
+        since: Optional[str] = None,
+        on_page: Optional[PageHandler] = None,
+    ) -> pd.DataFrame:
+        """Download table using skip-based paging with parallel requests.
+
+        ``$top`` adapts to observed latency (see ``AdaptivePageSize``) and
+        rows a server-side page cap left out are fetched again, so the result
+        never depends on the server honouring the requested page size.
+        With ``on_page`` pages are handed off in arrival order rather than
+        collected, and an empty DataFrame is returned.
+        """
+        since_filter = self._since_filter(since)
+        filter_param = f"&$filter={since_filter}" if since_filter else ""
         try:
             # Get total count
-            count_url = self.config.get_count_url(entity)
+            count_url = self.config.get_count_url(entity, since_filter)
             total_records_resp = await session.get(count_url, timeout=aiohttp.ClientTimeout(total=30))
             await _raise_for_status(total_records_resp)
             total_records = int(await total_records_resp.text())
         except Exception as e:
             self.logger.warning(f"Could not get count for {table}: {e}. Using sequential download.")
-            return await self._download_sequential(session, entity)
+            return await self._download_sequential(session, entity, since=since, on_page=on_page)
         
         if total_records == 0:
             self.logger.info(f"Table {table} has 0 records.")
             return pd.DataFrame()
         
-        num_pages = ceil(total_records / self.config.PAGE_SIZE)
+        page_size = AdaptivePageSize(initial=self.config.PAGE_SIZE)
+        select_param = self._select_param(table)
+        # Ranges are claimed in order with whatever $top the controller
+        # currently allows, so they stay contiguous while their sizes vary.
+        # A page the server cut short leaves a gap that is queued for refetch.
+        next_skip = 0
+        gaps: deque[Tuple[int, int]] = deque()
+
+        def claim_range() -> Optional[Tuple[int, int]]:
+            nonlocal next_skip
+            if gaps:
+                return gaps.popleft()
+            if next_skip >= total_records:
+                return None
+            claimed = (next_skip, page_size.current)
+            next_skip += claimed[1]
+            return claimed
+
+        pages: List[Tuple[int, pd.DataFrame]] = []
 
         with self._get_progress_bar(desc=f"Fetching {table} (skip)", total=total_records) as pbar:
-            semaphore = asyncio.Semaphore(self.config.CONCURRENCY_LIMIT)
-            
-            async def fetch_page(page_index: int) -> Tuple[int, Optional[pd.DataFrame]]:
-                async with semaphore:
-                    skip_val = page_index * self.config.PAGE_SIZE
-                    page_url = f"{self.config.BASE_URL}/{entity}?$format=json&$skip={skip_val}&$top={self.config.PAGE_SIZE}"
-                    
-                    try:
-                        page_data = await self.fetch_json(session, page_url)
-                        page_rows = page_data.get("value", [])
-                        if page_rows:
-                            pbar.update(len(page_rows))
-                            return page_index, pd.DataFrame.from_records(page_rows)
-                    except Exception as e:
-                        error_category = categorize_error(e)
-                        self.logger.error(f"Error fetching page {page_index}: {error_category.value} - {e}")
-                        return page_index, None
-                    
-                    return page_index, None
-            
+
+            async def fetch_page(skip_val: int, top: int) -> Optional[pd.DataFrame]:
+                page_url = (
+                    f"{self.config.BASE_URL}/{entity}?$format=json"
+                    f"&$skip={skip_val}&$top={top}{filter_param}{select_param}"
+                )
+                started = time.monotonic()
+                try:
+                    page_data = await self.fetch_json(session, page_url)
+                    page_rows = page_data.get("value", [])
+                except Exception as e:
+                    page_size.record_failure()
+                    error_category = categorize_error(e)
+                    self.logger.error(f"Error fetching rows {skip_val}-{skip_val + top - 1}: {error_category.value} - {e}")
+                    return None
+                page_size.record_success(time.monotonic() - started)
+
+                if not page_rows:
+                    return None
+                if len(page_rows) < top and skip_val + len(page_rows) < total_records:
+                    page_size.cap(len(page_rows))
+                    gaps.append((skip_val + len(page_rows), top - len(page_rows)))
+                pbar.update(len(page_rows))
+                return pd.DataFrame.from_records(page_rows)
+
+            async def worker() -> None:
+                while (claimed := claim_range()) is not None:
+                    page_df = await fetch_page(*claimed)
+                    if page_df is None:
+                        continue
+                    if on_page is not None:
+                        # Outside the fetch try-block: a sink failure must
+                        # surface, not be logged as a dropped page.
+                        await on_page(page_df)
+                    else:
+                        pages.append((claimed[0], page_df))
+
             # Fetch all pages
-            tasks = [fetch_page(i) for i in range(num_pages)]
-            gathered = await asyncio.gather(*tasks, return_exceptions=True)
-            results = cast(List[Tuple[int, Optional[pd.DataFrame]] | BaseException], gathered)
-        
-        # Process results
-        valid_dfs: List[Tuple[int, pd.DataFrame]] = []
-        for res in results:
+            workers = [worker() for _ in range(self.config.CONCURRENCY_LIMIT)]
+            gathered = await asyncio.gather(*workers, return_exceptions=True)
+
+        for res in gathered:
             if isinstance(res, BaseException):
+                if on_page is not None:
+                    raise res
                 self.logger.error(f"Page fetch failed: {res}")
-            elif res[1] is not None:
-                valid_dfs.append((res[0], res[1]))
-        
-        valid_dfs.sort(key=lambda x: x[0])  # Sort by page index
-        final_dfs = [df for _, df in valid_dfs]
+
+        pages.sort(key=lambda x: x[0])  # Sort by row offset
+        final_dfs = [df for _, df in pages]
         
         return pd.concat(final_dfs, ignore_index=True) if final_dfs else pd.DataFrame()
     
-    async def _download_sequential(self, session: aiohttp.ClientSession, entity: str) -> pd.DataFrame:
+    async def _download_sequential(
+        self,
+        session: aiohttp.ClientSession,
+        entity: str,
+        since: Optional[str] = None,
+        on_page: Optional[PageHandler] = None,
+    ) -> pd.DataFrame:
         """Fallback sequential download method."""
         table_name = entity.replace('()', '')
+        since_filter = self._since_filter(since)
+        filter_param = f"&$filter={since_filter}" if since_filter else ""
         self.logger.info(f"Using sequential download for {table_name}")
         
         dfs: List[pd.DataFrame] = []
-        page_index = 0
+        page_size = AdaptivePageSize(initial=self.config.PAGE_SIZE)
+        select_param = self._select_param(table_name)
+        skip_val = 0
         
         with self._get_progress_bar(desc=f"Fetching {table_name} (sequential)") as pbar:
             while True:
-                skip_val = page_index * self.config.PAGE_SIZE
-                url = f"{self.config.BASE_URL}/{entity}?$format=json&$skip={skip_val}&$top={self.config.PAGE_SIZE}"
+                url = (
+                    f"{self.config.BASE_URL}/{entity}?$format=json"
+                    f"&$skip={skip_val}&$top={page_size.current}{filter_param}{select_param}"
+                )
                 
+                started = time.monotonic()
                 try:
                     data = await self.fetch_json(session, url)
                 except Exception as e:
                     error_category = categorize_error(e)
-                    self.logger.error(f"Sequential fetch failed for page {page_index}: {error_category.value} - {e}")
+                    self.logger.error(f"Sequential fetch failed at row {skip_val}: {error_category.value} - {e}")
                     break
+                page_size.record_success(time.monotonic() - started)
                 
                 rows = data.get("value", [])
                 if not rows:
                     break
                 
-                dfs.append(pd.DataFrame.from_records(rows))
+                page_df = pd.DataFrame.from_records(rows)
+                if on_page is not None:
+                    await on_page(page_df)
+                else:
+                    dfs.append(page_df)
                 pbar.update(len(rows))
-                page_index += 1
+                # Advance by what was served, which may be less than $top
+                skip_val += len(rows)
         
         return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
@@ -5,7 +5,11 @@
 
 Core API:
 - get_db_connection(): Context manager for safe database connections
+  (read-only callers share a pooled database instance, writers are serialized)
+- exclusive_database_access(): Hold the file for a write outside get_db_connection
+- invalidate_connection_pool(): Drop pooled readers after the file is replaced
 - safe_execute_query(): Execute queries with error handling
+- default_ui_notifier(): Streamlit-backed (or no-op) ui_notify callback
 - cached_query_with_connection(): Execute cached queries
 
 Diagnostics (see connection_diagnostics.py):
@@ -27,10 +31,19 @@
 import time
 import weakref
 from pathlib import Path
-from typing import Any, Callable, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
 
 import duckdb
 
+from backend.query_cache import (
+    ANY_TABLE,
+    file_identity,
+    get_query_cache,
+    record_database_write,
+    watch_database_file,
+)
+from config.settings import Settings
+
 
 # Type alias for UI notification callbacks
 # Callback signature: (message: str, level: str) -> None
@@ -60,7 +73,7 @@ def notify(message: str, level: str) -> None:
         return None
 
 
-def _default_ui_notifier() -> UINotifyCallback:
+def default_ui_notifier() -> UINotifyCallback:
     """
     Get the default UI notification callback.
 
@@ -143,12 +156,271 @@ def log_connection_stats(self) -> None:
 _connection_monitor = ConnectionMonitor()
 
 
+class ReadConnectionPool:
+    """Read-only cursors handed out from one shared DuckDB instance.
+
+    Opening a DuckDB file means loading its catalog and starting a buffer
+    manager, so instead of a fresh ``duckdb.connect()`` per query the pool
+    keeps one read-only instance open and gives every caller its own
+    ``cursor()`` (cursors are cheap and safe to use from their own thread).
+    At most ``max_cursors`` are out at once; each is registered with the
+    ``ConnectionMonitor`` while checked out.
+
+    DuckDB refuses to open a file read-write while a read-only instance of
+    it is alive in the process, and another process cannot write it at all,
+    so the instance is closed when a writer needs the file (``suspend``),
+    when the file is replaced (detected from its inode/mtime/size on every
+    checkout, or via ``invalidate``) and after ``idle_seconds`` without
+    readers. The next checkout reopens it.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_cursors: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        monitor: Optional[ConnectionMonitor] = None,
+    ):
+        self.db_path = db_path
+        self.max_cursors = max_cursors or Settings.CONNECTION_POOL_SIZE
+        self.idle_seconds = (
+            Settings.CONNECTION_POOL_IDLE_SECONDS if idle_seconds is None else idle_seconds
+        )
+        self._monitor = monitor or _connection_monitor
+        self._slots = threading.BoundedSemaphore(self.max_cursors)
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._base: duckdb.DuckDBPyConnection | None = None
+        self._identity: Optional[Tuple[int, int, int]] = None
+        self._active = 0
+        self._suspended = 0
+        self._last_release = 0.0
+        self._idle_timer: threading.Timer | None = None
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the shared read-only instance is currently open."""
+        return self._base is not None
+
+    @property
+    def active_count(self) -> int:
+        """Number of cursors currently checked out."""
+        return self._active
+
+    def _held_by_thread(self) -> int:
+        return getattr(self._local, "held", 0)
+
+    def _wait_for_readers(self) -> None:
+        # Closing the instance would pull it out from under the caller's own
+        # cursor, and waiting for that cursor would never end.
+        if self._held_by_thread():
+            raise RuntimeError(
+                f"Cannot close the pooled instance of {self.db_path} while this "
+                "thread holds one of its cursors; finish the read before writing"
+            )
+        while self._active:
+            self._cond.wait()
+
+    def _close_base(self) -> None:
+        if self._base is None:
+            return
+        try:
+            self._base.close()
+        except Exception as e:
+            self._logger.warning(f"Error closing pooled connection to {self.db_path}: {e}")
+        self._base = None
+        self._identity = None
+        self._logger.debug(f"Closed pooled read-only instance of {self.db_path}")
+
+    @contextlib.contextmanager
+    def connection(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """Check out a read-only cursor for the duration of the block."""
+        nested = self._held_by_thread() > 0
+        # A thread that already holds a cursor skips the cap so nested
+        # reads cannot deadlock against their own slot.
+        if not nested:
+            self._slots.acquire()
+        try:
+            cursor = self._checkout(nested)
+        except BaseException:
+            if not nested:
+                self._slots.release()
+            raise
+        try:
+            yield cursor
+        finally:
+            self._checkin(cursor, nested)
+
+    def _checkout(self, nested: bool) -> duckdb.DuckDBPyConnection:
+        with self._cond:
+            if not nested:
+                if getattr(self._local, "suspending", 0):
+                    raise RuntimeError(
+                        f"This thread is writing {self.db_path}; read through its "
+                        "write connection instead of the read pool"
+                    )
+                while self._suspended:
+                    self._cond.wait()
+            identity = file_identity(self.db_path)
+            if self._base is not None and identity != self._identity and not nested:
+                self._logger.info(f"{self.db_path} changed on disk; reopening pooled connections")
+                self._wait_for_readers()
+                self._close_base()
+            if self._base is None:
+                self._base = duckdb.connect(database=self.db_path.as_posix(), read_only=True)
+                self._identity = identity
+                self._logger.debug(f"Opened pooled read-only instance of {self.db_path}")
+            cursor = self._base.cursor()
+            self._active += 1
+            self._local.held = self._held_by_thread() + 1
+        self._monitor.register_connection(cursor, str(self.db_path))
+        return cursor
+
+    def _checkin(self, cursor: duckdb.DuckDBPyConnection, nested: bool) -> None:
+        self._monitor.unregister_connection(cursor)
+        try:
+            cursor.close()
+        except Exception as e:
+            self._logger.warning(f"Error closing pooled cursor for {self.db_path}: {e}")
+        with self._cond:
+            self._active -= 1
+            self._local.held = self._held_by_thread() - 1
+            self._last_release = time.monotonic()
+            if self._active == 0:
+                self._cond.notify_all()
+                self._schedule_idle_release()
+        if not nested:
+            self._slots.release()
+
+    def _schedule_idle_release(self) -> None:
+        if self.idle_seconds <= 0 or self._idle_timer is not None:
+            return
+        self._idle_timer = threading.Timer(self.idle_seconds, self._release_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _release_if_idle(self) -> None:
+        with self._cond:
+            self._idle_timer = None
+            if self._active or self._base is None:
+                return
+            remaining = self.idle_seconds - (time.monotonic() - self._last_release)
+            if remaining > 0:
+                self._idle_timer = threading.Timer(remaining, self._release_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+                return
+            self._close_base()
+
+    def suspend(self) -> None:
+        """Block new readers, wait for current ones and close the instance.
+
+        Raises RuntimeError if the calling thread holds a cursor itself; until
+        ``resume`` the calling thread cannot check out cursors either.
+        """
+        with self._cond:
+            self._wait_for_readers()
+            self._suspended += 1
+            self._local.suspending = getattr(self._local, "suspending", 0) + 1
+            self._close_base()
+
+    def resume(self) -> None:
+        """Let readers back in after ``suspend``; the instance reopens lazily."""
+        with self._cond:
+            self._suspended = max(0, self._suspended - 1)
+            self._local.suspending = max(0, getattr(self._local, "suspending", 0) - 1)
+            self._cond.notify_all()
+
+    def invalidate(self) -> None:
+        """Close the instance once current readers finish (e.g. after a file swap).
+
+        New readers may reopen it at once; to write the file use ``suspend``.
+        """
+        with self._cond:
+            self._wait_for_readers()
+            self._close_base()
+
+
+_pools: Dict[str, ReadConnectionPool] = {}
+_writer_locks: Dict[str, threading.RLock] = {}
+_registry_lock = threading.Lock()
+
+
+def _pool_key(db_path: Path | str) -> str:
+    return str(Path(db_path).resolve())
+
+
+def get_connection_pool(db_path: Path) -> ReadConnectionPool:
+    """Return the shared read-only pool for ``db_path``, creating it on first use."""
+    key = _pool_key(db_path)
+    with _registry_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ReadConnectionPool(Path(db_path))
+            watch_database_file(Path(db_path))
+        return pool
+
+
+def invalidate_connection_pool(db_path: Path | str | None = None) -> None:
+    """Close pooled read-only instances so the next reader reopens the file.
+
+    Readers may reopen the file straight away, so this is not enough before
+    writing it outside ``get_db_connection``; use
+    ``exclusive_database_access`` for that. With no path every pool is
+    invalidated.
+    """
+    with _registry_lock:
+        if db_path is None:
+            pools = list(_pools.values())
+        else:
+            pool = _pools.get(_pool_key(db_path))
+            pools = [pool] if pool else []
+    for pool in pools:
+        pool.invalidate()
+
+
+@contextlib.contextmanager
+def _exclusive_writer(db_path: Path) -> Generator[None, None, None]:
+    """Serialize writers on ``db_path`` and keep pooled readers off the file."""
+    key = _pool_key(db_path)
+    with _registry_lock:
+        lock = _writer_locks.setdefault(key, threading.RLock())
+    with lock:
+        # Registering the pool up front means a reader that first asks for
+        # it mid-write gets this suspended pool instead of a fresh one.
+        pool = get_connection_pool(db_path)
+        pool.suspend()
+        try:
+            yield
+        finally:
+            pool.resume()
+
+
+@contextlib.contextmanager
+def exclusive_database_access(db_path: Path | str) -> Generator[None, None, None]:
+    """Keep every other reader and writer off ``db_path`` for the block.
+
+    For writes that cannot go through ``get_db_connection`` (raw read-write
+    connects, replacing or deleting the file): pooled readers stay
+    suspended until the block exits, and cached query results are
+    invalidated afterwards.
+    """
+    db_path = Path(db_path)
+    try:
+        with _exclusive_writer(db_path):
+            yield
+    finally:
+        record_database_write(db_path)
+
+
 @contextlib.contextmanager
 def get_db_connection(
     db_path: Path,
     read_only: bool = True,
     logger_obj: logging.Logger | None = None,
     ui_notify: UINotifyCallback | None = None,
+    writes: Optional[Iterable[str]] = None,
 ) -> Generator[duckdb.DuckDBPyConnection, None, None]:
     """
     Context manager for DuckDB connections with proper resource cleanup.
@@ -156,12 +428,19 @@ def get_db_connection(
     This is the recommended way to work with database connections.
     The connection is automatically closed when the context exits.
 
+    Read-only callers get a cursor from the file's ``ReadConnectionPool``
+    rather than a new database instance. Read-write callers are serialized
+    per file, and pooled readers are kept off the file until they finish.
+    On every exit from a read-write connection the cached query results
+    over ``writes`` are invalidated (all of them when ``writes`` is None).
+
     Args:
         db_path: Path to the database file
         read_only: Whether to open in read-only mode
         logger_obj: Optional logger for debug messages
         ui_notify: Optional callback for UI notifications (info/warning/error)
                    If None, uses Streamlit if available, otherwise no-op
+        writes: Tables a read-write block changes; None means any table
 
     Yields:
         DuckDB connection that will be automatically closed
@@ -174,7 +453,7 @@ def get_db_connection(
         logger_obj = logging.getLogger(__name__)
 
     if ui_notify is None:
-        ui_notify = _default_ui_notifier()
+        ui_notify = default_ui_notifier()
 
     # Handle missing database file
     if not db_path.exists() and read_only:
@@ -200,47 +479,60 @@ def get_db_connection(
         logger_obj.info(f"Database {db_path} does not exist. It will be created.")
         ui_notify(f"Database {db_path} will be created during write operation.", "info")
 
-    conn: duckdb.DuckDBPyConnection | None = None
-    try:
-        conn = duckdb.connect(database=db_path.as_posix(), read_only=read_only)
-        _connection_monitor.register_connection(conn, str(db_path))
-
-        # Test connection
-        conn.execute("SELECT 1")
-        logger_obj.debug(
-            f"Successfully connected to DuckDB at {db_path} (read_only={read_only})"
-        )
-
-        yield conn
+    if read_only:
+        with contextlib.ExitStack() as stack:
+            try:
+                conn = stack.enter_context(get_connection_pool(db_path).connection())
+                # Test connection
+                conn.execute("SELECT 1")
+                logger_obj.debug(f"Checked out pooled read-only connection to {db_path}")
+            except Exception as e:
+                stack.close()
+                logger_obj.error(
+                    f"Error connecting to database at {db_path}: {e}", exc_info=True
+                )
+                ui_notify(f"Database connection error: {e}", "error")
+
+                # Provide fallback in-memory connection for read operations
+                conn = duckdb.connect(database=":memory:", read_only=False)
+                _connection_monitor.register_connection(conn, ":memory:")
+                stack.callback(conn.close)
+                stack.callback(_connection_monitor.unregister_connection, conn)
+                logger_obj.info("Using in-memory fallback connection due to error")
+            yield conn
+        return
 
-    except Exception as e:
-        logger_obj.error(
-            f"Error connecting to database at {db_path}: {e}", exc_info=True
-        )
-        ui_notify(f"Database connection error: {e}", "error")
+    with _exclusive_writer(db_path):
+        conn: duckdb.DuckDBPyConnection | None = None
+        try:
+            conn = duckdb.connect(database=db_path.as_posix(), read_only=False)
+            _connection_monitor.register_connection(conn, str(db_path))
 
-        # Provide fallback in-memory connection for read operations
-        if read_only:
-            if conn:
-                _connection_monitor.unregister_connection(conn)
-                conn.close()
+            # Test connection
+            conn.execute("SELECT 1")
+            logger_obj.debug(
+                f"Successfully connected to DuckDB at {db_path} (read_only={read_only})"
+            )
 
-            conn = duckdb.connect(database=":memory:", read_only=False)
-            _connection_monitor.register_connection(conn, ":memory:")
-            logger_obj.info("Using in-memory fallback connection due to error")
             yield conn
-        else:
+
+        except Exception as e:
+            logger_obj.error(
+                f"Error connecting to database at {db_path}: {e}", exc_info=True
+            )
+            ui_notify(f"Database connection error: {e}", "error")
             raise
 
-    finally:
-        if conn:
-            try:
-                _connection_monitor.unregister_connection(conn)
-                conn.close()
-                logger_obj.debug(f"Connection to {db_path} closed successfully")
-            except Exception as close_err:
-                # Log but don't mask the original exception
-                logger_obj.warning(f"Error closing connection to {db_path}: {close_err}")
+        finally:
+            if conn:
+                try:
+                    _connection_monitor.unregister_connection(conn)
+                    conn.close()
+                    logger_obj.debug(f"Connection to {db_path} closed successfully")
+                except Exception as close_err:
+                    # Log but don't mask the original exception
+                    logger_obj.warning(f"Error closing connection to {db_path}: {close_err}")
+                record_database_write(db_path, (ANY_TABLE,) if writes is None else writes)
 
 
 def safe_execute_query(
@@ -269,7 +561,7 @@ def safe_execute_query(
         logger_obj = logging.getLogger(__name__)
 
     if ui_notify is None:
-        ui_notify = _default_ui_notifier()
+        ui_notify = default_ui_notifier()
 
     try:
         if params:
@@ -298,29 +590,14 @@ def log_connection_leaks() -> None:
     _connection_monitor.log_connection_stats()
 
 
-def _cache_data_decorator(ttl=3600):
-    """Decorator that uses Streamlit cache if available, otherwise no-op."""
-
-    def decorator(func):
-        try:
-            import streamlit as st
-            if hasattr(st, "cache_data"):
-                return st.cache_data(ttl=ttl)(func)
-        except ImportError:
-            pass
-        return func
-
-    return decorator
-
-
-@_cache_data_decorator(ttl=3600)
 def cached_query_with_connection(
     db_path_str: str, query: str, read_only: bool = True
 ) -> Any:
     """
     Execute a cached query with proper connection management.
 
-    Note: db_path must be string for Streamlit caching compatibility.
+    Results are kept in ``backend.query_cache`` until a table the query
+    reads is rewritten.
 
     Args:
         db_path_str: String path to the database file
@@ -335,16 +612,52 @@ def cached_query_with_connection(
     db_path = Path(db_path_str)
     logger_obj = logging.getLogger(__name__)
 
-    try:
+    def run() -> Any:
         with get_db_connection(
             db_path, read_only=read_only, logger_obj=logger_obj
         ) as conn:
             return safe_execute_query(conn, query, logger_obj)
+
+    try:
+        return get_query_cache().get_or_execute(
+            query, None, run, namespace=f"{db_path_str}:{read_only}"
+        )
     except Exception as e:
         logger_obj.error(f"Error in cached_query_with_connection: {e}", exc_info=True)
         return pd.DataFrame()
 
 
+class _HeldWriteConnection:
+    """Read-write connection from ``connect_db`` that holds the file until closed.
+
+    Delegates everything to the DuckDB connection; ``close`` (or leaving a
+    ``with`` block) also lets pooled readers back in. Close it on the thread
+    that opened it.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, release: Callable[[], None]):
+        self._conn = conn
+        self._release: Callable[[], None] | None = release
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "_HeldWriteConnection":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            _connection_monitor.unregister_connection(self._conn)
+            self._conn.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
 # Legacy compatibility function
 def connect_db(
     db_path: Path,
@@ -362,7 +675,7 @@ def connect_db(
         _logger_obj = logging.getLogger(__name__)
 
     if ui_notify is None:
-        ui_notify = _default_ui_notifier()
+        ui_notify = default_ui_notifier()
 
     _logger_obj.warning(
         "connect_db() is deprecated. Use get_db_connection() context manager to prevent connection leaks."
@@ -381,6 +694,12 @@ def connect_db(
         _connection_monitor.register_connection(conn, ":memory:")
         return conn
 
+    # Pooled read-only instances would make the read-write open fail, so
+    # readers stay suspended until the connection is closed.
+    hold = contextlib.ExitStack()
+    if not read_only:
+        hold.enter_context(exclusive_database_access(db_path))
+
     try:
         conn = duckdb.connect(database=db_path.as_posix(), read_only=read_only)
         _connection_monitor.register_connection(conn, str(db_path))
@@ -388,8 +707,11 @@ def connect_db(
         _logger_obj.debug(
             f"Successfully connected to DuckDB at {db_path} (read_only={read_only})"
         )
-        return conn
+        if read_only:
+            return conn
+        return _HeldWriteConnection(conn, hold.close)
     except Exception as e:
+        hold.close()
         _logger_obj.error(
             f"Error connecting to database at {db_path}: {e}", exc_info=True
         )
@@ -0,0 +1,145 @@
+"""Hive-partitioned Parquet layout for Knesset-scoped tables.
+
+A partitioned table is a directory ``<table>/KnessetNum=NN/part-*.parquet``
+instead of one ``<table>.parquet`` file. Readers that filter on the
+partition column only open the matching directories: DuckDB prunes the file
+list on the ``KnessetNum=NN`` path segment before reading any footer.
+
+Writers build the new tree next to the old one (``<table>.new``) and swap the
+directories afterwards, so a failed write leaves the previous tree intact.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import duckdb
+import pandas as pd
+
+PARTITION_COLUMN = "KnessetNum"
+
+#: Hive directory name DuckDB gives rows whose partition value is NULL.
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def partition_copy_options(partition_column: str = PARTITION_COLUMN) -> str:
+    """``COPY … TO`` options writing one ``part-N.parquet`` per partition dir."""
+    return f"PARTITION_BY ({partition_column}), FILENAME_PATTERN 'part-{{i}}'"
+
+
+def parquet_location(parquet_dir: Path, table_name: str) -> Optional[Path]:
+    """The partition directory or single file holding ``table_name``, if any."""
+    table_dir = parquet_dir / table_name
+    if table_dir.is_dir():
+        return table_dir
+    table_file = parquet_dir / f"{table_name}.parquet"
+    if table_file.exists():
+        return table_file
+    return None
+
+
+def has_part_files(table_dir: Path) -> bool:
+    """Whether a partition directory holds any part files yet."""
+    return next(table_dir.glob("*/*.parquet"), None) is not None
+
+
+def parquet_scan_sql(location: Path, partition_column: str = PARTITION_COLUMN) -> str:
+    """``read_parquet`` call for a partition directory or a single file.
+
+    A directory written from an empty result has no part files, and
+    ``read_parquet`` fails on a glob that matches nothing, so that case
+    scans an empty relation holding only the partition column instead.
+    """
+    if location.is_dir():
+        if not has_part_files(location):
+            return f"(SELECT CAST(NULL AS BIGINT) AS {partition_column} WHERE FALSE)"
+        return f"read_parquet('{location.as_posix()}/*/*.parquet', hive_partitioning = true)"
+    return f"read_parquet('{location.as_posix()}')"
+
+
+def list_partitions(table_dir: Path) -> Dict[str, List[Path]]:
+    """Part files per partition directory, both in sorted order."""
+    return {
+        partition.name: sorted(partition.glob("*.parquet"))
+        for partition in sorted(table_dir.iterdir())
+        if partition.is_dir()
+    }
+
+
+def replace_directory(new_dir: Path, target_dir: Path) -> None:
+    """Swap ``new_dir`` into ``target_dir``, then drop the previous tree.
+
+    Directories cannot be renamed over each other, so the old tree is moved
+    aside first. The swap is therefore two renames, not an atomic one: a
+    reader that lists ``target_dir`` between them finds no tree at all, and
+    a scan already running over the old tree can fail once it is removed.
+    """
+    old_dir = target_dir.with_name(f"{target_dir.name}.old")
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+    if target_dir.exists():
+        os.replace(target_dir, old_dir)
+    os.replace(new_dir, target_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def write_partitioned(
+    con: duckdb.DuckDBPyConnection,
+    select_sql: str,
+    target_dir: Path,
+    partition_column: str = PARTITION_COLUMN,
+) -> int:
+    """Write ``select_sql`` as a partitioned tree at ``target_dir``.
+
+    The partition column is cast to ``BIGINT`` so a column stored as a float
+    still yields ``KnessetNum=25`` rather than ``KnessetNum=25.0``. Returns the
+    number of rows written.
+    """
+    new_dir = target_dir.with_name(f"{target_dir.name}.new")
+    if new_dir.exists():
+        shutil.rmtree(new_dir)
+    new_dir.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        (rows,) = con.execute(
+            f"COPY (SELECT * REPLACE (TRY_CAST({partition_column} AS BIGINT) AS {partition_column}) "
+            f"FROM ({select_sql})) TO '{new_dir.as_posix()}' "
+            f"(FORMAT PARQUET, COMPRESSION ZSTD, {partition_copy_options(partition_column)})"
+        ).fetchone()
+        if not new_dir.exists():
+            # COPY of an empty result creates no partitions at all.
+            new_dir.mkdir(parents=True)
+        replace_directory(new_dir, target_dir)
+    except Exception:
+        shutil.rmtree(new_dir, ignore_errors=True)
+        raise
+    return int(rows)
+
+
+def read_parquet_table(
+    location: Path,
+    knesset_nums: Optional[Iterable[int]] = None,
+    limit: Optional[int] = None,
+    partition_column: str = PARTITION_COLUMN,
+    con: Optional[duckdb.DuckDBPyConnection] = None,
+) -> pd.DataFrame:
+    """Read a Parquet mirror, keeping only the requested Knesset terms.
+
+    On a partition directory the filter prunes whole partitions; on a single
+    file it is an ordinary predicate.
+    """
+    sql = f"SELECT * FROM {parquet_scan_sql(location, partition_column)}"
+    params: list = []
+    knesset_nums = [int(num) for num in knesset_nums or []]
+    if knesset_nums:
+        sql += f" WHERE {partition_column} IN ({', '.join('?' for _ in knesset_nums)})"
+        params.extend(knesset_nums)
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+
+    if con is not None:
+        return con.execute(sql, params).df()
+    with duckdb.connect(":memory:") as reader:
+        return reader.execute(sql, params).df()
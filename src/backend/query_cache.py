@@ -0,0 +1,357 @@
+"""
+Data-version-aware cache for query results.
+
+Results are keyed by the normalized SQL text, its parameters and the
+generation of every table the SQL reads. Each table generation is a
+counter bumped through ``bump_table_versions()``: every read-write
+``get_db_connection()`` bumps on exit (the tables it was told it writes,
+or ``ANY_TABLE``), so a refreshed table can never be served from the
+cache: the entries that read it are evicted at once and their keys would
+not match anymore anyway. Entries over unrelated tables survive a
+targeted refresh.
+
+Writes that bypass ``get_db_connection()`` (raw read-write connects,
+other processes such as a CLI refresh) are caught from the database
+file itself: every lookup compares the inode/mtime/size of each watched
+file with the last one seen, and a change nobody recorded bumps
+``ANY_TABLE``.
+
+The cache is an LRU bounded by entry count and by the estimated size of
+the cached values, so memory stays flat on small deployments.
+
+Core API:
+- get_query_cache(): Process-wide QueryResultCache
+- bump_table_versions(): Record that tables changed and evict dependents
+- watch_database_file(): Treat outside changes to a file as a full bump
+- record_database_write(): Bump after an in-process write to a watched file
+- data_version_cached(): Decorator for helpers that query the warehouse
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import logging
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, TypeVar
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+
+from config.settings import Settings
+
+T = TypeVar("T")
+
+# Dependency marker for entries that must be evicted on any table change
+# (schema listings and the like). Bumping it invalidates every entry.
+ANY_TABLE = "*"
+
+_IDENTIFIER_RE = re.compile(r'"([^"]+)"|\b([A-Za-z_][A-Za-z0-9_]*)\b')
+
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+# Database files whose outside changes invalidate the cache, mapped to the
+# identity last seen or recorded for them.
+_watched_files: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and drop a trailing semicolon."""
+    return " ".join(sql.split()).rstrip(";").rstrip()
+
+
+def referenced_tables(sql: str) -> FrozenSet[str]:
+    """Lower-cased names of the tables ``sql`` reads.
+
+    Uses DuckDB's parser; SQL it cannot parse falls back to every
+    identifier in the text, which over-approximates but never misses a
+    table.
+    """
+    try:
+        return frozenset(name.lower() for name in duckdb.get_table_names(sql))
+    except Exception:
+        return frozenset(
+            (quoted or bare).lower() for quoted, bare in _IDENTIFIER_RE.findall(sql)
+        )
+
+
+def get_table_version(table_name: str) -> int:
+    """Current generation of ``table_name`` (0 until it is first bumped)."""
+    with _versions_lock:
+        return _versions.get(table_name.lower(), 0)
+
+
+def bump_table_versions(*table_names: str) -> None:
+    """Record that tables changed and evict every cached result that read them."""
+    if not table_names:
+        return
+    with _versions_lock:
+        for name in table_names:
+            key = name.lower()
+            _versions[key] = _versions.get(key, 0) + 1
+    get_query_cache().invalidate_tables(table_names)
+
+
+def file_identity(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Inode, mtime and size of ``path``, or None if it is gone."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def watch_database_file(db_path: Path) -> None:
+    """Bump ``ANY_TABLE`` whenever ``db_path`` changes without a recorded write."""
+    key = str(Path(db_path).resolve())
+    with _versions_lock:
+        if key not in _watched_files:
+            _watched_files[key] = file_identity(Path(key))
+
+
+def record_database_write(db_path: Path, tables: Iterable[str] = (ANY_TABLE,)) -> None:
+    """Bump ``tables`` after a write to ``db_path`` made by this process.
+
+    The file's new identity is taken as known, so the write is not also
+    mistaken for an outside change that would flush every entry.
+    """
+    key = str(Path(db_path).resolve())
+    with _versions_lock:
+        if key in _watched_files:
+            _watched_files[key] = file_identity(Path(key))
+    bump_table_versions(*tables)
+
+
+def _check_watched_files() -> None:
+    changed = False
+    with _versions_lock:
+        for key, known in _watched_files.items():
+            current = file_identity(Path(key))
+            if current != known:
+                _watched_files[key] = current
+                changed = True
+    if changed:
+        bump_table_versions(ANY_TABLE)
+
+
+def _data_version(tables: FrozenSet[str]) -> Tuple[Tuple[str, int], ...]:
+    _check_watched_files()
+    with _versions_lock:
+        if ANY_TABLE in tables:
+            return tuple(sorted(_versions.items()))
+        return tuple(
+            sorted((t, _versions.get(t, 0)) for t in tables | {ANY_TABLE})
+        )
+
+
+def estimate_size(value: Any) -> int:
+    """Rough in-memory size of a cached value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pa.Table):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tables: FrozenSet[str]
+    size: int
+
+
+class QueryResultCache:
+    """Thread-safe LRU of query results with per-table invalidation.
+
+    Values are copied on the way in and out, so callers may modify what
+    they get back without corrupting the cache. Arrow tables are immutable
+    and are shared instead.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries or Settings.QUERY_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or Settings.QUERY_CACHE_MAX_BYTES
+        self._entries: "OrderedDict[Tuple[Any, ...], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._logger = logging.getLogger(__name__)
+
+    def make_key(
+        self,
+        namespace: str,
+        sql: str,
+        params: Any,
+        tables: FrozenSet[str],
+    ) -> Tuple[Any, ...]:
+        """Cache key for ``sql`` + ``params`` at the current data version."""
+        params_key = json.dumps(params, sort_keys=True, default=str) if params else ""
+        return (namespace, normalize_sql(sql), params_key, _data_version(tables))
+
+    def get(
+        self,
+        sql: str,
+        params: Any,
+        tables: Optional[Iterable[str]] = None,
+        namespace: str = "",
+    ) -> Any:
+        """Return the cached result for ``sql``/``params``, or ``None``."""
+        deps = (
+            frozenset(t.lower() for t in tables)
+            if tables is not None
+            else referenced_tables(sql)
+        )
+        key = self.make_key(namespace, sql, params, deps)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(entry.value)
+
+    def get_or_execute(
+        self,
+        sql: str,
+        params: Any,
+        execute: Callable[[], T],
+        tables: Optional[Iterable[str]] = None,
+        namespace: str = "",
+    ) -> T:
+        """Return the cached result for ``sql``/``params`` or run ``execute``.
+
+        ``tables`` defaults to the tables parsed from ``sql``. ``None``
+        results are not cached, so failed queries are retried next time.
+        """
+        deps = (
+            frozenset(t.lower() for t in tables)
+            if tables is not None
+            else referenced_tables(sql)
+        )
+        # Keyed at the pre-execution data version, so a table rewritten while
+        # ``execute`` runs never files a stale result under the new version
+        key = self.make_key(namespace, sql, params, deps)
+        cached = self.get(sql, params, tables=deps, namespace=namespace)
+        if cached is not None:
+            return cached
+
+        value = execute()
+        if value is not None:
+            self._store(key, value, deps)
+        return value
+
+    def _store(self, key: Tuple[Any, ...], value: Any, tables: FrozenSet[str]) -> None:
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            self._logger.debug(f"Result of {size:,} bytes exceeds the query cache budget; not cached")
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = _Entry(_copy(value), tables, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def invalidate_tables(self, table_names: Iterable[str]) -> int:
+        """Evict entries that read any of ``table_names``; returns the count.
+
+        ``ANY_TABLE`` among ``table_names`` evicts every entry.
+        """
+        changed = {name.lower() for name in table_names}
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if ANY_TABLE in changed or ANY_TABLE in entry.tables or entry.tables & changed
+            ]
+            for key in stale:
+                self._bytes -= self._entries.pop(key).size
+        if stale:
+            self._logger.debug(f"Evicted {len(stale)} cached results for {sorted(changed)}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _copy(value: T) -> T:
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, pa.Table):
+        return value
+    return copy.deepcopy(value)
+
+
+_query_cache: Optional[QueryResultCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache:
+    """Return the process-wide query result cache."""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryResultCache()
+        return _query_cache
+
+
+def data_version_cached(
+    tables: Iterable[str] = (ANY_TABLE,),
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Cache a warehouse helper's return value until ``tables`` change.
+
+    Arguments whose name starts with an underscore (loggers, connections)
+    are left out of the key, following the ``st.cache_data`` convention.
+    """
+    deps = frozenset(t.lower() for t in tables)
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        namespace = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            key_kwargs = {k: v for k, v in kwargs.items() if not k.startswith("_")}
+            key_args = [a for a in args if not isinstance(a, logging.Logger)]
+            return get_query_cache().get_or_execute(
+                namespace,
+                [key_args, key_kwargs],
+                lambda: func(*args, **kwargs),
+                tables=deps,
+                namespace=namespace,
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,228 @@
+"""
+Shared, instrumented execution path for read-only warehouse queries.
+
+Every chart query goes through ``QueryExecutionService.execute``, which
+serves repeated queries from ``backend.query_cache`` and records, per
+label (the chart name by default), how often the query ran, how often it
+was a cache hit, how long DuckDB took and how large the result was.
+
+Core API:
+- get_query_service(): Process-wide QueryExecutionService
+- query_label(): Context manager naming the queries run inside it
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional
+
+import duckdb
+import pandas as pd
+
+from backend.connection_manager import (
+    default_ui_notifier,
+    get_db_connection,
+    safe_execute_query,
+)
+from backend.query_cache import QueryResultCache, estimate_size, get_query_cache
+from config.settings import Settings
+
+#: Rewrites a query for the connection it is about to run on.
+QueryRewrite = Callable[[duckdb.DuckDBPyConnection, str], str]
+
+_current_label: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "query_label", default=None
+)
+
+
+@contextlib.contextmanager
+def query_label(label: str) -> Generator[None, None, None]:
+    """Attribute queries executed inside the block to ``label``."""
+    token = _current_label.set(label)
+    try:
+        yield
+    finally:
+        _current_label.reset(token)
+
+
+@dataclass
+class QueryStats:
+    """Accumulated execution statistics for one query label."""
+
+    label: str
+    calls: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_rows: int = 0
+    last_bytes: int = 0
+    total_bytes: int = 0
+
+    @property
+    def executions(self) -> int:
+        """Calls that reached DuckDB."""
+        return self.calls - self.cache_hits
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average DuckDB time per execution."""
+        return self.total_seconds / self.executions if self.executions else 0.0
+
+
+class QueryExecutionService:
+    """Run read-only queries through the result cache and time them."""
+
+    def __init__(
+        self,
+        cache: Optional[QueryResultCache] = None,
+        slow_query_seconds: Optional[float] = None,
+    ):
+        self._cache = cache
+        self.slow_query_seconds = (
+            Settings.SLOW_QUERY_SECONDS if slow_query_seconds is None else slow_query_seconds
+        )
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def cache(self) -> QueryResultCache:
+        return self._cache or get_query_cache()
+
+    def execute(
+        self,
+        db_path: Path,
+        query: str,
+        params: Optional[List[Any]] = None,
+        con: duckdb.DuckDBPyConnection | None = None,
+        logger_obj: logging.Logger | None = None,
+        label: Optional[str] = None,
+        tables: Optional[Iterable[str]] = None,
+        transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        rewrite: Optional[QueryRewrite] = None,
+    ) -> pd.DataFrame:
+        """Return the result of ``query`` against ``db_path``.
+
+        The cache is consulted first; only a miss uses ``con`` or, without
+        one, checks out a pooled read-only connection. ``rewrite`` maps the
+        query to the SQL actually run on that connection (the cache key stays
+        ``query``), and ``transform`` is applied once, before the result is
+        cached. Queries run through
+        ``safe_execute_query``, so errors are logged and reported there and
+        yield an empty DataFrame, which is not cached.
+        """
+        logger_obj = logger_obj or self._logger
+        label = label or _current_label.get() or "ad-hoc"
+        executed = False
+        failed = False
+        elapsed = 0.0
+
+        def run() -> Optional[pd.DataFrame]:
+            nonlocal executed, failed, elapsed
+            executed = True
+            start = time.perf_counter()
+            try:
+                if con is not None:
+                    result = self._run(con, query, params, logger_obj, rewrite)
+                else:
+                    with get_db_connection(db_path, read_only=True, logger_obj=logger_obj) as c:
+                        result = self._run(c, query, params, logger_obj, rewrite)
+            finally:
+                elapsed = time.perf_counter() - start
+            if result is None:
+                failed = True
+                return None
+            return transform(result) if transform is not None else result
+
+        result = self.cache.get_or_execute(
+            query, params, run, tables=tables, namespace=str(db_path)
+        )
+        if result is None:
+            result = pd.DataFrame()
+        self._record(label, result, executed, failed, elapsed)
+
+        if executed and elapsed >= self.slow_query_seconds:
+            logger_obj.warning(
+                f"Slow query for '{label}': {elapsed:.2f}s, {len(result):,} rows"
+            )
+        return result
+
+    @staticmethod
+    def _run(
+        con: duckdb.DuckDBPyConnection,
+        query: str,
+        params: Optional[List[Any]],
+        logger_obj: logging.Logger,
+        rewrite: Optional[QueryRewrite],
+    ) -> Optional[pd.DataFrame]:
+        """Execute via ``safe_execute_query``; ``None`` if it reported an error."""
+        errors: List[str] = []
+        notify = default_ui_notifier()
+
+        def record_error(message: str, level: str) -> None:
+            errors.append(message)
+            notify(message, level)
+
+        if rewrite is not None:
+            query = rewrite(con, query)
+        result = safe_execute_query(con, query, logger_obj, params=params, ui_notify=record_error)
+        return None if errors else result
+
+    def _record(
+        self,
+        label: str,
+        result: pd.DataFrame,
+        executed: bool,
+        failed: bool,
+        elapsed: float,
+    ) -> None:
+        size = estimate_size(result)
+        with self._lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = QueryStats(label)
+            stats.calls += 1
+            if not executed:
+                stats.cache_hits += 1
+            else:
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+            if failed:
+                stats.errors += 1
+            stats.last_rows = len(result)
+            stats.last_bytes = size
+            stats.total_bytes += size
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-label statistics, slowest total DuckDB time first."""
+        with self._lock:
+            rows = [
+                {**asdict(s), "executions": s.executions, "mean_seconds": s.mean_seconds}
+                for s in self._stats.values()
+            ]
+        return sorted(rows, key=lambda r: r["total_seconds"], reverse=True)
+
+    def reset_stats(self) -> None:
+        """Forget all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+_query_service: Optional[QueryExecutionService] = None
+_query_service_lock = threading.Lock()
+
+
+def get_query_service() -> QueryExecutionService:
+    """Return the process-wide query execution service."""
+    global _query_service
+    with _query_service_lock:
+        if _query_service is None:
+            _query_service = QueryExecutionService()
+        return _query_service
@@ -2,6 +2,8 @@
 from typing import Optional, List
 from pathlib import Path
 
+from backend.partitioned_parquet import PARTITION_COLUMN, parquet_location, read_parquet_table
+from config.settings import Settings
 from core.dependencies import DependencyContainer
 
 app = typer.Typer(
@@ -25,6 +27,12 @@ def refresh(
         None,
         "--db",
         help="Path to the DuckDB database file."
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        "-i",
+        help="Only download rows changed since the last refresh (LastUpdatedDate) and merge them by primary key."
     )
 ):
     """
@@ -47,7 +55,7 @@ def refresh(
         # Use the data refresh service from dependency container
         service = refresh_container.data_refresh_service
         # Use sync method - it handles async internally
-        success = service.refresh_tables_sync(tables_to_process)
+        success = service.refresh_tables_sync(tables_to_process, incremental=incremental)
 
         if success:
             typer.secho("Refresh process completed successfully.", fg=typer.colors.GREEN)
@@ -90,6 +98,53 @@ def refresh_factions(
         typer.secho(f"Error refreshing faction status: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1)
 
+@app.command()
+def read_parquet(
+    table: str = typer.Argument(..., help="Table or snapshot name, e.g. KNS_Bill or mk_votes."),
+    knesset: Optional[List[int]] = typer.Option(
+        None,
+        "--knesset",
+        "-k",
+        help="Knesset number to read; repeat for several. A partitioned mirror only opens these partitions."
+    ),
+    parquet_dir: Optional[Path] = typer.Option(
+        None,
+        "--dir",
+        help="Directory holding the Parquet mirror (default: data/parquet). Use data/snapshots for snapshots."
+    ),
+    column: str = typer.Option(
+        PARTITION_COLUMN,
+        "--column",
+        help="Knesset column to filter on (snapshots use knesset_num)."
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", help="Maximum number of rows to read."),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the rows to this CSV file instead of printing them."
+    )
+):
+    """
+    Read a table from the Parquet mirror, filtered to the given Knesset terms.
+    """
+    location = parquet_location(parquet_dir or Settings.PARQUET_DIR, table)
+    if location is None:
+        typer.secho(f"No Parquet data for '{table}' in {parquet_dir or Settings.PARQUET_DIR}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        df = read_parquet_table(location, knesset, limit=limit, partition_column=column)
+    except Exception as e:
+        typer.secho(f"Error reading '{table}': {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    if output:
+        df.to_csv(output, index=False, encoding="utf-8-sig")
+        typer.secho(f"Wrote {len(df):,} rows to {output}", fg=typer.colors.GREEN)
+    else:
+        typer.echo(df.to_string(index=False))
+
 if __name__ == "__main__":
     # Typer will handle running the async command function correctly
     app()
@@ -2,6 +2,7 @@
 
 import sys
 from enum import Enum
+from typing import Optional
 
 
 # Keep `config.api` and `src.config.api` pointing to the same module object
@@ -27,9 +28,21 @@ class APIConfig:
     
     # Request settings
     PAGE_SIZE = 100
+    # Adaptive paging: $top starts at PAGE_SIZE (or the cursor chunk size),
+    # doubles after PAGE_GROW_AFTER pages faster than PAGE_LATENCY_TARGET
+    # seconds, and halves on slow pages and timeouts.
+    MIN_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 1000
+    PAGE_LATENCY_TARGET = 5.0
+    PAGE_GROW_AFTER = 3
     MAX_RETRIES = 8
     REQUEST_TIMEOUT = 60
     CONCURRENCY_LIMIT = 8
+
+    # Parallel multi-table refresh: tables downloaded at once, and the cap on
+    # in-flight HTTP requests shared by all of them.
+    TABLE_CONCURRENCY = 4
+    GLOBAL_REQUEST_LIMIT = 16
     
     # Circuit breaker settings
     CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
@@ -46,6 +59,9 @@ def get_entity_url(cls, entity: str) -> str:
         return f"{cls.BASE_URL}/{entity}"
     
     @classmethod
-    def get_count_url(cls, entity: str) -> str:
-        """Get the count URL for an OData entity."""
-        return f"{cls.BASE_URL}/{entity}/$count"
+    def get_count_url(cls, entity: str, filter_expr: Optional[str] = None) -> str:
+        """Get the count URL for an OData entity, optionally filtered."""
+        url = f"{cls.BASE_URL}/{entity}/$count"
+        if filter_expr:
+            url = f"{url}?$filter={filter_expr}"
+        return url
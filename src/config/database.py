@@ -1,6 +1,6 @@
 """Database configuration and connection settings."""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 class DatabaseConfig:
@@ -61,6 +61,39 @@ class DatabaseConfig:
         "KNS_PlmSessionItem": ("plmPlenumSessionID", 100),
     }
     
+    # Largest tables, biggest first. A parallel refresh dispatches these ahead
+    # of everything else so the slowest download is never left for the end.
+    LARGE_TABLES = [
+        "KNS_CmtSessionItem",
+        "KNS_DocumentBill",
+        "KNS_DocumentCommitteeSession",
+        "KNS_PlmSessionItem",
+        "KNS_BillInitiator",
+        "KNS_Bill",
+        "KNS_Query",
+        "KNS_CommitteeSession",
+        "KNS_DocumentPlenumSession",
+    ]
+
+    # Optional $select projections for wide downloads. List only columns that
+    # some query pack, chart, snapshot or validator reads, plus the cursor key
+    # and WATERMARK_COLUMN; everything else is never requested or stored.
+    # Free-text item names are the bulk of these two tables' payloads.
+    SELECT_COLUMNS: Dict[str, List[str]] = {
+        "KNS_CmtSessionItem": [
+            "CmtSessionItemID", "ItemID", "CommitteeSessionID", "ItemTypeID",
+            "StatusID", "LastUpdatedDate",
+        ],
+        "KNS_PlmSessionItem": [
+            "plmPlenumSessionID", "ItemID", "PlenumSessionID", "ItemTypeID",
+            "ItemTypeDesc", "StatusID", "LastUpdatedDate",
+        ],
+    }
+
+    # Column carrying the OData row modification time; incremental refreshes
+    # request only rows past the table's current high-water mark on it.
+    WATERMARK_COLUMN = "LastUpdatedDate"
+
     # Connection settings
     CONNECTION_TIMEOUT = 60
     READ_ONLY_DEFAULT = True
@@ -78,4 +111,9 @@ def is_cursor_table(cls, table_name: str) -> bool:
     @classmethod
     def get_cursor_config(cls, table_name: str) -> Tuple[str, int]:
         """Get cursor configuration for a table."""
-        return cls.CURSOR_TABLES.get(table_name, ("id", 100))
\ No newline at end of file
+        return cls.CURSOR_TABLES.get(table_name, ("id", 100))
+
+    @classmethod
+    def get_select_columns(cls, table_name: str) -> Optional[List[str]]:
+        """Get the ``$select`` projection for a table (``None`` for all columns)."""
+        return cls.SELECT_COLUMNS.get(table_name)
\ No newline at end of file
@@ -16,6 +16,7 @@ class Settings:
     # Default database settings
     DEFAULT_DB_PATH = DATA_DIR / "warehouse.duckdb"
     PARQUET_DIR = DATA_DIR / "parquet"
+    STAGING_DIR = DATA_DIR / ".staging"
     RESUME_STATE_FILE = DATA_DIR / ".resume_state.json"
     FACTION_COALITION_STATUS_FILE = DATA_DIR / "faction_coalition_status_all_knessets.csv"
 
@@ -26,9 +27,33 @@ class Settings:
     # Performance settings
     QUERY_TIMEOUT_SECONDS = 60
     CONNECTION_POOL_SIZE = 8
+    # Close the pooled read-only DuckDB instance after this long without
+    # readers so other processes can open the warehouse for writing.
+    CONNECTION_POOL_IDLE_SECONDS = 30.0
     PAGE_SIZE = 100
+
+    # Query result cache (backend.query_cache): LRU bounds. Entries are
+    # evicted when a table they read is rewritten, not on a timer.
+    QUERY_CACHE_MAX_ENTRIES = 256
+    QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    # Page one of a predefined query fetches this many pages and keeps them
+    # as an Arrow table for paging; later pages use keyset pagination.
+    QUERY_RESULT_WINDOW_PAGES = 5
+    # Chart queries slower than this are logged by backend.query_service.
+    SLOW_QUERY_SECONDS = 2.0
     MAX_RETRIES = 8
 
+    # Streaming ingest: spool downloaded pages to Parquet parts in batches of
+    # STREAM_BATCH_ROWS instead of holding the whole table in memory.
+    ENABLE_STREAMING_INGEST = os.getenv('ENABLE_STREAMING_INGEST', 'false').lower() == 'true'
+    STREAM_BATCH_ROWS = 10000
+
+    # Partitioned Parquet mirror: write these Knesset-scoped tables as
+    # data/parquet/<table>/KnessetNum=NN/part-*.parquet instead of one file,
+    # so readers filtering on KnessetNum only open the matching partitions.
+    ENABLE_PARTITIONED_PARQUET = os.getenv('ENABLE_PARTITIONED_PARQUET', 'false').lower() == 'true'
+    PARTITIONED_PARQUET_TABLES = ("KNS_Bill", "KNS_Query", "KNS_Agenda", "KNS_PersonToPosition")
+
     # Feature flags
     ENABLE_BACKGROUND_MONITORING = False
     ENABLE_CONNECTION_DASHBOARD = True
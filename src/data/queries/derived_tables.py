@@ -0,0 +1,246 @@
+"""
+Physical copies of the expensive shared CTEs.
+
+Several ``SQLTemplates`` CTEs (faction resolution, first-submission dates,
+per-bill session rollups) are embedded verbatim in most query packs and
+charts, so every interactive query used to recompute the same window
+functions and unions. After a refresh, ``materialize_derived_tables()``
+stores each of them once as a ``Derived*`` table, and
+``use_derived_tables()`` rewrites a query's inline CTE into a scan of that
+table before it is executed. The CTE name stays the same, so query text and
+results are unchanged; when a derived table is missing (fresh warehouse,
+mid-refresh, test databases) the inline CTE simply runs as before.
+
+The rewrite matches the ``SQLTemplates`` text exactly, except that filter
+slots may already be bound: their conditions are carried over into the scan
+of the derived table (``DerivedTable.scope``), so a pushed-down Knesset
+filter still applies and the query's parameters keep their order. A query
+must otherwise embed the template unchanged; ``check_derived_ctes()``
+enforces that for the query packs when they are assembled, so a pack that
+defines one of these CTEs with edited text fails at import instead of
+silently never using the derived table.
+
+Writers keep the tables honest: ``drop_derived_tables_reading()`` is called
+whenever a source table is replaced, so a derived table is never older than
+the tables it was built from.
+
+Core API:
+- DERIVED_TABLES: The materialized CTEs and their source tables
+- materialize_derived_tables(): Rebuild every derived table whose sources exist
+- drop_derived_tables_reading(): Drop derived tables built from changed tables
+- use_derived_tables(): Point a query's inline CTEs at the derived tables
+- check_derived_ctes(): Reject SQL whose shared CTEs the rewrite cannot match
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import duckdb
+
+from data.queries.filter_slots import declared_filter_slots, slot_pattern
+from data.queries.sql_templates import SQLTemplates
+
+
+@dataclass(frozen=True)
+class DerivedTable:
+    """A shared CTE and the physical table it is materialized into.
+
+    ``scope`` is required when the CTE has filter slots: the ``WHERE``
+    condition of the derived-table scan, in which ``{conditions}`` stands for
+    the conditions bound into the slots (in order).
+    """
+
+    name: str
+    cte: str
+    sources: Tuple[str, ...]
+    scope: str = ""
+
+    def __post_init__(self) -> None:
+        if declared_filter_slots(self.cte) and "{conditions}" not in self.scope:
+            raise ValueError(f"{self.name} has filter slots but no scope for them")
+
+    @property
+    def table(self) -> str:
+        return f"Derived{self.name}"
+
+    @property
+    def select_sql(self) -> str:
+        """The CTE as a standalone query (slots unbound, so every row)."""
+        return f"WITH {self.cte}\nSELECT * FROM {self.name}"
+
+    @functools.cached_property
+    def pattern(self) -> re.Pattern[str]:
+        """Matches the CTE as embedded, with its slots bound or not."""
+        return re.compile(slot_pattern(self.cte))
+
+    def rewrite(self, sql: str) -> str:
+        """Replace the inline CTE in ``sql`` with a scan of the derived table."""
+
+        def _scan(match: re.Match[str]) -> str:
+            conditions = " ".join(g for g in match.groups() if g.startswith("AND "))
+            if not conditions:
+                return f'{self.name} AS (SELECT * FROM "{self.table}")'
+            where = self.scope.format(conditions=conditions)
+            return f'{self.name} AS (SELECT * FROM "{self.table}" WHERE {where})'
+
+        return self.pattern.sub(_scan, sql)
+
+
+# Per-bill CTEs take their slot conditions on KNS_Bill (alias B)
+_BILL_SCOPE = "BillID IN (SELECT B.BillID FROM KNS_Bill B WHERE TRUE {conditions})"
+
+DERIVED_TABLES: Tuple[DerivedTable, ...] = (
+    DerivedTable(
+        "StandardFactionLookup",
+        SQLTemplates.STANDARD_FACTION_LOOKUP,
+        ("KNS_PersonToPosition",),
+    ),
+    DerivedTable(
+        "MemberFactionCoalition",
+        SQLTemplates.MEMBER_FACTION_COALITION,
+        ("KNS_PersonToPosition", "KNS_Faction", "UserFactionCoalitionStatus"),
+    ),
+    DerivedTable(
+        "BillFirstSubmission",
+        SQLTemplates.BILL_FIRST_SUBMISSION,
+        (
+            "KNS_Bill",
+            "KNS_BillInitiator",
+            "KNS_CmtSessionItem",
+            "KNS_CommitteeSession",
+            "KNS_PlmSessionItem",
+            "KNS_PlenumSession",
+        ),
+        _BILL_SCOPE,
+    ),
+    DerivedTable(
+        "BillCommitteeSessions",
+        SQLTemplates.BILL_COMMITTEE_SESSIONS,
+        ("KNS_CmtSessionItem", "KNS_CommitteeSession", "KNS_Bill"),
+        _BILL_SCOPE,
+    ),
+    DerivedTable(
+        "BillPlenumSessions",
+        SQLTemplates.BILL_PLENUM_SESSIONS,
+        ("KNS_PlmSessionItem", "KNS_PlenumSession", "KNS_Bill"),
+        _BILL_SCOPE,
+    ),
+)
+
+DERIVED_TABLE_NAMES: Tuple[str, ...] = tuple(d.table for d in DERIVED_TABLES)
+
+_logger = logging.getLogger(__name__)
+
+
+def _defines_cte(sql: str, name: str) -> bool:
+    return re.search(rf"\b{name}\s+AS\s*\(", sql, re.IGNORECASE) is not None
+
+
+def unmatched_derived_ctes(sql: str) -> List[str]:
+    """Names of derived CTEs ``sql`` defines with text other than the template."""
+    return [
+        d.name
+        for d in DERIVED_TABLES
+        if _defines_cte(sql, d.name) and not d.pattern.search(sql)
+    ]
+
+
+def check_derived_ctes(sql: str, label: str = "query") -> None:
+    """Raise ``ValueError`` if ``use_derived_tables()`` could not rewrite ``sql``.
+
+    Every CTE named after a derived table must be the ``SQLTemplates``
+    constant embedded verbatim (slots bound or not), or the rewrite would
+    silently skip it.
+    """
+    unmatched = unmatched_derived_ctes(sql)
+    if unmatched:
+        raise ValueError(
+            f"{label} defines {', '.join(unmatched)} with text that differs from "
+            "SQLTemplates; embed the template unchanged so the derived table is used"
+        )
+
+
+def _existing_tables(con: duckdb.DuckDBPyConnection, names: Iterable[str]) -> set[str]:
+    wanted = {n.lower(): n for n in names}
+    if not wanted:
+        return set()
+    placeholders = ", ".join(["?"] * len(wanted))
+    rows = con.execute(
+        f"SELECT table_name FROM duckdb_tables() WHERE lower(table_name) IN ({placeholders})",
+        list(wanted),
+    ).fetchall()
+    return {wanted[row[0].lower()] for row in rows if row[0].lower() in wanted}
+
+
+def materialize_derived_tables(
+    con: duckdb.DuckDBPyConnection, logger_obj: Optional[logging.Logger] = None
+) -> List[str]:
+    """Rebuild every derived table whose source tables exist.
+
+    Each table is replaced in one ``CREATE OR REPLACE``, so readers see the
+    old or the new copy, never a partial one. Returns the tables built.
+    """
+    logger_obj = logger_obj or logging.getLogger(__name__)
+    present = _existing_tables(con, {s for d in DERIVED_TABLES for s in d.sources})
+    built: List[str] = []
+    for derived in DERIVED_TABLES:
+        missing = [s for s in derived.sources if s not in present]
+        if missing:
+            logger_obj.info(f"Skipping {derived.table}: missing source tables {missing}")
+            con.execute(f'DROP TABLE IF EXISTS "{derived.table}"')
+            continue
+        try:
+            con.execute(f'CREATE OR REPLACE TABLE "{derived.table}" AS {derived.select_sql}')
+        except duckdb.Error as e:
+            logger_obj.warning(f"Could not materialize {derived.table}: {e}")
+            con.execute(f'DROP TABLE IF EXISTS "{derived.table}"')
+            continue
+        built.append(derived.table)
+    logger_obj.info(f"Materialized derived tables: {', '.join(built) or 'none'}")
+    return built
+
+
+def drop_derived_tables_reading(
+    con: duckdb.DuckDBPyConnection, table_names: Iterable[str]
+) -> List[str]:
+    """Drop the derived tables built from any of ``table_names``.
+
+    Queries fall back to the inline CTEs until the next
+    ``materialize_derived_tables()``. Returns the tables dropped.
+    """
+    changed = {name.lower() for name in table_names}
+    stale = [
+        d.table for d in DERIVED_TABLES if changed & {s.lower() for s in d.sources}
+    ]
+    dropped = sorted(_existing_tables(con, stale))
+    for table in dropped:
+        con.execute(f'DROP TABLE IF EXISTS "{table}"')
+    return dropped
+
+
+def use_derived_tables(con: duckdb.DuckDBPyConnection, sql: str) -> str:
+    """Replace inline shared CTEs in ``sql`` with scans of their derived tables.
+
+    Only CTEs embedded verbatim from ``SQLTemplates`` and whose derived
+    table exists on ``con`` are rewritten; anything else is returned as is.
+    Conditions already bound into a CTE's filter slots move into the scan
+    with their placeholders in the same order, so ``params`` still line up.
+    """
+    for name in unmatched_derived_ctes(sql):
+        _logger.warning(f"{name} CTE differs from SQLTemplates; not using its derived table")
+    candidates = [d for d in DERIVED_TABLES if d.pattern.search(sql)]
+    if not candidates:
+        return sql
+    try:
+        present = _existing_tables(con, [d.table for d in candidates])
+    except Exception:
+        return sql
+    for derived in candidates:
+        if derived.table in present:
+            sql = derived.rewrite(sql)
+    return sql
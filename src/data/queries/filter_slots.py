@@ -0,0 +1,108 @@
+"""
+Named filter slots for predefined query packs.
+
+A pack marks where a filter belongs with ``filter_slot(name, column)``, which
+renders to an SQL comment such as ``/*filter:knesset B.KnessetNum*/``. Slots
+sit inside a ``WHERE`` clause of the driving CTEs and the main query, so the
+SQL runs unchanged (unfiltered) when nothing is bound. The executor binds a
+slot by replacing each of its markers with ``AND <condition>``, which lets a
+single-Knesset request scan only that Knesset's rows instead of filtering
+the finished result of every CTE.
+
+The ``seek`` slot declares the pack's stable ordering key (a comma-separated
+column list matching its descending ``ORDER BY``) and is where keyset
+pagination binds "rows after the previous page's last key".
+
+Core API:
+- FILTER_SLOTS: Slot names packs may declare
+- filter_slot(): Marker to embed in a pack's SQL
+- declared_filter_slots(): Slot names present in an SQL string
+- declared_order_key(): Result columns of a pack's seek (ordering) key
+- bind_filter_slots(): Replace markers with bound conditions and parameters
+- slot_pattern(): Regex matching an SQL fragment whether or not it is bound
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, List, Mapping, Tuple
+
+KNESSET_SLOT = "knesset"
+FACTION_SLOT = "faction"
+DOCUMENT_TYPE_SLOT = "document_type"
+SEEK_SLOT = "seek"
+
+FILTER_SLOTS: Tuple[str, ...] = (KNESSET_SLOT, FACTION_SLOT, DOCUMENT_TYPE_SLOT, SEEK_SLOT)
+
+_SLOT_RE = re.compile(r"/\*filter:(\w+) ([\w.\", ]+?)\*/")
+
+# Builds the condition for one marker: column -> (condition SQL, params)
+SlotBinder = Callable[[str], Tuple[str, List[Any]]]
+
+
+def filter_slot(name: str, column: str) -> str:
+    """Return the marker for slot ``name`` filtering on ``column``.
+
+    ``column`` is the column (or, for document types, the table alias; for
+    the seek slot, the comma-separated key columns) the bound condition
+    refers to at the marker's position.
+    """
+    if name not in FILTER_SLOTS:
+        raise ValueError(f"Unknown filter slot: {name}")
+    return f"/*filter:{name} {column}*/"
+
+
+def declared_filter_slots(sql: str) -> frozenset[str]:
+    """Return the slot names that have at least one marker in ``sql``."""
+    return frozenset(m.group(1) for m in _SLOT_RE.finditer(sql))
+
+
+def declared_order_key(sql: str) -> Tuple[str, ...]:
+    """Return the result column names of the seek slot's key, or ``()``."""
+    for match in _SLOT_RE.finditer(sql):
+        if match.group(1) == SEEK_SLOT:
+            return tuple(
+                column.strip().rsplit(".", 1)[-1]
+                for column in match.group(2).split(",")
+                if column.strip()
+            )
+    return ()
+
+
+def bind_filter_slots(
+    sql: str, binders: Mapping[str, SlotBinder]
+) -> Tuple[str, List[Any]]:
+    """Bind every marker whose slot is in ``binders``.
+
+    Markers of unbound slots are left in place (they are comments).
+    Parameters are returned in the order their placeholders appear.
+    """
+    params: List[Any] = []
+
+    def _replace(match: re.Match[str]) -> str:
+        binder = binders.get(match.group(1))
+        if binder is None:
+            return match.group(0)
+        condition, condition_params = binder(match.group(2))
+        if not condition:
+            return match.group(0)
+        params.extend(condition_params)
+        return f"AND {condition}"
+
+    return _SLOT_RE.sub(_replace, sql), params
+
+
+def slot_pattern(sql: str) -> str:
+    """Return a regex matching ``sql`` before or after its markers are bound.
+
+    Each marker becomes a capturing group that matches either the marker
+    itself or the one-line ``AND <condition>`` a binder put in its place.
+    """
+    pieces: List[str] = []
+    pos = 0
+    for match in _SLOT_RE.finditer(sql):
+        pieces.append(re.escape(sql[pos:match.start()]))
+        pieces.append(f"({re.escape(match.group(0))}|AND [^\\n]*)")
+        pos = match.end()
+    pieces.append(re.escape(sql[pos:]))
+    return "".join(pieces)
@@ -2,12 +2,13 @@
 
 from typing import Any
 
+from data.queries.filter_slots import filter_slot
 from data.queries.sql_templates import SQLTemplates
 
 AGENDA_QUERIES: dict[str, dict[str, Any]] = {
     "Agenda Motions (Full Details)": {
         "sql": f"""
-WITH {SQLTemplates.STANDARD_FACTION_LOOKUP},
+WITH {SQLTemplates.MEMBER_FACTION_COALITION},
 -- Agenda Documents CTE (aggregates documents per agenda)
 {SQLTemplates.AGENDA_DOCUMENTS}
 SELECT
@@ -27,13 +28,13 @@
     COALESCE(P.IsCurrent, false) AS InitiatorMKIsCurrent,
 
     -- Simplified faction lookup
-    COALESCE(ufs.NewFactionName, f.Name, 'Unknown') AS InitiatorMKFactionName,
-    COALESCE(ufs.CoalitionStatus, 'Unknown') AS InitiatorMKFactionCoalitionStatus,
+    COALESCE(mfc.NewFactionName, mfc.FactionName, 'Unknown') AS InitiatorMKFactionName,
+    COALESCE(mfc.CoalitionStatus, 'Unknown') AS InitiatorMKFactionCoalitionStatus,
 
     -- Main Initiator Display (prominent field showing who proposed the agenda)
     CASE
         WHEN A.ClassificationDesc = 'עצמאית' AND P.PersonID IS NOT NULL THEN
-            P.FirstName || ' ' || P.LastName || ' (' || COALESCE(ufs.NewFactionName, f.Name, 'Unknown Faction') || ')'
+            P.FirstName || ' ' || P.LastName || ' (' || COALESCE(mfc.NewFactionName, mfc.FactionName, 'Unknown Faction') || ')'
         WHEN A.ClassificationDesc = 'כוללת' THEN
             'Inclusive Proposal (הצעה כוללת - Multiple MKs)'
         ELSE
@@ -77,21 +78,21 @@
 FROM KNS_Agenda A
 LEFT JOIN KNS_Person P ON A.InitiatorPersonID = P.PersonID
 LEFT JOIN KNS_Status S ON A.StatusID = S.StatusID
-LEFT JOIN StandardFactionLookup sfl ON A.InitiatorPersonID = sfl.PersonID
-    AND A.KnessetNum = sfl.KnessetNum
-    AND sfl.rn = 1
-LEFT JOIN KNS_Faction f ON sfl.FactionID = f.FactionID
-LEFT JOIN UserFactionCoalitionStatus ufs ON f.FactionID = ufs.FactionID
-    AND A.KnessetNum = ufs.KnessetNum
+LEFT JOIN MemberFactionCoalition mfc ON A.InitiatorPersonID = mfc.PersonID
+    AND A.KnessetNum = mfc.KnessetNum
 LEFT JOIN AgendaDocuments ad ON A.AgendaID = ad.AgendaID
 LEFT JOIN KNS_Agenda LA ON A.LeadingAgendaID = LA.AgendaID
 LEFT JOIN UserAgendaCoding uacoding ON A.AgendaID = uacoding.AgendaID
+WHERE 1 = 1
+    {filter_slot("knesset", "A.KnessetNum")}
+    {filter_slot("faction", "mfc.FactionID")}
+    {filter_slot("seek", "A.KnessetNum, A.AgendaID")}
 
 ORDER BY A.KnessetNum DESC, A.AgendaID DESC
 LIMIT 1000;
         """,
         "knesset_filter_column": "A.KnessetNum",
-        "faction_filter_column": "f.FactionID",
+        "faction_filter_column": "mfc.FactionID",
         "description": (
             "Comprehensive agenda items data with faction details, "
             "status information, and document links"
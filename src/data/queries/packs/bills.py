@@ -2,39 +2,46 @@
 
 from typing import Any
 
+from data.queries.filter_slots import filter_slot
 from data.queries.sql_templates import SQLTemplates
 
 BILLS_QUERIES: dict[str, dict[str, Any]] = {
     "Bills & Legislation (Full Details)": {
         "sql": f"""
-WITH {SQLTemplates.STANDARD_FACTION_LOOKUP},
+WITH {SQLTemplates.MEMBER_FACTION_COALITION},
 BillMainInitiatorFaction AS (
     SELECT
         BI.BillID,
         B.KnessetNum,
         BI.PersonID as MainInitiatorPersonID,
-        sfl.FactionID,
+        mfc.FactionID,
+        mfc.FactionName,
+        mfc.NewFactionName,
+        mfc.CoalitionStatus,
         ROW_NUMBER() OVER (PARTITION BY BI.BillID ORDER BY BI.Ordinal) as rn
     FROM KNS_BillInitiator BI
     JOIN KNS_Bill B ON BI.BillID = B.BillID
-    LEFT JOIN StandardFactionLookup sfl ON BI.PersonID = sfl.PersonID
-        AND B.KnessetNum = sfl.KnessetNum
-        AND sfl.rn = 1
+    LEFT JOIN MemberFactionCoalition mfc ON BI.PersonID = mfc.PersonID
+        AND B.KnessetNum = mfc.KnessetNum
     WHERE BI.Ordinal = 1
+        {filter_slot("knesset", "B.KnessetNum")}
 ),
 BillSupportingMemberFactions AS (
     SELECT
         BI.BillID,
         BI.PersonID,
         B.KnessetNum,
-        sfl.FactionID,
+        mfc.FactionID,
+        mfc.FactionName,
+        mfc.NewFactionName,
+        mfc.CoalitionStatus,
         ROW_NUMBER() OVER (PARTITION BY BI.BillID, BI.PersonID ORDER BY BI.Ordinal) as rn
     FROM KNS_BillInitiator BI
     JOIN KNS_Bill B ON BI.BillID = B.BillID
-    LEFT JOIN StandardFactionLookup sfl ON BI.PersonID = sfl.PersonID
-        AND B.KnessetNum = sfl.KnessetNum
-        AND sfl.rn = 1
+    LEFT JOIN MemberFactionCoalition mfc ON BI.PersonID = mfc.PersonID
+        AND B.KnessetNum = mfc.KnessetNum
     WHERE BI.Ordinal > 1
+        {filter_slot("knesset", "B.KnessetNum")}
 ),
 BillMergeInfo AS (
     SELECT
@@ -45,38 +52,8 @@
     FROM KNS_BillUnion bu
     LEFT JOIN KNS_Bill lb ON bu.MainBillID = lb.BillID
 ),
-BillCommitteeSessions AS (
-    -- Direct bill-to-session connections using complete KNS_CmtSessionItem dataset
-    SELECT
-        csi.ItemID as BillID,
-        COUNT(DISTINCT csi.CommitteeSessionID) as BillSpecificSessions,
-        MIN(CAST(cs.StartDate AS TIMESTAMP)) as FirstRelevantSession,
-        MAX(CAST(cs.StartDate AS TIMESTAMP)) as LastRelevantSession
-    FROM KNS_CmtSessionItem csi
-    JOIN KNS_CommitteeSession cs ON csi.CommitteeSessionID = cs.CommitteeSessionID
-    WHERE csi.ItemID IS NOT NULL
-        AND cs.StartDate IS NOT NULL
-    GROUP BY csi.ItemID
-),
-BillPlenumSessions AS (
-    SELECT
-        psi.ItemID as BillID,
-        COUNT(DISTINCT psi.PlenumSessionID) as PlenumSessionCount,
-        MIN(CAST(ps.StartDate AS TIMESTAMP)) as FirstPlenumSession,
-        MAX(CAST(ps.StartDate AS TIMESTAMP)) as LastPlenumSession,
-        AVG(CASE
-            WHEN ps.StartDate IS NOT NULL AND ps.FinishDate IS NOT NULL
-            THEN DATE_DIFF('minute', CAST(ps.StartDate AS TIMESTAMP), CAST(ps.FinishDate AS TIMESTAMP))
-        END) as AvgPlenumSessionDurationMinutes,
-        GROUP_CONCAT(
-            DISTINCT CAST(ps.Number AS VARCHAR) || ': ' || ps.Name,
-            ' | ' ORDER BY CAST(ps.Number AS VARCHAR) || ': ' || ps.Name
-        ) as PlenumSessionNames
-    FROM KNS_PlmSessionItem psi
-    JOIN KNS_PlenumSession ps ON psi.PlenumSessionID = ps.PlenumSessionID
-    WHERE psi.ItemID IS NOT NULL
-    GROUP BY psi.ItemID
-),
+{SQLTemplates.BILL_COMMITTEE_SESSIONS},
+{SQLTemplates.BILL_PLENUM_SESSIONS},
 BillDocuments AS (
     -- Prioritize documents by importance and recency
     SELECT
@@ -137,7 +114,9 @@
         ) as DocumentLinks
 
     FROM KNS_DocumentBill db
+    JOIN KNS_Bill B ON db.BillID = B.BillID
     WHERE db.FilePath IS NOT NULL
+        {filter_slot("knesset", "B.KnessetNum")}
     GROUP BY db.BillID
 ),
 {SQLTemplates.BILL_FIRST_SUBMISSION}
@@ -194,7 +173,7 @@
     CASE
         WHEN COUNT(DISTINCT BI.PersonID) > 0 THEN
             COALESCE(
-                MAX(CASE WHEN BI.Ordinal = 1 THEN COALESCE(ufs.NewFactionName, f.Name) END),
+                MAX(CASE WHEN BI.Ordinal = 1 THEN COALESCE(bmif.NewFactionName, bmif.FactionName) END),
                 'Unknown'
             )
         ELSE 'Government'
@@ -204,7 +183,7 @@
     CASE
         WHEN COUNT(DISTINCT BI.PersonID) > 0 THEN
             COALESCE(
-                MAX(CASE WHEN BI.Ordinal = 1 THEN ufs.CoalitionStatus END),
+                MAX(CASE WHEN BI.Ordinal = 1 THEN bmif.CoalitionStatus END),
                 'Unknown'
             )
         ELSE 'Government'
@@ -232,8 +211,8 @@
     CASE
         WHEN COUNT(DISTINCT CASE WHEN BI.Ordinal > 1 THEN BI.PersonID END) > 0 THEN
             GROUP_CONCAT(
-                DISTINCT CASE WHEN BI.Ordinal > 1 THEN (Pi.FirstName || ' ' || Pi.LastName || ' (' || COALESCE(sufs.NewFactionName, sf.Name, 'Unknown Faction') || ')') END,
-                ', ' ORDER BY CASE WHEN BI.Ordinal > 1 THEN (Pi.FirstName || ' ' || Pi.LastName || ' (' || COALESCE(sufs.NewFactionName, sf.Name, 'Unknown Faction') || ')') END
+                DISTINCT CASE WHEN BI.Ordinal > 1 THEN (Pi.FirstName || ' ' || Pi.LastName || ' (' || COALESCE(bsmf.NewFactionName, bsmf.FactionName, 'Unknown Faction') || ')') END,
+                ', ' ORDER BY CASE WHEN BI.Ordinal > 1 THEN (Pi.FirstName || ' ' || Pi.LastName || ' (' || COALESCE(bsmf.NewFactionName, bsmf.FactionName, 'Unknown Faction') || ')') END
             )
         ELSE 'None'
     END AS BillSupportingMembersWithFactions,
@@ -242,23 +221,23 @@
     COUNT(DISTINCT CASE WHEN BI.Ordinal > 1 THEN BI.PersonID END) AS BillSupportingMemberCount,
 
     -- Coalition/Opposition member counts
-    COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND ufs.CoalitionStatus = 'Coalition' THEN BI.PersonID
-                        WHEN BI.Ordinal > 1 AND sufs.CoalitionStatus = 'Coalition' THEN BI.PersonID END) AS BillCoalitionMemberCount,
-    COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND ufs.CoalitionStatus = 'Opposition' THEN BI.PersonID
-                        WHEN BI.Ordinal > 1 AND sufs.CoalitionStatus = 'Opposition' THEN BI.PersonID END) AS BillOppositionMemberCount,
+    COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND bmif.CoalitionStatus = 'Coalition' THEN BI.PersonID
+                        WHEN BI.Ordinal > 1 AND bsmf.CoalitionStatus = 'Coalition' THEN BI.PersonID END) AS BillCoalitionMemberCount,
+    COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND bmif.CoalitionStatus = 'Opposition' THEN BI.PersonID
+                        WHEN BI.Ordinal > 1 AND bsmf.CoalitionStatus = 'Opposition' THEN BI.PersonID END) AS BillOppositionMemberCount,
 
     -- Coalition/Opposition member percentages
     CASE
         WHEN COUNT(DISTINCT BI.PersonID) > 0 THEN
-            ROUND((COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND ufs.CoalitionStatus = 'Coalition' THEN BI.PersonID
-                                      WHEN BI.Ordinal > 1 AND sufs.CoalitionStatus = 'Coalition' THEN BI.PersonID END) * 100.0)
+            ROUND((COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND bmif.CoalitionStatus = 'Coalition' THEN BI.PersonID
+                                      WHEN BI.Ordinal > 1 AND bsmf.CoalitionStatus = 'Coalition' THEN BI.PersonID END) * 100.0)
                   / COUNT(DISTINCT BI.PersonID), 1)
         ELSE 0.0
     END AS BillCoalitionMemberPercentage,
     CASE
         WHEN COUNT(DISTINCT BI.PersonID) > 0 THEN
-            ROUND((COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND ufs.CoalitionStatus = 'Opposition' THEN BI.PersonID
-                                      WHEN BI.Ordinal > 1 AND sufs.CoalitionStatus = 'Opposition' THEN BI.PersonID END) * 100.0)
+            ROUND((COUNT(DISTINCT CASE WHEN BI.Ordinal = 1 AND bmif.CoalitionStatus = 'Opposition' THEN BI.PersonID
+                                      WHEN BI.Ordinal > 1 AND bsmf.CoalitionStatus = 'Opposition' THEN BI.PersonID END) * 100.0)
                   / COUNT(DISTINCT BI.PersonID), 1)
         ELSE 0.0
     END AS BillOppositionMemberPercentage,
@@ -362,15 +341,9 @@
 LEFT JOIN KNS_BillInitiator BI ON B.BillID = BI.BillID
 LEFT JOIN KNS_Person Pi ON BI.PersonID = Pi.PersonID
 LEFT JOIN BillMainInitiatorFaction bmif ON B.BillID = bmif.BillID AND bmif.rn = 1
-LEFT JOIN KNS_Faction f ON bmif.FactionID = f.FactionID
-LEFT JOIN UserFactionCoalitionStatus ufs ON f.FactionID = ufs.FactionID
-    AND B.KnessetNum = ufs.KnessetNum
 LEFT JOIN BillSupportingMemberFactions bsmf ON BI.BillID = bsmf.BillID
     AND BI.PersonID = bsmf.PersonID
     AND bsmf.rn = 1
-LEFT JOIN KNS_Faction sf ON bsmf.FactionID = sf.FactionID
-LEFT JOIN UserFactionCoalitionStatus sufs ON sf.FactionID = sufs.FactionID
-    AND B.KnessetNum = sufs.KnessetNum
 LEFT JOIN BillMergeInfo bmi ON B.BillID = bmi.MergedBillID
 LEFT JOIN BillCommitteeSessions bcs ON B.BillID = bcs.BillID
 LEFT JOIN BillPlenumSessions bps ON B.BillID = bps.BillID
@@ -381,6 +354,10 @@
 LEFT JOIN UserCAPTaxonomy capt ON cap.CAPMinorCode = capt.MinorCode
 LEFT JOIN UserResearchers capr ON cap.ResearcherID = capr.ResearcherID
 LEFT JOIN UserBillCoding ubcoding ON B.BillID = ubcoding.BillID
+WHERE 1 = 1
+    {filter_slot("knesset", "B.KnessetNum")}
+    {filter_slot("document_type", "bd")}
+    {filter_slot("seek", "B.KnessetNum, B.BillID")}
 
 GROUP BY
     B.BillID, B.KnessetNum, B.Name, B.SubTypeID, B.SubTypeDesc, B.PrivateNumber,
@@ -2,12 +2,13 @@
 
 from typing import Any
 
+from data.queries.filter_slots import filter_slot
 from data.queries.sql_templates import SQLTemplates
 
 PARLIAMENTARY_QUERIES: dict[str, dict[str, Any]] = {
     "Parliamentary Queries (Full Details)": {
         "sql": f"""
-WITH {SQLTemplates.STANDARD_FACTION_LOOKUP},
+WITH {SQLTemplates.MEMBER_FACTION_COALITION},
 {SQLTemplates.MINISTER_LOOKUP}
 SELECT
     Q.QueryID,
@@ -23,8 +24,8 @@
     P.IsCurrent AS MKIsCurrent,
 
     -- Use simplified faction lookup with our improved faction data
-    COALESCE(ufs.NewFactionName, f.Name, 'Unknown') AS MKFactionName,
-    COALESCE(ufs.CoalitionStatus, 'Unknown') AS MKFactionCoalitionStatus,
+    COALESCE(mfc.NewFactionName, mfc.FactionName, 'Unknown') AS MKFactionName,
+    COALESCE(mfc.CoalitionStatus, 'Unknown') AS MKFactionCoalitionStatus,
 
     M.Name AS MinistryName,
     M.IsActive AS MinistryIsActive,
@@ -47,21 +48,21 @@
 LEFT JOIN KNS_Person P ON Q.PersonID = P.PersonID
 LEFT JOIN KNS_GovMinistry M ON Q.GovMinistryID = M.GovMinistryID
 LEFT JOIN KNS_Status S ON Q.StatusID = S.StatusID
-LEFT JOIN StandardFactionLookup sfl ON Q.PersonID = sfl.PersonID
-    AND Q.KnessetNum = sfl.KnessetNum
-    AND sfl.rn = 1
-LEFT JOIN KNS_Faction f ON sfl.FactionID = f.FactionID
-LEFT JOIN UserFactionCoalitionStatus ufs ON f.FactionID = ufs.FactionID
-    AND Q.KnessetNum = ufs.KnessetNum
+LEFT JOIN MemberFactionCoalition mfc ON Q.PersonID = mfc.PersonID
+    AND Q.KnessetNum = mfc.KnessetNum
 LEFT JOIN MinisterLookup ml ON Q.GovMinistryID = ml.GovMinistryID AND ml.rn = 1
 LEFT JOIN KNS_Person min_p ON ml.PersonID = min_p.PersonID
 LEFT JOIN UserQueryCoding uqcoding ON Q.QueryID = uqcoding.QueryID
+WHERE 1 = 1
+    {filter_slot("knesset", "Q.KnessetNum")}
+    {filter_slot("faction", "mfc.FactionID")}
+    {filter_slot("seek", "Q.KnessetNum, Q.QueryID")}
 
 ORDER BY Q.KnessetNum DESC, Q.QueryID DESC
 LIMIT 1000;
         """,
         "knesset_filter_column": "Q.KnessetNum",
-        "faction_filter_column": "f.FactionID",
+        "faction_filter_column": "mfc.FactionID",
         "description": (
             "Comprehensive query data with faction details, "
             "ministry information, and responsible ministers"
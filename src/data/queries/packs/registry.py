@@ -4,6 +4,8 @@
 
 from typing import Any
 
+from data.queries.derived_tables import check_derived_ctes
+
 from .agenda import AGENDA_QUERIES
 from .bills import BILLS_QUERIES
 from .parliamentary import PARLIAMENTARY_QUERIES
@@ -15,4 +17,6 @@ def build_predefined_queries() -> dict[str, dict[str, Any]]:
     queries.update(PARLIAMENTARY_QUERIES)
     queries.update(AGENDA_QUERIES)
     queries.update(BILLS_QUERIES)
+    for name, query in queries.items():
+        check_derived_ctes(query.get("sql", ""), label=f"Query pack '{name}'")
     return queries
@@ -4,6 +4,7 @@
 
 from typing import Any
 
+from data.queries.filter_slots import declared_filter_slots, declared_order_key
 from data.queries.packs import build_predefined_queries
 from data.queries.types import QueryDefinition
 
@@ -28,12 +29,15 @@ def get_query_definition(query_name: str) -> QueryDefinition | None:
     if not query_info:
         return None
 
+    sql = query_info.get("sql", "")
     return QueryDefinition(
         name=query_name,
-        sql=query_info.get("sql", ""),
+        sql=sql,
         knesset_filter_column=query_info.get("knesset_filter_column"),
         faction_filter_column=query_info.get("faction_filter_column"),
         description=query_info.get("description", ""),
+        filter_slots=declared_filter_slots(sql),
+        order_key=declared_order_key(sql),
     )
 
 
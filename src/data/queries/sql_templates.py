@@ -16,6 +16,8 @@
 
 from typing import Dict, List
 
+from data.queries.filter_slots import filter_slot
+
 
 class SQLTemplates:
     """Reusable SQL CTE fragments for query construction."""
@@ -41,7 +43,7 @@ class SQLTemplates:
     # Bill first submission date calculation
     # Considers: initiator assignment, committee sessions, plenum sessions, publication
     # Used in: Bills query, Bills per Faction chart, Bills by Coalition chart, Top Initiators chart
-    BILL_FIRST_SUBMISSION = """BillFirstSubmission AS (
+    BILL_FIRST_SUBMISSION = f"""BillFirstSubmission AS (
     -- Get the earliest activity date for each bill (true submission date)
     SELECT
         B.BillID,
@@ -88,9 +90,85 @@ class SQLTemplates:
         WHERE B.PublicationDate IS NOT NULL
     ) all_dates ON B.BillID = all_dates.BillID
     WHERE all_dates.earliest_date IS NOT NULL
+        {filter_slot("knesset", "B.KnessetNum")}
     GROUP BY B.BillID
 )"""
 
+    # Resolved faction per MK and Knesset: the StandardFactionLookup winner joined
+    # to its faction name and coalition status (the FactionResolver join chain)
+    # Used in: Bills, Agenda Motions and Parliamentary Queries
+    MEMBER_FACTION_COALITION = """MemberFactionCoalition AS (
+    SELECT
+        ranked.PersonID,
+        ranked.KnessetNum,
+        ranked.FactionID,
+        f.Name AS FactionName,
+        ufs.NewFactionName,
+        ufs.CoalitionStatus
+    FROM (
+        SELECT
+            ptp.PersonID,
+            ptp.KnessetNum,
+            ptp.FactionID,
+            ROW_NUMBER() OVER (
+                PARTITION BY ptp.PersonID, ptp.KnessetNum
+                ORDER BY
+                    CASE WHEN ptp.FactionID IS NOT NULL THEN 0 ELSE 1 END,
+                    ptp.KnessetNum DESC,
+                    ptp.StartDate DESC NULLS LAST
+            ) as rn
+        FROM KNS_PersonToPosition ptp
+        WHERE ptp.FactionID IS NOT NULL
+    ) ranked
+    LEFT JOIN KNS_Faction f ON ranked.FactionID = f.FactionID
+    LEFT JOIN UserFactionCoalitionStatus ufs ON f.FactionID = ufs.FactionID
+        AND ranked.KnessetNum = ufs.KnessetNum
+    WHERE ranked.rn = 1
+)"""
+
+    # Committee sessions that discussed each bill (joined to KNS_Bill so a
+    # Knesset filter bound into its slot narrows the session scan)
+    # Used in: Bills query
+    BILL_COMMITTEE_SESSIONS = f"""BillCommitteeSessions AS (
+    -- Direct bill-to-session connections using complete KNS_CmtSessionItem dataset
+    SELECT
+        csi.ItemID as BillID,
+        COUNT(DISTINCT csi.CommitteeSessionID) as BillSpecificSessions,
+        MIN(CAST(cs.StartDate AS TIMESTAMP)) as FirstRelevantSession,
+        MAX(CAST(cs.StartDate AS TIMESTAMP)) as LastRelevantSession
+    FROM KNS_CmtSessionItem csi
+    JOIN KNS_CommitteeSession cs ON csi.CommitteeSessionID = cs.CommitteeSessionID
+    JOIN KNS_Bill B ON csi.ItemID = B.BillID
+    WHERE csi.ItemID IS NOT NULL
+        AND cs.StartDate IS NOT NULL
+        {filter_slot("knesset", "B.KnessetNum")}
+    GROUP BY csi.ItemID
+)"""
+
+    # Plenum sessions that discussed each bill (Knesset slot as above)
+    # Used in: Bills query
+    BILL_PLENUM_SESSIONS = f"""BillPlenumSessions AS (
+    SELECT
+        psi.ItemID as BillID,
+        COUNT(DISTINCT psi.PlenumSessionID) as PlenumSessionCount,
+        MIN(CAST(ps.StartDate AS TIMESTAMP)) as FirstPlenumSession,
+        MAX(CAST(ps.StartDate AS TIMESTAMP)) as LastPlenumSession,
+        AVG(CASE
+            WHEN ps.StartDate IS NOT NULL AND ps.FinishDate IS NOT NULL
+            THEN DATE_DIFF('minute', CAST(ps.StartDate AS TIMESTAMP), CAST(ps.FinishDate AS TIMESTAMP))
+        END) as AvgPlenumSessionDurationMinutes,
+        GROUP_CONCAT(
+            DISTINCT CAST(ps.Number AS VARCHAR) || ': ' || ps.Name,
+            ' | ' ORDER BY CAST(ps.Number AS VARCHAR) || ': ' || ps.Name
+        ) as PlenumSessionNames
+    FROM KNS_PlmSessionItem psi
+    JOIN KNS_PlenumSession ps ON psi.PlenumSessionID = ps.PlenumSessionID
+    JOIN KNS_Bill B ON psi.ItemID = B.BillID
+    WHERE psi.ItemID IS NOT NULL
+        {filter_slot("knesset", "B.KnessetNum")}
+    GROUP BY psi.ItemID
+)"""
+
     # Bill status categorization CASE statement
     # - Passed (118): Green
     # - First Reading (104,108,111,141,109,101,106,142,150,113,130,114): Blue
@@ -218,6 +296,8 @@ def get_bill_first_submission(cls, bill_alias: str = "B") -> str:
         """
         if bill_alias == "B":
             return cls.BILL_FIRST_SUBMISSION
-        return cls.BILL_FIRST_SUBMISSION.replace("B.BillID", f"{bill_alias}.BillID").replace(
-            "FROM KNS_Bill B", f"FROM KNS_Bill {bill_alias}"
+        return (
+            cls.BILL_FIRST_SUBMISSION.replace("B.BillID", f"{bill_alias}.BillID")
+            .replace("B.KnessetNum", f"{bill_alias}.KnessetNum")
+            .replace("FROM KNS_Bill B", f"FROM KNS_Bill {bill_alias}")
         )
@@ -14,6 +14,8 @@ class PaginationSpec:
 
     limit: int | None = None
     offset: int = 0
+    # Keyset: order-key values of the previous page's last row
+    after: tuple[Any, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -25,6 +27,8 @@ class QueryDefinition:
     knesset_filter_column: str | None = None
     faction_filter_column: str | None = None
     description: str = ""
+    filter_slots: frozenset[str] = frozenset()
+    order_key: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
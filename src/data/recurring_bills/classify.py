@@ -173,7 +173,7 @@ def build_k16_k18_doc_based(
 
     For each K16-K18 bill in Amnon's Excel:
     - Download the first ``documents`` URL from ``fs.knesset.gov.il`` (cached)
-    - Extract text via ``textutil`` (.doc/.docx) or ``pypdf`` (.pdf)
+    - Extract text via ``word_text`` (.doc/.docx) or ``pypdf`` (.pdf)
     - Scan for Hebrew recurrence markers
     - Resolve ``פ/NNN`` references to BillIDs via KNS_Bill.PrivateNumber
 
@@ -0,0 +1,265 @@
+"""Concurrent, rate-limited prefetch of bill documents into the doc cache.
+
+``classify_bill_from_doc`` used to download each missing document inline,
+one at a time behind a fixed sleep, so a cold-cache full scan spent almost
+all of its time waiting on ``fs.knesset.gov.il``. This module runs ahead of
+classification instead:
+
+* Workers share one pooled ``requests.Session``, so connections stay open.
+* A token bucket caps the total request rate across all workers.
+* A 429 or 5xx response halves that rate and pauses every worker, for the
+  ``Retry-After`` the server sent or an exponential back-off. Each success
+  then wins a little of the rate back.
+* Each file is streamed to ``<bill_id>.<ext>.part`` and renamed into place
+  once complete, so a crash never leaves a truncated document that later
+  runs would take for a cached one.
+
+Classification then only reads from the cache directory.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data.recurring_bills.knesset_docs import DEFAULT_TIMEOUT_S, USER_AGENT, doc_cache_path
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_REQUESTS_PER_S = 5.0
+MAX_ATTEMPTS = 5
+
+_MIN_REQUESTS_PER_S = 0.2
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_BACKOFF_BASE_S = 2.0
+_BACKOFF_CAP_S = 120.0
+_CHUNK_BYTES = 1024 * 1024
+
+# Per-document outcomes reported by ``prefetch_docs``
+CACHED = "cached"
+DOWNLOADED = "downloaded"
+NOT_FOUND = "not_found"
+UNSUPPORTED = "unsupported"
+FAILED = "failed"
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate backs off under server pressure.
+
+    ``acquire`` blocks until a request may be sent. ``penalize`` halves the
+    rate (down to a floor) and holds every caller until the pause is over;
+    ``reward`` raises the rate back toward its target by a small step, so
+    the bucket settles just below the rate the server tolerates.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self.target_rate = rate_per_s
+        self.rate = rate_per_s
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def penalize(self, pause_s: float) -> None:
+        with self._lock:
+            self.rate = max(_MIN_REQUESTS_PER_S, self.rate / 2)
+            self._paused_until = max(self._paused_until, self._clock() + pause_s)
+            self._tokens = 0.0
+            self._updated = self._clock()
+
+    def reward(self) -> None:
+        with self._lock:
+            if self.rate < self.target_rate:
+                self.rate = min(self.target_rate, self.rate + self.target_rate / 20)
+
+
+def make_session(pool_size: int = DEFAULT_DOWNLOAD_WORKERS) -> requests.Session:
+    """Session with a connection pool large enough for every worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def _retry_after_s(resp: requests.Response, attempt: int) -> float:
+    """Server's ``Retry-After`` seconds if given, else exponential back-off."""
+    header = resp.headers.get("Retry-After", "")
+    if header.strip().isdigit():
+        return min(float(header), _BACKOFF_CAP_S)
+    return min(_BACKOFF_BASE_S * 2**attempt, _BACKOFF_CAP_S)
+
+
+def _write_atomically(resp: requests.Response, cache_path: Path) -> None:
+    tmp_path = cache_path.with_name(cache_path.name + ".part")
+    try:
+        with tmp_path.open("wb") as fh:
+            for chunk in resp.iter_content(_CHUNK_BYTES):
+                fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def fetch_to_cache(
+    session: requests.Session,
+    url: str,
+    cache_path: Path,
+    bucket: TokenBucket,
+    *,
+    timeout_s: int = DEFAULT_TIMEOUT_S,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> str:
+    """Download one document into the cache. Returns its outcome.
+
+    404 is final. 429/5xx and network errors (including a body cut off
+    mid-stream) are retried with back-off, up to ``max_attempts``. Any
+    other 4xx, or an error writing the cache file, fails at once.
+    """
+    if cache_path.exists():
+        return CACHED
+    for attempt in range(max_attempts):
+        bucket.acquire()
+        try:
+            with session.get(url, timeout=timeout_s, stream=True, allow_redirects=True) as resp:
+                if resp.status_code == 404:
+                    log.warning("Doc not found (404): %s", url)
+                    return NOT_FOUND
+                if resp.status_code in _RETRY_STATUSES:
+                    pause = _retry_after_s(resp, attempt)
+                    log.warning(
+                        "HTTP %d for %s (attempt %d/%d); backing off %.1fs",
+                        resp.status_code, url, attempt + 1, max_attempts, pause,
+                    )
+                    bucket.penalize(pause)
+                    continue
+                resp.raise_for_status()
+                _write_atomically(resp, cache_path)
+        except requests.HTTPError as exc:
+            log.warning("Download failed for %s: %s", url, exc)
+            return FAILED
+        except requests.RequestException as exc:
+            # Connection drops, timeouts and bodies cut off mid-stream
+            pause = min(_BACKOFF_BASE_S * 2**attempt, _BACKOFF_CAP_S)
+            log.warning("Attempt %d/%d for %s failed: %s", attempt + 1, max_attempts, url, exc)
+            bucket.penalize(pause)
+            continue
+        except OSError as exc:
+            log.warning("Could not write %s for %s: %s", cache_path.name, url, exc)
+            return FAILED
+        bucket.reward()
+        return DOWNLOADED
+    return FAILED
+
+
+def prefetch_docs(
+    docs: Iterable[tuple[int, str]],
+    cache_dir: Path,
+    *,
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    requests_per_s: float = DEFAULT_REQUESTS_PER_S,
+    session: requests.Session | None = None,
+    progress_cb: Callable[[int, int, int, str], None] | None = None,
+) -> dict[int, str]:
+    """Download every ``(bill_id, doc_url)`` not yet cached. Returns outcomes.
+
+    Documents already on disk cost no request. Stray ``.part`` files from an
+    interrupted run are removed first.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stray in cache_dir.glob("*.part"):
+        stray.unlink(missing_ok=True)
+
+    outcomes: dict[int, str] = {}
+    pending: list[tuple[int, str, Path]] = []
+    for bill_id, url in docs:
+        cache_path = doc_cache_path(cache_dir, bill_id, url)
+        if cache_path is None:
+            outcomes[bill_id] = UNSUPPORTED
+        elif cache_path.exists():
+            outcomes[bill_id] = CACHED
+        else:
+            pending.append((bill_id, url, cache_path))
+
+    log.info(
+        "Doc prefetch: %d to download, %d already cached, %d unsupported",
+        len(pending),
+        sum(1 for o in outcomes.values() if o == CACHED),
+        sum(1 for o in outcomes.values() if o == UNSUPPORTED),
+    )
+    if not pending:
+        return outcomes
+
+    bucket = TokenBucket(requests_per_s, burst=max(1, workers))
+    own_session = session is None
+    session = session or make_session(workers)
+    lock = threading.Lock()
+    done = 0
+
+    def fetch(job: tuple[int, str, Path]) -> None:
+        nonlocal done
+        bill_id, url, cache_path = job
+        outcome = fetch_to_cache(session, url, cache_path, bucket)
+        with lock:
+            outcomes[bill_id] = outcome
+            done += 1
+            if progress_cb:
+                progress_cb(done, len(pending), bill_id, outcome)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            list(pool.map(fetch, pending))
+    finally:
+        if own_session:
+            session.close()
+
+    log.info(
+        "Doc prefetch done: %d downloaded, %d not found, %d failed",
+        sum(1 for o in outcomes.values() if o == DOWNLOADED),
+        sum(1 for o in outcomes.values() if o == NOT_FOUND),
+        sum(1 for o in outcomes.values() if o == FAILED),
+    )
+    return outcomes
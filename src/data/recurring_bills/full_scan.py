@@ -18,21 +18,32 @@
 from ``bill_classifications``, preserving Tal's labels for comparison.
 
 Resumable by virtue of the disk cache at ``data/external/knesset_docs/``
-(shared with the K16-K18 pipeline). Per-bill exception isolation means
-one bad bill doesn't poison the run.
+(shared with the K16-K18 pipeline). Missing documents are fetched up front
+by ``doc_download.prefetch_docs`` — concurrently, under a shared rate limit —
+so classification itself only reads from that cache. Per-bill exception
+isolation means one bad bill doesn't poison the run.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 import duckdb
 import pandas as pd
 
+from data.recurring_bills.doc_download import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    DEFAULT_REQUESTS_PER_S,
+    prefetch_docs,
+)
 from data.recurring_bills.knesset_docs import classify_bill_from_doc
 
 log = logging.getLogger(__name__)
@@ -49,22 +60,146 @@ def _serialize_reference_candidates(candidates: list[dict] | None) -> str:
     return json.dumps(candidates, ensure_ascii=False, sort_keys=True)
 
 
-def _pick_best_doc_url(con: duckdb.DuckDBPyConnection, bill_id: int) -> str | None:
-    """Return the highest-priority doc URL for a BillID, or None if none exists."""
-    for doc_type in _DOC_TYPE_PREFERENCE:
-        row = con.execute(
+def _best_doc_urls(con: duckdb.DuckDBPyConnection, bills: pd.DataFrame) -> dict[int, str]:
+    """Return the highest-priority doc URL of every bill in ``bills`` that has one.
+
+    One windowed query instead of a lookup per bill: documents rank by
+    ``_DOC_TYPE_PREFERENCE`` first, then the earliest ``LastUpdatedDate``
+    (``FilePath`` breaks exact ties so reruns pick the same file).
+    """
+    con.register("scan_bills", bills[["BillID"]])
+    try:
+        rows = con.execute(
             """
-            SELECT FilePath
+            SELECT BillID, FilePath
             FROM KNS_DocumentBill
-            WHERE BillID = ? AND GroupTypeDesc = ? AND FilePath IS NOT NULL
-            ORDER BY LastUpdatedDate ASC
-            LIMIT 1
+            WHERE BillID IN (SELECT BillID FROM scan_bills)
+              AND list_contains(?, GroupTypeDesc)
+              AND FilePath IS NOT NULL AND FilePath <> ''
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY BillID
+                ORDER BY list_position(?, GroupTypeDesc), LastUpdatedDate ASC, FilePath
+            ) = 1
             """,
-            [bill_id, doc_type],
-        ).fetchone()
-        if row and row[0]:
-            return row[0]
-    return None
+            [_DOC_TYPE_PREFERENCE, _DOC_TYPE_PREFERENCE],
+        ).fetchall()
+    finally:
+        con.unregister("scan_bills")
+    return {int(bill_id): file_path for bill_id, file_path in rows}
+
+
+# (BillID, KnessetNum, Name, PrivateNumber, doc_url) — one bill to classify
+_Job = tuple[int, int, object, object, str | None]
+
+_BLANK_RESULT = {
+    "is_recurring": False,
+    "original_bill_id": None,
+    "matched_phrase": None,
+    "method": "doc_fetch_failed",
+}
+
+
+def _classify_job(job: _Job, cache_dir: Path, con: duckdb.DuckDBPyConnection) -> dict:
+    """Build the result row for one bill from its cached document.
+
+    An exception while classifying is confined to that bill: it is logged
+    and the bill is recorded as ``doc_fetch_failed`` so the scan carries on.
+    """
+    bid, kn, name, private_number, doc_url = job
+    if not doc_url:
+        return {
+            "BillID": bid,
+            "KnessetNum": kn,
+            "Name": name,
+            "PrivateNumber": private_number,
+            "is_original": True,
+            "original_bill_id": bid,
+            "matched_phrase": None,
+            "method": "no_doc_url",
+            "reference_candidates": "[]",
+            "reference_candidate_count": 0,
+            "reference_resolution_reason": None,
+            "reference_resolution_confidence": None,
+            "multiple_references_detected": False,
+            "submission_date": None,
+            "suspicious_self_resolution": False,
+            "ambiguous_reference_resolution": False,
+            "ambiguous_reference_reason": None,
+            "doc_url": None,
+        }
+
+    try:
+        r = classify_bill_from_doc(
+            bill_id=bid,
+            current_knesset=kn,
+            doc_url=doc_url,
+            cache_dir=cache_dir,
+            warehouse_con=con,
+            download=False,
+        )
+    except Exception:
+        log.exception("Classification failed for bill %d (%s)", bid, doc_url)
+        r = _BLANK_RESULT
+    is_rec = r["is_recurring"]
+    return {
+        "BillID": bid,
+        "KnessetNum": kn,
+        "Name": name,
+        "PrivateNumber": private_number,
+        "is_original": not is_rec,
+        "original_bill_id": r["original_bill_id"] if r["original_bill_id"] else bid,
+        "matched_phrase": r["matched_phrase"],
+        "method": r["method"],
+        "reference_candidates": _serialize_reference_candidates(r.get("reference_candidates")),
+        "reference_candidate_count": int(r.get("reference_candidate_count") or 0),
+        "reference_resolution_reason": r.get("reference_resolution_reason"),
+        "reference_resolution_confidence": r.get("reference_resolution_confidence"),
+        "multiple_references_detected": bool(r.get("multiple_references_detected", False)),
+        "submission_date": r.get("submission_date"),
+        "suspicious_self_resolution": bool(r.get("suspicious_self_resolution", False)),
+        "ambiguous_reference_resolution": bool(
+            r.get("ambiguous_reference_resolution", False)
+        ),
+        "ambiguous_reference_reason": r.get("ambiguous_reference_reason"),
+        "doc_url": doc_url,
+    }
+
+
+# Per-process state of a classification worker, set by _init_worker.
+_worker_con: duckdb.DuckDBPyConnection | None = None
+_worker_cache_dir: Path | None = None
+
+
+def _init_worker(warehouse_path: str, cache_dir: str) -> None:
+    """Give each worker process its own read-only warehouse connection."""
+    global _worker_con, _worker_cache_dir
+    _worker_con = duckdb.connect(warehouse_path, read_only=True)
+    _worker_cache_dir = Path(cache_dir)
+    atexit.register(_worker_con.close)
+
+
+def _classify_in_worker(job: _Job) -> dict:
+    assert _worker_con is not None and _worker_cache_dir is not None
+    return _classify_job(job, _worker_cache_dir, _worker_con)
+
+
+def _classify_in_processes(
+    jobs: list[_Job], warehouse_path: Path, cache_dir: Path, workers: int
+) -> Iterator[dict]:
+    """Classify ``jobs`` on a process pool, yielding rows in job order.
+
+    Workers are spawned rather than forked: the parent holds an open DuckDB
+    connection and its threads, neither of which survives a fork safely.
+    """
+    context = multiprocessing.get_context("spawn")
+    chunksize = max(1, min(64, len(jobs) // (workers * 8)))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(str(warehouse_path), str(cache_dir)),
+    ) as pool:
+        yield from pool.map(_classify_in_worker, jobs, chunksize=chunksize)
 
 
 def build_doc_based_full(
@@ -72,7 +207,9 @@ def build_doc_based_full(
     warehouse_path: Path,
     cache_dir: Path,
     knessets: list[int] | None = None,
-    delay_s: float = 0.3,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    requests_per_s: float = DEFAULT_REQUESTS_PER_S,
+    workers: int = 1,
     progress_cb=None,
 ) -> pd.DataFrame:
     """Classify every private bill in the warehouse via doc-based method.
@@ -81,7 +218,11 @@ def build_doc_based_full(
         warehouse_path: DuckDB warehouse file (read-only).
         cache_dir: Doc cache. Shared with K16-K18 pipeline.
         knessets: Optional filter (e.g. ``[1, 2, 3]``). Default: all K1-K25.
-        delay_s: Polite HTTP delay between fresh downloads.
+        download_workers: Concurrent downloads while prefetching docs.
+        requests_per_s: Polite cap on the total download request rate.
+        workers: Processes classifying bills in parallel. Text extraction
+            and the recurrence regexes are CPU-bound, so ``> 1`` spreads
+            them across cores; ``1`` classifies in this process.
         progress_cb: Optional ``cb(i, total, bill_id, method)`` for TUIs.
 
     Returns:
@@ -123,71 +264,38 @@ def build_doc_based_full(
             int(bills["KnessetNum"].max()) if len(bills) else "?",
         )
 
-        results: list[dict] = []
-        total = len(bills)
+        doc_urls = _best_doc_urls(con, bills)
+        log.info("Resolved doc URLs for %d of %d bills", len(doc_urls), len(bills))
+        prefetch_docs(
+            doc_urls.items(),
+            cache_dir,
+            workers=download_workers,
+            requests_per_s=requests_per_s,
+        )
+
+        jobs: list[_Job] = [
+            (
+                int(row.BillID),
+                int(row.KnessetNum),
+                row.Name,
+                row.PrivateNumber,
+                doc_urls.get(int(row.BillID)),
+            )
+            for row in bills.itertuples(index=False)
+        ]
+        total = len(jobs)
         now = datetime.now(timezone.utc)
 
-        for i, row in bills.iterrows():
-            bid = int(row["BillID"])
-            kn = int(row["KnessetNum"])
-
-            doc_url = _pick_best_doc_url(con, bid)
-            if not doc_url:
-                results.append({
-                    "BillID": bid,
-                    "KnessetNum": kn,
-                    "Name": row["Name"],
-                    "PrivateNumber": row["PrivateNumber"],
-                    "is_original": True,
-                    "original_bill_id": bid,
-                    "matched_phrase": None,
-                    "method": "no_doc_url",
-                    "reference_candidates": "[]",
-                    "reference_candidate_count": 0,
-                    "reference_resolution_reason": None,
-                    "reference_resolution_confidence": None,
-                    "multiple_references_detected": False,
-                    "submission_date": None,
-                    "suspicious_self_resolution": False,
-                    "ambiguous_reference_resolution": False,
-                    "ambiguous_reference_reason": None,
-                    "doc_url": None,
-                })
-            else:
-                r = classify_bill_from_doc(
-                    bill_id=bid,
-                    current_knesset=kn,
-                    doc_url=doc_url,
-                    cache_dir=cache_dir,
-                    warehouse_con=con,
-                    delay_s=delay_s,
-                )
-                is_rec = r["is_recurring"]
-                results.append({
-                    "BillID": bid,
-                    "KnessetNum": kn,
-                    "Name": row["Name"],
-                    "PrivateNumber": row["PrivateNumber"],
-                    "is_original": not is_rec,
-                    "original_bill_id": r["original_bill_id"] if r["original_bill_id"] else bid,
-                    "matched_phrase": r["matched_phrase"],
-                    "method": r["method"],
-                    "reference_candidates": _serialize_reference_candidates(r.get("reference_candidates")),
-                    "reference_candidate_count": int(r.get("reference_candidate_count") or 0),
-                    "reference_resolution_reason": r.get("reference_resolution_reason"),
-                    "reference_resolution_confidence": r.get("reference_resolution_confidence"),
-                    "multiple_references_detected": bool(r.get("multiple_references_detected", False)),
-                    "submission_date": r.get("submission_date"),
-                    "suspicious_self_resolution": bool(r.get("suspicious_self_resolution", False)),
-                    "ambiguous_reference_resolution": bool(
-                        r.get("ambiguous_reference_resolution", False)
-                    ),
-                    "ambiguous_reference_reason": r.get("ambiguous_reference_reason"),
-                    "doc_url": doc_url,
-                })
+        if workers > 1 and total:
+            rows = _classify_in_processes(jobs, warehouse_path, cache_dir, workers)
+        else:
+            rows = (_classify_job(job, cache_dir, con) for job in jobs)
 
+        results: list[dict] = []
+        for i, result in enumerate(rows, start=1):
+            results.append(result)
             if progress_cb:
-                progress_cb(int(i) + 1, total, bid, results[-1]["method"])
+                progress_cb(i, total, result["BillID"], result["method"])
     finally:
         con.close()
 
@@ -4,7 +4,8 @@
 API at pmb.teca-it.com does not cover). Replicates Tal's method:
 
 1. Download the bill's first document URL from ``fs.knesset.gov.il``.
-2. Extract text — ``textutil`` (macOS built-in) for .doc/.docx; ``pypdf`` for .pdf.
+2. Extract text — in-process readers (``word_text``) for .doc/.docx, with
+   ``textutil`` (macOS built-in) as fallback; ``pypdf`` for .pdf.
 3. Detect recurrence phrases in the explanatory notes.
 4. Resolve local ``פ/NNN`` references back to BillIDs via ``KNS_Bill.PrivateNumber``.
 """
@@ -12,14 +13,21 @@
 from __future__ import annotations
 
 from datetime import date
+import gzip
+import hashlib
+import json
 import logging
+import os
 import re
+import shutil
 import subprocess
 import time
 from pathlib import Path
 
 import requests
 
+from data.recurring_bills.word_text import WordExtractionError, word_text
+
 log = logging.getLogger(__name__)
 
 # Reuses the politeness defaults from fetch_tal
@@ -27,6 +35,11 @@
 DEFAULT_TIMEOUT_S = 30
 TEXTUTIL_TIMEOUT_S = 30
 
+# Bump whenever ``extract_text`` would return different text for the same
+# file (new tool, page limit, cleanup); cached extractions from an older
+# version are then ignored and redone.
+EXTRACTOR_VERSION = 2
+
 _RECURRENCE_PATTERNS = [
     {
         "pattern": re.compile(r"הצעות\s+חוק\s+דומות(?:\s+בעיקרן)?"),
@@ -124,8 +137,6 @@
     r"(?<!\d)(\d{1,4})[./-](\d{1,2})[./-](\d{1,4})(?!\d)"
 )
 _PATTERN_CONTEXT_BREAK = re.compile(r"(?:\n\s*\n|[.!?])")
-_PATTERN_PREVIOUS_KNESSET = re.compile(r"(?:בכנסת|הכנסת)\s+הקודמת")
-_PATTERN_NUMERIC_KNESSET = re.compile(r"(?:בכנסת|הכנסת)\s+ה[-\s]*(\d{1,2})(?:\b|$)")
 _PATTERN_SUBMISSION_ANCHOR = re.compile(r"ביום")
 _DASH_RE = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2015\u05BE]")
 _WHITESPACE_RE = re.compile(r"\s+")
@@ -196,6 +207,38 @@
     key=len,
     reverse=True,
 )
+_KNESSET_PHRASE_RANK = {
+    phrase: rank for rank, phrase in enumerate(_SORTED_NORMALIZED_KNESSET_PHRASES)
+}
+
+# Every recurrence spec in one alternation, searched from one past each hit
+# so a single sweep visits every position where some spec matches. A hit
+# names the first spec matching there; later specs are tried at that
+# position directly, which keeps overlapping phrases from different specs.
+_PATTERN_ANY_RECURRENCE = re.compile(
+    "|".join(
+        f"(?P<p{order}>{spec['pattern'].pattern})"
+        for order, spec in enumerate(_RECURRENCE_PATTERNS)
+    )
+)
+# The previous-Knesset, numeric and ordinal Knesset patterns as one regex.
+# Ordinals are listed longest first, so each position matches the phrase
+# the per-phrase search used to prefer.
+_PATTERN_KNESSET_MENTION = re.compile(
+    r"(?:בכנסת|הכנסת)\s+(?:(?P<previous>הקודמת)"
+    r"|ה[-\s]*(?P<number>\d{1,2})(?:\b|$)"
+    r"|(?P<ordinal>"
+    + "|".join(re.escape(phrase) for phrase in _SORTED_NORMALIZED_KNESSET_PHRASES)
+    + r")(?:\b|$))"
+)
+
+
+def doc_cache_path(cache_dir: Path, bill_id: int, doc_url: str) -> Path | None:
+    """Cache location of a bill's document, or None for an unsupported type."""
+    ext = doc_url.rsplit(".", 1)[-1].lower()
+    if ext not in ("doc", "docx", "pdf"):
+        return None
+    return Path(cache_dir) / f"{bill_id}.{ext}"
 
 
 def download_doc(
@@ -221,10 +264,30 @@ def download_doc(
         log.warning("Doc not found (404): %s", url)
         return None
     resp.raise_for_status()
-    cache_path.write_bytes(resp.content)
+    # Written aside and renamed so an interrupted write never looks cached.
+    tmp_path = cache_path.with_name(cache_path.name + ".part")
+    tmp_path.write_bytes(resp.content)
+    tmp_path.replace(cache_path)
     return cache_path
 
 
+def _textutil_text(path: Path) -> str | None:
+    """macOS ``textutil`` conversion, for Word files ``word_text`` rejects."""
+    try:
+        result = subprocess.run(
+            ["textutil", "-convert", "txt", "-stdout", str(path)],
+            capture_output=True,
+            timeout=TEXTUTIL_TIMEOUT_S,
+        )
+        if result.returncode != 0:
+            log.warning("textutil failed on %s: %s", path, result.stderr[:200])
+            return None
+        return result.stdout.decode("utf-8", errors="replace")
+    except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
+        log.warning("textutil invocation error on %s: %s", path, exc)
+        return None
+
+
 def extract_text(path: Path) -> str | None:
     """Extract plain text from a .doc / .docx / .pdf file."""
     path = Path(path)
@@ -232,18 +295,13 @@ def extract_text(path: Path) -> str | None:
 
     if ext in (".doc", ".docx"):
         try:
-            result = subprocess.run(
-                ["textutil", "-convert", "txt", "-stdout", str(path)],
-                capture_output=True,
-                timeout=TEXTUTIL_TIMEOUT_S,
-            )
-            if result.returncode != 0:
-                log.warning("textutil failed on %s: %s", path, result.stderr[:200])
+            return word_text(path)
+        except WordExtractionError as exc:
+            if shutil.which("textutil") is None:
+                log.warning("Word text extraction failed on %s: %s", path, exc)
                 return None
-            return result.stdout.decode("utf-8", errors="replace")
-        except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-            log.warning("textutil invocation error on %s: %s", path, exc)
-            return None
+            log.info("%s; falling back to textutil", exc)
+        return _textutil_text(path)
 
     if ext == ".pdf":
         try:
@@ -268,6 +326,58 @@ def extract_text(path: Path) -> str | None:
     return None
 
 
+def text_cache_dir_for(cache_dir: Path) -> Path:
+    """Sidecar directory holding extracted text for the docs in ``cache_dir``."""
+    cache_dir = Path(cache_dir)
+    return cache_dir.with_name(f"{cache_dir.name}_text")
+
+
+def _sha256_of_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def extract_text_cached(path: Path, text_cache_dir: Path) -> str | None:
+    """``extract_text`` memoized on disk by the document's SHA-256.
+
+    Each entry is gzip-compressed JSON holding the text and the
+    ``EXTRACTOR_VERSION`` that produced it, so re-running the classifier
+    after a regex change skips PDF and Word parsing entirely, while
+    a changed extractor still re-extracts. Failed extractions are not
+    cached: they can be environmental (``textutil`` missing, a timeout).
+    """
+    path = Path(path)
+    try:
+        digest = _sha256_of_file(path)
+    except OSError as exc:
+        log.warning("Cannot read %s for text cache lookup: %s", path, exc)
+        return None
+
+    entry_path = Path(text_cache_dir) / f"{digest}.json.gz"
+    if entry_path.exists():
+        try:
+            entry = json.loads(gzip.decompress(entry_path.read_bytes()))
+            if entry["extractor_version"] == EXTRACTOR_VERSION:
+                return entry["text"]
+        except (OSError, EOFError, ValueError, KeyError, TypeError) as exc:
+            log.warning("Ignoring unreadable text cache entry %s: %s", entry_path, exc)
+
+    text = extract_text(path)
+    if text is not None:
+        payload = json.dumps(
+            {"extractor_version": EXTRACTOR_VERSION, "text": text}, ensure_ascii=False
+        ).encode("utf-8")
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: parallel scan workers may extract the same file.
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.part")
+        tmp_path.write_bytes(gzip.compress(payload))
+        tmp_path.replace(entry_path)
+    return text
+
+
 def _hebrew_ratio(text: str) -> float:
     if not text:
         return 0.0
@@ -514,19 +624,32 @@ def classify_recurrence_phrase(matched_phrase: object) -> str | None:
 def _extract_contextual_knesset(
     text: str, *, current_knesset: int | None = None
 ) -> int | None:
+    """Knesset a recurrence context points at, from one pass over the text.
+
+    Precedence: "the previous Knesset" (when the current one is known), then
+    the first numeric mention, then the longest ordinal phrase found.
+    """
     normalized = _normalize_hebrew_phrase_text(text)
-    if current_knesset and _PATTERN_PREVIOUS_KNESSET.search(normalized):
-        return current_knesset - 1 if current_knesset > 1 else None
-
-    numeric_match = _PATTERN_NUMERIC_KNESSET.search(normalized)
-    if numeric_match:
-        knesset_num = int(numeric_match.group(1))
-        return knesset_num if 1 <= knesset_num <= 25 else None
-
-    for phrase in _SORTED_NORMALIZED_KNESSET_PHRASES:
-        pattern = rf"(?:בכנסת|הכנסת)\s+{re.escape(phrase)}(?:\b|$)"
-        if re.search(pattern, normalized):
-            return _NORMALIZED_KNESSET_NUMS[phrase]
+    first_number: int | None = None
+    best_ordinal: str | None = None
+    for match in _PATTERN_KNESSET_MENTION.finditer(normalized):
+        if match.group("previous") is not None:
+            if current_knesset:
+                return current_knesset - 1 if current_knesset > 1 else None
+        elif match.group("number") is not None:
+            if first_number is None:
+                first_number = int(match.group("number"))
+        elif (
+            best_ordinal is None
+            or _KNESSET_PHRASE_RANK[match.group("ordinal")]
+            < _KNESSET_PHRASE_RANK[best_ordinal]
+        ):
+            best_ordinal = match.group("ordinal")
+
+    if first_number is not None:
+        return first_number if 1 <= first_number <= 25 else None
+    if best_ordinal is not None:
+        return _NORMALIZED_KNESSET_NUMS[best_ordinal]
     return None
 
 
@@ -536,32 +659,53 @@ def _find_recurrence_occurrences(
     head = text[:_SCAN_CHAR_LIMIT]
     occurrences: list[dict] = []
     seen_spans: set[tuple[int, int, str]] = set()
+    # Per spec, where its previous match ended: matches of one spec never
+    # overlap, exactly as with ``finditer``.
+    resume_at = [0] * len(_RECURRENCE_PATTERNS)
+    knesset_by_context: dict[str, int | None] = {}
+
+    candidate = _PATTERN_ANY_RECURRENCE.search(head)
+    while candidate is not None:
+        start = candidate.start()
+        first = int(candidate.lastgroup[1:])
+        for order in range(first, len(_RECURRENCE_PATTERNS)):
+            if start < resume_at[order]:
+                continue
+            spec = _RECURRENCE_PATTERNS[order]
+            if order == first:
+                end = candidate.end(candidate.lastgroup)
+            else:
+                match = spec["pattern"].match(head, start)
+                if match is None:
+                    continue
+                end = match.end()
+            resume_at[order] = end
 
-    for order, spec in enumerate(_RECURRENCE_PATTERNS):
-        for match in spec["pattern"].finditer(head):
-            key = (match.start(), match.end(), spec["recurrence_type"])
+            key = (start, end, spec["recurrence_type"])
             if key in seen_spans:
                 continue
             seen_spans.add(key)
-            context_start, context = _extract_local_context(
-                head, match.start(), match.end()
-            )
+            context_start, context = _extract_local_context(head, start, end)
+            if context not in knesset_by_context:
+                knesset_by_context[context] = _extract_contextual_knesset(
+                    context,
+                    current_knesset=current_knesset,
+                )
             occurrences.append(
                 {
-                    "phrase_text": match.group(0),
-                    "phrase_start": match.start(),
+                    "phrase_text": head[start:end],
+                    "phrase_start": start,
                     "phrase_order": order,
                     "recurrence_type": spec["recurrence_type"],
                     "context": context,
-                    "phrase_in_context_start": max(0, match.start() - context_start),
-                    "contextual_knesset": _extract_contextual_knesset(
-                        context,
-                        current_knesset=current_knesset,
-                    ),
+                    "phrase_in_context_start": max(0, start - context_start),
+                    "contextual_knesset": knesset_by_context[context],
                 }
             )
+        candidate = _PATTERN_ANY_RECURRENCE.search(head, start + 1)
 
-    occurrences.sort(key=lambda item: (item["phrase_start"], item["phrase_order"]))
+    # Positions ascend and specs ascend within a position, so occurrences
+    # are already ordered by (phrase_start, phrase_order).
     return occurrences
 
 
@@ -888,11 +1032,16 @@ def classify_bill_from_doc(
     cache_dir: Path,
     warehouse_con,
     delay_s: float = 0.3,
+    download: bool = True,
 ) -> dict:
-    """End-to-end classification for a single bill using its explanatory notes."""
-    cache_dir = Path(cache_dir)
-    ext = doc_url.rsplit(".", 1)[-1].lower()
-    if ext not in ("doc", "docx", "pdf"):
+    """End-to-end classification for a single bill using its explanatory notes.
+
+    With ``download=False`` the document must already be in ``cache_dir``
+    (see ``doc_download.prefetch_docs``); a missing one is reported as
+    ``doc_fetch_failed`` without touching the network.
+    """
+    cache_path = doc_cache_path(cache_dir, bill_id, doc_url)
+    if cache_path is None:
         return {
             "is_recurring": False,
             "original_bill_id": None,
@@ -909,8 +1058,11 @@ def classify_bill_from_doc(
             "ambiguous_reference_reason": None,
         }
 
-    cache_path = cache_dir / f"{bill_id}.{ext}"
-    if not cache_path.exists():
+    if cache_path.exists():
+        path = cache_path
+    elif not download:
+        path = None
+    else:
         time.sleep(delay_s)
         try:
             path = download_doc(doc_url, cache_path)
@@ -931,26 +1083,24 @@ def classify_bill_from_doc(
                 "ambiguous_reference_resolution": False,
                 "ambiguous_reference_reason": None,
             }
-        if path is None:
-            return {
-                "is_recurring": False,
-                "original_bill_id": None,
-                "matched_phrase": None,
-                "method": "doc_fetch_failed",
-                "reference_candidates": [],
-                "reference_candidate_count": 0,
-                "reference_resolution_reason": None,
-                "reference_resolution_confidence": None,
-                "multiple_references_detected": False,
-                "submission_date": None,
-                "suspicious_self_resolution": False,
-                "ambiguous_reference_resolution": False,
-                "ambiguous_reference_reason": None,
-            }
-    else:
-        path = cache_path
+    if path is None:
+        return {
+            "is_recurring": False,
+            "original_bill_id": None,
+            "matched_phrase": None,
+            "method": "doc_fetch_failed",
+            "reference_candidates": [],
+            "reference_candidate_count": 0,
+            "reference_resolution_reason": None,
+            "reference_resolution_confidence": None,
+            "multiple_references_detected": False,
+            "submission_date": None,
+            "suspicious_self_resolution": False,
+            "ambiguous_reference_resolution": False,
+            "ambiguous_reference_reason": None,
+        }
 
-    text = extract_text(path)
+    text = extract_text_cached(path, text_cache_dir_for(cache_dir))
     if text is None:
         return {
             "is_recurring": False,
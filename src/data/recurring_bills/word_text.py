@@ -0,0 +1,339 @@
+"""In-process text extraction for Word documents (.docx and legacy .doc).
+
+``extract_text`` used to shell out to macOS ``textutil`` for every Word
+file, so on Linux every .doc/.docx bill ended up as ``doc_fetch_failed``.
+Both formats are read here with the standard library alone:
+
+* .docx — ``word/document.xml`` is streamed out of the zip package with
+  ``iterparse``; text runs, tabs, breaks and paragraph ends become text.
+* .doc — the OLE2 compound file is walked sector by sector to get the
+  ``WordDocument`` and table streams, then the piece table (CLX) the FIB
+  points at maps the main document's characters to UTF-16 or 8-bit runs.
+
+Files these readers do not handle (Word 6/95, encrypted, RTF or HTML
+served under a .doc name) raise ``WordExtractionError`` so the caller can
+fall back to another tool.
+"""
+
+from __future__ import annotations
+
+import struct
+import zipfile
+from pathlib import Path
+from typing import BinaryIO
+from xml.etree import ElementTree
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_MAGIC = b"PK\x03\x04"
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_BREAKS = {_W + "br": "\n", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+# [MS-CFB] sector markers
+_MAXREGSECT = 0xFFFFFFFA
+_ENDOFCHAIN = 0xFFFFFFFE
+_NOSTREAM = 0xFFFFFFFF
+_STREAM = 2
+_ROOT = 5
+
+# [MS-DOC] FIB fields
+_WORD_IDENT = 0xA5EC
+_MAX_WORD95_NFIB = 0x0068
+_F_ENCRYPTED = 0x0100
+_F_WHICH_TBL_STM = 0x0200
+_CCP_TEXT_INDEX = 3  # in FibRgLw97
+_CLX_INDEX = 33  # fcClx/lcbClx pair in FibRgFcLcb97
+_F_COMPRESSED = 0x40000000
+
+# Word's in-text control characters -> plain text. Field marks (0x13-0x15)
+# are handled separately so field codes can be dropped.
+_DOC_CONTROLS = str.maketrans(
+    {
+        "\r": "\n",  # paragraph end
+        "\x07": "\n",  # table cell / row end
+        "\x0b": "\n",  # manual line break
+        "\x0c": "\n",  # page / section break
+        "\x1e": "-",  # non-breaking hyphen
+        "\x1f": None,  # optional hyphen
+        **{chr(c): None for c in (0x01, 0x02, 0x03, 0x04, 0x05, 0x08)},
+    }
+)
+
+
+class WordExtractionError(ValueError):
+    """The file is not a Word document these readers can parse."""
+
+
+def sniff_word_format(path: Path) -> str | None:
+    """``"docx"`` for a zip package, ``"doc"`` for an OLE2 file, else None.
+
+    Goes by content rather than extension: the Knesset file server has
+    .doc URLs that serve .docx packages and the other way round.
+    """
+    with Path(path).open("rb") as fh:
+        head = fh.read(len(OLE_MAGIC))
+    if head.startswith(ZIP_MAGIC):
+        return "docx"
+    if head == OLE_MAGIC:
+        return "doc"
+    return None
+
+
+def word_text(path: Path) -> str:
+    """Plain text of a .doc or .docx file, whichever its content is."""
+    fmt = sniff_word_format(path)
+    if fmt == "docx":
+        return docx_text(path)
+    if fmt == "doc":
+        return doc_text(path)
+    raise WordExtractionError(f"{path} is neither a zip package nor an OLE2 file")
+
+
+def docx_text(path: Path) -> str:
+    """Text of the main document part of a .docx package."""
+    try:
+        with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as xml:
+            return _document_xml_text(xml)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        raise WordExtractionError(f"Cannot read {path} as .docx: {exc}") from exc
+
+
+def _document_xml_text(xml: BinaryIO) -> str:
+    parts: list[str] = []
+    in_tab_stops = 0  # <w:tabs> holds tab-stop definitions, not tabs
+    for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+        tag = elem.tag
+        if tag == _W + "tabs":
+            in_tab_stops += 1 if event == "start" else -1
+        elif event == "start":
+            continue
+        elif tag == _W + "t":
+            parts.append(elem.text or "")
+        elif tag == _W + "tab":
+            if not in_tab_stops:
+                parts.append("\t")
+        elif tag in _DOCX_BREAKS:
+            parts.append(_DOCX_BREAKS[tag])
+        elif tag == _W + "p":
+            parts.append("\n")
+            elem.clear()
+    return "".join(parts)
+
+
+def doc_text(path: Path) -> str:
+    """Main-document text of a Word 97-2003 binary (.doc) file."""
+    try:
+        ole = _OleFile(Path(path).read_bytes())
+        return _word97_text(ole)
+    except struct.error as exc:
+        raise WordExtractionError(f"Truncated .doc structure in {path}: {exc}") from exc
+
+
+class _OleFile:
+    """Just enough of [MS-CFB] to read streams from the root storage."""
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < 512 or data[: len(OLE_MAGIC)] != OLE_MAGIC:
+            raise WordExtractionError("Not an OLE2 compound file")
+        major, _byte_order, sector_shift, mini_shift = struct.unpack_from("<HHHH", data, 0x1A)
+        if sector_shift not in (9, 12) or mini_shift != 6:
+            raise WordExtractionError(f"Unexpected OLE2 sector shift {sector_shift}/{mini_shift}")
+        self._data = data
+        self._sector_size = 1 << sector_shift
+        self._mini_sector_size = 1 << mini_shift
+        (n_fat, first_dir) = struct.unpack_from("<II", data, 0x2C)
+        (self._mini_cutoff, first_minifat, _n_minifat, first_difat, n_difat) = struct.unpack_from(
+            "<IIIII", data, 0x38
+        )
+
+        per_sector = self._sector_size // 4
+        difat = list(struct.unpack_from("<109I", data, 0x4C))
+        sector = first_difat
+        for _ in range(n_difat):
+            if sector > _MAXREGSECT:
+                break
+            entries = struct.unpack(f"<{per_sector}I", self._sector(sector))
+            difat.extend(entries[:-1])
+            sector = entries[-1]
+        fat_sectors = [s for s in difat if s <= _MAXREGSECT][:n_fat]
+        self._fat = self._uint32s(b"".join(self._sector(s) for s in fat_sectors))
+
+        self._entries = self._directory(self._read_chain(first_dir, self._fat))
+        root = self._entries[0]
+        if root[1] != _ROOT:
+            raise WordExtractionError("OLE2 directory has no root entry")
+        self._mini_stream = self._read_chain(root[2], self._fat)
+        self._mini_fat = (
+            self._uint32s(self._read_chain(first_minifat, self._fat))
+            if first_minifat <= _MAXREGSECT
+            else ()
+        )
+        self._streams = self._root_streams(major)
+
+    @staticmethod
+    def _uint32s(blob: bytes) -> tuple[int, ...]:
+        return struct.unpack(f"<{len(blob) // 4}I", blob[: len(blob) // 4 * 4])
+
+    def _sector(self, sector: int) -> bytes:
+        offset = (sector + 1) * self._sector_size
+        if offset >= len(self._data):
+            raise WordExtractionError(f"OLE2 sector {sector} is past the end of the file")
+        return self._data[offset : offset + self._sector_size]
+
+    @staticmethod
+    def _chain(start: int, fat: tuple[int, ...]) -> list[int]:
+        chain: list[int] = []
+        sector = start
+        while sector != _ENDOFCHAIN:
+            if sector >= len(fat) or len(chain) > len(fat):
+                raise WordExtractionError("Broken OLE2 sector chain")
+            chain.append(sector)
+            sector = fat[sector]
+        return chain
+
+    def _read_chain(self, start: int, fat: tuple[int, ...]) -> bytes:
+        return b"".join(self._sector(s) for s in self._chain(start, fat))
+
+    def _read_mini_chain(self, start: int) -> bytes:
+        size = self._mini_sector_size
+        return b"".join(
+            self._mini_stream[s * size : (s + 1) * size] for s in self._chain(start, self._mini_fat)
+        )
+
+    @staticmethod
+    def _directory(blob: bytes) -> list[tuple[str, int, int, int, int, int, int]]:
+        """(name, type, start, size, left, right, child) per 128-byte entry."""
+        entries = []
+        for offset in range(0, len(blob) - 127, 128):
+            (name_len,) = struct.unpack_from("<H", blob, offset + 64)
+            name = blob[offset : offset + max(0, min(name_len, 64) - 2)].decode(
+                "utf-16-le", errors="replace"
+            )
+            entry_type = blob[offset + 66]
+            left, right, child = struct.unpack_from("<III", blob, offset + 68)
+            start, size = struct.unpack_from("<IQ", blob, offset + 116)
+            entries.append((name, entry_type, start, size, left, right, child))
+        if not entries:
+            raise WordExtractionError("Empty OLE2 directory")
+        return entries
+
+    def _root_streams(self, major: int) -> dict[str, tuple[int, int]]:
+        """Streams directly under the root, found by walking its sibling tree."""
+        streams: dict[str, tuple[int, int]] = {}
+        seen: set[int] = set()
+        pending = [self._entries[0][6]]
+        while pending:
+            index = pending.pop()
+            if index == _NOSTREAM or index >= len(self._entries) or index in seen:
+                continue
+            seen.add(index)
+            name, entry_type, start, size, left, right, _child = self._entries[index]
+            if entry_type == _STREAM:
+                # Version 3 files only define the low 32 bits of the size
+                streams[name] = (start, size & 0xFFFFFFFF if major == 3 else size)
+            pending.extend((left, right))
+        return streams
+
+    def stream(self, name: str) -> bytes:
+        if name not in self._streams:
+            raise WordExtractionError(f"OLE2 file has no {name!r} stream")
+        start, size = self._streams[name]
+        if size < self._mini_cutoff:
+            data = self._read_mini_chain(start)
+        else:
+            data = self._read_chain(start, self._fat)
+        if len(data) < size:
+            raise WordExtractionError(f"OLE2 stream {name!r} is truncated")
+        return data[:size]
+
+
+def _word97_text(ole: _OleFile) -> str:
+    word = ole.stream("WordDocument")
+    ident, nfib = struct.unpack_from("<HH", word, 0)
+    if ident != _WORD_IDENT:
+        raise WordExtractionError("WordDocument stream does not start with a FIB")
+    if nfib <= _MAX_WORD95_NFIB:
+        raise WordExtractionError(f"Word 6/95 file (nFib {nfib:#x}) is not supported")
+    (flags,) = struct.unpack_from("<H", word, 0x0A)
+    if flags & _F_ENCRYPTED:
+        raise WordExtractionError("Encrypted Word document")
+    table = ole.stream("1Table" if flags & _F_WHICH_TBL_STM else "0Table")
+
+    # FibBase is followed by three length-prefixed arrays: fibRgW (16-bit),
+    # fibRgLw (32-bit) and fibRgFcLcb (pairs of 32-bit offset + length).
+    pos = 0x20
+    (csw,) = struct.unpack_from("<H", word, pos)
+    pos += 2 + csw * 2
+    (cslw,) = struct.unpack_from("<H", word, pos)
+    if cslw <= _CCP_TEXT_INDEX:
+        raise WordExtractionError("FIB is too short to hold ccpText")
+    (ccp_text,) = struct.unpack_from("<i", word, pos + 2 + _CCP_TEXT_INDEX * 4)
+    pos += 2 + cslw * 4
+    (cb_rg_fc_lcb,) = struct.unpack_from("<H", word, pos)
+    if cb_rg_fc_lcb <= _CLX_INDEX:
+        raise WordExtractionError("FIB is too short to hold the CLX location")
+    fc_clx, lcb_clx = struct.unpack_from("<II", word, pos + 2 + _CLX_INDEX * 8)
+    clx = table[fc_clx : fc_clx + lcb_clx]
+    if len(clx) != lcb_clx or not lcb_clx:
+        raise WordExtractionError("CLX lies outside the table stream")
+
+    parts: list[str] = []
+    for cp_start, cp_end, fc in _piece_table(clx):
+        if cp_start >= ccp_text:
+            break
+        count = min(cp_end, ccp_text) - cp_start
+        if fc & _F_COMPRESSED:
+            start = (fc & ~_F_COMPRESSED) // 2
+            parts.append(word[start : start + count].decode("cp1252", errors="replace"))
+        else:
+            parts.append(word[fc : fc + 2 * count].decode("utf-16-le", errors="replace"))
+    return _clean_doc_text("".join(parts))
+
+
+def _piece_table(clx: bytes) -> list[tuple[int, int, int]]:
+    """(cp_start, cp_end, fc) per piece from the Pcdt inside a CLX."""
+    pos = 0
+    while pos < len(clx):
+        clxt = clx[pos]
+        if clxt == 0x01:  # Prc: property modifiers, not needed for text
+            (cb_grpprl,) = struct.unpack_from("<H", clx, pos + 1)
+            pos += 3 + cb_grpprl
+        elif clxt == 0x02:  # Pcdt
+            (lcb,) = struct.unpack_from("<I", clx, pos + 1)
+            plc = clx[pos + 5 : pos + 5 + lcb]
+            n_pieces = (lcb - 4) // 12
+            if n_pieces < 1 or 4 + 12 * n_pieces != lcb or len(plc) != lcb:
+                raise WordExtractionError("Malformed piece table")
+            cps = struct.unpack_from(f"<{n_pieces + 1}I", plc, 0)
+            pcd_base = 4 * (n_pieces + 1)
+            return [
+                (cps[i], cps[i + 1], struct.unpack_from("<HIH", plc, pcd_base + 8 * i)[1])
+                for i in range(n_pieces)
+            ]
+        else:
+            raise WordExtractionError(f"Unexpected CLX entry type {clxt:#x}")
+    raise WordExtractionError("CLX has no piece table")
+
+
+def _clean_doc_text(text: str) -> str:
+    """Drop field codes and map Word's control characters to plain text.
+
+    A field is ``0x13 code 0x14 result 0x15`` (the result part is optional)
+    and fields nest; only the results are document text.
+    """
+    if "\x13" in text:
+        kept: list[str] = []
+        in_code: list[bool] = []  # per open field: still inside its code?
+        for ch in text:
+            if ch == "\x13":
+                in_code.append(True)
+            elif ch == "\x14":
+                if in_code:
+                    in_code[-1] = False
+            elif ch == "\x15":
+                if in_code:
+                    in_code.pop()
+            elif True not in in_code:
+                kept.append(ch)
+        text = "".join(kept)
+    return text.translate(_DOC_CONTROLS)
@@ -1,12 +1,21 @@
 """Database repository for DuckDB operations."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
+import shutil
+import duckdb
 import pandas as pd
 
 from config.settings import Settings
 from backend.connection_manager import get_db_connection, safe_execute_query
+from backend.partitioned_parquet import write_partitioned
+from backend.query_cache import bump_table_versions
+from data.queries.derived_tables import (
+    DERIVED_TABLE_NAMES,
+    drop_derived_tables_reading,
+    materialize_derived_tables,
+)
 
 
 class DatabaseRepository:
@@ -24,8 +33,12 @@ def store_dataframe(self, df: pd.DataFrame, table_name: str) -> bool:
             return True
         
         try:
-            with get_db_connection(self.db_path, read_only=False, logger_obj=self.logger) as con:
+            with get_db_connection(
+                self.db_path, read_only=False, logger_obj=self.logger, writes=(table_name,)
+            ) as con:
                 con.execute(f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM df')
+                stale = drop_derived_tables_reading(con, [table_name])
+            bump_table_versions(*stale)
 
             self.logger.info(f"Successfully saved {len(df):,} rows for table '{table_name}'")
             return True
@@ -34,15 +47,37 @@ def store_dataframe(self, df: pd.DataFrame, table_name: str) -> bool:
             self.logger.error(f"Error storing '{table_name}' to DuckDB: {e}", exc_info=True)
             return False
     
+    def is_partitioned(self, table_name: str) -> bool:
+        """Whether ``table_name`` is mirrored as ``<table>/KnessetNum=NN/`` parts."""
+        return (
+            Settings.ENABLE_PARTITIONED_PARQUET
+            and table_name in Settings.PARTITIONED_PARQUET_TABLES
+        )
+
+    def _remove_other_layout(self, table_name: str, partitioned: bool) -> None:
+        """Drop the mirror left in the layout ``table_name`` no longer uses."""
+        if partitioned:
+            (Settings.PARQUET_DIR / f"{table_name}.parquet").unlink(missing_ok=True)
+        else:
+            shutil.rmtree(Settings.PARQUET_DIR / table_name, ignore_errors=True)
+
     def store_as_parquet(self, df: pd.DataFrame, table_name: str) -> bool:
-        """Store a DataFrame as a Parquet file."""
+        """Store a DataFrame as a Parquet file, or a partition tree if enabled."""
         if df.empty:
             return True
         
         parquet_path = Settings.PARQUET_DIR / f"{table_name}.parquet"
+        partitioned = self.is_partitioned(table_name)
         
         try:
-            df.to_parquet(parquet_path, compression="zstd", index=False)
+            if partitioned:
+                parquet_path = Settings.PARQUET_DIR / table_name
+                with duckdb.connect(":memory:") as con:
+                    con.register("df", df)
+                    write_partitioned(con, "SELECT * FROM df", parquet_path)
+            else:
+                df.to_parquet(parquet_path, compression="zstd", index=False)
+            self._remove_other_layout(table_name, partitioned)
             self.logger.info(f"Parquet data for '{table_name}' saved to {parquet_path}")
             return True
             
@@ -55,7 +90,221 @@ def store_table(self, df: pd.DataFrame, table_name: str) -> bool:
         db_success = self.store_dataframe(df, table_name)
         parquet_success = self.store_as_parquet(df, table_name)
         return db_success and parquet_success
+
+    def upsert_dataframe(self, df: pd.DataFrame, table_name: str, primary_key: str) -> bool:
+        """Merge ``df`` into an existing DuckDB table by primary key.
+
+        Rows whose key is already present are replaced, new keys are inserted.
+        Delete + insert run in one transaction so readers never observe a
+        half-merged table. Columns are matched by name, so a delta frame that
+        lacks an all-NULL column still lines up with the stored schema.
+        """
+        if df.empty:
+            self.logger.info(f"No changed rows for '{table_name}', skipping merge.")
+            return True
+
+        try:
+            with get_db_connection(
+                self.db_path, read_only=False, logger_obj=self.logger, writes=(table_name,)
+            ) as con:
+                con.execute("BEGIN TRANSACTION")
+                try:
+                    con.execute(
+                        f'DELETE FROM "{table_name}" '
+                        f'WHERE "{primary_key}" IN (SELECT "{primary_key}" FROM df)'
+                    )
+                    con.execute(f'INSERT INTO "{table_name}" BY NAME SELECT * FROM df')
+                    con.execute("COMMIT")
+                except Exception:
+                    con.execute("ROLLBACK")
+                    raise
+                stale = drop_derived_tables_reading(con, [table_name])
+            bump_table_versions(*stale)
+
+            self.logger.info(f"Merged {len(df):,} changed rows into table '{table_name}'")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error merging into '{table_name}': {e}", exc_info=True)
+            return False
+
+    def export_table_to_parquet(self, table_name: str) -> bool:
+        """Rewrite ``<table>.parquet`` from the current DuckDB table.
+
+        Used after a merge so the Parquet mirror matches the warehouse without
+        loading the full table into pandas. Written to a temp file and renamed
+        so a failed export leaves the previous file intact. Partitioned tables
+        are rewritten as a whole tree the same way.
+        """
+        parquet_path = Settings.PARQUET_DIR / f"{table_name}.parquet"
+        tmp_path = parquet_path.with_suffix(".parquet.new")
+        partitioned = self.is_partitioned(table_name)
+
+        try:
+            with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
+                if partitioned:
+                    parquet_path = Settings.PARQUET_DIR / table_name
+                    write_partitioned(con, f'SELECT * FROM "{table_name}"', parquet_path)
+                else:
+                    con.execute(
+                        f'COPY (SELECT * FROM "{table_name}") TO \'{tmp_path.as_posix()}\' '
+                        "(FORMAT PARQUET, COMPRESSION ZSTD)"
+                    )
+            if not partitioned:
+                tmp_path.replace(parquet_path)
+            self._remove_other_layout(table_name, partitioned)
+            self.logger.info(f"Parquet data for '{table_name}' saved to {parquet_path}")
+            return True
+
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.error(f"Error saving '{table_name}' to Parquet: {e}", exc_info=True)
+            return False
+
+    def upsert_table(self, df: pd.DataFrame, table_name: str, primary_key: str) -> bool:
+        """Merge changed rows into DuckDB, then refresh the Parquet mirror."""
+        if df.empty:
+            return True
+        if not self.upsert_dataframe(df, table_name, primary_key):
+            return False
+        return self.export_table_to_parquet(table_name)
+
+    def get_staging_dir(self, table_name: str) -> Path:
+        """Directory holding the streamed Parquet parts for ``table_name``."""
+        return Settings.STAGING_DIR / table_name
+
+    def list_staging_parts(self, table_name: str) -> List[Path]:
+        """Committed staging parts for ``table_name``, in write order."""
+        staging_dir = self.get_staging_dir(table_name)
+        if not staging_dir.exists():
+            return []
+        return sorted(staging_dir.glob("part-*.parquet"))
+
+    def write_staging_part(self, df: pd.DataFrame, table_name: str, part_index: int) -> bool:
+        """Write one batch of a streamed download as a Parquet part.
+
+        The part appears under its final name only once fully written, so a
+        crash never leaves a truncated part behind.
+        """
+        staging_dir = self.get_staging_dir(table_name)
+        part_path = staging_dir / f"part-{part_index:06d}.parquet"
+        tmp_path = part_path.with_suffix(".parquet.new")
+
+        try:
+            staging_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+            tmp_path.replace(part_path)
+            return True
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.error(f"Error writing staging part {part_index} for '{table_name}': {e}", exc_info=True)
+            return False
+
+    def clear_staging(self, table_name: str) -> None:
+        """Remove any staged parts for ``table_name``."""
+        staging_dir = self.get_staging_dir(table_name)
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def load_staging_parts(self, table_name: str) -> bool:
+        """Swap the staged parts in as the new DuckDB table and Parquet mirror.
+
+        ``CREATE OR REPLACE ... AS SELECT`` commits atomically, so readers see
+        either the old table or the complete new one. Parts are read with
+        ``union_by_name`` so a column that is all-NULL in early batches but
+        populated later gets the same type a single in-memory load would give
+        it. DuckDB streams the parts, so memory stays bounded by its own
+        buffer rather than the table size.
+        """
+        parts = self.list_staging_parts(table_name)
+        if not parts:
+            self.logger.info(f"No staged data for '{table_name}', skipping load.")
+            return True
+
+        part_list = ", ".join(f"'{p.as_posix()}'" for p in parts)
+        try:
+            with get_db_connection(
+                self.db_path, read_only=False, logger_obj=self.logger, writes=(table_name,)
+            ) as con:
+                con.execute(
+                    f'CREATE OR REPLACE TABLE "{table_name}" AS '
+                    f"SELECT * FROM read_parquet([{part_list}], union_by_name = true)"
+                )
+                row = con.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()
+                stale = drop_derived_tables_reading(con, [table_name])
+            bump_table_versions(*stale)
+            self.logger.info(f"Successfully saved {row[0] if row else 0:,} rows for table '{table_name}'")
+        except Exception as e:
+            self.logger.error(f"Error loading staged parts for '{table_name}': {e}", exc_info=True)
+            return False
+
+        if not self.export_table_to_parquet(table_name):
+            return False
+        self.clear_staging(table_name)
+        return True
+
+    def refresh_derived_tables(self) -> bool:
+        """Rebuild the materialized shared CTEs (see ``data.queries.derived_tables``).
+
+        Run once after a refresh; until then queries use the inline CTEs.
+        """
+        try:
+            with get_db_connection(
+                self.db_path, read_only=False, logger_obj=self.logger, writes=DERIVED_TABLE_NAMES
+            ) as con:
+                materialize_derived_tables(con, self.logger)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error materializing derived tables: {e}", exc_info=True)
+            return False
+
+    def get_watermark(self, table_name: str, column: str) -> Optional[str]:
+        """Return the table's high-water mark on ``column`` as ``YYYY-MM-DDTHH:MM:SS``.
+
+        The mark is derived from the stored rows rather than kept in a side
+        file, so it can never run ahead of what was actually committed.
+        Seconds are truncated, which at worst re-fetches rows from the same
+        second; the primary-key merge makes that harmless. Returns ``None``
+        when the table or column is missing or holds no parseable timestamps.
+        """
+        if not self.table_exists(table_name):
+            return None
+
+        try:
+            with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as conn:
+                has_column = conn.execute(
+                    "SELECT COUNT(*) FROM duckdb_columns() "
+                    "WHERE table_name = ? AND column_name = ?",
+                    [table_name, column],
+                ).fetchone()
+                if not has_column or has_column[0] == 0:
+                    return None
+
+                row = conn.execute(
+                    f'SELECT strftime(MAX(TRY_CAST("{column}" AS TIMESTAMP)), '
+                    f"'%Y-%m-%dT%H:%M:%S') FROM \"{table_name}\""
+                ).fetchone()
+                return row[0] if row and row[0] else None
+        except Exception as e:
+            self.logger.error(f"Error reading watermark for '{table_name}': {e}", exc_info=True)
+            return None
     
+    def has_unique_key(self, table_name: str, column: str) -> bool:
+        """Whether every stored row of ``table_name`` has a distinct, non-NULL ``column``.
+
+        False when the table or column is missing.
+        """
+        try:
+            with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as conn:
+                row = conn.execute(
+                    f'SELECT COUNT(*) = COUNT(DISTINCT "{column}") '
+                    f'AND COUNT(*) = COUNT("{column}") FROM "{table_name}"'
+                ).fetchone()
+                return bool(row and row[0])
+        except Exception as e:
+            self.logger.warning(f"Could not check '{column}' uniqueness in '{table_name}': {e}")
+            return False
+
     def execute_query(self, query: str) -> Optional[pd.DataFrame]:
         """Execute a query and return results."""
         try:
@@ -94,6 +343,23 @@ def get_table_count(self, table_name: str) -> int:
         result = self.execute_query(query)
         return result.iloc[0]['count'] if result is not None and not result.empty else 0
 
+    def get_table_sizes(self) -> Dict[str, int]:
+        """Get DuckDB's estimated row count for every stored table.
+
+        Cheap (catalog-only) and used to start the largest downloads first.
+        Returns an empty mapping when the warehouse does not exist yet.
+        """
+        if not self.db_path.exists():
+            return {}
+        query = "SELECT table_name, estimated_size FROM duckdb_tables()"
+        result = self.execute_query(query)
+        if result is None or result.empty:
+            return {}
+        return {
+            str(row.table_name): int(row.estimated_size or 0)
+            for row in result.itertuples(index=False)
+        }
+
     def get_tables(self) -> list:
         """Get list of all tables in the database."""
         query = "SELECT table_name FROM duckdb_tables() ORDER BY table_name"
@@ -133,7 +399,12 @@ def load_faction_coalition_status(self) -> bool:
     def _create_empty_faction_status_table(self) -> bool:
         """Create an empty faction status table."""
         try:
-            with get_db_connection(self.db_path, read_only=False, logger_obj=self.logger) as con:
+            with get_db_connection(
+                self.db_path,
+                read_only=False,
+                logger_obj=self.logger,
+                writes=("UserFactionCoalitionStatus",),
+            ) as con:
                 con.execute("""
                     CREATE TABLE IF NOT EXISTS "UserFactionCoalitionStatus" (
                         KnessetNum INTEGER,
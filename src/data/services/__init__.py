@@ -5,6 +5,7 @@
     from data.services.data_refresh_service import DataRefreshService
 """
 
+from .refresh_scheduler import RefreshScheduler
 from .resume_state_service import ResumeStateService
 
-__all__ = ["ResumeStateService"]
\ No newline at end of file
+__all__ = ["RefreshScheduler", "ResumeStateService"]
\ No newline at end of file
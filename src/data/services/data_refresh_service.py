@@ -1,15 +1,22 @@
 """Data refresh service for coordinating OData downloads and storage."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 import logging
 
+import pandas as pd
+
+from config.api import APIConfig
 from config.database import DatabaseConfig
 from config.settings import Settings
 from api.odata_client import ODataClient
+from backend.tables import KnessetTables
 from data.repositories.database_repository import DatabaseRepository
+from data.services.refresh_scheduler import RefreshScheduler
 from data.services.resume_state_service import ResumeStateService
+from data.services.streaming_ingest import StreamingTableIngest
 from data.services.storage_sync_service import StorageSyncService
 
 
@@ -19,40 +26,213 @@ class DataRefreshService:
     def __init__(
         self,
         db_path: Optional[Path] = None,
-        logger_obj: Optional[logging.Logger] = None
+        logger_obj: Optional[logging.Logger] = None,
+        max_concurrent_tables: Optional[int] = None,
+        streaming: Optional[bool] = None,
     ):
         self.db_path = db_path or Settings.get_db_path()
         self.logger = logger_obj or logging.getLogger(__name__)
+        self.max_concurrent_tables = max_concurrent_tables or APIConfig.TABLE_CONCURRENCY
+        # Streaming mode spools pages to disk instead of building the whole
+        # table in memory; defaults to Settings.ENABLE_STREAMING_INGEST.
+        self.streaming = Settings.ENABLE_STREAMING_INGEST if streaming is None else streaming
+        # Single-thread executor that owns every DuckDB write while a
+        # multi-table refresh is running; None means write inline.
+        self._writer: Optional[ThreadPoolExecutor] = None
+        # Checkpointing ingests for cursor tables currently downloading in
+        # memory, keyed by table; fed by the client's checkpoint handler.
+        self._checkpoints: Dict[str, StreamingTableIngest] = {}
 
         # Initialize components
         self.odata_client = ODataClient(self.logger)
         self.db_repository = DatabaseRepository(self.db_path, self.logger)
         self.resume_service = ResumeStateService(logger_obj=self.logger)
         self.storage_sync = StorageSyncService(logger_obj=self.logger)
+        self.odata_client.set_checkpoint_handler(self._checkpoint_page)
     
-    async def refresh_single_table(
+    async def _write(self, fn: Callable[..., bool], *args: Any) -> bool:
+        """Run a storage call through the single writer when one is active.
+
+        DuckDB allows one read-write connection per file, so concurrent table
+        downloads hand their writes to one thread; this also keeps the event
+        loop free to keep downloading while a table is being stored.
+        """
+        if self._writer is None:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, fn, *args)
+
+    def _open_ingest(self, table_name: str) -> StreamingTableIngest:
+        """Staged ingest for ``table_name``, checkpointing if it is cursor-paged."""
+        return StreamingTableIngest(
+            table_name,
+            self.db_repository,
+            self._write,
+            logger_obj=self.logger,
+            resume_service=self.resume_service,
+        )
+
+    async def _checkpoint_page(self, table_name: str, df: pd.DataFrame) -> None:
+        """Persist an in-memory cursor page towards the table's next checkpoint."""
+        checkpoint = self._checkpoints.get(table_name)
+        if checkpoint is not None:
+            await checkpoint.add_page(df)
+
+    def _get_delta_plan(self, table_name: str) -> Optional[Tuple[str, str]]:
+        """Return ``(primary_key, watermark)`` if the table can be delta-refreshed.
+
+        Only keys declared in ``KnessetTables`` are trusted for merging: the
+        cursor paging keys in ``DatabaseConfig.CURSOR_TABLES`` are not always
+        unique (e.g. ``plmPlenumSessionID``), and a declared key is only used
+        while the stored rows are unique on it. Tables without a usable key or
+        without a stored watermark fall back to a full reload.
+        """
+        metadata = KnessetTables.get_table_by_name(table_name)
+        if metadata is None:
+            self.logger.info(f"No declared primary key for {table_name}; using full refresh")
+            return None
+
+        watermark = self.db_repository.get_watermark(table_name, DatabaseConfig.WATERMARK_COLUMN)
+        if watermark is None:
+            self.logger.info(f"No stored watermark for {table_name}; using full refresh")
+            return None
+
+        # A merge deletes every stored row sharing a changed row's key, so a
+        # declared key that is not unique in practice (KNS_KnessetDates has
+        # several rows per KnessetNum) would lose rows.
+        if not self.db_repository.has_unique_key(table_name, metadata.primary_key):
+            self.logger.warning(
+                f"{metadata.primary_key} is not unique in {table_name}; using full refresh"
+            )
+            return None
+
+        return metadata.primary_key, watermark
+
+    async def _refresh_table_delta(
+        self,
+        table_name: str,
+        primary_key: str,
+        watermark: str,
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> bool:
+        """Download rows changed since ``watermark`` and merge them by primary key."""
+        df = await self.odata_client.download_table(table_name, None, since=watermark)
+
+        if not await self._write(self.db_repository.upsert_table, df, table_name, primary_key):
+            self.logger.error(f"Failed to merge delta for table: {table_name}")
+            return False
+
+        if progress_callback:
+            progress_callback(table_name, len(df))
+
+        self.logger.info(
+            f"Successfully refreshed table: {table_name} "
+            f"({len(df):,} changed rows since {watermark})"
+        )
+        return True
+
+    async def _refresh_table_streaming(
         self,
         table_name: str,
         progress_callback: Optional[Callable[[str, int], None]] = None
     ) -> bool:
-        """Refresh a single table from OData API."""
+        """Full refresh that streams pages into staging parts, then swaps them in."""
+        ingest = self._open_ingest(table_name)
+        saved_state = None
+        if DatabaseConfig.is_cursor_table(table_name):
+            saved_state = self.resume_service.get_table_state(table_name)
+        resume_state = await ingest.start(saved_state)
+        try:
+            await self.odata_client.stream_table(
+                table_name, ingest.add_page, resume_state if ingest.checkpointing else None
+            )
+            success = await ingest.commit()
+        except Exception:
+            await ingest.abort()
+            raise
+
+        if not success:
+            self.logger.error(f"Failed to store table: {table_name}")
+            return False
+
+        if DatabaseConfig.is_cursor_table(table_name):
+            self.resume_service.clear_table_state(table_name)
+        if progress_callback:
+            progress_callback(table_name, ingest.rows_written)
+
+        self.logger.info(f"Successfully refreshed table: {table_name} ({ingest.rows_written:,} rows, streamed)")
+        return True
+
+    async def refresh_single_table(
+        self,
+        table_name: str,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        incremental: bool = False,
+    ) -> bool:
+        """Refresh a single table from OData API.
+
+        With ``incremental=True`` only rows whose ``LastUpdatedDate`` is past
+        the stored high-water mark are downloaded and merged into the
+        existing table; see ``_get_delta_plan`` for when this falls back to a
+        full reload. In streaming mode a full reload never holds more than one
+        batch of pages in memory.
+
+        Cursor-paged tables are checkpointed as they download (see
+        ``StreamingTableIngest``): after an interruption the next refresh
+        fetches only rows past the last checkpoint and appends them to the
+        rows already staged on disk.
+        """
         try:
+            if incremental:
+                delta_plan = self._get_delta_plan(table_name)
+                if delta_plan is not None:
+                    primary_key, watermark = delta_plan
+                    self.logger.info(f"Starting delta refresh for table: {table_name}")
+                    return await self._refresh_table_delta(
+                        table_name, primary_key, watermark, progress_callback
+                    )
+
+            if self.streaming:
+                self.logger.info(f"Starting streaming refresh for table: {table_name}")
+                return await self._refresh_table_streaming(table_name, progress_callback)
+
             self.logger.info(f"Starting refresh for table: {table_name}")
             
-            # Get resume state if cursor table
+            # Cursor tables checkpoint every staged batch while downloading
+            # and resume from the last checkpoint a previous run left behind
             resume_state = None
+            checkpoint = None
             if DatabaseConfig.is_cursor_table(table_name):
-                resume_state = self.resume_service.get_table_state(table_name)
-            
-            # Download data
-            df = await self.odata_client.download_table(table_name, resume_state)
+                checkpoint = self._open_ingest(table_name)
+                resume_state = await checkpoint.start(self.resume_service.get_table_state(table_name))
+                self._checkpoints[table_name] = checkpoint
             
-            if df.empty:
-                self.logger.info(f"No data downloaded for table: {table_name}")
-                return True
-            
-            # Store data
-            success = self.db_repository.store_table(df, table_name)
+            try:
+                # Download data
+                df = await self.odata_client.download_table(table_name, resume_state)
+
+                if checkpoint is not None and checkpoint.resumed:
+                    # df holds only the rows after the checkpoint; they were
+                    # staged as they arrived and are appended to earlier parts
+                    success = await checkpoint.commit()
+                    stored_rows = checkpoint.rows_written
+                elif df.empty:
+                    self.logger.info(f"No data downloaded for table: {table_name}")
+                    if checkpoint is not None:
+                        await checkpoint.discard()
+                    return True
+                else:
+                    # Store data
+                    success = await self._write(self.db_repository.store_table, df, table_name)
+                    stored_rows = len(df)
+                    if success and checkpoint is not None:
+                        await checkpoint.discard()
+            except Exception:
+                if checkpoint is not None:
+                    await checkpoint.abort()
+                raise
+            finally:
+                self._checkpoints.pop(table_name, None)
             
             if success:
                 # Clear resume state if cursor table (download completed)
@@ -61,9 +241,9 @@ async def refresh_single_table(
                 
                 # Call progress callback
                 if progress_callback:
-                    progress_callback(table_name, len(df))
+                    progress_callback(table_name, stored_rows)
                 
-                self.logger.info(f"Successfully refreshed table: {table_name} ({len(df):,} rows)")
+                self.logger.info(f"Successfully refreshed table: {table_name} ({stored_rows:,} rows)")
                 return True
             else:
                 self.logger.error(f"Failed to store table: {table_name}")
@@ -80,9 +260,16 @@ async def refresh_single_table(
     async def refresh_tables(
         self,
         tables: Optional[List[str]] = None,
-        progress_callback: Optional[Callable[[str, int], None]] = None
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        incremental: bool = False,
     ) -> bool:
-        """Refresh multiple tables from OData API."""
+        """Refresh multiple tables from OData API.
+
+        Tables are downloaded concurrently (``max_concurrent_tables`` at once,
+        with ``APIConfig.GLOBAL_REQUEST_LIMIT`` requests in flight overall) in
+        dependency order, largest first; see ``RefreshScheduler``. Writes go
+        through a single writer thread.
+        """
         tables_to_refresh = tables or DatabaseConfig.get_all_tables()
         
         # Validate table names
@@ -94,17 +281,35 @@ async def refresh_tables(
         
         self.logger.info(f"Starting refresh for {len(tables_to_refresh)} tables")
         
-        success_count = 0
-        for table_name in tables_to_refresh:
-            success = await self.refresh_single_table(table_name, progress_callback)
-            if success:
-                success_count += 1
+        async def refresh_one(table_name: str) -> bool:
+            return await self.refresh_single_table(
+                table_name, progress_callback, incremental=incremental
+            )
+
+        scheduler = RefreshScheduler(self.max_concurrent_tables, self.logger)
+        self.odata_client.set_request_budget(asyncio.Semaphore(APIConfig.GLOBAL_REQUEST_LIMIT))
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="duckdb-writer")
+        try:
+            results = await scheduler.run(
+                tables_to_refresh, refresh_one, self.db_repository.get_table_sizes()
+            )
+        finally:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+            self.odata_client.set_request_budget(None)
+
+        success_count = sum(1 for ok in results.values() if ok)
         
         # Also refresh faction coalition status
         self.logger.info("Loading faction coalition status from CSV...")
         faction_success = self.db_repository.load_faction_coalition_status()
-        
-        total_success = success_count == len(tables_to_refresh) and faction_success
+
+        # Materialize the shared CTEs once so interactive queries don't recompute them
+        if success_count or faction_success:
+            self.logger.info("Materializing derived tables...")
+            self.db_repository.refresh_derived_tables()
+
+        total_success = success_count == len(results) and faction_success
 
         if total_success:
             self.logger.info("All data refresh tasks completed successfully")
@@ -128,14 +333,15 @@ async def refresh_tables(
                     self.logger.error("Error during cloud sync", exc_info=True)
                     # Don't fail the entire refresh if cloud sync fails
         else:
-            self.logger.warning(f"Refresh completed with {success_count}/{len(tables_to_refresh)} table successes")
+            self.logger.warning(f"Refresh completed with {success_count}/{len(results)} table successes")
 
         return total_success
     
     def refresh_tables_sync(
         self,
         tables: Optional[List[str]] = None,
-        progress_callback: Optional[Callable[[str, int], None]] = None
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        incremental: bool = False,
     ) -> bool:
         """Synchronous wrapper for refresh_tables.
 
@@ -157,7 +363,7 @@ def refresh_tables_sync(
                     import nest_asyncio
                     nest_asyncio.apply()
                     self.logger.info("Using nest_asyncio for nested event loop")
-                    return asyncio.run(self.refresh_tables(tables, progress_callback))
+                    return asyncio.run(self.refresh_tables(tables, progress_callback, incremental=incremental))
                 except ImportError:
                     # Run in a separate thread with its own event loop
                     # NOTE: Progress callbacks are disabled in thread context because
@@ -181,7 +387,9 @@ def run_in_thread() -> bool:
                         try:
                             service.logger.info(f"Running refresh_tables for {len(tables_to_refresh or [])} tables")
                             result = new_loop.run_until_complete(
-                                service.refresh_tables(tables_to_refresh, logging_callback)
+                                service.refresh_tables(
+                                    tables_to_refresh, logging_callback, incremental=incremental
+                                )
                             )
                             service.logger.info(f"Thread completed with result: {result}")
                             return result
@@ -208,7 +416,7 @@ def run_in_thread() -> bool:
             except RuntimeError:
                 # No running loop - we're in CLI context, use asyncio.run()
                 self.logger.info("No existing event loop (CLI context)")
-                return asyncio.run(self.refresh_tables(tables, progress_callback))
+                return asyncio.run(self.refresh_tables(tables, progress_callback, incremental=incremental))
 
         except Exception:
             self.logger.error("Error during synchronous refresh", exc_info=True)
@@ -217,4 +425,7 @@ def run_in_thread() -> bool:
     def refresh_faction_status_only(self) -> bool:
         """Refresh only the faction coalition status from CSV."""
         self.logger.info("Refreshing faction coalition status from CSV")
-        return self.db_repository.load_faction_coalition_status()
+        if not self.db_repository.load_faction_coalition_status():
+            return False
+        self.db_repository.refresh_derived_tables()
+        return True
@@ -0,0 +1,108 @@
+"""Dependency-aware concurrent scheduling for multi-table refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from backend.tables import KnessetTables
+from config.database import DatabaseConfig
+
+
+class RefreshScheduler:
+    """Run per-table refresh coroutines concurrently in dependency order.
+
+    A table is started only after every dependency that is part of the same
+    run (per ``TableMetadata.dependencies``) has finished, successfully or
+    not. Among ready tables the largest is dispatched first so the slowest
+    download sets the total time instead of trailing at the end.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_tables: int,
+        logger_obj: Optional[logging.Logger] = None,
+    ):
+        if max_concurrent_tables < 1:
+            raise ValueError("max_concurrent_tables must be at least 1")
+        self.max_concurrent_tables = max_concurrent_tables
+        self.logger = logger_obj or logging.getLogger(__name__)
+
+    @staticmethod
+    def _priority(table: str, size_hints: Dict[str, int]) -> tuple[int, int]:
+        """Sort key: known-large tables in declared order, then by stored size."""
+        large_tables = DatabaseConfig.LARGE_TABLES
+        rank = large_tables.index(table) if table in large_tables else len(large_tables)
+        return rank, -size_hints.get(table, 0)
+
+    def get_dependencies(self, table: str, scheduled: List[str]) -> List[str]:
+        """Dependencies of ``table`` restricted to the tables in this run."""
+        return [dep for dep in KnessetTables.get_dependencies(table) if dep in scheduled and dep != table]
+
+    def plan(self, tables: List[str], size_hints: Optional[Dict[str, int]] = None) -> List[str]:
+        """Return the dispatch order: dependency-respecting, largest-first.
+
+        Mirrors ``KnessetTables.get_load_order``: if a dependency cycle is
+        found the highest-priority remaining table is released anyway.
+        """
+        hints = size_hints or {}
+        remaining = list(dict.fromkeys(tables))
+        placed: set[str] = set()
+        order: List[str] = []
+
+        while remaining:
+            ready = [
+                t for t in remaining
+                if all(dep in placed for dep in self.get_dependencies(t, tables))
+            ]
+            if not ready:
+                self.logger.warning(f"Dependency cycle among {remaining}; releasing highest priority table")
+                ready = remaining
+            chosen = min(ready, key=lambda t: self._priority(t, hints))
+            order.append(chosen)
+            placed.add(chosen)
+            remaining.remove(chosen)
+
+        return order
+
+    async def run(
+        self,
+        tables: List[str],
+        refresh_fn: Callable[[str], Awaitable[bool]],
+        size_hints: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, bool]:
+        """Refresh ``tables`` with at most ``max_concurrent_tables`` in flight.
+
+        Returns a ``{table: success}`` mapping. An exception raised by
+        ``refresh_fn`` counts as a failure for that table only.
+        """
+        order = self.plan(tables, size_hints)
+        self.logger.info(
+            f"Scheduling {len(order)} tables ({self.max_concurrent_tables} concurrent): {order}"
+        )
+
+        slots = asyncio.Semaphore(self.max_concurrent_tables)
+        finished: Dict[str, asyncio.Event] = {t: asyncio.Event() for t in order}
+        position = {t: i for i, t in enumerate(order)}
+        results: Dict[str, bool] = {}
+
+        async def run_table(table: str) -> None:
+            try:
+                # Only wait on dependencies planned earlier, so a cycle that
+                # plan() broke cannot deadlock here.
+                for dep in self.get_dependencies(table, order):
+                    if position[dep] < position[table]:
+                        await finished[dep].wait()
+                async with slots:
+                    results[table] = bool(await refresh_fn(table))
+            except Exception:
+                self.logger.error(f"Scheduled refresh of {table} failed", exc_info=True)
+                results[table] = False
+            finally:
+                finished[table].set()
+
+        # Tasks are created in plan order, so ready tables reach the semaphore
+        # (which wakes waiters FIFO) largest-first.
+        await asyncio.gather(*(run_table(t) for t in order))
+        return {t: results.get(t, False) for t in order}
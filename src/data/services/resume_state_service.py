@@ -115,9 +115,15 @@ def update_table_state(
         table_name: str,
         last_pk: int,
         total_rows: int,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        part_count: Optional[int] = None
     ) -> None:
-        """Update resume state for a table."""
+        """Update resume state for a table.
+
+        ``part_count`` records how many staging parts hold the ``total_rows``
+        rows up to ``last_pk``; a checkpoint is only resumable while those
+        parts are still on disk.
+        """
         self._recently_cleared.discard(table_name)
         self._state[table_name] = {
             "last_pk": last_pk,
@@ -127,6 +133,8 @@ def update_table_state(
         
         if chunk_size is not None:
             self._state[table_name]["chunk_size"] = chunk_size
+        if part_count is not None:
+            self._state[table_name]["part_count"] = part_count
         
         self._save_state()
     
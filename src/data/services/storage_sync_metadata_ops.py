@@ -7,6 +7,7 @@
 
 import duckdb
 
+from backend.connection_manager import exclusive_database_access
 from data.services.sync_types import SyncMetadata
 
 
@@ -94,22 +95,23 @@ def update_last_modified(service: Any, settings: Any) -> bool:
         if not settings.DEFAULT_DB_PATH.exists():
             return False
 
-        conn = duckdb.connect(str(settings.DEFAULT_DB_PATH), read_only=False)
-        try:
-            now = datetime.now().isoformat()
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO _SyncMetadata (Key, Value, UpdatedAt)
-                VALUES ('last_modified', ?, CURRENT_TIMESTAMP)
-                """,
-                [now],
-            )
-            return True
-        except Exception as exc:
-            service.logger.debug(f"Could not update _SyncMetadata (table may not exist): {exc}")
-            return False
-        finally:
-            conn.close()
+        with exclusive_database_access(settings.DEFAULT_DB_PATH):
+            conn = duckdb.connect(str(settings.DEFAULT_DB_PATH), read_only=False)
+            try:
+                now = datetime.now().isoformat()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO _SyncMetadata (Key, Value, UpdatedAt)
+                    VALUES ('last_modified', ?, CURRENT_TIMESTAMP)
+                    """,
+                    [now],
+                )
+                return True
+            except Exception as exc:
+                service.logger.debug(f"Could not update _SyncMetadata (table may not exist): {exc}")
+                return False
+            finally:
+                conn.close()
     except Exception as exc:
         service.logger.debug(f"Error updating last modified: {exc}")
         return False
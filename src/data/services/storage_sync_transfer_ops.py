@@ -4,6 +4,8 @@
 
 from typing import Any, Callable
 
+from backend.connection_manager import exclusive_database_access
+
 
 def download_all_data(
     service: Any,
@@ -22,10 +24,13 @@ def download_all_data(
         if progress_callback:
             progress_callback("Downloading database...")
 
-        db_success = bool(service.gcs_manager.download_file(
-            gcs_path="data/warehouse.duckdb",
-            local_path=settings.DEFAULT_DB_PATH,
-        ))
+        # Pooled readers must not open the file while it is replaced; leaving
+        # the block also drops every cached result.
+        with exclusive_database_access(settings.DEFAULT_DB_PATH):
+            db_success = bool(service.gcs_manager.download_file(
+                gcs_path="data/warehouse.duckdb",
+                local_path=settings.DEFAULT_DB_PATH,
+            ))
         results["database"] = db_success
 
         if progress_callback:
@@ -110,7 +115,8 @@ def upload_all_data(
         raw_parquet_results = service.gcs_manager.upload_directory(
             local_dir=settings.PARQUET_DIR,
             gcs_prefix="data/parquet",
-            include_patterns=["*.parquet"],
+            # Single-file mirrors and <table>/KnessetNum=NN/ partitions
+            include_patterns=["*.parquet", "*/*/*.parquet"],
         )
         parquet_results = (
             {str(k): bool(v) for k, v in raw_parquet_results.items()}
@@ -0,0 +1,152 @@
+"""Streaming page-to-warehouse ingest for large OData tables."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from config.database import DatabaseConfig
+from config.settings import Settings
+from data.repositories.database_repository import DatabaseRepository
+from data.services.resume_state_service import ResumeStateService
+
+# Runs a repository call, possibly on the refresh's single writer thread.
+WriteFn = Callable[..., Awaitable[bool]]
+
+
+class StreamingTableIngest:
+    """Spool downloaded pages to Parquet parts, then swap them in at once.
+
+    Pages are buffered until ``batch_rows`` rows have accumulated and then
+    written as one staging part, so peak memory is about one batch instead
+    of two to three times the table. ``commit`` loads every part into DuckDB
+    in a single ``CREATE OR REPLACE`` and rewrites the Parquet mirror.
+
+    Given a ``resume_service``, every part written for a cursor-paged table
+    is also a checkpoint: the last cursor key, row total and part count are
+    saved after the part is on disk. A later run started with that state
+    keeps the parts, fetches only rows past the key and appends to them, so
+    the committed table matches an uninterrupted download.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        repository: DatabaseRepository,
+        write: WriteFn,
+        batch_rows: Optional[int] = None,
+        logger_obj: Optional[logging.Logger] = None,
+        resume_service: Optional[ResumeStateService] = None,
+    ):
+        self.table_name = table_name
+        self.repository = repository
+        self.write = write
+        self.batch_rows = batch_rows or Settings.STREAM_BATCH_ROWS
+        self.logger = logger_obj or logging.getLogger(__name__)
+        self.resume_service = resume_service
+        self.cursor_key: Optional[str] = None
+        if resume_service is not None and DatabaseConfig.is_cursor_table(table_name):
+            self.cursor_key = DatabaseConfig.get_cursor_config(table_name)[0]
+        self._buffer: List[pd.DataFrame] = []
+        self._buffered_rows = 0
+        self._next_part = 0
+        self.rows_written = 0
+        self.resumed = False
+
+    @property
+    def checkpointing(self) -> bool:
+        """Whether written parts are recorded as resume checkpoints."""
+        return self.cursor_key is not None
+
+    async def start(self, resume_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Prepare staging and return the resume state to download from.
+
+        A checkpoint is resumed only if all of its parts are still staged;
+        parts written after the last saved checkpoint are dropped because
+        their rows will be fetched again. Anything else starts from scratch.
+        """
+        fresh_state: Dict[str, Any] = {"last_pk": -1, "total_rows": 0}
+        state = resume_state or {}
+        part_count = state.get("part_count")
+        parts = self.repository.list_staging_parts(self.table_name)
+
+        if self.checkpointing and state.get("last_pk", -1) > -1:
+            if isinstance(part_count, int) and 0 < part_count <= len(parts):
+                for orphan in parts[part_count:]:
+                    orphan.unlink(missing_ok=True)
+                self._next_part = part_count
+                self.rows_written = int(state.get("total_rows", 0))
+                self.resumed = True
+                self.logger.info(
+                    f"Resuming {self.table_name} after {self.rows_written:,} checkpointed rows "
+                    f"({part_count} staged parts)"
+                )
+                return state
+            self.logger.warning(
+                f"Discarding checkpoint for {self.table_name}: its staged parts are missing"
+            )
+            if self.resume_service is not None:
+                self.resume_service.clear_table_state(self.table_name)
+
+        self.repository.clear_staging(self.table_name)
+        return fresh_state
+
+    async def add_page(self, df: pd.DataFrame) -> None:
+        """Buffer one page, flushing a part once the batch is full."""
+        if df.empty:
+            return
+        self._buffer.append(df)
+        self._buffered_rows += len(df)
+        if self._buffered_rows >= self.batch_rows:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered pages as the next staging part (and checkpoint it)."""
+        if not self._buffer:
+            return
+        batch = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+
+        ok = await self.write(
+            self.repository.write_staging_part, batch, self.table_name, self._next_part
+        )
+        if not ok:
+            raise RuntimeError(f"Could not write staging part {self._next_part} for {self.table_name}")
+        self._next_part += 1
+        self.rows_written += len(batch)
+
+        if self.resume_service is not None and self.cursor_key is not None:
+            # Saved only after the part is on disk, so the checkpoint never
+            # points past rows that were actually persisted.
+            self.resume_service.update_table_state(
+                self.table_name,
+                int(batch[self.cursor_key].iloc[-1]),
+                self.rows_written,
+                part_count=self._next_part,
+            )
+        self.logger.debug(f"Staged {self.rows_written:,} rows for {self.table_name}")
+
+    async def commit(self) -> bool:
+        """Flush the tail batch and swap the staged table in."""
+        await self.flush()
+        return bool(await self.write(self.repository.load_staging_parts, self.table_name))
+
+    async def discard(self) -> None:
+        """Drop the buffer and any parts written so far."""
+        self._buffer = []
+        self._buffered_rows = 0
+        self.repository.clear_staging(self.table_name)
+
+    async def abort(self) -> None:
+        """Give up after a failure, keeping committed checkpoints for a resume."""
+        if self.checkpointing:
+            self._buffer = []
+            self._buffered_rows = 0
+            self.logger.info(
+                f"Keeping {self._next_part} staged parts of {self.table_name} for resume"
+            )
+            return
+        await self.discard()
@@ -64,13 +64,16 @@ def refresh_tables_sync(
         self,
         tables: Optional[List[str]] = None,
         progress_callback: Callable[[str], None] | None = None,
+        incremental: bool = False,
     ) -> bool:
         """Refresh tables via async service with a sync API."""
         try:
             async_service = self._get_async_service()
             if async_service:
                 result = self._run_async(
-                    async_service.refresh_tables(tables, progress_callback)
+                    async_service.refresh_tables(
+                        tables, progress_callback, incremental=incremental
+                    )
                 )
                 return bool(result)
 
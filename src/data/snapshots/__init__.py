@@ -9,9 +9,25 @@
     Every snapshot file is written as ``<name>.parquet.new`` and then
     POSIX-renamed to ``<name>.parquet``. ``manifest.json`` is written
     last via the same protocol; it is the commit marker that pins all
-    the individual snapshots to a single warehouse read.
+    the individual snapshots to a single warehouse read. A snapshot
+    exported with ``--partitioned`` is a directory
+    ``<name>/knesset_num=NN/part-*.parquet`` instead, built as
+    ``<name>.new/`` and swapped in the same way; its manifest entry lists
+    the partitions.
 """
 
-from .manifest import Manifest, SnapshotEntry, read_manifest, write_manifest
+from .manifest import (
+    Manifest,
+    PartitionEntry,
+    SnapshotEntry,
+    read_manifest,
+    write_manifest,
+)
 
-__all__ = ["Manifest", "SnapshotEntry", "read_manifest", "write_manifest"]
+__all__ = [
+    "Manifest",
+    "PartitionEntry",
+    "SnapshotEntry",
+    "read_manifest",
+    "write_manifest",
+]
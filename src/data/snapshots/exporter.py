@@ -4,6 +4,9 @@
 one Parquet per API-endpoint shape plus a ``manifest.json`` commit marker.
 Every file is produced atomically via ``<name>.new`` → ``os.replace``, and the
 manifest is always written last so readers see a consistent old-or-new state.
+Subqueries shared by several snapshots are materialized once up front (see
+``data.snapshots.planner``) and the snapshots then export concurrently on
+cursors of the one read-only connection.
 
 CLI::
 
@@ -18,12 +21,19 @@
 import hashlib
 import logging
 import os
+import re
+import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 import duckdb
 
+from backend.partitioned_parquet import list_partitions, replace_directory
 from data.queries.packs.bills import BILLS_QUERIES
 from data.queries.packs.committees import COMMITTEES_QUERIES
 from data.queries.packs.mks import MK_QUERIES
@@ -35,14 +45,45 @@
     RUNG_ORDER,
     UnmappedBillStatusError,
 )
-from data.snapshots.manifest import Manifest, SnapshotEntry, write_manifest
+from data.snapshots.layout import DEFAULT_LAYOUT, SnapshotLayout
+from data.snapshots.manifest import (
+    Manifest,
+    PartitionEntry,
+    SnapshotEntry,
+    read_manifest,
+    write_manifest,
+)
+from data.snapshots.planner import (
+    ExportPlan,
+    PlannedSnapshot,
+    SharedIntermediate,
+    materialize_intermediates,
+    plan_exports,
+)
 
 log = logging.getLogger("data.snapshots.exporter")
 
 # Snapshot-specific "by MK" joins live here (not in the Streamlit packs)
 # because they serve the FastAPI contract, not the UI. Phase 4 may fold them
 # into a dedicated ``mk_activity`` pack once the API surface solidifies.
-_MK_BILLS_SQL = """
+
+#: The one bill sub-type the snapshot bundle covers. Shared by
+#: ``_PRIVATE_BILLS_SQL`` and the pre-flight status guard so the guard cannot
+#: check a wider population than the snapshot actually exports.
+_PRIVATE_MEMBER_SUB_TYPE = "פרטית"
+
+# private_bills — the private-member bill population, shared verbatim by
+# mk_bills and bills_list so the export planner computes it once per run.
+_PRIVATE_BILLS_SQL = f"""
+    SELECT *
+    FROM KNS_Bill
+    WHERE SubTypeDesc = '{_PRIVATE_MEMBER_SUB_TYPE}'
+""".strip("\n")
+
+_MK_BILLS_SQL = f"""
+WITH private_bills AS (
+{_PRIVATE_BILLS_SQL}
+)
 SELECT
     bi.PersonID                     AS mk_id,
     bi.BillID                       AS bill_id,
@@ -57,17 +98,16 @@
     CAST(bi.Ordinal AS INTEGER)     AS initiator_ordinal,
     bi.IsInitiator                  AS is_main_initiator
 FROM KNS_BillInitiator bi
-JOIN KNS_Bill b ON bi.BillID = b.BillID
-LEFT JOIN UserBillCoding ubcoding ON bi.BillID = ubcoding.BillID
-LEFT JOIN UserBillCAP ubcap ON bi.BillID = ubcap.BillID
-LEFT JOIN UserCAPTaxonomy ubcap_tax ON ubcap.CAPMinorCode = ubcap_tax.MinorCode
 -- Only private member bills are an MK's own legislative initiative. Government
 -- ('ממשלתית') and committee ('ועדה') bills also list MKs as initiators upstream
 -- (a minister who is an MK signs the government bill), but crediting them to the
 -- MK misrepresents their legislative record, so exclude them here at the source.
 -- The ``stage`` column is thus always 'פרטית' by construction.
+JOIN private_bills b ON bi.BillID = b.BillID
+LEFT JOIN UserBillCoding ubcoding ON bi.BillID = ubcoding.BillID
+LEFT JOIN UserBillCAP ubcap ON bi.BillID = ubcap.BillID
+LEFT JOIN UserCAPTaxonomy ubcap_tax ON ubcap.CAPMinorCode = ubcap_tax.MinorCode
 WHERE bi.PersonID IS NOT NULL
-  AND b.SubTypeDesc = 'פרטית'
 ORDER BY bi.BillID, bi.Ordinal, bi.PersonID
 """.strip()
 
@@ -101,17 +141,15 @@ def _bill_status_rung_order_case_sql(column: str) -> str:
     return "\n".join(lines)
 
 
-#: The one bill sub-type the snapshot bundle covers. Shared by
-#: ``_BILLS_LIST_SQL`` and the pre-flight status guard so the guard cannot
-#: check a wider population than the snapshot actually exports.
-_PRIVATE_MEMBER_SUB_TYPE = "פרטית"
-
 # bills_list — titles + decoded status + reading-stage rung, keyed on
 # bill_id. Kept as its own snapshot rather than denormalised into
 # mk_bills: titles average 70 chars and mk_bills has 165k rows against 59k
 # distinct bills, so denormalising would repeat each title 2.8x (11.6 MB vs
 # 4.1 MB). The platform already carries bill_id and can join on it.
 _BILLS_LIST_SQL = f"""
+WITH private_bills AS (
+{_PRIVATE_BILLS_SQL}
+)
 SELECT
     b.BillID                        AS bill_id,
     CAST(b.KnessetNum AS INTEGER)   AS knesset_num,
@@ -130,7 +168,10 @@ def _bill_status_rung_order_case_sql(column: str) -> str:
     s."Desc"                        AS status_desc,
 {_bill_status_rung_case_sql("b.StatusID")} AS status_rung,
 {_bill_status_rung_order_case_sql("b.StatusID")} AS status_rung_order
-FROM KNS_Bill b
+-- Scoped to private-member bills to match mk_bills, which is 'פרטית'-only by
+-- construction (see _MK_BILLS_SQL) — a bills_list carrying government/
+-- committee bills would let a join silently reintroduce them.
+FROM private_bills b
 -- StatusID happens to be globally unique across KNS_Status today (verified
 -- against production: 81 rows, 81 distinct ids), so this TypeDesc predicate
 -- changes no output right now. It is defensive, not redundant: StatusID is
@@ -168,10 +209,6 @@ def _bill_status_rung_order_case_sql(column: str) -> str:
     WHERE p.ItemTypeDesc = 'הצעת חוק'
     GROUP BY p.ItemID
 ) fp ON b.BillID = fp.BillID
--- Scoped to private-member bills to match mk_bills, which is 'פרטית'-only by
--- construction (see _MK_BILLS_SQL) — a bills_list carrying government/
--- committee bills would let a join silently reintroduce them.
-WHERE b.SubTypeDesc = '{_PRIVATE_MEMBER_SUB_TYPE}'
 ORDER BY b.BillID
 """.strip()
 
@@ -334,6 +371,19 @@ def _bill_status_rung_order_case_sql(column: str) -> str:
 ORDER BY mk_id
 """.strip()
 
+
+def _cte_body(sql: str, name: str) -> str:
+    """The body of CTE ``name`` inside ``sql``, between its parentheses.
+
+    Relies on the packs' layout: the body starts on the line after
+    ``<name> AS (`` and ends at the first ``)`` in column 0.
+    """
+    match = re.search(rf"\b{name} AS \(\n(.*?)\n\)", sql, re.DOTALL)
+    if match is None:
+        raise ValueError(f"CTE {name!r} not found")
+    return match.group(1)
+
+
 def _committee_name_norm_sql(column: str) -> str:
     """Whitespace/punctuation-stripped normalisation for matching a free-text
     committee name (``WebMkCommittee.committee_name_he``, from the site
@@ -347,17 +397,29 @@ def _committee_name_norm_sql(column: str) -> str:
 # committee_ids — shared CTE resolving every KNS_Committee row to its
 # normalised name. Embedded (via an f-string) into both queries below that
 # need to match a WebMkCommittee free-text committee name to a
-# committees_list id, so the resolution logic lives in exactly one place.
-_COMMITTEE_IDS_CTE_SQL = f"""
-committee_ids AS (
+# committees_list id, so the resolution logic lives in exactly one place
+# and the export planner can materialize it once for both.
+_COMMITTEE_IDS_SQL = f"""
     SELECT
         CAST(CommitteeID AS BIGINT) AS committee_id,
         KnessetNum,
         {_committee_name_norm_sql("Name")} AS norm_name
     FROM KNS_Committee
+""".strip("\n")
+
+_COMMITTEE_IDS_CTE_SQL = f"""
+committee_ids AS (
+{_COMMITTEE_IDS_SQL}
 )
 """.strip()
 
+# latest_faction — one row per (MK, Knesset) ranked by how recently the MK
+# took up the faction seat, rn = 1 being the latest. This is mk_summary's own
+# LatestPerTerm body, reused verbatim so committee members are attributed to
+# exactly the faction their MK profile shows — and so the export planner
+# materializes it once for both snapshots.
+_LATEST_FACTION_SQL = _cte_body(MK_QUERIES["mk_summary"]["sql"], "LatestPerTerm")
+
 # committee_members_by_faction — currently-serving members per committee, grouped
 # downstream by faction. Source is WebMkCommittee (site backend); we keep only
 # current memberships (to_date IS NULL), resolve the committee NAME to a
@@ -367,15 +429,7 @@ def _committee_name_norm_sql(column: str) -> str:
 # attach each MK's latest faction for that term (same logic as mk_summary).
 _COMMITTEE_MEMBERS_SQL = f"""
 WITH latest_faction AS (
-    SELECT
-        PersonID, KnessetNum, FactionID, FactionName,
-        ROW_NUMBER() OVER (
-            PARTITION BY PersonID, KnessetNum
-            ORDER BY TRY_CAST(StartDate AS TIMESTAMP) DESC NULLS LAST,
-                     PersonToPositionID DESC
-        ) AS rn
-    FROM KNS_PersonToPosition
-    WHERE FactionID IS NOT NULL
+{_LATEST_FACTION_SQL}
 ),
 {_COMMITTEE_IDS_CTE_SQL}
 SELECT DISTINCT
@@ -639,43 +693,311 @@ def _committee_name_norm_sql(column: str) -> str:
     ("committee_bills", _COMMITTEE_BILLS_SQL),
 )
 
+# Subqueries embedded verbatim in more than one snapshot above. The planner
+# materializes each once per run instead of once per snapshot.
+SHARED_INTERMEDIATES: tuple[SharedIntermediate, ...] = (
+    SharedIntermediate("latest_faction", _LATEST_FACTION_SQL),
+    SharedIntermediate("private_bills", _PRIVATE_BILLS_SQL),
+    SharedIntermediate("committee_ids", _COMMITTEE_IDS_SQL),
+)
+
+# Physical layout of the snapshots the consumer filters on; every other
+# snapshot keeps DEFAULT_LAYOUT (its query's ORDER BY, DuckDB defaults).
+# The MK-activity files are clustered on mk_id then knesset_num, which is how
+# the MK profile reads them. mk_bills is large enough to span only two
+# default row groups, so it gets smaller ones for tighter mk_id ranges, with
+# the default dictionary limit (1/20 of a default row group) kept explicitly
+# so its label columns stay dictionary-encoded. mk_votes, the largest file,
+# is already ordered by mk_id and spans many row groups; smaller ones only
+# grew it (a dictionary per row group) without faster reads, so it just
+# compresses harder. See scripts/benchmark_snapshot_layout.py.
+SNAPSHOT_LAYOUTS: dict[str, SnapshotLayout] = {
+    "mk_votes": SnapshotLayout(compression_level=9),
+    "mk_bills": SnapshotLayout(
+        sort_by=("mk_id", "knesset_num"),
+        row_group_size=32_768,
+        dictionary_size_limit=6_144,
+    ),
+    "mk_questions": SnapshotLayout(sort_by=("mk_id", "knesset_num")),
+    "mk_motions": SnapshotLayout(sort_by=("mk_id", "knesset_num")),
+    "bills_list": SnapshotLayout(sort_by=("knesset_num",)),
+}
+
+#: Snapshots written as ``<name>/knesset_num=NN/part-*.parquet`` by
+#: ``export_all(partitioned=True)``, with their partition column. Both are
+#: large and read one Knesset at a time; the small snapshots stay single files
+#: either way.
+PARTITIONED_SNAPSHOTS: dict[str, str] = {
+    "mk_votes": "knesset_num",
+    "bills_list": "knesset_num",
+}
+
+#: Snapshots exported concurrently, each on its own cursor. DuckDB already
+#: parallelises inside one query; most snapshots here are too small to keep
+#: every core busy on their own, so a few at a time fill the gaps.
+DEFAULT_EXPORT_WORKERS = 4
+
 # Keep BILLS_QUERIES referenced so lint doesn't drop the import —
 # Phase 4 will switch mk_bills to a real helper inside bills.py.
 _ = BILLS_QUERIES
 
 
+def snapshot_layout(name: str, partitioned: bool = False) -> SnapshotLayout:
+    """Layout ``name`` is written with, partitioned if asked and eligible."""
+    layout = SNAPSHOT_LAYOUTS.get(name, DEFAULT_LAYOUT)
+    if partitioned and name in PARTITIONED_SNAPSHOTS:
+        layout = replace(layout, partition_by=PARTITIONED_SNAPSHOTS[name])
+    return layout
+
+
+def snapshot_path(output_dir: Path, name: str, layout: SnapshotLayout) -> Path:
+    """The file, or partition directory, a snapshot is exported to."""
+    if layout.partition_by is not None:
+        return output_dir / name
+    return output_dir / f"{name}.parquet"
+
+
+def _file_chunks(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as fh:
+        yield from iter(lambda: fh.read(1024 * 1024), b"")
+
+
 def _sha256_of_file(path: Path) -> str:
     h = hashlib.sha256()
-    with path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+    for chunk in _file_chunks(path):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def _sha256_of_tree(root: Path, files: list[Path]) -> str:
+    """Digest of part files, each prefixed with its path under ``root`` so a
+    row moving to another partition changes it too."""
+    h = hashlib.sha256()
+    for path in files:
+        h.update(path.relative_to(root).as_posix().encode("utf-8") + b"\0")
+        for chunk in _file_chunks(path):
             h.update(chunk)
     return h.hexdigest()
 
 
+def _exported_bytes(path: Path) -> int:
+    """Size of a snapshot file, or of every part under a partition directory."""
+    if path.is_dir():
+        return sum(part.stat().st_size for part in path.rglob("*.parquet"))
+    return path.stat().st_size
+
+
+_READ_CSV_RE = re.compile(r"read_csv\(\s*'([^']+)'")
+
+
+def _query_sha256(sql: str, layout: SnapshotLayout = DEFAULT_LAYOUT) -> str:
+    """Digest of everything that shapes the file besides the source data —
+    so a changed query or layout re-exports the snapshot on the next run."""
+    statement = f"{layout.ordered_sql(sql)}\n{layout.copy_options()}"
+    return hashlib.sha256(statement.encode("utf-8")).hexdigest()
+
+
+def _warehouse_relations(con: duckdb.DuckDBPyConnection) -> tuple[str, ...]:
+    """Tables and views of the warehouse a snapshot query could read."""
+    rows = con.execute(
+        """
+        SELECT table_name FROM duckdb_tables()
+        WHERE database_name = current_database() AND NOT temporary
+        UNION
+        SELECT view_name FROM duckdb_views()
+        WHERE database_name = current_database() AND NOT internal
+        """
+    ).fetchall()
+    return tuple(sorted(str(r[0]) for r in rows))
+
+
+def snapshot_sources(sql: str, relations: tuple[str, ...]) -> tuple[str, ...]:
+    """Source keys ``sql`` reads: warehouse relations it names and the seed
+    CSVs it loads (as ``file:<path>``)."""
+    tables = [t for t in relations if re.search(rf"\b{re.escape(t)}\b", sql)]
+    files = [f"file:{path}" for path in _READ_CSV_RE.findall(sql)]
+    return tuple(sorted(tables)) + tuple(sorted(files))
+
+
+def _fingerprint_source(con: duckdb.DuckDBPyConnection, source: str) -> str:
+    """Content fingerprint of one source key.
+
+    Tables are fingerprinted as row count plus an order-independent sum of
+    row hashes — one scan, no sort. DuckDB does not promise ``hash()`` is
+    stable across releases, so an upgrade costs one full re-export, never a
+    stale skip.
+    """
+    if source.startswith("file:"):
+        path = Path(source.removeprefix("file:"))
+        return _sha256_of_file(path) if path.exists() else "missing"
+    cursor = con.cursor()
+    try:
+        row = cursor.execute(
+            f'SELECT COUNT(*), SUM(hash(t)) FROM "{source}" t'
+        ).fetchone()
+    finally:
+        cursor.close()
+    assert row is not None  # aggregate without GROUP BY always returns one row
+    return f"{int(row[0])}:{int(row[1] or 0):x}"
+
+
+def fingerprint_sources(
+    con: duckdb.DuckDBPyConnection,
+    sources: set[str],
+    workers: int = DEFAULT_EXPORT_WORKERS,
+) -> dict[str, str]:
+    """Fingerprint every source once, concurrently on cursors of ``con``."""
+    ordered = sorted(sources)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        fingerprints = pool.map(
+            lambda source: _fingerprint_source(con, source), ordered
+        )
+        return dict(zip(ordered, fingerprints))
+
+
+def _previous_entries(output_dir: Path) -> dict[str, SnapshotEntry]:
+    """Entries of the manifest already in ``output_dir``, if it is readable."""
+    path = output_dir / "manifest.json"
+    if not path.exists():
+        return {}
+    try:
+        return read_manifest(path).snapshots
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        log.warning("ignoring unreadable previous manifest %s: %s", path, exc)
+        return {}
+
+
+def _is_current(
+    entry: SnapshotEntry | None, query_sha256: str, sources: dict[str, str], path: Path
+) -> bool:
+    """Whether the file behind ``entry`` was exported from exactly these inputs."""
+    return (
+        entry is not None
+        and entry.query_sha256 == query_sha256
+        and entry.sources == sources
+        and path.exists()
+        and _exported_bytes(path) == entry.bytes
+    )
+
+
 def _utc_isoformat(ts: float) -> str:
     return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def export_snapshot(
-    con: duckdb.DuckDBPyConnection, name: str, sql: str, output_dir: Path
+    con: duckdb.DuckDBPyConnection,
+    name: str,
+    sql: str,
+    output_dir: Path,
+    layout: SnapshotLayout = DEFAULT_LAYOUT,
 ) -> SnapshotEntry:
-    """Export one query to ``<name>.parquet`` atomically. Returns manifest entry."""
+    """Export one query to ``<name>.parquet`` atomically. Returns manifest entry.
+
+    With ``layout.partition_by`` set the query is written to the directory
+    ``<name>/`` instead (see ``_export_partitioned``).
+    """
+    if layout.partition_by is not None:
+        return _export_partitioned(con, name, sql, output_dir, layout)
     final_path = output_dir / f"{name}.parquet"
     tmp_path = output_dir / f"{name}.parquet.new"
+    started = time.perf_counter()
     # COPY … TO … FORMAT PARQUET streams directly from DuckDB's columnar engine;
     # no pandas roundtrip. COMPRESSION ZSTD trades a bit of CPU for ~2x smaller
-    # files vs. snappy on our data shapes.
-    con.execute(f"COPY ({sql}) TO '{tmp_path}' (FORMAT PARQUET, COMPRESSION ZSTD)")
-    row = con.execute(f"SELECT COUNT(*) FROM read_parquet('{tmp_path}')").fetchone()
-    assert row is not None  # COUNT(*) always returns one row
+    # files vs. snappy on our data shapes. COPY reports how many rows it
+    # wrote, so the file is never re-opened to count them.
+    row = con.execute(
+        f"COPY ({layout.ordered_sql(sql)}) TO '{tmp_path}' ({layout.copy_options()})"
+    ).fetchone()
+    assert row is not None  # COPY always returns its row count
     rows = int(row[0])
+    copied = time.perf_counter()
+    # DuckDB owns the file handle while writing, so the digest takes one
+    # sequential read afterwards (hashlib releases the GIL for it, which lets
+    # concurrent exports keep COPYing meanwhile).
     size_bytes = tmp_path.stat().st_size
     digest = _sha256_of_file(tmp_path)
+    hashed = time.perf_counter()
     os.replace(tmp_path, final_path)
     log.info(
-        "exported %s: rows=%d bytes=%d sha256=%s…", name, rows, size_bytes, digest[:12]
+        "exported %s: rows=%d bytes=%d sha256=%s… copy=%.2fs hash=%.2fs",
+        name,
+        rows,
+        size_bytes,
+        digest[:12],
+        copied - started,
+        hashed - copied,
+    )
+    return SnapshotEntry(rows=rows, sha256=digest, bytes=int(size_bytes))
+
+
+def _export_partitioned(
+    con: duckdb.DuckDBPyConnection,
+    name: str,
+    sql: str,
+    output_dir: Path,
+    layout: SnapshotLayout,
+) -> SnapshotEntry:
+    """Export one query as ``<name>/<column>=NN/part-*.parquet``.
+
+    The tree is built as ``<name>.new/`` and swapped in by
+    ``replace_directory``; unlike the ``.parquet.new`` rename that takes two
+    renames, so the directory is briefly absent. The partition column lives in
+    the directory names, not in the part files; per-partition row counts come
+    from the part footers.
+    """
+    final_dir = output_dir / name
+    tmp_dir = output_dir / f"{name}.new"
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    started = time.perf_counter()
+    row = con.execute(
+        f"COPY ({layout.ordered_sql(sql)}) TO '{tmp_dir}' ({layout.copy_options()})"
+    ).fetchone()
+    assert row is not None  # COPY always returns its row count
+    rows = int(row[0])
+    copied = time.perf_counter()
+    # An empty result writes no partitions and no directory.
+    tmp_dir.mkdir(exist_ok=True)
+    parts = list_partitions(tmp_dir)
+    files = [path for paths in parts.values() for path in paths]
+    part_rows: dict[str, int] = {}
+    if files:
+        part_rows = {
+            Path(file_name).relative_to(tmp_dir).as_posix(): int(num_rows)
+            for file_name, num_rows in con.execute(
+                "SELECT file_name, num_rows FROM parquet_file_metadata(?)",
+                [[path.as_posix() for path in files]],
+            ).fetchall()
+        }
+    partitions = {
+        partition: PartitionEntry(
+            rows=sum(part_rows[f"{partition}/{path.name}"] for path in paths),
+            bytes=sum(path.stat().st_size for path in paths),
+            files=tuple(path.name for path in paths),
+        )
+        for partition, paths in parts.items()
+    }
+    size_bytes = sum(entry.bytes for entry in partitions.values())
+    digest = _sha256_of_tree(tmp_dir, files)
+    hashed = time.perf_counter()
+    replace_directory(tmp_dir, final_dir)
+    log.info(
+        "exported %s: rows=%d bytes=%d partitions=%d sha256=%s… copy=%.2fs hash=%.2fs",
+        name,
+        rows,
+        size_bytes,
+        len(partitions),
+        digest[:12],
+        copied - started,
+        hashed - copied,
+    )
+    return SnapshotEntry(
+        rows=rows,
+        sha256=digest,
+        bytes=size_bytes,
+        partition_by=layout.partition_by or "",
+        partitions=partitions,
     )
-    return SnapshotEntry(rows=int(rows), sha256=digest, bytes=int(size_bytes))
 
 
 def assert_every_bill_status_is_mapped(con: duckdb.DuckDBPyConnection) -> None:
@@ -713,10 +1035,90 @@ def assert_every_bill_status_is_mapped(con: duckdb.DuckDBPyConnection) -> None:
         )
 
 
-def export_all(warehouse: Path, output_dir: Path) -> Manifest:
-    """Run all snapshots. Manifest is written last; individual parquets first."""
+def _export_planned(
+    con: duckdb.DuckDBPyConnection,
+    snapshot: PlannedSnapshot,
+    output_dir: Path,
+    partitioned: bool = False,
+) -> tuple[SnapshotEntry, float]:
+    """Export one planned snapshot on a cursor of its own; also returns the
+    seconds it took."""
+    started = time.perf_counter()
+    cursor = con.cursor()
+    try:
+        entry = export_snapshot(
+            cursor,
+            snapshot.name,
+            snapshot.sql,
+            output_dir,
+            snapshot_layout(snapshot.name, partitioned),
+        )
+    finally:
+        cursor.close()
+    return entry, time.perf_counter() - started
+
+
+def export_planned(
+    con: duckdb.DuckDBPyConnection,
+    plan: ExportPlan,
+    output_dir: Path,
+    workers: int = DEFAULT_EXPORT_WORKERS,
+    partitioned: bool = False,
+) -> dict[str, SnapshotEntry]:
+    """Materialize the plan's intermediates, then export its snapshots
+    concurrently. Entries come back in plan order whatever order the
+    exports finish in."""
+    started = time.perf_counter()
+    materialize_intermediates(con, plan.intermediates)
+    materialized = time.perf_counter()
+    results: dict[str, SnapshotEntry] = {}
+    seconds: dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(
+                _export_planned, con, snapshot, output_dir, partitioned
+            ): snapshot.name
+            for snapshot in plan.snapshots
+        }
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name], seconds[name] = future.result()
+        except BaseException:
+            # Don't start exports that haven't begun; running ones finish
+            # before the pool exits, so no cursor outlives the connection.
+            for future in futures:
+                future.cancel()
+            raise
+    if seconds:
+        slowest = sorted(seconds.items(), key=lambda item: item[1], reverse=True)
+        log.info(
+            "export timings: intermediates=%.2fs snapshots=%.2fs wall; slowest %s",
+            materialized - started,
+            time.perf_counter() - materialized,
+            ", ".join(f"{name}={secs:.2f}s" for name, secs in slowest[:5]),
+        )
+    return {snapshot.name: results[snapshot.name] for snapshot in plan.snapshots}
+
+
+def export_all(
+    warehouse: Path,
+    output_dir: Path,
+    workers: int = DEFAULT_EXPORT_WORKERS,
+    force: bool = False,
+    partitioned: bool = False,
+) -> Manifest:
+    """Run all snapshots. Manifest is written last; individual parquets first.
+
+    A snapshot whose query and source fingerprints match its entry in the
+    existing manifest is not re-exported: its file and entry are kept as
+    they are. ``force`` re-exports everything. ``partitioned`` writes the
+    ``PARTITIONED_SNAPSHOTS`` as Knesset partition directories; switching it
+    on or off re-exports them, since the layout is part of the query digest.
+    """
     warehouse_mtime = warehouse.stat().st_mtime
     started_at = datetime.now(tz=timezone.utc)
+    previous = {} if force else _previous_entries(output_dir)
     con = duckdb.connect(str(warehouse), read_only=True)
     try:
         # Pre-flight, before mkdir and before a single byte is written. A
@@ -725,11 +1127,47 @@ def export_all(warehouse: Path, output_dir: Path) -> Manifest:
         # reads live. Failing here leaves the previous bundle fully intact.
         assert_every_bill_status_is_mapped(con)
         output_dir.mkdir(parents=True, exist_ok=True)
-        entries: dict[str, SnapshotEntry] = {}
+
+        relations = _warehouse_relations(con)
+        source_keys = {
+            name: snapshot_sources(sql, relations) for name, sql in SNAPSHOTS
+        }
+        fingerprints = fingerprint_sources(
+            con, {key for keys in source_keys.values() for key in keys}, workers
+        )
+        layouts = {name: snapshot_layout(name, partitioned) for name, _sql in SNAPSHOTS}
+        query_digests = {
+            name: _query_sha256(sql, layouts[name]) for name, sql in SNAPSHOTS
+        }
+        sources = {
+            name: {key: fingerprints[key] for key in keys}
+            for name, keys in source_keys.items()
+        }
+
+        stale = []
         for name, sql in SNAPSHOTS:
-            entries[name] = export_snapshot(con, name, sql, output_dir)
+            path = snapshot_path(output_dir, name, layouts[name])
+            if _is_current(
+                previous.get(name), query_digests[name], sources[name], path
+            ):
+                log.info("unchanged %s: keeping previous export", name)
+            else:
+                stale.append((name, sql))
+
+        plan = plan_exports(stale, SHARED_INTERMEDIATES)
+        exported = export_planned(con, plan, output_dir, workers, partitioned)
     finally:
         con.close()
+    entries = {
+        name: (
+            replace(
+                exported[name], query_sha256=query_digests[name], sources=sources[name]
+            )
+            if name in exported
+            else previous[name]
+        )
+        for name, _sql in SNAPSHOTS
+    }
     manifest = Manifest(
         version=1,
         generated_at_utc=started_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -737,12 +1175,28 @@ def export_all(warehouse: Path, output_dir: Path) -> Manifest:
         snapshots=entries,
     )
     write_manifest(output_dir / "manifest.json", manifest)
-    log.info("manifest committed → %s", output_dir / "manifest.json")
-    # Belt-and-braces: clean up any stray `.new` files if an earlier run
-    # crashed between tempfile write and replace. os.replace already
-    # handled the happy path; this only catches leftover sidecars.
-    for stray in output_dir.glob("*.new"):
-        stray.unlink(missing_ok=True)
+    log.info(
+        "manifest committed → %s (%d exported, %d unchanged)",
+        output_dir / "manifest.json",
+        len(exported),
+        len(entries) - len(exported),
+    )
+    # Only now that the manifest no longer names them: drop the single file
+    # or partition directory a snapshot left behind in its other layout.
+    for name, layout in layouts.items():
+        if layout.partition_by is not None:
+            (output_dir / f"{name}.parquet").unlink(missing_ok=True)
+        elif (output_dir / name).is_dir():
+            shutil.rmtree(output_dir / name)
+    # Belt-and-braces: clean up any stray `.new` files (or partition
+    # directories, and `.old` ones mid-swap) if an earlier run crashed
+    # between tempfile write and replace. os.replace already handled the
+    # happy path; this only catches leftover sidecars.
+    for stray in [*output_dir.glob("*.new"), *output_dir.glob("*.old")]:
+        if stray.is_dir():
+            shutil.rmtree(stray, ignore_errors=True)
+        else:
+            stray.unlink(missing_ok=True)
     return manifest
 
 
@@ -760,6 +1214,25 @@ def main(argv: list[str] | None = None) -> int:
         default=Path("data/snapshots"),
         help="Destination directory for Parquet snapshots + manifest.json.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_EXPORT_WORKERS,
+        help="Snapshots exported concurrently (1 = one after another).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-export every snapshot, even those whose sources are unchanged.",
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help=(
+            "Write mk_votes and bills_list as knesset_num=NN/ partition "
+            "directories instead of single files."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -772,7 +1245,13 @@ def main(argv: list[str] | None = None) -> int:
     if not args.warehouse.exists():
         log.error("warehouse not found: %s", args.warehouse)
         return 2
-    export_all(args.warehouse, args.output_dir)
+    export_all(
+        args.warehouse,
+        args.output_dir,
+        args.workers,
+        force=args.force,
+        partitioned=args.partitioned,
+    )
     return 0
 
 
@@ -0,0 +1,60 @@
+"""Physical Parquet layout of one snapshot file.
+
+The consumer reads snapshots with selective predicates (``knesset_num``,
+``mk_id``, ``vote_id``). DuckDB writes min/max statistics for every column
+of every row group; they only let a reader skip row groups when the file is
+clustered on the predicate column, so a layout pairs a sort key with a row
+group size small enough for the statistics to be selective.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from backend.partitioned_parquet import partition_copy_options
+
+
+@dataclass(frozen=True)
+class SnapshotLayout:
+    """How a snapshot is written: clustering, row groups and encoding."""
+
+    #: Result columns to cluster the file on. Empty keeps the query's own
+    #: ORDER BY. Ties are broken on every column, so the file stays
+    #: byte-stable on unchanged data.
+    sort_by: tuple[str, ...] = ()
+    #: Rows per row group; ``None`` leaves DuckDB's default (122,880).
+    row_group_size: int | None = None
+    #: ZSTD level; ``None`` leaves DuckDB's default (3).
+    compression_level: int | None = None
+    #: Most distinct values a column may have in one row group and still be
+    #: dictionary-encoded. DuckDB scales its default with the row group size,
+    #: so shrinking row groups can silently drop the dictionary from label
+    #: columns (faction names, status and position labels) without this.
+    dictionary_size_limit: int | None = None
+    #: Result column to Hive-partition on: the snapshot becomes a directory
+    #: ``<name>/<column>=NN/part-*.parquet`` and a reader filtering on the
+    #: column opens only the matching partitions. ``None`` writes one file.
+    partition_by: str | None = None
+
+    def copy_options(self) -> str:
+        """The option list of the snapshot's ``COPY … TO`` statement."""
+        options = ["FORMAT PARQUET", "COMPRESSION ZSTD"]
+        if self.compression_level is not None:
+            options.append(f"COMPRESSION_LEVEL {self.compression_level}")
+        if self.row_group_size is not None:
+            options.append(f"ROW_GROUP_SIZE {self.row_group_size}")
+        if self.dictionary_size_limit is not None:
+            options.append(f"DICTIONARY_SIZE_LIMIT {self.dictionary_size_limit}")
+        if self.partition_by is not None:
+            options.append(partition_copy_options(self.partition_by))
+        return ", ".join(options)
+
+    def ordered_sql(self, sql: str) -> str:
+        """``sql`` re-sorted on the layout's cluster key, if it has one."""
+        if not self.sort_by:
+            return sql
+        keys = ", ".join(self.sort_by)
+        return f"SELECT * FROM (\n{sql}\n) AS snapshot ORDER BY {keys}, COLUMNS(*)"
+
+
+DEFAULT_LAYOUT = SnapshotLayout()
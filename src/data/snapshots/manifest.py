@@ -1,9 +1,9 @@
 """Manifest dataclass and atomic read/write for the snapshot directory.
 
 The manifest is the cross-file consistency contract: readers observe only
-``manifest.json`` that names existing, complete Parquet files, because the
-exporter writes all Parquet files first and only then replaces the manifest
-with a fresh version.
+``manifest.json`` that names existing, complete Parquet files (or partition
+directories), because the exporter writes all Parquet files first and only
+then replaces the manifest with a fresh version.
 """
 
 from __future__ import annotations
@@ -17,6 +17,16 @@
 MANIFEST_VERSION = 1
 
 
+@dataclass(frozen=True)
+class PartitionEntry:
+    """One ``<column>=<value>`` directory of a partitioned snapshot."""
+
+    rows: int
+    bytes: int
+    #: Part files, relative to the partition directory, in sorted order.
+    files: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True)
 class SnapshotEntry:
     """Per-file entry inside the manifest."""
@@ -24,6 +34,18 @@ class SnapshotEntry:
     rows: int
     sha256: str
     bytes: int
+    #: Digest of the query (and COPY options) the file was written with.
+    query_sha256: str = ""
+    #: Content fingerprint of every warehouse table or seed file the query
+    #: read, keyed by table name or ``file:<name>``. A later export skips the
+    #: snapshot while the query digest and all of these still match.
+    sources: dict[str, str] = field(default_factory=dict)
+    #: Column the snapshot is Hive-partitioned on; empty for a single
+    #: ``<name>.parquet`` file. A partitioned snapshot is the directory
+    #: ``<name>/`` and ``sha256``/``bytes``/``rows`` cover all its parts.
+    partition_by: str = ""
+    #: Partition directory name (``knesset_num=25``) → its rows and files.
+    partitions: dict[str, PartitionEntry] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -60,7 +82,23 @@ def read_manifest(path: Path) -> Manifest:
         generated_at_utc=str(data["generated_at_utc"]),
         warehouse_mtime_utc=str(data["warehouse_mtime_utc"]),
         snapshots={
-            name: SnapshotEntry(rows=int(e["rows"]), sha256=str(e["sha256"]), bytes=int(e["bytes"]))
+            name: SnapshotEntry(
+                rows=int(e["rows"]),
+                sha256=str(e["sha256"]),
+                bytes=int(e["bytes"]),
+                # Absent from manifests written before incremental export
+                query_sha256=str(e.get("query_sha256", "")),
+                sources={str(k): str(v) for k, v in e.get("sources", {}).items()},
+                partition_by=str(e.get("partition_by", "")),
+                partitions={
+                    str(k): PartitionEntry(
+                        rows=int(p["rows"]),
+                        bytes=int(p["bytes"]),
+                        files=tuple(str(f) for f in p.get("files", ())),
+                    )
+                    for k, p in e.get("partitions", {}).items()
+                },
+            )
             for name, e in data.get("snapshots", {}).items()
         },
     )
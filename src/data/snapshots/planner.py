@@ -0,0 +1,103 @@
+"""Export planner for the snapshot bundle.
+
+Several snapshot queries embed the same subquery verbatim (an MK's latest
+faction per term, the normalised committee names, the private-member bill
+population). The planner finds those shared bodies, materializes each one
+once into an in-memory scratch database attached to the export connection,
+and rewrites every snapshot to read the scratch table instead of recomputing
+it. The scratch database is attached to the DuckDB instance rather than
+created as ``TEMP`` tables because temp tables are private to one connection,
+and the snapshots then run concurrently on cursors of that connection.
+
+Only a body that at least two snapshots share is materialized — for a single
+consumer the extra table write is pure overhead.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import duckdb
+
+log = logging.getLogger("data.snapshots.planner")
+
+#: In-memory database holding the materialized intermediates for one run.
+SCRATCH_DB = "export_scratch"
+
+
+@dataclass(frozen=True)
+class SharedIntermediate:
+    """A subquery several snapshots embed verbatim, computed once per run."""
+
+    name: str
+    sql: str
+
+    @property
+    def table(self) -> str:
+        return f"{SCRATCH_DB}.{self.name}"
+
+
+@dataclass(frozen=True)
+class PlannedSnapshot:
+    """One snapshot with its shared subqueries swapped for scratch reads."""
+
+    name: str
+    sql: str
+    intermediates: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ExportPlan:
+    """Intermediates to materialize first, then independent snapshot exports."""
+
+    intermediates: tuple[SharedIntermediate, ...]
+    snapshots: tuple[PlannedSnapshot, ...]
+
+
+def plan_exports(
+    snapshots: Sequence[tuple[str, str]],
+    intermediates: Iterable[SharedIntermediate],
+) -> ExportPlan:
+    """Decide which intermediates to materialize and rewrite the snapshots.
+
+    Snapshot order is preserved so the manifest stays byte-stable.
+    """
+    users = {
+        intermediate: [name for name, sql in snapshots if intermediate.sql in sql]
+        for intermediate in intermediates
+    }
+    shared = tuple(i for i, names in users.items() if len(names) >= 2)
+
+    planned = []
+    for name, sql in snapshots:
+        used = []
+        for intermediate in shared:
+            if intermediate.sql in sql:
+                sql = sql.replace(
+                    intermediate.sql, f"SELECT * FROM {intermediate.table}"
+                )
+                used.append(intermediate.name)
+        planned.append(PlannedSnapshot(name=name, sql=sql, intermediates=tuple(used)))
+    return ExportPlan(intermediates=shared, snapshots=tuple(planned))
+
+
+def materialize_intermediates(
+    con: duckdb.DuckDBPyConnection, intermediates: Sequence[SharedIntermediate]
+) -> None:
+    """Attach the scratch database and fill one table per intermediate.
+
+    The scratch database is attached ``READ_WRITE`` explicitly: it would
+    otherwise inherit the read-only mode of the warehouse connection.
+    """
+    con.execute(f"ATTACH ':memory:' AS {SCRATCH_DB} (READ_WRITE)")
+    for intermediate in intermediates:
+        started = time.perf_counter()
+        con.execute(f"CREATE TABLE {intermediate.table} AS {intermediate.sql}")
+        log.info(
+            "materialized shared intermediate %s in %.2fs",
+            intermediate.name,
+            time.perf_counter() - started,
+        )
@@ -137,9 +137,10 @@ def upload_directory(
 
     for local_file in files_to_upload:
         if local_file.is_file():
-            gcs_path = (
-                f"{gcs_prefix}/{local_file.name}" if gcs_prefix else local_file.name
-            )
+            # Relative path, not just the name: partitioned Parquet mirrors
+            # hold a part-0.parquet in every KnessetNum=NN/ directory.
+            relative = local_file.relative_to(local_dir).as_posix()
+            gcs_path = f"{gcs_prefix}/{relative}" if gcs_prefix else relative
             success = upload_file(manager, local_file, gcs_path)
             results[str(local_file)] = success
 
@@ -168,8 +169,8 @@ def download_directory(
                 ):
                     continue
 
-            filename = blob.name.split("/")[-1]
-            local_path = local_dir / filename
+            relative = blob.name[len(gcs_prefix):].lstrip("/")
+            local_path = local_dir / (relative or blob.name.split("/")[-1])
 
             try:
                 local_path.parent.mkdir(parents=True, exist_ok=True)
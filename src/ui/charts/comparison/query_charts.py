@@ -13,7 +13,6 @@
 import plotly.graph_objects as go
 import streamlit as st
 
-from backend.connection_manager import get_db_connection, safe_execute_query
 from ..base import BaseChart
 
 
@@ -33,66 +32,61 @@ def plot_queries_per_faction(
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="q", **kwargs)
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                if not self.check_tables_exist(
-                    con, ["KNS_Query", "KNS_PersonToPosition", "KNS_Faction"]
-                ):
-                    return None
-
-                # Use date-based faction attribution - queries attributed to faction MK belonged to at submission time
-                query = f"""
-                    SELECT
-                        COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown') AS FactionName,
-                        COUNT(DISTINCT q.QueryID) AS QueryCount
-                    FROM KNS_Query q
-                    LEFT JOIN KNS_PersonToPosition ptp ON q.PersonID = ptp.PersonID
-                        AND q.KnessetNum = ptp.KnessetNum
-                        AND ptp.FactionID IS NOT NULL
-                        AND CAST(q.SubmitDate AS TIMESTAMP)
-                            BETWEEN CAST(ptp.StartDate AS TIMESTAMP)
-                            AND CAST(COALESCE(ptp.FinishDate, '9999-12-31') AS TIMESTAMP)
-                    LEFT JOIN KNS_Faction f ON ptp.FactionID = f.FactionID
-                    LEFT JOIN UserFactionCoalitionStatus ufs_name ON ptp.FactionID = ufs_name.FactionID
-                        AND q.KnessetNum = ufs_name.KnessetNum
-                    WHERE q.KnessetNum IS NOT NULL
-                        AND q.SubmitDate IS NOT NULL
-                        AND COALESCE(ufs_name.NewFactionName, f.Name) IS NOT NULL
-                        AND {filters["knesset_condition"]}
-                    GROUP BY COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown')
-                    ORDER BY QueryCount DESC
-                    LIMIT 20
-                """
-
-                df = safe_execute_query(con, query, self.logger)
-
-                if df.empty:
-                    st.info(
-                        f"No faction query data found for '{filters['knesset_title']}'."
-                    )
-                    return None
-
-                fig = px.bar(
-                    df,
-                    x="FactionName",
-                    y="QueryCount",
-                    title=f"<b>Queries per Faction for {filters['knesset_title']}</b>",
-                    labels={
-                        "FactionName": "Faction",
-                        "QueryCount": "Number of Queries",
-                    },
-                    color_discrete_sequence=self.config.KNESSET_COLOR_SEQUENCE,
-                )
+            if not self.check_tables_exist(["KNS_Query", "KNS_PersonToPosition", "KNS_Faction"]):
+                return None
+
+            # Use date-based faction attribution - queries attributed to faction MK belonged to at submission time
+            query = f"""
+                SELECT
+                    COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown') AS FactionName,
+                    COUNT(DISTINCT q.QueryID) AS QueryCount
+                FROM KNS_Query q
+                LEFT JOIN KNS_PersonToPosition ptp ON q.PersonID = ptp.PersonID
+                    AND q.KnessetNum = ptp.KnessetNum
+                    AND ptp.FactionID IS NOT NULL
+                    AND CAST(q.SubmitDate AS TIMESTAMP)
+                        BETWEEN CAST(ptp.StartDate AS TIMESTAMP)
+                        AND CAST(COALESCE(ptp.FinishDate, '9999-12-31') AS TIMESTAMP)
+                LEFT JOIN KNS_Faction f ON ptp.FactionID = f.FactionID
+                LEFT JOIN UserFactionCoalitionStatus ufs_name ON ptp.FactionID = ufs_name.FactionID
+                    AND q.KnessetNum = ufs_name.KnessetNum
+                WHERE q.KnessetNum IS NOT NULL
+                    AND q.SubmitDate IS NOT NULL
+                    AND COALESCE(ufs_name.NewFactionName, f.Name) IS NOT NULL
+                    AND {filters["knesset_condition"]}
+                GROUP BY COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown')
+                ORDER BY QueryCount DESC
+                LIMIT 20
+            """
 
-                fig.update_layout(
-                    xaxis_title="Faction",
-                    yaxis_title="Number of Queries",
-                    title_x=0.5,
-                    xaxis_tickangle=-45,
+            df = self.run_query(query)
+
+            if df.empty:
+                st.info(
+                    f"No faction query data found for '{filters['knesset_title']}'."
                 )
+                return None
+
+            fig = px.bar(
+                df,
+                x="FactionName",
+                y="QueryCount",
+                title=f"<b>Queries per Faction for {filters['knesset_title']}</b>",
+                labels={
+                    "FactionName": "Faction",
+                    "QueryCount": "Number of Queries",
+                },
+                color_discrete_sequence=self.config.KNESSET_COLOR_SEQUENCE,
+            )
 
-                return fig
+            fig.update_layout(
+                xaxis_title="Faction",
+                yaxis_title="Number of Queries",
+                title_x=0.5,
+                xaxis_tickangle=-45,
+            )
+
+            return fig
 
         except Exception as e:
             self.logger.error(
@@ -134,110 +128,107 @@ def plot_queries_by_coalition_status(self, **kwargs) -> Optional[go.Figure]:
         single_knesset_num = int(knesset_filter[0])
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                required_tables = [
-                    "KNS_Query",
-                    "KNS_Person",
-                    "KNS_PersonToPosition",
-                    "UserFactionCoalitionStatus",
-                ]
-                if not self.check_tables_exist(con, required_tables):
-                    return None
-
-                params: list[Any] = [single_knesset_num]
-                conditions: list[str] = [
-                    "q.KnessetNum = ?",
-                    "q.SubmitDate IS NOT NULL",
-                ]
-
-                if start_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
-                    params.append(start_date)
-                if end_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
-                    params.append(end_date)
-
-                if query_type_filter:
-                    placeholders = ", ".join("?" for _ in query_type_filter)
-                    conditions.append(f"q.TypeDesc IN ({placeholders})")
-                    params.extend(query_type_filter)
-
-                if query_status_filter:
-                    placeholders = ", ".join("?" for _ in query_status_filter)
-                    conditions.append(f's."Desc" IN ({placeholders})')
-                    params.extend(query_status_filter)
-
-                valid_faction_ids = [
-                    int(fid)
-                    for fid in faction_filter or []
-                    if str(fid).isdigit()
-                ]
-                if valid_faction_ids:
-                    placeholders = ", ".join("?" for _ in valid_faction_ids)
-                    conditions.append(f"p2p.FactionID IN ({placeholders})")
-                    params.extend(valid_faction_ids)
-
-                where_clause = " AND ".join(conditions)
-
-                query = f"""
-                SELECT
-                    COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
-                    COUNT(DISTINCT q.QueryID) AS QueryCount
-                FROM KNS_Query q
-                JOIN KNS_Person p ON q.PersonID = p.PersonID
-                LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
-                LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
-                    AND q.KnessetNum = p2p.KnessetNum
-                    AND p2p.FactionID IS NOT NULL
-                    AND CAST(q.SubmitDate AS TIMESTAMP)
-                        BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
-                        AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
-                LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
-                    AND q.KnessetNum = ufs.KnessetNum
-                WHERE {where_clause}
-                GROUP BY CoalitionStatus
-                HAVING QueryCount > 0
-                ORDER BY QueryCount DESC
-                """
-
-                self.logger.debug(
-                    "Executing SQL for plot_queries_by_coalition_status (Knesset %s): %s",
-                    single_knesset_num,
-                    query,
-                )
-                df = safe_execute_query(con, query, self.logger, params=params)
+            required_tables = [
+                "KNS_Query",
+                "KNS_Person",
+                "KNS_PersonToPosition",
+                "UserFactionCoalitionStatus",
+            ]
+            if not self.check_tables_exist(required_tables):
+                return None
+
+            params: list[Any] = [single_knesset_num]
+            conditions: list[str] = [
+                "q.KnessetNum = ?",
+                "q.SubmitDate IS NOT NULL",
+            ]
+
+            if start_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
+                params.append(start_date)
+            if end_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
+                params.append(end_date)
+
+            if query_type_filter:
+                placeholders = ", ".join("?" for _ in query_type_filter)
+                conditions.append(f"q.TypeDesc IN ({placeholders})")
+                params.extend(query_type_filter)
+
+            if query_status_filter:
+                placeholders = ", ".join("?" for _ in query_status_filter)
+                conditions.append(f's."Desc" IN ({placeholders})')
+                params.extend(query_status_filter)
+
+            valid_faction_ids = [
+                int(fid)
+                for fid in faction_filter or []
+                if str(fid).isdigit()
+            ]
+            if valid_faction_ids:
+                placeholders = ", ".join("?" for _ in valid_faction_ids)
+                conditions.append(f"p2p.FactionID IN ({placeholders})")
+                params.extend(valid_faction_ids)
+
+            where_clause = " AND ".join(conditions)
+
+            query = f"""
+            SELECT
+                COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
+                COUNT(DISTINCT q.QueryID) AS QueryCount
+            FROM KNS_Query q
+            JOIN KNS_Person p ON q.PersonID = p.PersonID
+            LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
+            LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
+                AND q.KnessetNum = p2p.KnessetNum
+                AND p2p.FactionID IS NOT NULL
+                AND CAST(q.SubmitDate AS TIMESTAMP)
+                    BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
+                    AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
+            LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
+                AND q.KnessetNum = ufs.KnessetNum
+            WHERE {where_clause}
+            GROUP BY CoalitionStatus
+            HAVING QueryCount > 0
+            ORDER BY QueryCount DESC
+            """
+
+            self.logger.debug(
+                "Executing SQL for plot_queries_by_coalition_status (Knesset %s): %s",
+                single_knesset_num,
+                query,
+            )
+            df = self.run_query(query, params=params)
 
-                if df.empty:
-                    st.info(
-                        f"No query data for Knesset {single_knesset_num} to visualize 'Queries by Coalition Status'."
-                    )
-                    return None
-
-                df["QueryCount"] = pd.to_numeric(
-                    df["QueryCount"], errors="coerce"
-                ).fillna(0)
-
-                coalition_colors = {
-                    **self.config.COALITION_OPPOSITION_COLORS,
-                    "Unknown": "#808080",
-                }
-                title = (
-                    f"<b>Queries by Coalition Status (Knesset {single_knesset_num})</b>"
+            if df.empty:
+                st.info(
+                    f"No query data for Knesset {single_knesset_num} to visualize 'Queries by Coalition Status'."
                 )
+                return None
+
+            df["QueryCount"] = pd.to_numeric(
+                df["QueryCount"], errors="coerce"
+            ).fillna(0)
+
+            coalition_colors = {
+                **self.config.COALITION_OPPOSITION_COLORS,
+                "Unknown": "#808080",
+            }
+            title = (
+                f"<b>Queries by Coalition Status (Knesset {single_knesset_num})</b>"
+            )
 
-                fig = px.pie(
-                    df,
-                    values="QueryCount",
-                    names="CoalitionStatus",
-                    title=title,
-                    color="CoalitionStatus",
-                    color_discrete_map=coalition_colors,
-                )
-                fig.update_traces(textposition="inside", textinfo="percent+label")
-                fig.update_layout(title_x=0.5, height=600, margin=dict(t=120))
-                return fig
+            fig = px.pie(
+                df,
+                values="QueryCount",
+                names="CoalitionStatus",
+                title=title,
+                color="CoalitionStatus",
+                color_discrete_map=coalition_colors,
+            )
+            fig.update_traces(textposition="inside", textinfo="percent+label")
+            fig.update_layout(title_x=0.5, height=600, margin=dict(t=120))
+            return fig
 
         except Exception as e:
             self.logger.error(
@@ -276,143 +267,140 @@ def plot_queries_by_ministry(
         single_knesset_num = knesset_filter[0]
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                required_tables = ["KNS_Query", "KNS_GovMinistry", "KNS_Status"]
-                if not self.check_tables_exist(con, required_tables):
-                    return None
-
-                # Build answer status categorization
-                answer_status_case_sql = """
-                    CASE
-                        WHEN s.Desc LIKE '%נענתה%' AND s.Desc NOT LIKE '%לא נענתה%' THEN 'Answered'
-                        WHEN s.Desc LIKE '%לא נענתה%' THEN 'Not Answered'
-                        WHEN s.Desc LIKE '%הועברה%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%בטיפול%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%נדחתה%' THEN 'Not Answered'
-                        WHEN s.Desc LIKE '%הוסרה%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%נקבע תאריך%' THEN 'Other/In Progress'
-                        ELSE 'Unknown'
-                    END AS AnswerStatus
-                """
-
-                sql_query = f"""
-                WITH MinistryQueryStats AS (
-                    SELECT
-                        q.GovMinistryID,
-                        m.Name AS MinistryName,
-                        {answer_status_case_sql},
-                        COUNT(q.QueryID) AS QueryCount
-                    FROM KNS_Query q
-                    JOIN KNS_GovMinistry m ON q.GovMinistryID = m.GovMinistryID
-                    JOIN KNS_Status s ON q.StatusID = s.StatusID
-                    WHERE q.KnessetNum = {single_knesset_num} AND q.GovMinistryID IS NOT NULL
-                    GROUP BY q.GovMinistryID, m.Name, AnswerStatus
-                )
+            required_tables = ["KNS_Query", "KNS_GovMinistry", "KNS_Status"]
+            if not self.check_tables_exist(required_tables):
+                return None
+
+            # Build answer status categorization
+            answer_status_case_sql = """
+                CASE
+                    WHEN s.Desc LIKE '%נענתה%' AND s.Desc NOT LIKE '%לא נענתה%' THEN 'Answered'
+                    WHEN s.Desc LIKE '%לא נענתה%' THEN 'Not Answered'
+                    WHEN s.Desc LIKE '%הועברה%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%בטיפול%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%נדחתה%' THEN 'Not Answered'
+                    WHEN s.Desc LIKE '%הוסרה%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%נקבע תאריך%' THEN 'Other/In Progress'
+                    ELSE 'Unknown'
+                END AS AnswerStatus
+            """
+
+            sql_query = f"""
+            WITH MinistryQueryStats AS (
                 SELECT
-                    MinistryName,
-                    AnswerStatus,
-                    QueryCount,
-                    SUM(QueryCount) OVER (PARTITION BY MinistryName) AS TotalQueriesForMinistry,
-                    SUM(CASE WHEN AnswerStatus = 'Answered' THEN QueryCount ELSE 0 END) OVER (PARTITION BY MinistryName) AS AnsweredQueriesForMinistry
-                FROM MinistryQueryStats
-                ORDER BY TotalQueriesForMinistry DESC, MinistryName,
-                    CASE AnswerStatus
-                        WHEN 'Answered' THEN 1
-                        WHEN 'Not Answered' THEN 2
-                        WHEN 'Other/In Progress' THEN 3
-                        ELSE 4
-                    END
-                """
-
-                self.logger.debug(
-                    f"Executing SQL for plot_queries_by_ministry (Knesset {single_knesset_num}): {sql_query}"
-                )
-                result = safe_execute_query(con, sql_query, self.logger)
+                    q.GovMinistryID,
+                    m.Name AS MinistryName,
+                    {answer_status_case_sql},
+                    COUNT(q.QueryID) AS QueryCount
+                FROM KNS_Query q
+                JOIN KNS_GovMinistry m ON q.GovMinistryID = m.GovMinistryID
+                JOIN KNS_Status s ON q.StatusID = s.StatusID
+                WHERE q.KnessetNum = {single_knesset_num} AND q.GovMinistryID IS NOT NULL
+                GROUP BY q.GovMinistryID, m.Name, AnswerStatus
+            )
+            SELECT
+                MinistryName,
+                AnswerStatus,
+                QueryCount,
+                SUM(QueryCount) OVER (PARTITION BY MinistryName) AS TotalQueriesForMinistry,
+                SUM(CASE WHEN AnswerStatus = 'Answered' THEN QueryCount ELSE 0 END) OVER (PARTITION BY MinistryName) AS AnsweredQueriesForMinistry
+            FROM MinistryQueryStats
+            ORDER BY TotalQueriesForMinistry DESC, MinistryName,
+                CASE AnswerStatus
+                    WHEN 'Answered' THEN 1
+                    WHEN 'Not Answered' THEN 2
+                    WHEN 'Other/In Progress' THEN 3
+                    ELSE 4
+                END
+            """
+
+            self.logger.debug(
+                f"Executing SQL for plot_queries_by_ministry (Knesset {single_knesset_num}): {sql_query}"
+            )
+            result = self.run_query(sql_query)
 
-                if result is None or result.empty:
-                    st.info(
-                        f"No query data found for ministries in Knesset {single_knesset_num}."
-                    )
-                    return None
-
-                df = result.copy()
-
-                # Convert to numeric and calculate percentages
-                df["QueryCount"] = pd.to_numeric(df["QueryCount"], errors="coerce").fillna(0)
-                df["TotalQueriesForMinistry"] = pd.to_numeric(
-                    df["TotalQueriesForMinistry"], errors="coerce"
-                ).fillna(0)
-                df["AnsweredQueriesForMinistry"] = pd.to_numeric(
-                    df["AnsweredQueriesForMinistry"], errors="coerce"
-                ).fillna(0)
-
-                df["ReplyPercentage"] = (
-                    (df["AnsweredQueriesForMinistry"] / df["TotalQueriesForMinistry"].replace(0, pd.NA)) * 100
-                ).round(1)
-                df["ReplyPercentageText"] = df["ReplyPercentage"].apply(
-                    lambda x: f"{x}% replied" if pd.notna(x) else "N/A replied"
+            if result is None or result.empty:
+                st.info(
+                    f"No query data found for ministries in Knesset {single_knesset_num}."
                 )
+                return None
+
+            df = result.copy()
+
+            # Convert to numeric and calculate percentages
+            df["QueryCount"] = pd.to_numeric(df["QueryCount"], errors="coerce").fillna(0)
+            df["TotalQueriesForMinistry"] = pd.to_numeric(
+                df["TotalQueriesForMinistry"], errors="coerce"
+            ).fillna(0)
+            df["AnsweredQueriesForMinistry"] = pd.to_numeric(
+                df["AnsweredQueriesForMinistry"], errors="coerce"
+            ).fillna(0)
+
+            df["ReplyPercentage"] = (
+                (df["AnsweredQueriesForMinistry"] / df["TotalQueriesForMinistry"].replace(0, pd.NA)) * 100
+            ).round(1)
+            df["ReplyPercentageText"] = df["ReplyPercentage"].apply(
+                lambda x: f"{x}% replied" if pd.notna(x) else "N/A replied"
+            )
 
-                # Get ministry order for consistent sorting
-                df_annotations = df.drop_duplicates(subset=["MinistryName"]).sort_values(
-                    by="TotalQueriesForMinistry", ascending=False
-                )
+            # Get ministry order for consistent sorting
+            df_annotations = df.drop_duplicates(subset=["MinistryName"]).sort_values(
+                by="TotalQueriesForMinistry", ascending=False
+            )
 
-                # Import color config
-                from config.charts import ChartConfig
-
-                fig = px.bar(
-                    df,
-                    x="MinistryName",
-                    y="QueryCount",
-                    color="AnswerStatus",
-                    title=f"<b>Query Distribution and Reply Rate by Ministry (Knesset {single_knesset_num})</b>",
-                    labels={
-                        "MinistryName": "Ministry",
-                        "QueryCount": "Number of Queries",
-                        "AnswerStatus": "Query Outcome",
-                    },
-                    color_discrete_map=ChartConfig.ANSWER_STATUS_COLORS,
-                    category_orders={
-                        "AnswerStatus": ["Answered", "Not Answered", "Other/In Progress", "Unknown"],
-                        "MinistryName": df_annotations["MinistryName"].tolist(),
-                    },
-                )
+            # Import color config
+            from config.charts import ChartConfig
+
+            fig = px.bar(
+                df,
+                x="MinistryName",
+                y="QueryCount",
+                color="AnswerStatus",
+                title=f"<b>Query Distribution and Reply Rate by Ministry (Knesset {single_knesset_num})</b>",
+                labels={
+                    "MinistryName": "Ministry",
+                    "QueryCount": "Number of Queries",
+                    "AnswerStatus": "Query Outcome",
+                },
+                color_discrete_map=ChartConfig.ANSWER_STATUS_COLORS,
+                category_orders={
+                    "AnswerStatus": ["Answered", "Not Answered", "Other/In Progress", "Unknown"],
+                    "MinistryName": df_annotations["MinistryName"].tolist(),
+                },
+            )
 
-                # Update hover for each trace separately to show reply rate only for Answered
-                for trace in fig.data:
-                    trace_df = df[df["AnswerStatus"] == trace.name]
-                    if trace.name == "Answered":
-                        trace.customdata = trace_df[["TotalQueriesForMinistry", "ReplyPercentage"]].values
-                        trace.hovertemplate = (
-                            "<b>Ministry:</b> %{x}<br>"
-                            + "<b>Status:</b> %{fullData.name}<br>"
-                            + "<b>Answered:</b> %{y}<br>"
-                            + "<b>Total Queries:</b> %{customdata[0]}<br>"
-                            + "<b>Reply Rate:</b> %{customdata[1]:.1f}%<extra></extra>"
-                        )
-                    else:
-                        trace.customdata = trace_df[["TotalQueriesForMinistry"]].values
-                        trace.hovertemplate = (
-                            "<b>Ministry:</b> %{x}<br>"
-                            + "<b>Status:</b> %{fullData.name}<br>"
-                            + "<b>Count:</b> %{y}<br>"
-                            + "<b>Total Queries:</b> %{customdata[0]}<extra></extra>"
-                        )
-
-                fig.update_layout(
-                    xaxis_title="Ministry",
-                    yaxis_title="Number of Queries",
-                    legend_title_text="Query Outcome",
-                    title_x=0.5,
-                    xaxis_tickangle=-45,
-                    height=800,
-                    margin=dict(t=180),
-                )
+            # Update hover for each trace separately to show reply rate only for Answered
+            for trace in fig.data:
+                trace_df = df[df["AnswerStatus"] == trace.name]
+                if trace.name == "Answered":
+                    trace.customdata = trace_df[["TotalQueriesForMinistry", "ReplyPercentage"]].values
+                    trace.hovertemplate = (
+                        "<b>Ministry:</b> %{x}<br>"
+                        + "<b>Status:</b> %{fullData.name}<br>"
+                        + "<b>Answered:</b> %{y}<br>"
+                        + "<b>Total Queries:</b> %{customdata[0]}<br>"
+                        + "<b>Reply Rate:</b> %{customdata[1]:.1f}%<extra></extra>"
+                    )
+                else:
+                    trace.customdata = trace_df[["TotalQueriesForMinistry"]].values
+                    trace.hovertemplate = (
+                        "<b>Ministry:</b> %{x}<br>"
+                        + "<b>Status:</b> %{fullData.name}<br>"
+                        + "<b>Count:</b> %{y}<br>"
+                        + "<b>Total Queries:</b> %{customdata[0]}<extra></extra>"
+                    )
 
-                return fig
+            fig.update_layout(
+                xaxis_title="Ministry",
+                yaxis_title="Number of Queries",
+                legend_title_text="Query Outcome",
+                title_x=0.5,
+                xaxis_tickangle=-45,
+                height=800,
+                margin=dict(t=180),
+            )
+
+            return fig
 
         except Exception as e:
             self.logger.error(
@@ -454,201 +442,198 @@ def plot_query_status_by_faction(
         single_knesset_num = knesset_filter[0]
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                required_tables = [
-                    "KNS_Query",
-                    "KNS_Person",
-                    "KNS_PersonToPosition",
-                    "KNS_Status",
-                    "KNS_Faction",
+            required_tables = [
+                "KNS_Query",
+                "KNS_Person",
+                "KNS_PersonToPosition",
+                "KNS_Status",
+                "KNS_Faction",
+            ]
+            if not self.check_tables_exist(required_tables):
+                return None
+
+            params: List[Any] = [single_knesset_num]
+            conditions = [
+                "q.KnessetNum = ?",
+                "q.SubmitDate IS NOT NULL",
+            ]
+
+            if start_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
+                params.append(start_date)
+            if end_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
+                params.append(end_date)
+
+            if faction_filter:
+                valid_ids = [
+                    str(fid) for fid in faction_filter if str(fid).isdigit()
                 ]
-                if not self.check_tables_exist(con, required_tables):
-                    return None
+                if valid_ids:
+                    placeholders = ", ".join("?" for _ in valid_ids)
+                    conditions.append(f"p2p.FactionID IN ({placeholders})")
+                    params.extend(valid_ids)
+
+            where_clause = " AND ".join(conditions)
+
+            # Use same status categorization as the ministry chart
+            answer_status_case_sql = """
+                CASE
+                    WHEN s.Desc LIKE '%נענתה%' AND s.Desc NOT LIKE '%לא נענתה%' THEN 'Answered'
+                    WHEN s.Desc LIKE '%לא נענתה%' THEN 'Not Answered'
+                    WHEN s.Desc LIKE '%הועברה%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%בטיפול%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%נדחתה%' THEN 'Not Answered'
+                    WHEN s.Desc LIKE '%הוסרה%' THEN 'Other/In Progress'
+                    WHEN s.Desc LIKE '%נקבע תאריך%' THEN 'Other/In Progress'
+                    ELSE 'Unknown'
+                END AS AnswerStatus
+            """
+
+            sql_query = f"""
+            WITH FactionQueryStats AS (
+                SELECT
+                    COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown Faction') AS FactionName,
+                    p2p.FactionID,
+                    {answer_status_case_sql},
+                    COUNT(DISTINCT q.QueryID) AS QueryCount
+                FROM KNS_Query q
+                JOIN KNS_Person p ON q.PersonID = p.PersonID
+                LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
+                LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
+                    AND q.KnessetNum = p2p.KnessetNum
+                    AND p2p.FactionID IS NOT NULL
+                    AND CAST(q.SubmitDate AS TIMESTAMP) BETWEEN CAST(p2p.StartDate AS TIMESTAMP) AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
+                LEFT JOIN KNS_Faction f ON p2p.FactionID = f.FactionID
+                LEFT JOIN UserFactionCoalitionStatus ufs_name ON p2p.FactionID = ufs_name.FactionID
+                    AND q.KnessetNum = ufs_name.KnessetNum
+                WHERE {where_clause}
+                    AND COALESCE(ufs_name.NewFactionName, f.Name) IS NOT NULL
+                GROUP BY COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown Faction'), p2p.FactionID, AnswerStatus
+            )
+            SELECT
+                FactionName,
+                FactionID,
+                AnswerStatus,
+                QueryCount,
+                SUM(QueryCount) OVER (PARTITION BY FactionName) AS TotalQueriesForFaction,
+                SUM(CASE WHEN AnswerStatus = 'Answered' THEN QueryCount ELSE 0 END) OVER (PARTITION BY FactionName) AS AnsweredQueriesForFaction
+            FROM FactionQueryStats
+            ORDER BY TotalQueriesForFaction DESC, FactionName,
+                CASE AnswerStatus
+                    WHEN 'Answered' THEN 1
+                    WHEN 'Not Answered' THEN 2
+                    WHEN 'Other/In Progress' THEN 3
+                    ELSE 4
+                END
+            """
+
+            date_filter_info = ""
+            if start_date or end_date:
+                date_filter_info = f" with date filter: {start_date or 'None'} to {end_date or 'None'}"
+            self.logger.debug(
+                "Executing SQL for plot_query_status_by_faction (Knesset %s)%s: %s",
+                single_knesset_num,
+                date_filter_info,
+                sql_query,
+            )
 
-                params: List[Any] = [single_knesset_num]
-                conditions = [
-                    "q.KnessetNum = ?",
-                    "q.SubmitDate IS NOT NULL",
-                ]
+            result = self.run_query(sql_query, params=params)
 
-                if start_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
-                    params.append(start_date)
-                if end_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
-                    params.append(end_date)
-
-                if faction_filter:
-                    valid_ids = [
-                        str(fid) for fid in faction_filter if str(fid).isdigit()
-                    ]
-                    if valid_ids:
-                        placeholders = ", ".join("?" for _ in valid_ids)
-                        conditions.append(f"p2p.FactionID IN ({placeholders})")
-                        params.extend(valid_ids)
-
-                where_clause = " AND ".join(conditions)
-
-                # Use same status categorization as the ministry chart
-                answer_status_case_sql = """
-                    CASE
-                        WHEN s.Desc LIKE '%נענתה%' AND s.Desc NOT LIKE '%לא נענתה%' THEN 'Answered'
-                        WHEN s.Desc LIKE '%לא נענתה%' THEN 'Not Answered'
-                        WHEN s.Desc LIKE '%הועברה%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%בטיפול%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%נדחתה%' THEN 'Not Answered'
-                        WHEN s.Desc LIKE '%הוסרה%' THEN 'Other/In Progress'
-                        WHEN s.Desc LIKE '%נקבע תאריך%' THEN 'Other/In Progress'
-                        ELSE 'Unknown'
-                    END AS AnswerStatus
-                """
-
-                sql_query = f"""
-                WITH FactionQueryStats AS (
-                    SELECT
-                        COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown Faction') AS FactionName,
-                        p2p.FactionID,
-                        {answer_status_case_sql},
-                        COUNT(DISTINCT q.QueryID) AS QueryCount
-                    FROM KNS_Query q
-                    JOIN KNS_Person p ON q.PersonID = p.PersonID
-                    LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
-                    LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
-                        AND q.KnessetNum = p2p.KnessetNum
-                        AND p2p.FactionID IS NOT NULL
-                        AND CAST(q.SubmitDate AS TIMESTAMP) BETWEEN CAST(p2p.StartDate AS TIMESTAMP) AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
-                    LEFT JOIN KNS_Faction f ON p2p.FactionID = f.FactionID
-                    LEFT JOIN UserFactionCoalitionStatus ufs_name ON p2p.FactionID = ufs_name.FactionID
-                        AND q.KnessetNum = ufs_name.KnessetNum
-                    WHERE {where_clause}
-                        AND COALESCE(ufs_name.NewFactionName, f.Name) IS NOT NULL
-                    GROUP BY COALESCE(ufs_name.NewFactionName, f.Name, 'Unknown Faction'), p2p.FactionID, AnswerStatus
+            if result is None or result.empty:
+                st.info(
+                    f"No query data for Knesset {single_knesset_num} to visualize 'Query Status by Faction' with the current filters."
                 )
-                SELECT
-                    FactionName,
-                    FactionID,
-                    AnswerStatus,
-                    QueryCount,
-                    SUM(QueryCount) OVER (PARTITION BY FactionName) AS TotalQueriesForFaction,
-                    SUM(CASE WHEN AnswerStatus = 'Answered' THEN QueryCount ELSE 0 END) OVER (PARTITION BY FactionName) AS AnsweredQueriesForFaction
-                FROM FactionQueryStats
-                ORDER BY TotalQueriesForFaction DESC, FactionName,
-                    CASE AnswerStatus
-                        WHEN 'Answered' THEN 1
-                        WHEN 'Not Answered' THEN 2
-                        WHEN 'Other/In Progress' THEN 3
-                        ELSE 4
-                    END
-                """
-
-                date_filter_info = ""
-                if start_date or end_date:
-                    date_filter_info = f" with date filter: {start_date or 'None'} to {end_date or 'None'}"
-                self.logger.debug(
-                    "Executing SQL for plot_query_status_by_faction (Knesset %s)%s: %s",
+                self.logger.info(
+                    "No data for 'Query Status by Faction' plot (Knesset %s).",
                     single_knesset_num,
-                    date_filter_info,
-                    sql_query,
                 )
+                return None
+
+            df = result.copy()
+
+            # Convert to numeric and calculate percentages
+            df["QueryCount"] = pd.to_numeric(df["QueryCount"], errors="coerce").fillna(0)
+            df["TotalQueriesForFaction"] = pd.to_numeric(
+                df["TotalQueriesForFaction"], errors="coerce"
+            ).fillna(0)
+            df["AnsweredQueriesForFaction"] = pd.to_numeric(
+                df["AnsweredQueriesForFaction"], errors="coerce"
+            ).fillna(0)
+
+            df["ReplyPercentage"] = (
+                (df["AnsweredQueriesForFaction"] / df["TotalQueriesForFaction"].replace(0, pd.NA)) * 100
+            ).round(1)
+
+            # Get faction order for consistent sorting (by total queries)
+            df_annotations = df.drop_duplicates(subset=["FactionName"]).sort_values(
+                by="TotalQueriesForFaction", ascending=False
+            )
 
-                result = safe_execute_query(con, sql_query, self.logger, params=params)
+            # Import color config
+            from config.charts import ChartConfig
+
+            # Build title with optional date range
+            title = f"<b>Query Status by Faction (Knesset {single_knesset_num})</b>"
+            if start_date or end_date:
+                if start_date and end_date:
+                    date_range_text = f" ({start_date} to {end_date})"
+                elif start_date:
+                    date_range_text = f" (from {start_date})"
+                else:
+                    date_range_text = f" (until {end_date})"
+                title = f"<b>Query Status by Faction (Knesset {single_knesset_num}){date_range_text}</b>"
+
+            fig = px.bar(
+                df,
+                x="FactionName",
+                y="QueryCount",
+                color="AnswerStatus",
+                title=title,
+                labels={
+                    "FactionName": "Faction",
+                    "QueryCount": "Number of Queries",
+                    "AnswerStatus": "Query Status",
+                },
+                color_discrete_map=ChartConfig.ANSWER_STATUS_COLORS,
+                category_orders={
+                    "AnswerStatus": ["Answered", "Not Answered", "Other/In Progress", "Unknown"],
+                    "FactionName": df_annotations["FactionName"].tolist(),
+                },
+            )
 
-                if result is None or result.empty:
-                    st.info(
-                        f"No query data for Knesset {single_knesset_num} to visualize 'Query Status by Faction' with the current filters."
+            # Update hover for each trace separately to show reply rate only for Answered
+            for trace in fig.data:
+                trace_df = df[df["AnswerStatus"] == trace.name]
+                if trace.name == "Answered":
+                    trace.customdata = trace_df[["TotalQueriesForFaction", "ReplyPercentage"]].values
+                    trace.hovertemplate = (
+                        "<b>Faction:</b> %{x}<br>"
+                        + "<b>Status:</b> %{fullData.name}<br>"
+                        + "<b>Answered:</b> %{y}<br>"
+                        + "<b>Total Queries:</b> %{customdata[0]}<br>"
+                        + "<b>Reply Rate:</b> %{customdata[1]:.1f}%<extra></extra>"
                     )
-                    self.logger.info(
-                        "No data for 'Query Status by Faction' plot (Knesset %s).",
-                        single_knesset_num,
+                else:
+                    trace.customdata = trace_df[["TotalQueriesForFaction"]].values
+                    trace.hovertemplate = (
+                        "<b>Faction:</b> %{x}<br>"
+                        + "<b>Status:</b> %{fullData.name}<br>"
+                        + "<b>Count:</b> %{y}<br>"
+                        + "<b>Total Queries:</b> %{customdata[0]}<extra></extra>"
                     )
-                    return None
-
-                df = result.copy()
-
-                # Convert to numeric and calculate percentages
-                df["QueryCount"] = pd.to_numeric(df["QueryCount"], errors="coerce").fillna(0)
-                df["TotalQueriesForFaction"] = pd.to_numeric(
-                    df["TotalQueriesForFaction"], errors="coerce"
-                ).fillna(0)
-                df["AnsweredQueriesForFaction"] = pd.to_numeric(
-                    df["AnsweredQueriesForFaction"], errors="coerce"
-                ).fillna(0)
-
-                df["ReplyPercentage"] = (
-                    (df["AnsweredQueriesForFaction"] / df["TotalQueriesForFaction"].replace(0, pd.NA)) * 100
-                ).round(1)
-
-                # Get faction order for consistent sorting (by total queries)
-                df_annotations = df.drop_duplicates(subset=["FactionName"]).sort_values(
-                    by="TotalQueriesForFaction", ascending=False
-                )
 
-                # Import color config
-                from config.charts import ChartConfig
-
-                # Build title with optional date range
-                title = f"<b>Query Status by Faction (Knesset {single_knesset_num})</b>"
-                if start_date or end_date:
-                    if start_date and end_date:
-                        date_range_text = f" ({start_date} to {end_date})"
-                    elif start_date:
-                        date_range_text = f" (from {start_date})"
-                    else:
-                        date_range_text = f" (until {end_date})"
-                    title = f"<b>Query Status by Faction (Knesset {single_knesset_num}){date_range_text}</b>"
-
-                fig = px.bar(
-                    df,
-                    x="FactionName",
-                    y="QueryCount",
-                    color="AnswerStatus",
-                    title=title,
-                    labels={
-                        "FactionName": "Faction",
-                        "QueryCount": "Number of Queries",
-                        "AnswerStatus": "Query Status",
-                    },
-                    color_discrete_map=ChartConfig.ANSWER_STATUS_COLORS,
-                    category_orders={
-                        "AnswerStatus": ["Answered", "Not Answered", "Other/In Progress", "Unknown"],
-                        "FactionName": df_annotations["FactionName"].tolist(),
-                    },
-                )
-
-                # Update hover for each trace separately to show reply rate only for Answered
-                for trace in fig.data:
-                    trace_df = df[df["AnswerStatus"] == trace.name]
-                    if trace.name == "Answered":
-                        trace.customdata = trace_df[["TotalQueriesForFaction", "ReplyPercentage"]].values
-                        trace.hovertemplate = (
-                            "<b>Faction:</b> %{x}<br>"
-                            + "<b>Status:</b> %{fullData.name}<br>"
-                            + "<b>Answered:</b> %{y}<br>"
-                            + "<b>Total Queries:</b> %{customdata[0]}<br>"
-                            + "<b>Reply Rate:</b> %{customdata[1]:.1f}%<extra></extra>"
-                        )
-                    else:
-                        trace.customdata = trace_df[["TotalQueriesForFaction"]].values
-                        trace.hovertemplate = (
-                            "<b>Faction:</b> %{x}<br>"
-                            + "<b>Status:</b> %{fullData.name}<br>"
-                            + "<b>Count:</b> %{y}<br>"
-                            + "<b>Total Queries:</b> %{customdata[0]}<extra></extra>"
-                        )
-
-                fig.update_layout(
-                    xaxis_title="Faction",
-                    yaxis_title="Number of Queries",
-                    legend_title_text="Query Status",
-                    title_x=0.5,
-                    xaxis_tickangle=-45,
-                    height=800,
-                    margin=dict(t=180),
-                )
+            fig.update_layout(
+                xaxis_title="Faction",
+                yaxis_title="Number of Queries",
+                legend_title_text="Query Status",
+                title_x=0.5,
+                xaxis_tickangle=-45,
+                height=800,
+                margin=dict(t=180),
+            )
 
-                return fig
+            return fig
 
         except Exception as e:
             self.logger.error(
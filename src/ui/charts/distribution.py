@@ -6,7 +6,6 @@
 import plotly.express as px
 import plotly.graph_objects as go
 
-from backend.connection_manager import get_db_connection, safe_execute_query
 from ui.queries.sql_templates import SQLTemplates
 
 from .base import BaseChart, chart_error_handler
@@ -36,50 +35,49 @@ def plot_query_types_distribution(
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="q",
                                      start_date=start_date, end_date=end_date, **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            if not self.check_tables_exist(con, ["KNS_Query"]):
-                return None
-
-            status_join = ""
-            if filters['query_status_condition'] != "1=1":
-                status_join = "LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID"
-
-            query = f"""
-                SELECT
-                    COALESCE(q.TypeDesc, 'Unknown') AS QueryType,
-                    COUNT(q.QueryID) AS Count
-                FROM KNS_Query q
-                {status_join}
-                WHERE q.KnessetNum IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                    AND {filters["query_type_condition"]}
-                    AND {filters["query_status_condition"]}
-                    AND {filters["start_date_condition"]}
-                    AND {filters["end_date_condition"]}
-                GROUP BY q.TypeDesc
-                ORDER BY Count DESC
-            """
+        if not self.check_tables_exist(["KNS_Query"]):
+            return None
 
-            df = safe_execute_query(con, query, self.logger)
+        status_join = ""
+        if filters['query_status_condition'] != "1=1":
+            status_join = "LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID"
+
+        query = f"""
+            SELECT
+                COALESCE(q.TypeDesc, 'Unknown') AS QueryType,
+                COUNT(q.QueryID) AS Count
+            FROM KNS_Query q
+            {status_join}
+            WHERE q.KnessetNum IS NOT NULL
+                AND {filters["knesset_condition"]}
+                AND {filters["query_type_condition"]}
+                AND {filters["query_status_condition"]}
+                AND {filters["start_date_condition"]}
+                AND {filters["end_date_condition"]}
+            GROUP BY q.TypeDesc
+            ORDER BY Count DESC
+        """
 
-            if self.handle_empty_result(df, "query type", filters):
-                return None
+        df = self.run_query(query)
 
-            date_range_text = ""
-            if start_date or end_date:
-                if start_date and end_date:
-                    date_range_text = f" ({start_date} to {end_date})"
-                elif start_date:
-                    date_range_text = f" (from {start_date})"
-                elif end_date:
-                    date_range_text = f" (until {end_date})"
+        if self.handle_empty_result(df, "query type", filters):
+            return None
 
-            fig = px.pie(
-                df, values="Count", names="QueryType",
-                title=f"<b>Query Types Distribution for {filters['knesset_title']}{date_range_text}</b>",
-            )
+        date_range_text = ""
+        if start_date or end_date:
+            if start_date and end_date:
+                date_range_text = f" ({start_date} to {end_date})"
+            elif start_date:
+                date_range_text = f" (from {start_date})"
+            elif end_date:
+                date_range_text = f" (until {end_date})"
+
+        fig = px.pie(
+            df, values="Count", names="QueryType",
+            title=f"<b>Query Types Distribution for {filters['knesset_title']}{date_range_text}</b>",
+        )
 
-            return self.apply_pie_chart_defaults(fig)
+        return self.apply_pie_chart_defaults(fig)
 
     @chart_error_handler("agenda classifications")
     def plot_agenda_classifications_pie(
@@ -94,32 +92,31 @@ def plot_agenda_classifications_pie(
 
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="a", **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            if not self.check_tables_exist(con, ["KNS_Agenda"]):
-                return None
+        if not self.check_tables_exist(["KNS_Agenda"]):
+            return None
 
-            query = f"""
-                SELECT
-                    COALESCE(a.ClassificationDesc, 'Unknown') AS Classification,
-                    COUNT(a.AgendaID) AS Count
-                FROM KNS_Agenda a
-                WHERE a.KnessetNum IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                GROUP BY a.ClassificationDesc
-                ORDER BY Count DESC
-            """
+        query = f"""
+            SELECT
+                COALESCE(a.ClassificationDesc, 'Unknown') AS Classification,
+                COUNT(a.AgendaID) AS Count
+            FROM KNS_Agenda a
+            WHERE a.KnessetNum IS NOT NULL
+                AND {filters["knesset_condition"]}
+            GROUP BY a.ClassificationDesc
+            ORDER BY Count DESC
+        """
 
-            df = safe_execute_query(con, query, self.logger)
+        df = self.run_query(query)
 
-            if self.handle_empty_result(df, "agenda classification", filters):
-                return None
+        if self.handle_empty_result(df, "agenda classification", filters):
+            return None
 
-            fig = px.pie(
-                df, values="Count", names="Classification",
-                title=f"<b>Agenda Classifications Distribution for {filters['knesset_title']}</b>",
-            )
+        fig = px.pie(
+            df, values="Count", names="Classification",
+            title=f"<b>Agenda Classifications Distribution for {filters['knesset_title']}</b>",
+        )
 
-            return self.apply_pie_chart_defaults(fig)
+        return self.apply_pie_chart_defaults(fig)
 
     def plot_query_status_distribution(self, **kwargs) -> Optional[go.Figure]:
         """Generate query status distribution chart."""
@@ -144,94 +141,93 @@ def plot_query_status_distribution(self, **kwargs) -> Optional[go.Figure]:
             knesset_title = "All Knessets"
 
         try:
-            with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-                required_tables = [
-                    "KNS_Query",
-                    "KNS_Status",
-                    "KNS_PersonToPosition",
-                ]
-                if not self.check_tables_exist(con, required_tables):
-                    return None
-
-                params: list[Any] = []
-                conditions: list[str] = [
-                    "q.KnessetNum IS NOT NULL",
-                    "q.SubmitDate IS NOT NULL",
-                ]
-
-                if knesset_filter:
-                    placeholders = ", ".join("?" for _ in knesset_filter)
-                    conditions.append(f"q.KnessetNum IN ({placeholders})")
-                    params.extend(int(k) for k in knesset_filter)
-
-                valid_faction_ids = [
-                    int(fid)
-                    for fid in faction_filter or []
-                    if str(fid).isdigit()
-                ]
-                if valid_faction_ids:
-                    placeholders = ", ".join("?" for _ in valid_faction_ids)
-                    conditions.append(f"p2p.FactionID IN ({placeholders})")
-                    params.extend(valid_faction_ids)
-
-                if start_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
-                    params.append(start_date)
-                if end_date:
-                    conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
-                    params.append(end_date)
-
-                if query_type_filter:
-                    placeholders = ", ".join("?" for _ in query_type_filter)
-                    conditions.append(f"q.TypeDesc IN ({placeholders})")
-                    params.extend(query_type_filter)
-
-                if query_status_filter:
-                    placeholders = ", ".join("?" for _ in query_status_filter)
-                    conditions.append(f's."Desc" IN ({placeholders})')
-                    params.extend(query_status_filter)
-
-                where_clause = " AND ".join(conditions)
-
-                query = f"""
-                SELECT
-                    COALESCE(s."Desc", 'Unknown') AS Status,
-                    COUNT(DISTINCT q.QueryID) AS Count
-                FROM KNS_Query q
-                LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
-                LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
-                    AND q.KnessetNum = p2p.KnessetNum
-                    AND p2p.FactionID IS NOT NULL
-                    AND CAST(q.SubmitDate AS TIMESTAMP)
-                        BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
-                        AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
-                WHERE {where_clause}
-                GROUP BY s."Desc"
-                ORDER BY Count DESC
-                """
-
-                df = safe_execute_query(con, query, self.logger, params=params)
-                if self.handle_empty_result(df, "query status", {"knesset_title": knesset_title}):
-                    return None
-
-                date_range_text = ""
-                if start_date or end_date:
-                    if start_date and end_date:
-                        date_range_text = f" ({start_date} to {end_date})"
-                    elif start_date:
-                        date_range_text = f" (from {start_date})"
-                    else:
-                        date_range_text = f" (until {end_date})"
-
-                fig = px.pie(
-                    df,
-                    values="Count",
-                    names="Status",
-                    title=f"<b>Query Status Distribution for {knesset_title}{date_range_text}</b>",
-                    color="Status",
-                    color_discrete_map=self.config.GENERAL_STATUS_COLORS,
-                )
-                return self.apply_pie_chart_defaults(fig)
+            required_tables = [
+                "KNS_Query",
+                "KNS_Status",
+                "KNS_PersonToPosition",
+            ]
+            if not self.check_tables_exist(required_tables):
+                return None
+
+            params: list[Any] = []
+            conditions: list[str] = [
+                "q.KnessetNum IS NOT NULL",
+                "q.SubmitDate IS NOT NULL",
+            ]
+
+            if knesset_filter:
+                placeholders = ", ".join("?" for _ in knesset_filter)
+                conditions.append(f"q.KnessetNum IN ({placeholders})")
+                params.extend(int(k) for k in knesset_filter)
+
+            valid_faction_ids = [
+                int(fid)
+                for fid in faction_filter or []
+                if str(fid).isdigit()
+            ]
+            if valid_faction_ids:
+                placeholders = ", ".join("?" for _ in valid_faction_ids)
+                conditions.append(f"p2p.FactionID IN ({placeholders})")
+                params.extend(valid_faction_ids)
+
+            if start_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) >= ?")
+                params.append(start_date)
+            if end_date:
+                conditions.append("CAST(q.SubmitDate AS DATE) <= ?")
+                params.append(end_date)
+
+            if query_type_filter:
+                placeholders = ", ".join("?" for _ in query_type_filter)
+                conditions.append(f"q.TypeDesc IN ({placeholders})")
+                params.extend(query_type_filter)
+
+            if query_status_filter:
+                placeholders = ", ".join("?" for _ in query_status_filter)
+                conditions.append(f's."Desc" IN ({placeholders})')
+                params.extend(query_status_filter)
+
+            where_clause = " AND ".join(conditions)
+
+            query = f"""
+            SELECT
+                COALESCE(s."Desc", 'Unknown') AS Status,
+                COUNT(DISTINCT q.QueryID) AS Count
+            FROM KNS_Query q
+            LEFT JOIN KNS_Status s ON q.StatusID = s.StatusID
+            LEFT JOIN KNS_PersonToPosition p2p ON q.PersonID = p2p.PersonID
+                AND q.KnessetNum = p2p.KnessetNum
+                AND p2p.FactionID IS NOT NULL
+                AND CAST(q.SubmitDate AS TIMESTAMP)
+                    BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
+                    AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
+            WHERE {where_clause}
+            GROUP BY s."Desc"
+            ORDER BY Count DESC
+            """
+
+            df = self.run_query(query, params=params)
+            if self.handle_empty_result(df, "query status", {"knesset_title": knesset_title}):
+                return None
+
+            date_range_text = ""
+            if start_date or end_date:
+                if start_date and end_date:
+                    date_range_text = f" ({start_date} to {end_date})"
+                elif start_date:
+                    date_range_text = f" (from {start_date})"
+                else:
+                    date_range_text = f" (until {end_date})"
+
+            fig = px.pie(
+                df,
+                values="Count",
+                names="Status",
+                title=f"<b>Query Status Distribution for {knesset_title}{date_range_text}</b>",
+                color="Status",
+                color_discrete_map=self.config.GENERAL_STATUS_COLORS,
+            )
+            return self.apply_pie_chart_defaults(fig)
         except Exception as e:
             self.logger.error("Error generating query status distribution: %s", e, exc_info=True)
             self.show_error(f"Could not generate query status distribution: {e}")
@@ -250,33 +246,32 @@ def plot_agenda_status_distribution(
 
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="a", **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            if not self.check_tables_exist(con, ["KNS_Agenda", "KNS_Status"]):
-                return None
+        if not self.check_tables_exist(["KNS_Agenda", "KNS_Status"]):
+            return None
 
-            query = f"""
-                SELECT
-                    COALESCE(s."Desc", 'Unknown') AS Status,
-                    COUNT(a.AgendaID) AS Count
-                FROM KNS_Agenda a
-                LEFT JOIN KNS_Status s ON a.StatusID = s.StatusID
-                WHERE a.KnessetNum IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                GROUP BY s."Desc"
-                ORDER BY Count DESC
-            """
+        query = f"""
+            SELECT
+                COALESCE(s."Desc", 'Unknown') AS Status,
+                COUNT(a.AgendaID) AS Count
+            FROM KNS_Agenda a
+            LEFT JOIN KNS_Status s ON a.StatusID = s.StatusID
+            WHERE a.KnessetNum IS NOT NULL
+                AND {filters["knesset_condition"]}
+            GROUP BY s."Desc"
+            ORDER BY Count DESC
+        """
 
-            df = safe_execute_query(con, query, self.logger)
+        df = self.run_query(query)
 
-            if self.handle_empty_result(df, "agenda status", filters):
-                return None
+        if self.handle_empty_result(df, "agenda status", filters):
+            return None
 
-            fig = px.pie(
-                df, values="Count", names="Status",
-                title=f"<b>Agenda Status Distribution for {filters['knesset_title']}</b>",
-            )
+        fig = px.pie(
+            df, values="Count", names="Status",
+            title=f"<b>Agenda Status Distribution for {filters['knesset_title']}</b>",
+        )
 
-            return self.apply_pie_chart_defaults(fig)
+        return self.apply_pie_chart_defaults(fig)
 
     @chart_error_handler("bill subtype distribution")
     def plot_bill_subtype_distribution(
@@ -291,68 +286,67 @@ def plot_bill_subtype_distribution(
 
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            if not self.check_tables_exist(con, ["KNS_Bill"]):
-                return None
+        if not self.check_tables_exist(["KNS_Bill"]):
+            return None
 
-            query = f"""
-                SELECT
-                    COALESCE(b.SubTypeDesc, 'Unknown') AS SubType,
-                    {SQLTemplates.BILL_STATUS_CASE_HE} AS Stage,
-                    COUNT(b.BillID) AS Count
-                FROM KNS_Bill b
-                WHERE b.KnessetNum IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                    AND {filters["bill_origin_condition"]}
-                GROUP BY b.SubTypeDesc, Stage
-                ORDER BY SubType, Stage
-            """
+        query = f"""
+            SELECT
+                COALESCE(b.SubTypeDesc, 'Unknown') AS SubType,
+                {SQLTemplates.BILL_STATUS_CASE_HE} AS Stage,
+                COUNT(b.BillID) AS Count
+            FROM KNS_Bill b
+            WHERE b.KnessetNum IS NOT NULL
+                AND {filters["knesset_condition"]}
+                AND {filters["bill_origin_condition"]}
+            GROUP BY b.SubTypeDesc, Stage
+            ORDER BY SubType, Stage
+        """
 
-            df = safe_execute_query(con, query, self.logger)
+        df = self.run_query(query)
 
-            if self.handle_empty_result(df, "bill subtype", filters):
-                return None
+        if self.handle_empty_result(df, "bill subtype", filters):
+            return None
 
-            # Sort subtypes by total count
-            subtype_totals = df.groupby('SubType')['Count'].sum().sort_values(ascending=False)
-            subtypes = subtype_totals.index.tolist()
-
-            # Use centralized stage order and colors from SQLTemplates
-            stage_order = SQLTemplates.BILL_STAGE_ORDER
-            stage_colors = SQLTemplates.BILL_STAGE_COLORS
-
-            fig = go.Figure()
-
-            for stage in stage_order:
-                stage_data = df[df['Stage'] == stage].set_index('SubType')
-                counts = [stage_data.loc[subtype, 'Count'] if subtype in stage_data.index else 0
-                         for subtype in subtypes]
-
-                fig.add_trace(go.Bar(
-                    name=stage, x=subtypes, y=counts,
-                    marker_color=stage_colors[stage],
-                    text=counts, textposition='inside',
-                    textfont=dict(color='white', size=12),
-                    hovertemplate='<b>%{x}</b><br>' + f'{stage}: %{{y}}<br>' + '<extra></extra>'
-                ))
-
-            fig.update_layout(
-                barmode='stack',
-                title=f"<b>Bill SubType Distribution by Status for {filters['knesset_title']}</b>",
-                title_x=0.5,
-                xaxis_title="Bill SubType",
-                yaxis_title="Number of Bills",
-                xaxis_tickangle=-45,
-                showlegend=True,
-                legend_title_text='Bill Status',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                height=800, margin=dict(t=180), font_size=12,
-                xaxis=dict(automargin=True),
-                yaxis=dict(gridcolor="lightgray"),
-                plot_bgcolor="white"
-            )
+        # Sort subtypes by total count
+        subtype_totals = df.groupby('SubType')['Count'].sum().sort_values(ascending=False)
+        subtypes = subtype_totals.index.tolist()
+
+        # Use centralized stage order and colors from SQLTemplates
+        stage_order = SQLTemplates.BILL_STAGE_ORDER
+        stage_colors = SQLTemplates.BILL_STAGE_COLORS
+
+        fig = go.Figure()
 
-            return fig
+        for stage in stage_order:
+            stage_data = df[df['Stage'] == stage].set_index('SubType')
+            counts = [stage_data.loc[subtype, 'Count'] if subtype in stage_data.index else 0
+                     for subtype in subtypes]
+
+            fig.add_trace(go.Bar(
+                name=stage, x=subtypes, y=counts,
+                marker_color=stage_colors[stage],
+                text=counts, textposition='inside',
+                textfont=dict(color='white', size=12),
+                hovertemplate='<b>%{x}</b><br>' + f'{stage}: %{{y}}<br>' + '<extra></extra>'
+            ))
+
+        fig.update_layout(
+            barmode='stack',
+            title=f"<b>Bill SubType Distribution by Status for {filters['knesset_title']}</b>",
+            title_x=0.5,
+            xaxis_title="Bill SubType",
+            yaxis_title="Number of Bills",
+            xaxis_tickangle=-45,
+            showlegend=True,
+            legend_title_text='Bill Status',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            height=800, margin=dict(t=180), font_size=12,
+            xaxis=dict(automargin=True),
+            yaxis=dict(gridcolor="lightgray"),
+            plot_bgcolor="white"
+        )
+
+        return fig
 
     @chart_error_handler("major topic distribution")
     def plot_majoril_distribution(
@@ -367,57 +361,56 @@ def plot_majoril_distribution(
 
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            required = ["KNS_Bill", "UserBillCoding"]
-            if not self.check_tables_exist(con, required):
-                return None
+        required = ["KNS_Bill", "UserBillCoding"]
+        if not self.check_tables_exist(required):
+            return None
 
-            query = f"""
-                WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
-                SELECT
-                    ubc.MajorIL AS TopicCode,
-                    COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
-                    COUNT(DISTINCT b.BillID) AS BillCount
-                FROM KNS_Bill b
-                JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
-                LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
-                LEFT JOIN KNS_BillInitiator bi ON b.BillID = bi.BillID AND bi.Ordinal = 1
-                LEFT JOIN KNS_PersonToPosition p2p ON bi.PersonID = p2p.PersonID
-                    AND b.KnessetNum = p2p.KnessetNum
-                    AND p2p.FactionID IS NOT NULL
-                    AND COALESCE(bfs.FirstSubmissionDate, CAST(b.LastUpdatedDate AS TIMESTAMP))
-                        BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
-                        AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
-                LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
-                    AND b.KnessetNum = ufs.KnessetNum
-                WHERE ubc.MajorIL IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                    AND {filters["bill_origin_condition"]}
-                GROUP BY ubc.MajorIL, ufs.CoalitionStatus
-                ORDER BY TopicCode, CoalitionStatus
-            """
+        query = f"""
+            WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
+            SELECT
+                ubc.MajorIL AS TopicCode,
+                COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
+                COUNT(DISTINCT b.BillID) AS BillCount
+            FROM KNS_Bill b
+            JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
+            LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
+            LEFT JOIN KNS_BillInitiator bi ON b.BillID = bi.BillID AND bi.Ordinal = 1
+            LEFT JOIN KNS_PersonToPosition p2p ON bi.PersonID = p2p.PersonID
+                AND b.KnessetNum = p2p.KnessetNum
+                AND p2p.FactionID IS NOT NULL
+                AND COALESCE(bfs.FirstSubmissionDate, CAST(b.LastUpdatedDate AS TIMESTAMP))
+                    BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
+                    AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
+            LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
+                AND b.KnessetNum = ufs.KnessetNum
+            WHERE ubc.MajorIL IS NOT NULL
+                AND {filters["knesset_condition"]}
+                AND {filters["bill_origin_condition"]}
+            GROUP BY ubc.MajorIL, ufs.CoalitionStatus
+            ORDER BY TopicCode, CoalitionStatus
+        """
 
-            df = safe_execute_query(con, query, self.logger)
+        df = self.run_query(query)
 
-            if self.handle_empty_result(df, "major topic", filters):
-                return None
+        if self.handle_empty_result(df, "major topic", filters):
+            return None
 
-            df["BillCount"] = pd.to_numeric(df["BillCount"], errors="coerce").fillna(0)
-            df["TopicCode"] = df["TopicCode"].astype(int)
+        df["BillCount"] = pd.to_numeric(df["BillCount"], errors="coerce").fillna(0)
+        df["TopicCode"] = df["TopicCode"].astype(int)
 
-            # Apply MAJORIL text labels
-            from utils.majoril_labels import apply_majoril_labels
+        # Apply MAJORIL text labels
+        from utils.majoril_labels import apply_majoril_labels
 
-            df = apply_majoril_labels(df)
+        df = apply_majoril_labels(df)
 
-            show_percentage = kwargs.get("show_percentage", False)
-            return self._build_topic_chart(
-                df, filters, show_percentage,
-                topic_label="Major Topic (MajorIL)",
-                title_prefix="Bills by Major Topic (MajorIL)",
-                bar_height=45, min_height=500,
-                use_topic_labels=True,
-            )
+        show_percentage = kwargs.get("show_percentage", False)
+        return self._build_topic_chart(
+            df, filters, show_percentage,
+            topic_label="Major Topic (MajorIL)",
+            title_prefix="Bills by Major Topic (MajorIL)",
+            bar_height=45, min_height=500,
+            use_topic_labels=True,
+        )
 
     @chart_error_handler("minor topic distribution")
     def plot_minoril_distribution(
@@ -432,51 +425,50 @@ def plot_minoril_distribution(
 
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
-        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            required = ["KNS_Bill", "UserBillCoding"]
-            if not self.check_tables_exist(con, required):
-                return None
+        required = ["KNS_Bill", "UserBillCoding"]
+        if not self.check_tables_exist(required):
+            return None
 
-            query = f"""
-                WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
-                SELECT
-                    ubc.MinorIL AS TopicCode,
-                    COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
-                    COUNT(DISTINCT b.BillID) AS BillCount
-                FROM KNS_Bill b
-                JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
-                LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
-                LEFT JOIN KNS_BillInitiator bi ON b.BillID = bi.BillID AND bi.Ordinal = 1
-                LEFT JOIN KNS_PersonToPosition p2p ON bi.PersonID = p2p.PersonID
-                    AND b.KnessetNum = p2p.KnessetNum
-                    AND p2p.FactionID IS NOT NULL
-                    AND COALESCE(bfs.FirstSubmissionDate, CAST(b.LastUpdatedDate AS TIMESTAMP))
-                        BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
-                        AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
-                LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
-                    AND b.KnessetNum = ufs.KnessetNum
-                WHERE ubc.MinorIL IS NOT NULL
-                    AND {filters["knesset_condition"]}
-                    AND {filters["bill_origin_condition"]}
-                GROUP BY ubc.MinorIL, ufs.CoalitionStatus
-                ORDER BY TopicCode, CoalitionStatus
-            """
+        query = f"""
+            WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
+            SELECT
+                ubc.MinorIL AS TopicCode,
+                COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
+                COUNT(DISTINCT b.BillID) AS BillCount
+            FROM KNS_Bill b
+            JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
+            LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
+            LEFT JOIN KNS_BillInitiator bi ON b.BillID = bi.BillID AND bi.Ordinal = 1
+            LEFT JOIN KNS_PersonToPosition p2p ON bi.PersonID = p2p.PersonID
+                AND b.KnessetNum = p2p.KnessetNum
+                AND p2p.FactionID IS NOT NULL
+                AND COALESCE(bfs.FirstSubmissionDate, CAST(b.LastUpdatedDate AS TIMESTAMP))
+                    BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
+                    AND CAST(COALESCE(p2p.FinishDate, '9999-12-31') AS TIMESTAMP)
+            LEFT JOIN UserFactionCoalitionStatus ufs ON p2p.FactionID = ufs.FactionID
+                AND b.KnessetNum = ufs.KnessetNum
+            WHERE ubc.MinorIL IS NOT NULL
+                AND {filters["knesset_condition"]}
+                AND {filters["bill_origin_condition"]}
+            GROUP BY ubc.MinorIL, ufs.CoalitionStatus
+            ORDER BY TopicCode, CoalitionStatus
+        """
 
-            df = safe_execute_query(con, query, self.logger)
+        df = self.run_query(query)
 
-            if self.handle_empty_result(df, "minor topic", filters):
-                return None
+        if self.handle_empty_result(df, "minor topic", filters):
+            return None
 
-            df["BillCount"] = pd.to_numeric(df["BillCount"], errors="coerce").fillna(0)
-            df["TopicCode"] = df["TopicCode"].astype(int)
+        df["BillCount"] = pd.to_numeric(df["BillCount"], errors="coerce").fillna(0)
+        df["TopicCode"] = df["TopicCode"].astype(int)
 
-            show_percentage = kwargs.get("show_percentage", False)
-            return self._build_topic_chart(
-                df, filters, show_percentage,
-                topic_label="Minor Topic Code (MinorIL)",
-                title_prefix="Bills by Minor Topic (MinorIL)",
-                bar_height=30, min_height=600,
-            )
+        show_percentage = kwargs.get("show_percentage", False)
+        return self._build_topic_chart(
+            df, filters, show_percentage,
+            topic_label="Minor Topic Code (MinorIL)",
+            title_prefix="Bills by Minor Topic (MinorIL)",
+            bar_height=30, min_height=600,
+        )
 
     def _build_topic_chart(
         self,
@@ -578,69 +570,66 @@ def plot_majoril_distribution_gov(
             knesset_filter, faction_filter, table_prefix="b", **kwargs
         )
 
-        with get_db_connection(
-            self.db_path, read_only=True, logger_obj=self.logger
-        ) as con:
-            required = ["KNS_Bill", "UserBillCoding"]
-            if not self.check_tables_exist(con, required):
-                return None
+        required = ["KNS_Bill", "UserBillCoding"]
+        if not self.check_tables_exist(required):
+            return None
 
-            query = f"""
-                SELECT
-                    ubc.MajorIL AS TopicCode,
-                    COUNT(DISTINCT b.BillID) AS BillCount
-                FROM KNS_Bill b
-                JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
-                WHERE ubc.MajorIL IS NOT NULL
-                    AND b.PrivateNumber IS NULL
-                    AND {filters["knesset_condition"]}
-                GROUP BY ubc.MajorIL
-                ORDER BY TopicCode
-            """
+        query = f"""
+            SELECT
+                ubc.MajorIL AS TopicCode,
+                COUNT(DISTINCT b.BillID) AS BillCount
+            FROM KNS_Bill b
+            JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
+            WHERE ubc.MajorIL IS NOT NULL
+                AND b.PrivateNumber IS NULL
+                AND {filters["knesset_condition"]}
+            GROUP BY ubc.MajorIL
+            ORDER BY TopicCode
+        """
 
-            df = safe_execute_query(con, query, self.logger)
-            if self.handle_empty_result(df, "government bill topic", filters):
-                return None
+        df = self.run_query(query)
+        if self.handle_empty_result(df, "government bill topic", filters):
+            return None
 
-            df["BillCount"] = pd.to_numeric(
-                df["BillCount"], errors="coerce"
-            ).fillna(0)
-            df["TopicCode"] = df["TopicCode"].astype(int)
+        df["BillCount"] = pd.to_numeric(
+            df["BillCount"], errors="coerce"
+        ).fillna(0)
+        df["TopicCode"] = df["TopicCode"].astype(int)
 
-            # Apply labels
-            from utils.majoril_labels import apply_majoril_labels
+        # Apply labels
+        from utils.majoril_labels import apply_majoril_labels
 
-            df = apply_majoril_labels(df)
+        df = apply_majoril_labels(df)
 
-            topic_order = sorted(df["TopicCode"].unique())
-            label_map = dict(zip(df["TopicCode"], df["TopicLabel"]))
-            topic_order_display = [
-                label_map.get(t, str(t)) for t in topic_order
-            ]
-            df["TopicDisplay"] = df["TopicLabel"]
+        topic_order = sorted(df["TopicCode"].unique())
+        label_map = dict(zip(df["TopicCode"], df["TopicLabel"]))
+        topic_order_display = [
+            label_map.get(t, str(t)) for t in topic_order
+        ]
+        df["TopicDisplay"] = df["TopicLabel"]
 
-            fig = px.bar(
-                df.sort_values("TopicCode"),
-                y="TopicDisplay",
-                x="BillCount",
-                orientation="h",
-                title=(
-                    f"<b>Government Bills by Major Topic"
-                    f" - {filters['knesset_title']}</b>"
-                ),
-                labels={
-                    "TopicDisplay": "Major Topic",
-                    "BillCount": "Number of Bills",
-                },
-                category_orders={"TopicDisplay": topic_order_display},
-            )
-            fig.update_layout(
-                yaxis=dict(type="category", dtick=1),
-                height=max(500, len(topic_order) * 45 + 200),
-                title_x=0.5,
-                margin=dict(t=100, l=250, r=40),
-            )
-            return fig
+        fig = px.bar(
+            df.sort_values("TopicCode"),
+            y="TopicDisplay",
+            x="BillCount",
+            orientation="h",
+            title=(
+                f"<b>Government Bills by Major Topic"
+                f" - {filters['knesset_title']}</b>"
+            ),
+            labels={
+                "TopicDisplay": "Major Topic",
+                "BillCount": "Number of Bills",
+            },
+            category_orders={"TopicDisplay": topic_order_display},
+        )
+        fig.update_layout(
+            yaxis=dict(type="category", dtick=1),
+            height=max(500, len(topic_order) * 45 + 200),
+            title_x=0.5,
+            margin=dict(t=100, l=250, r=40),
+        )
+        return fig
 
     @chart_error_handler("policy topic time trend")
     def plot_majoril_time_trend(
@@ -669,64 +658,61 @@ def plot_majoril_time_trend(
         elif bill_origin == "Governmental Bills Only":
             origin_cond = "b.PrivateNumber IS NULL"
 
-        with get_db_connection(
-            self.db_path, read_only=True, logger_obj=self.logger
-        ) as con:
-            required = ["KNS_Bill", "UserBillCoding"]
-            if not self.check_tables_exist(con, required):
-                return None
+        required = ["KNS_Bill", "UserBillCoding"]
+        if not self.check_tables_exist(required):
+            return None
 
-            if split_by_coalition:
-                query = f"""
-                    WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
-                    SELECT
-                        b.KnessetNum,
-                        ubc.MajorIL AS TopicCode,
-                        COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
-                        COUNT(DISTINCT b.BillID) AS BillCount
-                    FROM KNS_Bill b
-                    JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
-                    LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
-                    LEFT JOIN KNS_BillInitiator bi
-                        ON b.BillID = bi.BillID AND bi.Ordinal = 1
-                    LEFT JOIN KNS_PersonToPosition p2p
-                        ON bi.PersonID = p2p.PersonID
-                        AND b.KnessetNum = p2p.KnessetNum
-                        AND p2p.FactionID IS NOT NULL
-                        AND COALESCE(
-                            bfs.FirstSubmissionDate,
-                            CAST(b.LastUpdatedDate AS TIMESTAMP)
+        if split_by_coalition:
+            query = f"""
+                WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
+                SELECT
+                    b.KnessetNum,
+                    ubc.MajorIL AS TopicCode,
+                    COALESCE(ufs.CoalitionStatus, 'Unknown') AS CoalitionStatus,
+                    COUNT(DISTINCT b.BillID) AS BillCount
+                FROM KNS_Bill b
+                JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
+                LEFT JOIN BillFirstSubmission bfs ON b.BillID = bfs.BillID
+                LEFT JOIN KNS_BillInitiator bi
+                    ON b.BillID = bi.BillID AND bi.Ordinal = 1
+                LEFT JOIN KNS_PersonToPosition p2p
+                    ON bi.PersonID = p2p.PersonID
+                    AND b.KnessetNum = p2p.KnessetNum
+                    AND p2p.FactionID IS NOT NULL
+                    AND COALESCE(
+                        bfs.FirstSubmissionDate,
+                        CAST(b.LastUpdatedDate AS TIMESTAMP)
+                    )
+                        BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
+                        AND CAST(
+                            COALESCE(p2p.FinishDate, '9999-12-31')
+                            AS TIMESTAMP
                         )
-                            BETWEEN CAST(p2p.StartDate AS TIMESTAMP)
-                            AND CAST(
-                                COALESCE(p2p.FinishDate, '9999-12-31')
-                                AS TIMESTAMP
-                            )
-                    LEFT JOIN UserFactionCoalitionStatus ufs
-                        ON p2p.FactionID = ufs.FactionID
-                        AND b.KnessetNum = ufs.KnessetNum
-                    WHERE ubc.MajorIL IS NOT NULL
-                        AND {origin_cond}
-                    GROUP BY b.KnessetNum, ubc.MajorIL, ufs.CoalitionStatus
-                    ORDER BY b.KnessetNum, TopicCode
-                """
-            else:
-                query = f"""
-                    SELECT
-                        b.KnessetNum,
-                        ubc.MajorIL AS TopicCode,
-                        COUNT(DISTINCT b.BillID) AS BillCount
-                    FROM KNS_Bill b
-                    JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
-                    WHERE ubc.MajorIL IS NOT NULL
-                        AND {origin_cond}
-                    GROUP BY b.KnessetNum, ubc.MajorIL
-                    ORDER BY b.KnessetNum, TopicCode
-                """
-
-            df = safe_execute_query(con, query, self.logger)
-            if self.handle_empty_result(df, "policy topic trend", {}):
-                return None
+                LEFT JOIN UserFactionCoalitionStatus ufs
+                    ON p2p.FactionID = ufs.FactionID
+                    AND b.KnessetNum = ufs.KnessetNum
+                WHERE ubc.MajorIL IS NOT NULL
+                    AND {origin_cond}
+                GROUP BY b.KnessetNum, ubc.MajorIL, ufs.CoalitionStatus
+                ORDER BY b.KnessetNum, TopicCode
+            """
+        else:
+            query = f"""
+                SELECT
+                    b.KnessetNum,
+                    ubc.MajorIL AS TopicCode,
+                    COUNT(DISTINCT b.BillID) AS BillCount
+                FROM KNS_Bill b
+                JOIN UserBillCoding ubc ON b.BillID = ubc.BillID
+                WHERE ubc.MajorIL IS NOT NULL
+                    AND {origin_cond}
+                GROUP BY b.KnessetNum, ubc.MajorIL
+                ORDER BY b.KnessetNum, TopicCode
+            """
+
+        df = self.run_query(query)
+        if self.handle_empty_result(df, "policy topic trend", {}):
+            return None
 
         df["TopicCode"] = df["TopicCode"].astype(int)
         df["BillCount"] = pd.to_numeric(
@@ -11,6 +11,7 @@
 
 import plotly.graph_objects as go
 
+from backend.query_service import query_label
 from .comparison import ComparisonCharts
 from .distribution import DistributionCharts
 from .time_series import TimeSeriesCharts
@@ -101,7 +102,9 @@ def create_chart(
             return None
 
         try:
-            return generator.generate(chart_type, **kwargs)
+            # Every query the chart runs is timed under this label.
+            with query_label(f"{chart_category}.{chart_type}"):
+                return generator.generate(chart_type, **kwargs)
         except Exception as e:
             self.logger.error(
                 f"Error creating chart {chart_category}.{chart_type}: {e}",
@@ -3,24 +3,28 @@
 This mixin provides database-related functionality for chart classes:
 - Database existence checking
 - Table existence validation
-- Query execution with caching
+- Query execution through the shared, cached query service
 - Secure query execution with parameter binding
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import duckdb
 import pandas as pd
-import streamlit as st
 
-from backend.connection_manager import get_db_connection, safe_execute_query
+from backend.query_cache import ANY_TABLE
+from backend.query_service import get_query_service
+from data.queries.derived_tables import use_derived_tables
 from utils.performance_utils import optimize_dataframe_dtypes
 from utils.query_builder import SecureQueryBuilder
 
 
+def _optimize_large_result(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast dtypes of large results before they are cached."""
+    return optimize_dataframe_dtypes(df) if len(df) > 1000 else df
+
+
 class ChartDataMixin:
     """Mixin providing database operations and query execution for charts.
 
@@ -56,22 +60,20 @@ def check_database_exists(self) -> bool:
             return False
         return True
 
-    def check_tables_exist(
-        self, con: duckdb.DuckDBPyConnection, required_tables: List[str]
-    ) -> bool:
+    def check_tables_exist(self, required_tables: List[str]) -> bool:
         """Check if all required tables exist in the database.
 
         Args:
-            con: Active DuckDB connection.
             required_tables: List of table names that must exist.
 
         Returns:
             True if all tables exist, False otherwise.
         """
         try:
-            db_tables_df = con.execute(
-                "SELECT table_name FROM duckdb_tables() WHERE schema_name='main';"
-            ).df()
+            db_tables_df = self.run_query(
+                "SELECT table_name FROM duckdb_tables() WHERE schema_name='main';",
+                tables=[ANY_TABLE],
+            )
             db_tables_list = db_tables_df["table_name"].str.lower().tolist()
             missing_tables = [
                 table
@@ -94,78 +96,82 @@ def check_tables_exist(
             self.show_error(f"Error checking table existence: {e}")
             return False
 
-    def execute_query(
-        self, query: str, params: Optional[Dict[str, Any]] = None
-    ) -> Optional[pd.DataFrame]:
-        """Execute a query safely with optional parameters.
+    def run_query(
+        self,
+        query: str,
+        params: Optional[List[Any]] = None,
+        tables: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Run a chart query through the shared query execution service.
+
+        Results are cached until a table the query reads is rewritten and
+        each call is timed under the current chart's name. A pooled
+        connection is checked out only on a cache miss.
 
         Args:
-            query: SQL query to execute.
-            params: Optional dictionary of parameters for parameterized queries.
+            query: SQL query with ``?`` placeholders.
+            params: Optional positional parameter values.
+            tables: Tables the result depends on, if not parsed from the SQL.
 
         Returns:
-            DataFrame with query results, or None on error.
+            DataFrame with query results (empty on error).
         """
-        return self._execute_query_cached(query, json.dumps(params) if params else None)
+        return get_query_service().execute(
+            self.db_path,
+            query,
+            params=params,
+            logger_obj=self.logger,
+            tables=tables,
+            rewrite=use_derived_tables,
+        )
 
-    @st.cache_data(ttl=1800, show_spinner=False)
-    def _execute_query_cached(
-        _self, query: str, params_str: Optional[str]
+    def execute_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
     ) -> Optional[pd.DataFrame]:
-        """Cached query execution to avoid redundant database queries.
-
-        Uses Streamlit's caching mechanism with a 10-minute TTL.
+        """Execute a query safely with optional parameters.
 
         Args:
             query: SQL query to execute.
-            params_str: JSON-serialized parameters (for cache key stability).
+            params: Optional dictionary of ``$param_N`` parameters.
 
         Returns:
             DataFrame with query results, or None on error.
         """
         try:
-            params = json.loads(params_str) if params_str else None
-            with get_db_connection(
-                _self.db_path, read_only=True, logger_obj=_self.logger
-            ) as con:
-                if params:
-                    # DuckDB uses ? placeholders, convert $param_N format
-                    processed_query = query
-                    param_values = []
-
-                    # Sort parameters by their number to maintain order
-                    sorted_params = []
-                    for param_name, value in params.items():
-                        if param_name.startswith('param_'):
-                            try:
-                                param_num = int(param_name.split('_')[1])
-                                sorted_params.append((param_num, param_name, value))
-                            except (ValueError, IndexError):
-                                sorted_params.append((999999, param_name, value))
-                        else:
+            processed_query = query
+            param_values = []
+            if params:
+                # DuckDB uses ? placeholders, convert $param_N format
+                # Sort parameters by their number to maintain order
+                sorted_params = []
+                for param_name, value in params.items():
+                    if param_name.startswith('param_'):
+                        try:
+                            param_num = int(param_name.split('_')[1])
+                            sorted_params.append((param_num, param_name, value))
+                        except (ValueError, IndexError):
                             sorted_params.append((999999, param_name, value))
-
-                    sorted_params.sort(key=lambda x: x[0])
-
-                    # Replace $param_name with ? in correct order
-                    for _, param_name, value in sorted_params:
-                        processed_query = processed_query.replace(f'${param_name}', '?', 1)
-                        param_values.append(value)
-
-                    result = safe_execute_query(
-                        con, processed_query, _self.logger, param_values
-                    )
-                    if isinstance(result, pd.DataFrame) and len(result) > 1000:
-                        return optimize_dataframe_dtypes(result)
-                    return result if isinstance(result, pd.DataFrame) else None
-                else:
-                    result = safe_execute_query(con, query, _self.logger)
-                    if isinstance(result, pd.DataFrame) and len(result) > 1000:
-                        return optimize_dataframe_dtypes(result)
-                    return result if isinstance(result, pd.DataFrame) else None
+                    else:
+                        sorted_params.append((999999, param_name, value))
+
+                sorted_params.sort(key=lambda x: x[0])
+
+                # Replace $param_name with ? in correct order
+                for _, param_name, value in sorted_params:
+                    processed_query = processed_query.replace(f'${param_name}', '?', 1)
+                    param_values.append(value)
+
+            return get_query_service().execute(
+                self.db_path,
+                processed_query,
+                params=param_values or None,
+                logger_obj=self.logger,
+                transform=_optimize_large_result,
+                rewrite=use_derived_tables,
+            )
         except Exception as e:
-            _self.logger.error(f"Error executing query: {e}", exc_info=True)
-            _self.show_error(f"Error executing query: {e}")
+            self.logger.error(f"Error executing query: {e}", exc_info=True)
+            self.show_error(f"Error executing query: {e}")
             return None
 
     def execute_secure_query(
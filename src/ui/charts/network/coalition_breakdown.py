@@ -11,7 +11,6 @@
 import plotly.graph_objects as go
 import streamlit as st
 
-from backend.connection_manager import get_db_connection, safe_execute_query
 from ..base import BaseChart
 from .network_utils import COALITION_STATUS_COLORS
 
@@ -43,25 +42,22 @@ def plot(
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                if not self.check_tables_exist(
-                    con, ["KNS_Bill", "KNS_BillInitiator", "KNS_PersonToPosition", "KNS_Faction", "UserFactionCoalitionStatus"]
-                ):
-                    return None
-
-                query = self._build_query(filters, min_collaborations)
-                df = safe_execute_query(con, query, self.logger)
-
-                if df.empty:
-                    st.info(
-                        f"No faction collaboration breakdown data found for '{filters['knesset_title']}' "
-                        f"with minimum {min_collaborations} collaborations."
-                    )
-                    return None
-
-                return self._create_chart(df, filters['knesset_title'])
+            if not self.check_tables_exist(
+                ["KNS_Bill", "KNS_BillInitiator", "KNS_PersonToPosition", "KNS_Faction", "UserFactionCoalitionStatus"]
+            ):
+                return None
+
+            query = self._build_query(filters, min_collaborations)
+            df = self.run_query(query)
+
+            if df.empty:
+                st.info(
+                    f"No faction collaboration breakdown data found for '{filters['knesset_title']}' "
+                    f"with minimum {min_collaborations} collaborations."
+                )
+                return None
+
+            return self._create_chart(df, filters['knesset_title'])
 
         except Exception as e:
             self.logger.error(f"Error generating faction collaboration breakdown: {e}", exc_info=True)
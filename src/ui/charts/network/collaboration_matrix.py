@@ -12,7 +12,6 @@
 import plotly.graph_objects as go
 import streamlit as st
 
-from backend.connection_manager import get_db_connection, safe_execute_query
 from ..base import BaseChart
 
 
@@ -47,22 +46,19 @@ def plot(
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                if not self.check_tables_exist(
-                    con, ["KNS_Bill", "KNS_BillInitiator", "KNS_PersonToPosition", "KNS_Faction"]
-                ):
-                    return None
-
-                query = self._build_query(filters, min_collaborations, show_solo_bills, min_total_bills)
-                df = safe_execute_query(con, query, self.logger)
-
-                if df.empty:
-                    st.info(f"No faction activity data found for '{filters['knesset_title']}'.")
-                    return None
-
-                return self._create_chart(df, filters['knesset_title'], min_collaborations, show_solo_bills)
+            if not self.check_tables_exist(
+                ["KNS_Bill", "KNS_BillInitiator", "KNS_PersonToPosition", "KNS_Faction"]
+            ):
+                return None
+
+            query = self._build_query(filters, min_collaborations, show_solo_bills, min_total_bills)
+            df = self.run_query(query)
+
+            if df.empty:
+                st.info(f"No faction activity data found for '{filters['knesset_title']}'.")
+                return None
+
+            return self._create_chart(df, filters['knesset_title'], min_collaborations, show_solo_bills)
 
         except Exception as e:
             self.logger.error(f"Error generating faction collaboration matrix: {e}", exc_info=True)
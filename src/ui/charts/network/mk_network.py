@@ -12,7 +12,6 @@
 import plotly.graph_objects as go
 import streamlit as st
 
-from backend.connection_manager import get_db_connection, safe_execute_query
 from utils.graph_layout import ForceDirectedLayout
 from ..base import BaseChart
 from .network_utils import get_faction_color_map, get_node_size, INDEPENDENT_COLOR
@@ -45,25 +44,22 @@ def plot(
         filters = self.build_filters(knesset_filter, faction_filter, table_prefix="b", **kwargs)
 
         try:
-            with get_db_connection(
-                self.db_path, read_only=True, logger_obj=self.logger
-            ) as con:
-                if not self.check_tables_exist(
-                    con, ["KNS_Bill", "KNS_BillInitiator", "KNS_Person", "KNS_PersonToPosition", "KNS_Faction"]
-                ):
-                    return None
-
-                query = self._build_query(filters, min_collaborations)
-                df = safe_execute_query(con, query, self.logger)
-
-                if df.empty:
-                    st.info(
-                        f"No MK collaboration data found for '{filters['knesset_title']}' "
-                        f"with minimum {min_collaborations} collaborations."
-                    )
-                    return None
-
-                return self._create_chart(df, filters['knesset_title'])
+            if not self.check_tables_exist(
+                ["KNS_Bill", "KNS_BillInitiator", "KNS_Person", "KNS_PersonToPosition", "KNS_Faction"]
+            ):
+                return None
+
+            query = self._build_query(filters, min_collaborations)
+            df = self.run_query(query)
+
+            if df.empty:
+                st.info(
+                    f"No MK collaboration data found for '{filters['knesset_title']}' "
+                    f"with minimum {min_collaborations} collaborations."
+                )
+                return None
+
+            return self._create_chart(df, filters['knesset_title'])
 
         except Exception as e:
             self.logger.error(f"Error generating MK collaboration network: {e}", exc_info=True)
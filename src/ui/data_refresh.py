@@ -27,6 +27,7 @@
 import ui.plot_generators as pg
 import ui.sidebar_components as sc
 import ui.ui_utils as ui_utils
+from backend.query_cache import data_version_cached
 
 # Initialize logger for the UI module
 ui_logger = logging.getLogger("knesset.ui.data_refresh")  # Use logging.getLogger
@@ -96,7 +97,7 @@
     st.session_state.cloud_sync_checked = True
 
 # --- Lazy-loaded filter options (only computed when first accessed) ---
-@st.cache_data(ttl=3600, show_spinner=False)
+@data_version_cached(tables=ui_utils.FILTER_OPTION_TABLES)
 def _get_cached_filter_options():
     """Lazily load and cache filter options."""
     knesset_nums, factions_df = ui_utils.get_filter_options_from_db(DB_PATH, ui_logger)
@@ -2,21 +2,50 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
 from backend.connection_manager import get_db_connection, safe_execute_query
-from data.queries.predefined_queries import get_query_definition
+from backend.query_cache import get_query_cache
+from config.settings import Settings
+from data.queries.derived_tables import use_derived_tables
+from data.queries.filter_slots import (
+    DOCUMENT_TYPE_SLOT,
+    FACTION_SLOT,
+    KNESSET_SLOT,
+    SEEK_SLOT,
+    SlotBinder,
+    bind_filter_slots,
+)
+from data.queries.predefined_queries import get_all_query_names, get_query_definition
 from data.queries.types import PaginationSpec, QueryRequest
 
 
+# Cache namespace for whole predefined-query results kept for paging
+_RESULT_TABLE_NAMESPACE = "query_executor.result_table"
+
+
 class QueryExecutor:
     """Handles execution of predefined queries with safe filtering."""
 
+    # Document type -> (BillDocuments count column, result column)
+    _DOCUMENT_TYPE_COLUMNS: Dict[str, Tuple[str, str]] = {
+        "Published Law": ("PublishedLawCount", "BillPublishedLawDocCount"),
+        "First Reading": ("FirstReadingCount", "BillFirstReadingDocCount"),
+        "2nd/3rd Reading": ("SecondThirdCount", "BillSecondThirdReadingDocCount"),
+        "Second & Third Reading": ("SecondThirdCount", "BillSecondThirdReadingDocCount"),
+        "Early Discussion": ("EarlyDiscussionCount", "BillEarlyDiscussionDocCount"),
+        "Early Stage Discussion": ("EarlyDiscussionCount", "BillEarlyDiscussionDocCount"),
+        "Other": ("OtherDocCount", "BillOtherDocCount"),
+    }
+
     def __init__(
         self,
         db_path: Path,
@@ -35,12 +64,21 @@ def execute_query_with_filters(
         safe_execute_func: Optional[Callable[..., pd.DataFrame]] = None,
         document_type_filter: Optional[List[str]] = None,
         page_offset: int = 0,
+        page_after: Optional[Sequence[Any]] = None,
     ) -> Tuple[pd.DataFrame, str, List[str], List[Any]]:
         """Execute a predefined query with optional filters and pagination.
 
+        The first page fetches the first ``Settings.QUERY_RESULT_WINDOW_PAGES``
+        pages at once and keeps them as an Arrow table; the pages inside that
+        window are slices of it. Pages past the window, or after it is gone
+        (evicted, data refreshed), are fetched with keyset pagination from
+        ``page_after`` (the previous page's last ``order_key``), or with
+        ``OFFSET`` for packs without an ordering key.
+
         Returns:
             Tuple of (results_df, executed_sql, applied_filters, query_params).
-            query_params are the bound parameter values needed to re-execute the SQL.
+            executed_sql is the page in ``LIMIT``/``OFFSET`` form and
+            query_params are the bound parameter values needed to re-execute it.
         """
         definition = get_query_definition(query_name)
         if not definition:
@@ -55,11 +93,19 @@ def execute_query_with_filters(
             pagination=PaginationSpec(
                 limit=self._extract_default_limit(definition.sql),
                 offset=max(page_offset, 0),
+                after=tuple(page_after) if page_after and definition.order_key else None,
             ),
         )
 
-        sql, params, applied_filters = self._build_query(request)
-        result_df = self._run_query(sql, params, safe_execute_func)
+        sql, params, applied_filters = self._build_query(
+            dataclasses.replace(
+                request, pagination=dataclasses.replace(request.pagination, after=None)
+            )
+        )
+        result_df = self._page_from_result_table(request)
+        if result_df is None:
+            page_sql, page_params, _ = self._build_query(request)
+            result_df = self._run_query(page_sql, page_params, safe_execute_func)
         self.logger.info(
             "Executed query '%s' with %d rows", query_name, len(result_df)
         )
@@ -128,6 +174,64 @@ def update_session_state_with_table_results(
         st.session_state.table_explorer_df = results_df
         st.session_state.show_table_explorer_results = True
 
+    @staticmethod
+    def page_seek_key(
+        definition_or_name: Any, results_df: pd.DataFrame
+    ) -> Optional[Tuple[Any, ...]]:
+        """Order-key values of the page's last row, to fetch the next page by keyset.
+
+        Returns ``None`` when the query has no ordering key, the page is
+        empty or the key has NULLs (those pages fall back to ``OFFSET``).
+        """
+        definition = (
+            get_query_definition(definition_or_name)
+            if isinstance(definition_or_name, str)
+            else definition_or_name
+        )
+        if not definition or not definition.order_key or results_df.empty:
+            return None
+        if any(column not in results_df.columns for column in definition.order_key):
+            return None
+        values = results_df[list(definition.order_key)].iloc[-1]
+        if values.isna().any():
+            return None
+        return tuple(values.tolist())
+
+    def _page_from_result_table(self, request: QueryRequest) -> Optional[pd.DataFrame]:
+        """Slice the page out of the cached first pages, fetching them on page one."""
+        pagination = request.pagination
+        limit = pagination.limit or self._extract_default_limit(request.definition.sql)
+        window_rows = limit * max(Settings.QUERY_RESULT_WINDOW_PAGES, 1)
+        sql, params, _ = self._build_query(
+            dataclasses.replace(request, pagination=PaginationSpec(limit=window_rows))
+        )
+        cache = get_query_cache()
+
+        if pagination.offset == 0:
+            table = cache.get_or_execute(
+                sql,
+                params,
+                lambda: self._fetch_result_table(sql, params),
+                namespace=_RESULT_TABLE_NAMESPACE,
+            )
+        else:
+            table = cache.get(sql, params, namespace=_RESULT_TABLE_NAMESPACE)
+        if table is None:
+            return None
+
+        # A window cut off at window_rows cannot serve pages that run past its end
+        if table.num_rows >= window_rows and pagination.offset + limit > table.num_rows:
+            return None
+        return table.slice(pagination.offset, limit).to_pandas()
+
+    def _fetch_result_table(self, sql: str, params: Sequence[Any]) -> Optional[pa.Table]:
+        try:
+            with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
+                return con.execute(use_derived_tables(con, sql), list(params)).fetch_arrow_table()
+        except Exception as e:
+            self.logger.warning("Could not fetch result table, paging with SQL: %s", e)
+            return None
+
     def _run_query(
         self,
         sql: str,
@@ -137,53 +241,138 @@ def _run_query(
         execute = safe_execute_func or safe_execute_query
 
         with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-            return execute(con, sql, logger_obj=self.logger, params=list(params))
+            return execute(
+                con, use_derived_tables(con, sql), logger_obj=self.logger, params=list(params)
+            )
 
-    def _build_query(self, request: QueryRequest) -> tuple[str, list[Any], list[str]]:
+    def benchmark_filter_pushdown(
+        self,
+        knesset_filter: Sequence[int],
+        repeat: int = 3,
+    ) -> pd.DataFrame:
+        """Time each pack with its Knesset filter pushed down vs. wrapped outside.
+
+        Both variants run the same filter and page; the best of ``repeat`` runs
+        is reported per pack, with ``Speedup`` = wrapped / pushdown.
+        """
+        rows: list[dict[str, Any]] = []
+        for query_name in get_all_query_names():
+            definition = get_query_definition(query_name)
+            if not definition or KNESSET_SLOT not in definition.filter_slots:
+                continue
+
+            request = QueryRequest(
+                definition=definition,
+                knesset_numbers=tuple(knesset_filter),
+                pagination=PaginationSpec(limit=self._extract_default_limit(definition.sql)),
+            )
+            wrapped = self._time_query(*self._build_query(request, pushdown=False)[:2], repeat)
+            pushed = self._time_query(*self._build_query(request)[:2], repeat)
+            rows.append(
+                {
+                    "Query": query_name,
+                    "WrappedSeconds": round(wrapped, 4),
+                    "PushdownSeconds": round(pushed, 4),
+                    "Speedup": round(wrapped / pushed, 2) if pushed > 0 else None,
+                }
+            )
+            self.logger.info(
+                "Filter pushdown benchmark '%s': wrapped %.3fs, pushdown %.3fs",
+                query_name, wrapped, pushed,
+            )
+        return pd.DataFrame(rows, columns=["Query", "WrappedSeconds", "PushdownSeconds", "Speedup"])
+
+    def _time_query(self, sql: str, params: Sequence[Any], repeat: int) -> float:
+        best = float("inf")
+        with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
+            sql = use_derived_tables(con, sql)
+            for _ in range(max(repeat, 1)):
+                started = time.perf_counter()
+                con.execute(sql, list(params)).fetchall()
+                best = min(best, time.perf_counter() - started)
+        return best
+
+    def _build_query(
+        self, request: QueryRequest, pushdown: bool = True
+    ) -> tuple[str, list[Any], list[str]]:
+        """Build the paged SQL for a request.
+
+        Filters go into the pack's declared filter slots, inside the driving
+        CTEs, so only matching rows are scanned. Filters a pack has no slot
+        for (or all filters, with ``pushdown=False``) fall back to wrapping
+        the query as ``SELECT * FROM (...) WHERE ...``.
+        """
         base_sql, default_limit = self._strip_trailing_limit(request.definition.sql)
+        slots = request.definition.filter_slots if pushdown else frozenset()
 
+        binders: dict[str, SlotBinder] = {}
         params: list[Any] = []
         conditions: list[str] = []
         applied_filters: list[str] = []
 
         if request.knesset_numbers and request.definition.knesset_filter_column:
-            # Strip table alias (e.g. "B.KnessetNum" -> "KnessetNum") because
-            # filters are applied outside the subquery where aliases aren't in scope
-            col = self._strip_table_alias(request.definition.knesset_filter_column)
-            clause, clause_params = self._build_in_clause(col, request.knesset_numbers)
-            conditions.append(clause)
-            params.extend(clause_params)
+            if KNESSET_SLOT in slots:
+                binders[KNESSET_SLOT] = self._in_clause_binder(request.knesset_numbers)
+            else:
+                # Strip table alias (e.g. "B.KnessetNum" -> "KnessetNum") because
+                # filters are applied outside the subquery where aliases aren't in scope
+                col = self._strip_table_alias(request.definition.knesset_filter_column)
+                clause, clause_params = self._build_in_clause(col, request.knesset_numbers)
+                conditions.append(clause)
+                params.extend(clause_params)
             applied_filters.append(
                 f"KnessetNum IN ({', '.join(map(str, request.knesset_numbers))})"
             )
 
         faction_col = request.definition.faction_filter_column
         if request.faction_ids and faction_col and faction_col != "NULL":
-            col = self._strip_table_alias(faction_col)
-            clause, clause_params = self._build_in_clause(col, request.faction_ids)
-            conditions.append(clause)
-            params.extend(clause_params)
+            if FACTION_SLOT in slots:
+                binders[FACTION_SLOT] = self._in_clause_binder(request.faction_ids)
+            else:
+                col = self._strip_table_alias(faction_col)
+                clause, clause_params = self._build_in_clause(col, request.faction_ids)
+                conditions.append(clause)
+                params.extend(clause_params)
             applied_filters.append(
                 f"FactionID IN ({', '.join(map(str, request.faction_ids))})"
             )
 
         document_clause = self._build_document_filter_clause(request.document_types)
         if document_clause:
-            conditions.append(document_clause)
+            if DOCUMENT_TYPE_SLOT in slots:
+                document_types = tuple(request.document_types)
+                binders[DOCUMENT_TYPE_SLOT] = lambda alias: (
+                    self._build_document_filter_clause(document_types, alias),
+                    [],
+                )
+            else:
+                conditions.append(document_clause)
             applied_filters.append(
                 f"Document Types: {', '.join(request.document_types)}"
             )
 
-        query = f"SELECT * FROM ({base_sql}) AS base_query"
+        # Keyset page: seek past the previous page's last key instead of OFFSET
+        seek = bool(request.pagination.after) and SEEK_SLOT in slots
+        if seek:
+            after = tuple(request.pagination.after or ())
+            binders[SEEK_SLOT] = lambda columns: self._build_seek_clause(
+                [c.strip() for c in columns.split(",")], after
+            )
+
+        # Slot parameters precede the wrapper's, matching placeholder order
+        query, slot_params = bind_filter_slots(base_sql, binders)
+        params = slot_params + params
+
         if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+            query = f"SELECT * FROM ({query}) AS base_query WHERE " + " AND ".join(conditions)
 
         query_limit = request.pagination.limit or default_limit
         if query_limit:
             query += f" LIMIT {int(query_limit)}"
 
         if request.pagination.offset > 0:
-            query += f" OFFSET {int(request.pagination.offset)}"
+            if not seek:
+                query += f" OFFSET {int(request.pagination.offset)}"
             applied_filters.append(f"Offset: {request.pagination.offset}")
 
         return query, params, applied_filters
@@ -202,22 +391,46 @@ def _build_in_clause(column: str, values: Sequence[int]) -> tuple[str, list[int]
         return f"{column} IN ({placeholders})", list(values)
 
     @staticmethod
-    def _build_document_filter_clause(document_types: Sequence[str]) -> str:
+    def _build_seek_clause(
+        columns: Sequence[str], after: Sequence[Any]
+    ) -> tuple[str, list[Any]]:
+        """Rows strictly after ``after`` in descending ``columns`` order."""
+        if len(columns) != len(after):
+            return "", []
+        branches: list[str] = []
+        params: list[Any] = []
+        for i, column in enumerate(columns):
+            terms = [f"{prev} = ?" for prev in columns[:i]] + [f"{column} < ?"]
+            branches.append("(" + " AND ".join(terms) + ")")
+            params.extend(after[: i + 1])
+        return "(" + " OR ".join(branches) + ")", params
+
+    @staticmethod
+    def _in_clause_binder(values: Sequence[int]) -> SlotBinder:
+        return lambda column: QueryExecutor._build_in_clause(column, values)
+
+    @classmethod
+    def _build_document_filter_clause(
+        cls, document_types: Sequence[str], alias: Optional[str] = None
+    ) -> str:
+        """OR together the selected document types.
+
+        With ``alias`` the condition reads the BillDocuments counts inside the
+        query; without it, the result columns of the finished query.
+        """
         if not document_types:
             return ""
 
         doc_type_conditions: list[str] = []
         for doc_type in document_types:
-            if doc_type == "Published Law":
-                doc_type_conditions.append("BillPublishedLawDocCount > 0")
-            elif doc_type == "First Reading":
-                doc_type_conditions.append("BillFirstReadingDocCount > 0")
-            elif doc_type in ["2nd/3rd Reading", "Second & Third Reading"]:
-                doc_type_conditions.append("BillSecondThirdReadingDocCount > 0")
-            elif doc_type in ["Early Discussion", "Early Stage Discussion"]:
-                doc_type_conditions.append("BillEarlyDiscussionDocCount > 0")
-            elif doc_type == "Other":
-                doc_type_conditions.append("BillOtherDocCount > 0")
+            columns = cls._DOCUMENT_TYPE_COLUMNS.get(doc_type)
+            if columns is None:
+                continue
+            count_col, result_col = columns
+            column = f"{alias}.{count_col}" if alias else result_col
+            condition = f"{column} > 0"
+            if condition not in doc_type_conditions:
+                doc_type_conditions.append(condition)
 
         if not doc_type_conditions:
             return ""
@@ -6,7 +6,7 @@
 """
 
 import streamlit as st
-from typing import Dict, Any
+from typing import Any, Dict, List
 
 
 def render_connection_dashboard() -> None:
@@ -18,10 +18,12 @@ def render_connection_dashboard() -> None:
     - Active connection count
     - Connections grouped by database
     - Long-running connections that may indicate leaks
+    - Per-chart query timings and cache hits
     """
     # Import here to avoid circular imports
     from backend.connection_diagnostics import monitor_connection_health
     from backend.connection_manager import log_connection_leaks
+    from backend.query_service import get_query_service
 
     st.subheader("🔌 Database Connection Monitor")
 
@@ -55,6 +57,11 @@ def render_connection_dashboard() -> None:
         with st.expander("📊 Connection Details"):
             _render_connection_details(health_info)
 
+    query_stats = get_query_service().stats()
+    if query_stats:
+        with st.expander("⏱️ Chart Query Timings"):
+            _render_query_stats(query_stats)
+
     # Actions
     col1, col2 = st.columns(2)
 
@@ -90,3 +97,28 @@ def _render_connection_details(health_info: Dict[str, Any]) -> None:
             st.write(
                 f"- Connection `{conn['conn_id']}` to `{conn['db_path']}`: {age_min:.1f} minutes"
             )
+
+
+def _render_query_stats(query_stats: List[Dict[str, Any]]) -> None:
+    """Render per-chart query statistics, slowest first."""
+    import pandas as pd
+
+    df = pd.DataFrame(query_stats)[
+        ["label", "calls", "cache_hits", "errors", "mean_seconds", "max_seconds", "last_rows", "last_bytes"]
+    ]
+    df["last_kb"] = (df.pop("last_bytes") / 1024).round(1)
+    st.dataframe(
+        df.rename(
+            columns={
+                "label": "Chart",
+                "calls": "Calls",
+                "cache_hits": "Cache Hits",
+                "errors": "Errors",
+                "mean_seconds": "Mean (s)",
+                "max_seconds": "Max (s)",
+                "last_rows": "Rows",
+                "last_kb": "Result (KB)",
+            }
+        ),
+        hide_index=True,
+    )
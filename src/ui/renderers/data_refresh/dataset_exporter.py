@@ -5,17 +5,35 @@
 downloads and SQL query modifications.
 """
 
-import io
 import logging
 import re
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Any, Optional, Sequence
 
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
 from backend.connection_manager import get_db_connection, safe_execute_query
+from data.queries.derived_tables import use_derived_tables
+from utils.excel_writer import EXCEL_MAX_DATA_ROWS, HyperlinkExcelWriter
+
+# Format -> (file suffix, MIME type, button label)
+EXPORT_FORMATS: dict[str, tuple[str, str, str]] = {
+    "csv": (".csv", "text/csv", "CSV"),
+    "parquet": (".parquet", "application/vnd.apache.parquet", "Parquet"),
+    "xlsx": (
+        ".xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "Excel",
+    ),
+}
+
+UTF8_BOM = b"\xef\xbb\xbf"
+EXPORT_CHUNK_BYTES = 1024 * 1024
+EXPORT_BATCH_ROWS = 10_000
 
 
 class DatasetExporter:
@@ -134,7 +152,7 @@ def get_full_dataset_row_count(
         try:
             with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
                 count_result = safe_execute_query(
-                    con, full_count_sql, self.logger, params=list(params) if params else None
+                    con, use_derived_tables(con, full_count_sql), self.logger, params=list(params) if params else None
                 )
                 # Convert to native Python int to ensure boolean comparisons work with Streamlit
                 if count_result is not None and not count_result.empty:
@@ -162,7 +180,7 @@ def fetch_full_dataset(
         try:
             with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
                 result = safe_execute_query(
-                    con, full_sql_no_limit, self.logger, params=list(params) if params else None
+                    con, use_derived_tables(con, full_sql_no_limit), self.logger, params=list(params) if params else None
                 )
                 if isinstance(result, pd.DataFrame):
                     return result
@@ -171,35 +189,76 @@ def fetch_full_dataset(
             self.logger.error(f"Error fetching full dataset: {e}", exc_info=True)
             return None
 
-    def export_full_dataset_csv_bytes(
-        self, modified_sql: str, params: Optional[Sequence[Any]] = None
-    ) -> tuple[bytes, int]:
-        """Export the full result set to CSV without materializing a pandas DataFrame."""
+    def export_full_dataset_to_file(
+        self,
+        modified_sql: str,
+        fmt: str = "csv",
+        params: Optional[Sequence[Any]] = None,
+    ) -> tuple[Path, int]:
+        """
+        Run the full query once and write it to a temporary file.
+
+        CSV and Parquet are written by DuckDB's COPY, whose result is the row
+        count; XLSX is written from Arrow record batches into a write-only
+        workbook. No format materializes the result in pandas.
+
+        Args:
+            modified_sql: The SQL query with filters applied
+            fmt: One of EXPORT_FORMATS
+            params: Bound parameter values for filter placeholders
+
+        Returns:
+            Tuple of (file path, row count). The caller owns (and deletes) the file.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
         full_sql_no_limit = self.remove_limit_offset_from_query(modified_sql)
-        row_count = self.get_full_dataset_row_count(modified_sql, params)
-        temp_path: Path | None = None
+        suffix = EXPORT_FORMATS[fmt][0]
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
 
         try:
-            with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-
-            copy_sql = (
-                f"COPY ({full_sql_no_limit}) TO {self._quote_duckdb_path(temp_path)} "
-                "(HEADER, DELIMITER ',')"
-            )
             with get_db_connection(self.db_path, read_only=True, logger_obj=self.logger) as con:
-                if params:
-                    con.execute(copy_sql, list(params))
+                query = use_derived_tables(con, full_sql_no_limit)
+                bound = list(params) if params else []
+                if fmt == "xlsx":
+                    reader = con.execute(query, bound).fetch_record_batch(EXPORT_BATCH_ROWS)
+                    row_count = self._write_xlsx(reader, temp_path)
                 else:
-                    con.execute(copy_sql)
+                    options = "(HEADER, DELIMITER ',')" if fmt == "csv" else "(FORMAT PARQUET)"
+                    copy_sql = f"COPY ({query}) TO {self._quote_duckdb_path(temp_path)} {options}"
+                    result = con.execute(copy_sql, bound).fetchone()
+                    row_count = int(result[0]) if result else 0
+            if fmt == "csv":
+                self._prepend_utf8_bom(temp_path)
+            return temp_path, row_count
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-            csv_data = temp_path.read_bytes()
-            if not csv_data.startswith(b"\xef\xbb\xbf"):
-                csv_data = b"\xef\xbb\xbf" + csv_data
-            return csv_data, row_count
-        finally:
-            if temp_path is not None:
-                temp_path.unlink(missing_ok=True)
+    @staticmethod
+    def _prepend_utf8_bom(path: Path) -> None:
+        """Prefix the file with a UTF-8 BOM (for Excel), copying it in chunks."""
+        with open(path, "rb") as source:
+            if source.read(len(UTF8_BOM)) == UTF8_BOM:
+                return
+        bom_path = path.with_name(path.name + ".bom")
+        with open(path, "rb") as source, open(bom_path, "wb") as target:
+            target.write(UTF8_BOM)
+            shutil.copyfileobj(source, target, EXPORT_CHUNK_BYTES)
+        bom_path.replace(path)
+
+    @staticmethod
+    def _write_xlsx(reader: pa.RecordBatchReader, path: Path) -> int:
+        """Stream record batches into a write-only workbook; returns the row count.
+
+        The full dataset is raw data, so URL columns keep their plain values
+        rather than becoming ``HYPERLINK`` formulas.
+        """
+        return HyperlinkExcelWriter(links=False).write_record_batches(
+            reader, reader.schema, path
+        )
 
     def render_full_dataset_download(
         self,
@@ -219,76 +278,60 @@ def render_full_dataset_download(
         st.markdown("### 📦 Download Full Filtered Dataset")
         st.caption("⚠️ This will download ALL rows matching your filters (not just 1000 displayed)")
 
-        # Get row count for full dataset
-        total_rows = self.get_full_dataset_row_count(modified_sql, params)
-
-        if total_rows == 0:
-            st.error("Error counting rows or no rows found")
-            return
-
-        st.info(f"📊 Total rows in filtered dataset: **{total_rows:,}**")
-
-        if total_rows > 50000:
-            st.warning(f"⚠️ Large dataset ({total_rows:,} rows). Download may take some time.")
-
-        # Download buttons for full dataset
-        col1, col2 = st.columns(2)
+        # The row count comes from the export itself, so rendering the
+        # section runs no query; an Excel export past the sheet limit fails
+        # with a message pointing at CSV/Parquet.
+        col1, col2, col3 = st.columns(3)
 
         with col1:
-            if st.button("⬇️ Download Full CSV", disabled=(total_rows == 0), key=f"full_csv_btn_{safe_name}"):
-                self._handle_full_csv_download(modified_sql, safe_name, params)
+            if st.button("⬇️ Download Full CSV", key=f"full_csv_btn_{safe_name}"):
+                self._handle_full_download(modified_sql, safe_name, "csv", params)
 
         with col2:
-            if st.button("⬇️ Download Full Excel", disabled=(total_rows == 0), key=f"full_excel_btn_{safe_name}"):
-                self._handle_full_excel_download(modified_sql, safe_name, params)
-
-    def _handle_full_csv_download(
-        self, modified_sql: str, safe_name: str, params: Optional[Sequence[Any]] = None
-    ) -> None:
-        """Handle full CSV dataset download."""
-        with st.spinner("Preparing full dataset..."):
-            try:
-                csv_data, row_count = self.export_full_dataset_csv_bytes(
-                    modified_sql, params
-                )
-
-                if csv_data:
-                    st.download_button(
-                        "💾 Click to Save Full CSV",
-                        csv_data,
-                        f"{safe_name}_FULL_results.csv",
-                        "text/csv",
-                        key=f"full_csv_download_{safe_name}"
-                    )
-                    st.success(f"✅ Prepared {row_count:,} rows for download")
-                else:
-                    st.error("Failed to retrieve full dataset")
-            except Exception as e:
-                self.logger.error(f"Error preparing full CSV: {e}", exc_info=True)
-                st.error(f"Error preparing CSV: {e}")
-
-    def _handle_full_excel_download(
-        self, modified_sql: str, safe_name: str, params: Optional[Sequence[Any]] = None
+            if st.button("⬇️ Download Full Parquet", key=f"full_parquet_btn_{safe_name}"):
+                self._handle_full_download(modified_sql, safe_name, "parquet", params)
+
+        with col3:
+            if st.button(
+                "⬇️ Download Full Excel",
+                key=f"full_excel_btn_{safe_name}",
+                help=f"Excel holds at most {EXCEL_MAX_DATA_ROWS:,} rows; use CSV or Parquet beyond that",
+            ):
+                self._handle_full_download(modified_sql, safe_name, "xlsx", params)
+
+    def _handle_full_download(
+        self,
+        modified_sql: str,
+        safe_name: str,
+        fmt: str,
+        params: Optional[Sequence[Any]] = None,
     ) -> None:
-        """Handle full Excel dataset download."""
+        """Handle a full dataset download in ``fmt`` (one query execution)."""
+        suffix, mime, label = EXPORT_FORMATS[fmt]
         with st.spinner("Preparing full dataset..."):
+            temp_path: Path | None = None
             try:
-                full_df = self.fetch_full_dataset(modified_sql, params)
-
-                if full_df is not None and not full_df.empty:
-                    excel_buffer = io.BytesIO()
-                    with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-                        full_df.to_excel(writer, index=False, sheet_name="Results")
+                temp_path, row_count = self.export_full_dataset_to_file(modified_sql, fmt, params)
+                if row_count == 0:
+                    st.warning("No rows match the current filters")
+                    return
+                # st.download_button reads the whole file into memory to
+                # serve it, so the finished export is held there once; only
+                # the query and file writing stay out of pandas.
+                with open(temp_path, "rb") as handle:
                     st.download_button(
-                        "💾 Click to Save Full Excel",
-                        excel_buffer.getvalue(),
-                        f"{safe_name}_FULL_results.xlsx",
-                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key=f"full_excel_download_{safe_name}"
+                        f"💾 Click to Save Full {label}",
+                        handle,
+                        f"{safe_name}_FULL_results{suffix}",
+                        mime,
+                        key=f"full_{fmt}_download_{safe_name}",
                     )
-                    st.success(f"✅ Prepared {len(full_df):,} rows for download")
-                else:
-                    st.error("Failed to retrieve full dataset")
+                st.success(f"✅ Prepared {row_count:,} rows for download")
+                if row_count > 50000:
+                    st.info(f"📊 Large dataset ({row_count:,} rows); saving may take a moment.")
             except Exception as e:
-                self.logger.error(f"Error preparing full Excel: {e}", exc_info=True)
-                st.error(f"Error preparing Excel: {e}")
+                self.logger.error(f"Error preparing full {label}: {e}", exc_info=True)
+                st.error(f"Error preparing {label}: {e}")
+            finally:
+                if temp_path is not None:
+                    temp_path.unlink(missing_ok=True)
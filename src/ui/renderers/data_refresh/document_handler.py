@@ -15,6 +15,7 @@
 import streamlit as st
 
 from backend.connection_manager import get_db_connection, safe_execute_query
+from utils.excel_writer import HyperlinkExcelWriter
 
 
 class DocumentHandler:
@@ -173,34 +174,8 @@ def create_excel_with_hyperlinks(self, df: pd.DataFrame) -> io.BytesIO:
         Returns:
             BytesIO buffer containing Excel file with hyperlinks
         """
-        from openpyxl.styles import Font
-
-        buffer = io.BytesIO()
-
-        # Identify URL columns
-        url_columns = [
-            col for col in df.columns
-            if 'URL' in col or 'Link' in col or col == 'BillKnessetWebsiteURL'
-        ]
-
         try:
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                df.to_excel(writer, index=False, sheet_name="Results")
-
-                # Get worksheet
-                worksheet = writer.sheets["Results"]
-
-                # Add hyperlinks to URL columns
-                for col_idx, col_name in enumerate(df.columns, start=1):
-                    if col_name in url_columns:
-                        for row_idx, url in enumerate(df[col_name], start=2):  # start=2 for header
-                            if pd.notna(url) and url:
-                                cell = worksheet.cell(row=row_idx, column=col_idx)
-                                cell.value = "Open Link"
-                                cell.hyperlink = str(url)
-                                cell.font = Font(color="0563C1", underline="single")
-
-            buffer.seek(0)
+            return HyperlinkExcelWriter().to_buffer(df)
         except Exception as e:
             self.logger.error(f"Error creating Excel with hyperlinks: {e}")
             # Fallback to simple Excel
@@ -208,8 +183,7 @@ def create_excel_with_hyperlinks(self, df: pd.DataFrame) -> io.BytesIO:
             with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
                 df.to_excel(writer, index=False, sheet_name="Results")
             buffer.seek(0)
-
-        return buffer
+            return buffer
 
     def render_multi_document_view(self, df: pd.DataFrame) -> None:
         """
@@ -11,6 +11,7 @@
 import streamlit as st
 
 import ui.ui_utils as ui_utils
+from ui.queries.query_executor import QueryExecutor
 from ui.state.session_manager import SessionStateManager
 from utils.export_verifier import ExportVerifier
 
@@ -241,6 +242,14 @@ def render_pagination_controls(renderer: Any, results_df: pd.DataFrame) -> None:
             disabled=not has_more,
             use_container_width=True,
         ):
+            # Remember where this page ends so the next one can seek past it
+            seek_keys = st.session_state.get("query_page_seek_keys", [])[: current_page - 1]
+            seek_keys.append(
+                QueryExecutor.page_seek_key(
+                    SessionStateManager.get_executed_query_name() or "", results_df
+                )
+            )
+            st.session_state.query_page_seek_keys = seek_keys
             st.session_state.query_page_number = current_page + 1
             st.session_state.query_page_offset = (
                 st.session_state.query_page_number - 1
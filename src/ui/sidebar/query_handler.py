@@ -42,6 +42,12 @@ def handle_run_query_button_click(
         if not page_offset:
             st.session_state.query_page_number = 1
             st.session_state.query_page_offset = 0
+            st.session_state.query_page_seek_keys = []
+
+        # Seek key of the previous page's last row, for keyset pagination
+        page_number = st.session_state.get("query_page_number", 1)
+        seek_keys = st.session_state.get("query_page_seek_keys", [])
+        page_after = seek_keys[page_number - 2] if 1 < page_number <= len(seek_keys) + 1 else None
 
         selected_faction_ids = [
             faction_display_map[name]
@@ -62,6 +68,7 @@ def handle_run_query_button_click(
                 safe_execute_func=safe_execute_query,
                 document_type_filter=document_type_filter,
                 page_offset=page_offset,
+                page_after=page_after,
             )
         )
 
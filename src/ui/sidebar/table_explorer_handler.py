@@ -2,6 +2,9 @@
 Table exploration handler for sidebar.
 
 Handles the logic for exploring database tables with filtering and JOINs.
+Tables with a KnessetNum-partitioned Parquet mirror (see
+``backend.partitioned_parquet``) are read from the mirror, so a Knesset
+filter only opens the selected partitions.
 """
 
 import logging
@@ -12,6 +15,8 @@
 import streamlit as st
 
 from backend.connection_manager import get_db_connection, safe_execute_query
+from backend.partitioned_parquet import has_part_files, parquet_location, parquet_scan_sql
+from config.settings import Settings
 
 
 def handle_explore_table_button_click(
@@ -42,7 +47,11 @@ def handle_explore_table_button_click(
 
             # Build query with potential JOINs
             query_parts = _build_explorer_query(
-                table_to_explore, all_table_cols, db_tables_list_lower, faction_display_map
+                table_to_explore,
+                all_table_cols,
+                db_tables_list_lower,
+                faction_display_map,
+                _partitioned_mirror_source(table_to_explore),
             )
 
             final_query = query_parts["query"]
@@ -77,11 +86,22 @@ def handle_explore_table_button_click(
         st.error("Database not found. Cannot explore tables.")
 
 
+def _partitioned_mirror_source(table_to_explore: str) -> str | None:
+    """``read_parquet`` over the table's partitioned mirror, if it has one."""
+    if not Settings.ENABLE_PARTITIONED_PARQUET:
+        return None
+    location = parquet_location(Settings.PARQUET_DIR, table_to_explore)
+    if location is None or not location.is_dir() or not has_part_files(location):
+        return None
+    return parquet_scan_sql(location)
+
+
 def _build_explorer_query(
     table_to_explore: str,
     all_table_cols: list[str],
     db_tables_list_lower: list[str],
     faction_display_map: dict[str, int],
+    table_source: str | None = None,
 ) -> dict[str, str]:
     """Build the explorer query with JOINs and filters.
 
@@ -90,13 +110,19 @@ def _build_explorer_query(
         all_table_cols: List of columns in the table
         db_tables_list_lower: List of all table names (lowercase)
         faction_display_map: Mapping from faction names to IDs
+        table_source: Table function to read instead of the warehouse table
+            (a partitioned Parquet mirror); aliased to the table's usual name
 
     Returns:
         Dictionary with 'query' key containing the final SQL
     """
     join_clause = ""
     select_prefix = f'"{table_to_explore}".*'
-    base_query_table_ref = f'"{table_to_explore}"'
+    base_query_table_ref = (
+        f'{table_source} AS "{table_to_explore}"'
+        if table_source
+        else f'"{table_to_explore}"'
+    )
 
     # Handle special cases for faction-related tables
     if (
@@ -120,7 +146,9 @@ def _build_explorer_query(
             "p2p.*, ufs.CoalitionStatus AS UserCoalitionStatus, "
             "ufs.DateJoinedCoalition, ufs.DateLeftCoalition"
         )
-        base_query_table_ref = "KNS_PersonToPosition p2p"
+        base_query_table_ref = (
+            f"{table_source} AS p2p" if table_source else "KNS_PersonToPosition p2p"
+        )
         join_clause = (
             "LEFT JOIN UserFactionCoalitionStatus ufs "
             "ON p2p.FactionID = ufs.FactionID AND p2p.KnessetNum = ufs.KnessetNum"
@@ -13,6 +13,11 @@
 
 # Import connection manager for safe database handling
 from backend.connection_manager import get_db_connection, cached_query_with_connection
+from backend.query_cache import ANY_TABLE, data_version_cached
+from backend.partitioned_parquet import parquet_location
+
+# Tables read by get_filter_options_from_db (cached until one is rewritten).
+FILTER_OPTION_TABLES = ("KNS_KnessetDates", "KNS_Faction", "UserFactionCoalitionStatus")
 
 # --- Database Connection and Utility Functions ---
 # REMOVED @st.cache_resource(ttl=300) - This was causing issues with closed connections being reused.
@@ -46,7 +51,7 @@ def safe_execute_query(con: duckdb.DuckDBPyConnection, query: str, _logger_obj:
         st.error(f"Query execution error: {e}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=3600)
+@data_version_cached(tables=(ANY_TABLE,))
 def get_db_table_list(db_path: Path, _logger_obj: logging.Logger | None = None) -> list[str]:
     """Fetches the list of all tables from the database."""
     if _logger_obj: _logger_obj.info("Fetching database table list...")
@@ -66,7 +71,7 @@ def get_db_table_list(db_path: Path, _logger_obj: logging.Logger | None = None)
         return []
 
 
-@st.cache_data(ttl=3600)
+@data_version_cached(tables=(ANY_TABLE,))
 def get_table_columns(db_path: Path, table_name: str, _logger_obj: logging.Logger | None = None) -> tuple[list[str], list[str], list[str]]:
     """Fetches all column names, numeric column names, and categorical column names for a table."""
     if not table_name or not db_path.exists():
@@ -95,7 +100,7 @@ def get_table_columns(db_path: Path, table_name: str, _logger_obj: logging.Logge
         return [], [], []
 
 
-@st.cache_data(ttl=3600)
+@data_version_cached(tables=FILTER_OPTION_TABLES)
 def get_filter_options_from_db(db_path: Path, _logger_obj: logging.Logger | None = None) -> tuple[list, pd.DataFrame]:
     """Fetches distinct Knesset numbers and faction data for filter dropdowns."""
     if _logger_obj: _logger_obj.info("Fetching filter options from database...")
@@ -173,9 +178,9 @@ def human_readable_timestamp(ts_value, _logger_obj: logging.Logger | None = None
         return str(ts_value) 
 
 def get_last_updated_for_table(parquet_dir: Path, table_name: str, _logger_obj: logging.Logger | None = None) -> str: 
-    """Gets the last updated timestamp for a table (Parquet file modification time)."""
-    parquet_file = parquet_dir / f"{table_name}.parquet"
-    if parquet_file.exists():
+    """Gets the last updated timestamp for a table (Parquet file or partition directory modification time)."""
+    parquet_file = parquet_location(parquet_dir, table_name)
+    if parquet_file is not None:
         try:
             return human_readable_timestamp(parquet_file.stat().st_mtime, _logger_obj)
         except Exception as e:
@@ -217,7 +222,7 @@ def format_dataframe_dates(df: pd.DataFrame, _logger_obj: logging.Logger | None
     return formatted_df
 
 
-@st.cache_data(ttl=3600)
+@data_version_cached(tables=("KNS_Query", "KNS_Agenda", "KNS_Bill"))
 def get_available_knessetes_for_query(db_path: Path, query_type: str, _logger_obj: logging.Logger | None = None) -> list[int]:
     """
     Fetches all available Knesset numbers for a specific query type.
@@ -0,0 +1,144 @@
+"""
+Fast XLSX export with clickable links.
+
+``HyperlinkExcelWriter`` builds the workbook in openpyxl's write-only mode,
+so rows are serialized as they are appended and memory stays flat. URL
+columns are detected once from the header and their cells are written as
+``HYPERLINK`` formulas sharing one link font, in the same pass as the plain
+values, instead of rewriting every URL cell after ``df.to_excel``. With
+``links=False`` every column keeps its plain values, for raw data exports.
+
+Core API:
+- HyperlinkExcelWriter: Write a DataFrame or Arrow record batches to XLSX
+- is_url_column(): Which columns are written as links
+- EXCEL_MAX_DATA_ROWS: Rows a sheet can hold below its header
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Iterable, List, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font
+
+# Excel's sheet limit is 1,048,576 rows including the header
+EXCEL_MAX_DATA_ROWS = 1_048_575
+
+# Excel rejects string arguments longer than this inside a formula
+_MAX_FORMULA_STRING = 255
+
+LINK_COLOR = "0563C1"
+
+
+def is_url_column(column: str) -> bool:
+    """Whether ``column`` holds links to write as clickable cells."""
+    return "URL" in column or "Link" in column
+
+
+class HyperlinkExcelWriter:
+    """Write tabular results to a single-sheet XLSX with clickable URL cells."""
+
+    def __init__(
+        self, sheet_name: str = "Results", link_text: str = "Open Link", links: bool = True
+    ):
+        self.sheet_name = sheet_name
+        self.link_text = link_text
+        self.links = links
+        # One font object for every link cell, so the workbook has one style
+        self._link_font = Font(color=LINK_COLOR, underline="single")
+
+    def write_dataframe(self, df: pd.DataFrame, target: Union[str, Path, IO[bytes]]) -> int:
+        """Write ``df`` to ``target``; returns the number of data rows."""
+        workbook, sheet = self._new_workbook()
+        columns = [str(c) for c in df.columns]
+        sheet.append(columns)
+        values = [self._series_values(df.iloc[:, i]) for i in range(len(columns))]
+        rows = self._append_rows(sheet, columns, values, 0)
+        workbook.save(target)
+        return rows
+
+    def write_record_batches(
+        self, reader: Iterable[pa.RecordBatch], schema: pa.Schema, target: Union[str, Path, IO[bytes]]
+    ) -> int:
+        """Write Arrow record batches to ``target``; returns the number of data rows."""
+        workbook, sheet = self._new_workbook()
+        columns = list(schema.names)
+        sheet.append(columns)
+        rows = 0
+        for batch in reader:
+            values = [
+                [self._excel_value(v) for v in column.to_pylist()] for column in batch.columns
+            ]
+            rows = self._append_rows(sheet, columns, values, rows)
+        workbook.save(target)
+        return rows
+
+    def to_buffer(self, df: pd.DataFrame) -> io.BytesIO:
+        """Write ``df`` into an in-memory workbook, rewound for reading."""
+        buffer = io.BytesIO()
+        self.write_dataframe(df, buffer)
+        buffer.seek(0)
+        return buffer
+
+    def _new_workbook(self) -> tuple[Workbook, Any]:
+        workbook = Workbook(write_only=True)
+        return workbook, workbook.create_sheet(self.sheet_name)
+
+    def _append_rows(
+        self,
+        sheet: Any,
+        columns: Sequence[str],
+        values: List[List[Any]],
+        rows_written: int,
+    ) -> int:
+        """Append column-major ``values`` as rows; URL columns become link cells.
+
+        Without ``links`` the URLs are written as the plain strings they are.
+        """
+        n_rows = len(values[0]) if values else 0
+        if rows_written + n_rows > EXCEL_MAX_DATA_ROWS:
+            raise ValueError(
+                f"Result has more than {EXCEL_MAX_DATA_ROWS:,} rows, "
+                "which Excel cannot open; use CSV or Parquet instead"
+            )
+        for i, column in enumerate(columns):
+            if self.links and is_url_column(column):
+                values[i] = [self._link_cell(sheet, url) for url in values[i]]
+        for row in zip(*values):
+            sheet.append(row)
+        return rows_written + n_rows
+
+    def _link_cell(self, sheet: Any, url: Any) -> Any:
+        if url is None or url == "":
+            return None
+        text = str(url)
+        if len(text) > _MAX_FORMULA_STRING:
+            # Too long for a formula argument; keep the URL itself visible
+            return text
+        escaped = text.replace('"', '""')
+        cell = WriteOnlyCell(sheet, value=f'=HYPERLINK("{escaped}","{self.link_text}")')
+        cell.font = self._link_font
+        return cell
+
+    @classmethod
+    def _series_values(cls, series: pd.Series) -> List[Any]:
+        """Column values with NaN/NaT as ``None`` and Excel-safe scalars."""
+        values = series.astype(object).where(series.notna(), None).tolist()
+        return [cls._excel_value(v) for v in values]
+
+    @staticmethod
+    def _excel_value(value: Any) -> Any:
+        if isinstance(value, str):
+            return ILLEGAL_CHARACTERS_RE.sub("", value)
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.replace(tzinfo=None)
+        if isinstance(value, (list, dict, tuple)):
+            return str(value)
+        return value
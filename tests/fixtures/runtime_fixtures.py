@@ -55,6 +55,18 @@ async def fake_download_table(self, table, resume_state=None):
         monkeypatch.setattr(ODataClient, "download_table", fake_download_table)
 
 
+@pytest.fixture(autouse=True)
+def reset_query_cache():
+    """Start every test with an empty query result cache (as with st.cache_data above)."""
+    import sys
+
+    for name in ("backend.query_cache", "src.backend.query_cache"):
+        module = sys.modules.get(name)
+        if module is not None:
+            module.get_query_cache().clear()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def disable_cloud_storage(monkeypatch):
     """Disable cloud sync by default in tests (no Streamlit secrets dependency)."""
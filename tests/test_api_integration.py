@@ -5,6 +5,7 @@
 and OData client functionality to ensure robust API communication.
 """
 
+import json
 import pytest
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
@@ -132,7 +133,7 @@ async def test_successful_api_call(self, client):
         
         with patch('aiohttp.ClientSession.get') as mock_get:
             mock_response = AsyncMock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.read.return_value = json.dumps(mock_response_data).encode()
             mock_response.status = 200
             mock_get.return_value.__aenter__.return_value = mock_response
             
@@ -168,7 +169,7 @@ def mock_get_factory(*args, **kwargs):
                 raise aiohttp.ClientConnectionError("Connection failed")
             # Success on third try
             mock_response = AsyncMock()
-            mock_response.json.return_value = {"value": []}
+            mock_response.read.return_value = b'{"value": []}'
             mock_response.status = 200
             mock_context = AsyncMock()
             mock_context.__aenter__.return_value = mock_response
@@ -234,7 +235,7 @@ def alternating_responses(*args, **kwargs):
                 raise aiohttp.ClientConnectionError("Intermittent failure")
 
             mock_response = AsyncMock()
-            mock_response.json.return_value = success_response
+            mock_response.read.return_value = json.dumps(success_response).encode()
             mock_response.status = 200
             mock_context = AsyncMock()
             mock_context.__aenter__.return_value = mock_response
@@ -0,0 +1,115 @@
+"""Smoke test for the full bills CSV export audit script."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import runpy
+import shutil
+
+import duckdb
+
+from ui.renderers.data_refresh.dataset_exporter import DatasetExporter
+
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_AUDIT_EXPORT = runpy.run_path(
+    str(_REPO_ROOT / "scripts" / "audit_bills_full_export.py")
+)["audit_export"]
+
+_STAND_IN_SQL = """
+SELECT
+    B.BillID,
+    B.KnessetNum,
+    B.Name AS BillName,
+    B.StatusID AS BillStatusID,
+    'Approved' AS BillStatusDesc,
+    B.PrivateNumber,
+    B.SubTypeID AS BillSubTypeID,
+    B.Number AS BillNumber,
+    strftime(B.LastUpdatedDate, '%Y-%m-%d') AS LastUpdatedDateFormatted,
+    (SELECT COUNT(DISTINCT I.PersonID) FROM KNS_BillInitiator I WHERE I.BillID = B.BillID)
+        AS BillTotalMemberCount,
+    1 AS BillMainInitiatorCount,
+    0 AS BillSupportingMemberCount,
+    1 AS BillCoalitionMemberCount,
+    0 AS BillOppositionMemberCount,
+    100.0 AS BillCoalitionMemberPercentage,
+    0.0 AS BillOppositionMemberPercentage,
+    (SELECT COUNT(*) FROM KNS_DocumentBill D WHERE D.BillID = B.BillID AND D.FilePath IS NOT NULL)
+        AS BillDocumentCount,
+    (SELECT MIN(D.FilePath) FROM KNS_DocumentBill D WHERE D.BillID = B.BillID)
+        AS BillPrimaryDocumentURL,
+    'https://main.knesset.gov.il/Activity/Legislation/Laws/Pages/LawBill.aspx?lawitemid='
+        || B.BillID AS BillKnessetWebsiteURL,
+    NULL AS CAPCode,
+    NULL AS CAPMajorCategory,
+    NULL AS CodingMajorIL,
+    NULL AS CodingMinorIL
+FROM KNS_Bill B
+ORDER BY B.BillID
+LIMIT 1000
+"""
+
+
+def _build_warehouse(db_path: Path) -> None:
+    with duckdb.connect(db_path.as_posix()) as con:
+        con.execute(
+            """
+            CREATE TABLE KNS_Bill AS
+            SELECT
+                range + 1 AS BillID,
+                25 AS KnessetNum,
+                'Bill ' || (range + 1) AS Name,
+                118 AS StatusID,
+                range + 100 AS PrivateNumber,
+                54 AS SubTypeID,
+                range + 1 AS Number,
+                TIMESTAMP '2026-01-01 00:00:00' AS LastUpdatedDate
+            FROM range(3)
+            """
+        )
+        con.execute(
+            """
+            CREATE TABLE KNS_DocumentBill AS
+            SELECT
+                BillID,
+                'https://fs.knesset.gov.il/' || BillID || '.pdf' AS FilePath,
+                'Primary' AS GroupTypeDesc,
+                'PDF' AS ApplicationDesc
+            FROM KNS_Bill
+            """
+        )
+        con.execute(
+            "CREATE TABLE KNS_BillInitiator AS SELECT BillID, BillID AS PersonID FROM KNS_Bill"
+        )
+
+
+def test_audit_report_compares_fresh_export_from_file(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "warehouse.duckdb"
+    _build_warehouse(db_path)
+    monkeypatch.setitem(
+        _AUDIT_EXPORT.__globals__,
+        "PREDEFINED_QUERIES",
+        {"Bills & Legislation (Full Details)": {"sql": _STAND_IN_SQL}},
+    )
+
+    exporter = DatasetExporter(db_path, logging.getLogger(__name__))
+    export_path, _ = exporter.export_full_dataset_to_file(_STAND_IN_SQL, "csv")
+    csv_path = tmp_path / "bills_full_details.csv"
+    shutil.move(export_path, csv_path)
+    report_path = tmp_path / "audit.md"
+    json_path = tmp_path / "audit.json"
+
+    result = _AUDIT_EXPORT(csv_path, db_path, report_path, json_path)
+
+    assert result["fresh_streaming_export_rows"] == 3
+    assert result["fresh_streaming_export_matches_file"] is True
+    assert result["fresh_streaming_export_size_bytes"] == csv_path.stat().st_size
+    assert result["fresh_streaming_export_sha256"] == result["csv_sha256"]
+    assert result["all_core_checks_pass"] is True
+    assert json.loads(json_path.read_text(encoding="utf-8"))["csv_rows"] == 3
+    assert "PASS: Fresh DuckDB streaming export matches CSV bytes" in report_path.read_text(
+        encoding="utf-8"
+    )
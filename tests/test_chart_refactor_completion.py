@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from contextlib import nullcontext
 from datetime import date
 from pathlib import Path
 from types import SimpleNamespace
@@ -24,13 +23,10 @@ def test_queries_by_coalition_status_chart_generation(monkeypatch, tmp_path, moc
     chart = QueryComparisonCharts(db_path, mock_logger)
 
     monkeypatch.setattr(chart, "check_database_exists", lambda: True)
-    monkeypatch.setattr(chart, "check_tables_exist", lambda con, tables: True)
+    monkeypatch.setattr(chart, "check_tables_exist", lambda tables: True)
     monkeypatch.setattr(
-        "ui.charts.comparison.query_charts.get_db_connection",
-        lambda *args, **kwargs: nullcontext(mock.MagicMock()),
-    )
-    monkeypatch.setattr(
-        "ui.charts.comparison.query_charts.safe_execute_query",
+        chart,
+        "run_query",
         lambda *args, **kwargs: pd.DataFrame(
             {
                 "CoalitionStatus": ["Coalition", "Opposition"],
@@ -57,13 +53,10 @@ def test_query_status_distribution_chart_generation(monkeypatch, tmp_path, mock_
     chart = DistributionCharts(db_path, mock_logger)
 
     monkeypatch.setattr(chart, "check_database_exists", lambda: True)
-    monkeypatch.setattr(chart, "check_tables_exist", lambda con, tables: True)
-    monkeypatch.setattr(
-        "ui.charts.distribution.get_db_connection",
-        lambda *args, **kwargs: nullcontext(mock.MagicMock()),
-    )
+    monkeypatch.setattr(chart, "check_tables_exist", lambda tables: True)
     monkeypatch.setattr(
-        "ui.charts.distribution.safe_execute_query",
+        chart,
+        "run_query",
         lambda *args, **kwargs: pd.DataFrame(
             {
                 "Status": ["Answered", "Not Answered"],
@@ -21,7 +21,7 @@ def test_refresh_specific_table():
         table_name = "MyTable"
         result = runner.invoke(app, ["refresh", "--table", table_name])
 
-        mock_service.refresh_tables_sync.assert_called_once_with([table_name])
+        mock_service.refresh_tables_sync.assert_called_once_with([table_name], incremental=False)
         assert f"Attempting to refresh specific table: {table_name}" in result.stdout
         assert "Refresh process completed successfully." in result.stdout
         assert result.exit_code == 0
@@ -40,7 +40,7 @@ def test_refresh_all_tables():
     with mock.patch('src.cli.container', mock_container):
         result = runner.invoke(app, ["refresh"])
 
-        mock_service.refresh_tables_sync.assert_called_once_with(None)
+        mock_service.refresh_tables_sync.assert_called_once_with(None, incremental=False)
         assert "Attempting to refresh all relevant tables." in result.stdout
         assert "Refresh process completed successfully." in result.stdout
         assert result.exit_code == 0
@@ -85,3 +85,49 @@ def test_refresh_generic_exception():
         assert "An unexpected error occurred during refresh:" in output
         assert error_message in output
         assert result.exit_code == 1
+
+
+def test_refresh_incremental_flag():
+    """Test --incremental is forwarded to the refresh service."""
+    mock_service = mock.Mock()
+    mock_service.refresh_tables_sync = mock.Mock(return_value=True)
+
+    mock_container = mock.Mock()
+    mock_container.data_refresh_service = mock_service
+
+    with mock.patch('src.cli.container', mock_container):
+        result = runner.invoke(app, ["refresh", "--table", "KNS_Bill", "--incremental"])
+
+        mock_service.refresh_tables_sync.assert_called_once_with(["KNS_Bill"], incremental=True)
+        assert result.exit_code == 0
+
+
+def test_read_parquet_filters_partitioned_mirror(tmp_path):
+    """read-parquet reads only the requested KnessetNum partitions."""
+    import duckdb
+    import pandas as pd
+    from src.backend.partitioned_parquet import write_partitioned
+
+    with duckdb.connect(":memory:") as con:
+        write_partitioned(
+            con,
+            "SELECT range AS BillID, 23 + range % 3 AS KnessetNum FROM range(9)",
+            tmp_path / "KNS_Bill",
+        )
+
+    output = tmp_path / "bills.csv"
+    result = runner.invoke(
+        app, ["read-parquet", "KNS_Bill", "--dir", str(tmp_path), "-k", "24", "-k", "25", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Wrote 6 rows" in result.output
+    assert set(pd.read_csv(output)["KnessetNum"]) == {24, 25}
+
+
+def test_read_parquet_missing_table(tmp_path):
+    """read-parquet exits with an error when the table has no mirror."""
+    result = runner.invoke(app, ["read-parquet", "KNS_Bill", "--dir", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "No Parquet data for 'KNS_Bill'" in result.output
@@ -439,7 +439,7 @@ def test_data_refresh_detects_streamlit_context(self, streamlit_context):
                         service = DataRefreshService(db_path=":memory:")
 
                         # Mock the async refresh_tables method
-                        async def mock_refresh_tables(tables, progress_callback):
+                        async def mock_refresh_tables(tables, progress_callback, incremental=False):
                             return True
 
                         with patch.object(service, "refresh_tables", mock_refresh_tables):
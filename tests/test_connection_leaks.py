@@ -18,7 +18,12 @@
     get_connection_stats,
     log_connection_leaks,
     _connection_monitor,
-    ConnectionMonitor
+    ConnectionMonitor,
+    ReadConnectionPool,
+    get_connection_pool,
+    invalidate_connection_pool,
+    exclusive_database_access,
+    connect_db,
 )
 
 
@@ -169,6 +174,199 @@ def test_get_connection_stats(self):
         assert stats['active_count'] == initial_count
 
 
+class TestReadConnectionPool:
+    """Test pooled read-only connections and the single-writer path."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        path = tmp_path / "pool.duckdb"
+        with duckdb.connect(str(path)) as conn:
+            conn.execute("CREATE TABLE test AS SELECT 1 AS id")
+        yield path
+        invalidate_connection_pool(path)
+
+    def test_readers_share_one_instance(self, db_path):
+        """Sequential and concurrent readers reuse a single opened instance."""
+        pool = get_connection_pool(db_path)
+        with patch('src.backend.connection_manager.duckdb.connect', wraps=duckdb.connect) as mock_connect:
+            def worker():
+                with get_db_connection(db_path) as conn:
+                    assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+
+            threads = [threading.Thread(target=worker) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            worker()
+
+        assert mock_connect.call_count == 1
+        assert pool.is_open
+        assert pool.active_count == 0
+
+    def test_checked_out_cursors_are_monitored(self, db_path):
+        """Each checked-out cursor is registered and unregistered with the monitor."""
+        monitor = ConnectionMonitor()
+        pool = ReadConnectionPool(db_path, monitor=monitor, idle_seconds=0)
+        try:
+            with pool.connection() as first, pool.connection() as second:
+                assert first is not second
+                assert len(monitor.get_active_connections()) == 2
+            assert monitor.get_active_connections() == {}
+        finally:
+            pool.invalidate()
+
+    def test_cursor_cap_blocks_extra_readers(self, db_path):
+        """No more than max_cursors readers hold a cursor at once."""
+        pool = ReadConnectionPool(db_path, max_cursors=2, idle_seconds=0)
+        peak = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def worker():
+            with pool.connection() as conn:
+                with lock:
+                    peak.append(pool.active_count)
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+                conn.execute("SELECT 1")
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.invalidate()
+
+        assert max(peak) <= 2
+
+    def test_writer_closes_pool_and_readers_see_writes(self, db_path):
+        """A read-write connection suspends the pool; readers reopen afterwards."""
+        pool = get_connection_pool(db_path)
+        with get_db_connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+        assert pool.is_open
+
+        with get_db_connection(db_path, read_only=False) as conn:
+            assert not pool.is_open
+            conn.execute("INSERT INTO test VALUES (2)")
+
+        with get_db_connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 2
+
+    def test_swapped_file_is_reopened(self, db_path, tmp_path):
+        """Replacing the database file on disk is picked up by the next reader."""
+        with get_db_connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+
+        replacement = tmp_path / "replacement.duckdb"
+        with duckdb.connect(str(replacement)) as conn:
+            conn.execute("CREATE TABLE test AS SELECT * FROM range(5) t(id)")
+        replacement.replace(db_path)
+
+        with get_db_connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 5
+
+    def test_exclusive_access_allows_raw_write_connection(self, db_path):
+        """Inside exclusive access the file can be opened read-write directly."""
+        with get_db_connection(db_path) as conn:
+            conn.execute("SELECT 1")
+
+        with exclusive_database_access(db_path):
+            with duckdb.connect(str(db_path), read_only=False) as conn:
+                conn.execute("INSERT INTO test VALUES (3)")
+
+        with get_db_connection(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 2
+
+    def test_exclusive_access_keeps_readers_out_until_it_ends(self, db_path):
+        """A reader arriving mid-write waits instead of reopening the file."""
+        pool = get_connection_pool(db_path)
+        seen = []
+
+        def reader():
+            with get_db_connection(db_path) as conn:
+                seen.append(conn.execute("SELECT COUNT(*) FROM test").fetchone()[0])
+
+        with exclusive_database_access(db_path):
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+            assert not pool.is_open
+            with duckdb.connect(str(db_path), read_only=False) as conn:
+                conn.execute("INSERT INTO test VALUES (4)")
+        thread.join(timeout=5)
+
+        assert seen == [2]
+
+    def test_pool_first_requested_mid_write_starts_suspended(self, db_path):
+        """A reader with no pool yet still waits for an in-flight write."""
+        seen = []
+
+        def reader():
+            with get_db_connection(db_path) as conn:
+                seen.append(conn.execute("SELECT COUNT(*) FROM test").fetchone()[0])
+
+        with exclusive_database_access(db_path):
+            assert get_connection_pool(db_path)._suspended == 1
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=0.2)
+            assert thread.is_alive()
+            with duckdb.connect(str(db_path), read_only=False) as conn:
+                conn.execute("INSERT INTO test VALUES (4)")
+        thread.join(timeout=5)
+
+        assert seen == [2]
+
+    def test_writer_on_a_thread_holding_a_cursor_fails_cleanly(self, db_path):
+        """The pool is not closed under the caller's own cursor."""
+        pool = get_connection_pool(db_path)
+        with get_db_connection(db_path) as reader:
+            with pytest.raises(RuntimeError, match="holds one of its cursors"):
+                with get_db_connection(db_path, read_only=False):
+                    pass
+            assert reader.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+        assert pool.is_open
+
+        # The writer lock was released; other writers are not blocked.
+        with get_db_connection(db_path, read_only=False) as conn:
+            conn.execute("INSERT INTO test VALUES (5)")
+
+    def test_legacy_write_connection_holds_the_file_until_closed(self, db_path):
+        """connect_db(read_only=False) keeps pooled readers suspended while open."""
+        pool = get_connection_pool(db_path)
+        with get_db_connection(db_path) as conn:
+            conn.execute("SELECT 1")
+
+        conn = connect_db(db_path, read_only=False, _logger_obj=Mock(), ui_notify=Mock())
+        try:
+            assert not pool.is_open
+            assert pool._suspended == 1
+            conn.execute("INSERT INTO test VALUES (6)")
+        finally:
+            conn.close()
+
+        assert pool._suspended == 0
+        with get_db_connection(db_path) as reader:
+            assert reader.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 2
+
+    def test_idle_pool_releases_instance(self, db_path):
+        """The shared instance is closed after the idle timeout."""
+        pool = ReadConnectionPool(db_path, idle_seconds=0.05)
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+        assert pool.is_open
+
+        deadline = time.time() + 5
+        while pool.is_open and time.time() < deadline:
+            time.sleep(0.02)
+        assert not pool.is_open
+
+
 class TestConnectionLeakDetection:
     """Test connection leak detection scenarios."""
     
@@ -10,6 +10,7 @@
 from typing import Dict, List, Optional, Any, Callable
 
 from src.data.services.data_refresh_service import DataRefreshService
+from src.data.services.refresh_scheduler import RefreshScheduler
 from src.data.services.resume_state_service import ResumeStateService
 from src.data.repositories.database_repository import DatabaseRepository
 from src.api.odata_client import ODataClient
@@ -57,6 +58,7 @@ async def test_refresh_single_table_with_resume_state(self):
             'last_pk': 100,
             'total_rows': 50,
             'chunk_size': 100,
+            'part_count': 1,
             'timestamp': '2024-01-01T00:00:00'
         }
 
@@ -67,14 +69,38 @@ async def test_refresh_single_table_with_resume_state(self):
 
         with patch.object(self.service.resume_service, 'get_table_state', return_value=resume_state), \
              patch.object(DatabaseConfig, 'is_cursor_table', return_value=True), \
+             patch.object(self.service.db_repository, 'list_staging_parts', return_value=[Path("part-000000.parquet")]), \
              patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=test_df) as mock_download, \
-             patch.object(self.service.db_repository, 'store_table', return_value=True):
+             patch.object(self.service.db_repository, 'load_staging_parts', return_value=True) as mock_load, \
+             patch.object(self.service.db_repository, 'store_table', return_value=True) as mock_store:
 
             result = await self.service.refresh_single_table("KNS_Person")
 
             assert result is True
             # Verify resume state was passed to download_table
             mock_download.assert_called_once_with("KNS_Person", resume_state)
+            # Resumed rows are appended to the checkpointed parts, not stored alone
+            mock_load.assert_called_once_with("KNS_Person")
+            mock_store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_state_without_staged_rows_is_discarded(self):
+        """A checkpoint whose staged parts are gone restarts from scratch."""
+        resume_state = {'last_pk': 100, 'total_rows': 50, 'part_count': 2}
+        test_df = pd.DataFrame({'PersonID': [1, 2]})
+
+        with patch.object(self.service.resume_service, 'get_table_state', return_value=resume_state), \
+             patch.object(self.service.resume_service, 'clear_table_state') as mock_clear, \
+             patch.object(self.service.db_repository, 'list_staging_parts', return_value=[]), \
+             patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=test_df) as mock_download, \
+             patch.object(self.service.db_repository, 'store_table', return_value=True) as mock_store:
+
+            result = await self.service.refresh_single_table("KNS_Person")
+
+            assert result is True
+            mock_download.assert_called_once_with("KNS_Person", {'last_pk': -1, 'total_rows': 0})
+            mock_store.assert_called_once_with(test_df, "KNS_Person")
+            mock_clear.assert_called_with("KNS_Person")
 
     @pytest.mark.asyncio
     async def test_refresh_single_table_download_failure(self):
@@ -203,6 +229,304 @@ def test_refresh_faction_status_failure(self):
             assert result is False
 
 
+class TestIncrementalRefresh:
+    """Test delta (LastUpdatedDate watermark) refresh mode."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.mock_logger = Mock()
+        self.service = DataRefreshService(Path("test.db"), self.mock_logger)
+
+    @pytest.mark.asyncio
+    async def test_incremental_downloads_since_watermark_and_upserts(self):
+        """Delta mode asks for rows past the watermark and merges by declared PK."""
+        delta_df = pd.DataFrame({'BillID': [7], 'Name': ['changed']})
+
+        with patch.object(self.service.db_repository, 'get_watermark', return_value='2024-05-01T00:00:00'), \
+             patch.object(self.service.db_repository, 'has_unique_key', return_value=True), \
+             patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=delta_df) as mock_download, \
+             patch.object(self.service.db_repository, 'upsert_table', return_value=True) as mock_upsert, \
+             patch.object(self.service.db_repository, 'store_table') as mock_store:
+
+            result = await self.service.refresh_single_table("KNS_Bill", incremental=True)
+
+            assert result is True
+            mock_download.assert_called_once_with("KNS_Bill", None, since='2024-05-01T00:00:00')
+            mock_upsert.assert_called_once_with(delta_df, "KNS_Bill", "BillID")
+            mock_store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incremental_falls_back_to_full_without_watermark(self):
+        """A table with no stored rows is loaded in full."""
+        full_df = pd.DataFrame({'BillID': [1, 2]})
+
+        with patch.object(self.service.db_repository, 'get_watermark', return_value=None), \
+             patch.object(self.service.resume_service, 'get_table_state', return_value={}), \
+             patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=full_df) as mock_download, \
+             patch.object(self.service.db_repository, 'store_table', return_value=True) as mock_store, \
+             patch.object(self.service.db_repository, 'upsert_table') as mock_upsert:
+
+            result = await self.service.refresh_single_table("KNS_Bill", incremental=True)
+
+            assert result is True
+            assert 'since' not in mock_download.call_args.kwargs
+            mock_store.assert_called_once_with(full_df, "KNS_Bill")
+            mock_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incremental_falls_back_to_full_when_key_is_not_unique(self):
+        """A declared key with duplicate stored values is never merged on."""
+        full_df = pd.DataFrame({'KnessetNum': [25, 25], 'Assembly': [1, 2]})
+
+        with patch.object(self.service.db_repository, 'get_watermark', return_value='2024-05-01T00:00:00'), \
+             patch.object(self.service.db_repository, 'has_unique_key', return_value=False) as mock_unique, \
+             patch.object(self.service.resume_service, 'get_table_state', return_value={}), \
+             patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=full_df) as mock_download, \
+             patch.object(self.service.db_repository, 'store_table', return_value=True) as mock_store, \
+             patch.object(self.service.db_repository, 'upsert_table') as mock_upsert:
+
+            result = await self.service.refresh_single_table("KNS_KnessetDates", incremental=True)
+
+            assert result is True
+            mock_unique.assert_called_once_with("KNS_KnessetDates", "KnessetNum")
+            assert 'since' not in mock_download.call_args.kwargs
+            mock_store.assert_called_once_with(full_df, "KNS_KnessetDates")
+            mock_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incremental_requires_declared_primary_key(self):
+        """Tables without a KnessetTables key are never merged."""
+        with patch.object(self.service.db_repository, 'get_watermark') as mock_watermark, \
+             patch.object(self.service.odata_client, 'download_table', new_callable=AsyncMock, return_value=pd.DataFrame()), \
+             patch.object(self.service.db_repository, 'upsert_table') as mock_upsert:
+
+            result = await self.service.refresh_single_table("KNS_PlmSessionItem", incremental=True)
+
+            assert result is True
+            mock_watermark.assert_not_called()
+            mock_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_tables_forwards_incremental(self):
+        """refresh_tables passes the delta flag to each table."""
+        with patch.object(self.service, 'refresh_single_table', new_callable=AsyncMock, return_value=True) as mock_refresh, \
+             patch.object(self.service.db_repository, 'load_faction_coalition_status', return_value=True):
+
+            result = await self.service.refresh_tables(["KNS_Bill"], incremental=True)
+
+            assert result is True
+            assert mock_refresh.call_args.kwargs == {'incremental': True}
+
+            await self.service.refresh_tables(["KNS_Bill"])
+            assert mock_refresh.call_args.kwargs == {'incremental': False}
+
+
+class TestRefreshScheduler:
+    """Test dependency-aware concurrent refresh scheduling."""
+
+    def test_plan_starts_large_tables_first_after_dependencies(self):
+        """Known-large tables lead, but never ahead of their dependencies."""
+        scheduler = RefreshScheduler(max_concurrent_tables=4)
+        tables = ["KNS_Status", "KNS_Bill", "KNS_Person", "KNS_CmtSessionItem", "KNS_Committee"]
+
+        order = scheduler.plan(tables)
+
+        assert order[0] == "KNS_CmtSessionItem"
+        assert order.index("KNS_Bill") > order.index("KNS_Person")
+        assert order.index("KNS_Bill") > order.index("KNS_Committee")
+        assert sorted(order) == sorted(tables)
+
+    def test_plan_uses_size_hints_for_other_tables(self):
+        """Tables outside LARGE_TABLES are ordered by stored size."""
+        scheduler = RefreshScheduler(max_concurrent_tables=2)
+
+        order = scheduler.plan(["KNS_Status", "KNS_Faction"], {"KNS_Faction": 500, "KNS_Status": 10})
+
+        assert order == ["KNS_Faction", "KNS_Status"]
+
+    @pytest.mark.asyncio
+    async def test_run_respects_concurrency_and_dependencies(self):
+        """No more than N tables run at once and dependents wait for their inputs."""
+        scheduler = RefreshScheduler(max_concurrent_tables=2)
+        in_flight = 0
+        peak = 0
+        finished: List[str] = []
+
+        async def fake_refresh(table_name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            finished.append(table_name)
+            return table_name != "KNS_Status"
+
+        results = await scheduler.run(
+            ["KNS_Bill", "KNS_Person", "KNS_Committee", "KNS_Status", "KNS_Faction"], fake_refresh
+        )
+
+        assert peak <= 2
+        assert finished.index("KNS_Bill") > finished.index("KNS_Person")
+        assert finished.index("KNS_Bill") > finished.index("KNS_Committee")
+        assert results["KNS_Status"] is False
+        assert results["KNS_Bill"] is True
+
+    @pytest.mark.asyncio
+    async def test_run_isolates_exceptions(self):
+        """A table that raises is recorded as failed without stopping the others."""
+        scheduler = RefreshScheduler(max_concurrent_tables=3)
+
+        async def fake_refresh(table_name):
+            if table_name == "KNS_Person":
+                raise RuntimeError("boom")
+            return True
+
+        results = await scheduler.run(["KNS_Person", "KNS_Bill", "KNS_Status"], fake_refresh)
+
+        assert results == {"KNS_Person": False, "KNS_Bill": True, "KNS_Status": True}
+
+    @pytest.mark.asyncio
+    async def test_service_serializes_writes_on_one_thread(self):
+        """Concurrent table downloads hand all storage to a single writer thread."""
+        import threading
+
+        service = DataRefreshService(Path("test.db"), Mock(), max_concurrent_tables=3)
+        writer_threads = set()
+
+        def record_store(df, table_name):
+            writer_threads.add(threading.get_ident())
+            return True
+
+        with patch.object(service.odata_client, 'download_table', new_callable=AsyncMock,
+                          return_value=pd.DataFrame({'ID': [1]})), \
+             patch.object(service.resume_service, 'get_table_state', return_value={}), \
+             patch.object(service.resume_service, 'clear_table_state'), \
+             patch.object(service.db_repository, 'store_table', side_effect=record_store) as mock_store, \
+             patch.object(service.db_repository, 'load_faction_coalition_status', return_value=True):
+
+            result = await service.refresh_tables(["KNS_Person", "KNS_Faction", "KNS_Status"])
+
+        assert result is True
+        assert mock_store.call_count == 3
+        assert len(writer_threads) == 1
+        assert threading.get_ident() not in writer_threads
+        assert service._writer is None
+
+
+class TestStreamingRefresh:
+    """Test streaming (page-to-staging) refresh mode end to end."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_pages_become_the_table(self, tmp_path):
+        """Pages are spooled in bounded batches and swapped in as one table."""
+        from config.settings import Settings
+
+        with patch.object(Settings, 'PARQUET_DIR', tmp_path / "parquet"), \
+             patch.object(Settings, 'STAGING_DIR', tmp_path / ".staging"), \
+             patch.object(Settings, 'RESUME_STATE_FILE', tmp_path / ".resume_state.json"), \
+             patch.object(Settings, 'STREAM_BATCH_ROWS', 2):
+            service = DataRefreshService(tmp_path / "warehouse.duckdb", Mock(), streaming=True)
+            staged_batches = []
+            original_write_part = service.db_repository.write_staging_part
+
+            def spy_write_part(df, table_name, part_index):
+                staged_batches.append(len(df))
+                return original_write_part(df, table_name, part_index)
+
+            async def fake_stream(table_name, on_page, resume_state=None, since=None):
+                for start in range(1, 6):
+                    await on_page(pd.DataFrame({'PersonID': [start], 'Name': [f'p{start}']}))
+                return 5
+
+            with patch.object(service.odata_client, 'stream_table', side_effect=fake_stream), \
+                 patch.object(service.db_repository, 'write_staging_part', side_effect=spy_write_part), \
+                 patch.object(service.resume_service, 'clear_table_state'), \
+                 patch.object(service.odata_client, 'download_table', new_callable=AsyncMock) as mock_download:
+
+                result = await service.refresh_single_table("KNS_Person")
+
+            assert result is True
+            mock_download.assert_not_called()
+            assert staged_batches == [2, 2, 1]
+            assert service.db_repository.get_table_count("KNS_Person") == 5
+            assert not (tmp_path / ".staging" / "KNS_Person").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_discards_staging(self, tmp_path):
+        """A download error leaves no staged parts and no table."""
+        from config.settings import Settings
+
+        with patch.object(Settings, 'PARQUET_DIR', tmp_path / "parquet"), \
+             patch.object(Settings, 'STAGING_DIR', tmp_path / ".staging"), \
+             patch.object(Settings, 'STREAM_BATCH_ROWS', 1):
+            service = DataRefreshService(tmp_path / "warehouse.duckdb", Mock(), streaming=True)
+
+            async def failing_stream(table_name, on_page, resume_state=None, since=None):
+                await on_page(pd.DataFrame({'StatusID': [1]}))
+                raise ConnectionError("dropped")
+
+            with patch.object(service.odata_client, 'stream_table', side_effect=failing_stream):
+                result = await service.refresh_single_table("KNS_Status")
+
+            assert result is False
+            assert not (tmp_path / ".staging" / "KNS_Status").exists()
+            assert not service.db_repository.table_exists("KNS_Status")
+
+
+class _SimulatedCrash(BaseException):
+    """Stands in for the process dying mid-download."""
+
+
+class TestCursorCheckpointResume:
+    """Test mid-table checkpointing of cursor-paged downloads."""
+
+    ROWS = [{'PersonID': i, 'Name': f'p{i}'} for i in range(1, 8)]
+
+    def _fake_fetch(self, urls, crash_on_call=None):
+        async def fetch_json(session, url):
+            urls.append(url)
+            if crash_on_call is not None and len(urls) == crash_on_call:
+                raise _SimulatedCrash()
+            last_pk = int(url.split("PersonID%20gt%20")[1].split("&")[0])
+            return {'value': [r for r in self.ROWS if r['PersonID'] > last_pk][:2]}
+        return fetch_json
+
+    @pytest.mark.asyncio
+    @pytest.mark.no_autouse_stub
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_resume_appends_to_checkpointed_rows(self, tmp_path, streaming):
+        """An interrupted download resumes past its checkpoint and ends with the full table."""
+        from config.settings import Settings
+
+        with patch.object(Settings, 'PARQUET_DIR', tmp_path / "parquet"), \
+             patch.object(Settings, 'STAGING_DIR', tmp_path / ".staging"), \
+             patch.object(Settings, 'RESUME_STATE_FILE', tmp_path / ".resume_state.json"), \
+             patch.object(Settings, 'STREAM_BATCH_ROWS', 2), \
+             patch.object(DatabaseConfig, 'get_cursor_config', return_value=('PersonID', 2)):
+            db_path = tmp_path / "warehouse.duckdb"
+
+            first_urls: List[str] = []
+            crashed = DataRefreshService(db_path, Mock(), streaming=streaming)
+            with patch.object(crashed.odata_client, 'fetch_json', side_effect=self._fake_fetch(first_urls, crash_on_call=3)):
+                with pytest.raises(_SimulatedCrash):
+                    await crashed.refresh_single_table("KNS_Person")
+
+            state = json.loads((tmp_path / ".resume_state.json").read_text())["KNS_Person"]
+            assert (state["last_pk"], state["total_rows"], state["part_count"]) == (4, 4, 2)
+            assert not crashed.db_repository.table_exists("KNS_Person")
+
+            resumed_urls: List[str] = []
+            service = DataRefreshService(db_path, Mock(), streaming=streaming)
+            with patch.object(service.odata_client, 'fetch_json', side_effect=self._fake_fetch(resumed_urls)):
+                assert await service.refresh_single_table("KNS_Person") is True
+
+            assert "PersonID%20gt%204" in resumed_urls[0]
+            stored = service.db_repository.execute_query('SELECT PersonID, Name FROM "KNS_Person" ORDER BY PersonID')
+            assert stored.to_dict("records") == self.ROWS
+            assert service.resume_service.get_table_state("KNS_Person") == {}
+            assert not (tmp_path / ".staging" / "KNS_Person").exists()
+
+
 class TestResumeStateService:
     """Test ResumeStateService functionality."""
 
@@ -409,6 +733,7 @@ async def test_data_refresh_with_resume_state_integration(self):
             'last_pk': 50,
             'total_rows': 25,
             'chunk_size': 100,
+            'part_count': 1,
             'timestamp': '2024-01-01T00:00:00'
         }
 
@@ -420,8 +745,9 @@ async def test_data_refresh_with_resume_state_integration(self):
 
         with patch.object(self.data_service.resume_service, 'get_table_state', return_value=resume_state), \
              patch.object(DatabaseConfig, 'is_cursor_table', return_value=True), \
+             patch.object(self.data_service.db_repository, 'list_staging_parts', return_value=[Path("part-000000.parquet")]), \
              patch.object(self.data_service.odata_client, 'download_table', new_callable=AsyncMock, return_value=test_df) as mock_download, \
-             patch.object(self.data_service.db_repository, 'store_table', return_value=True), \
+             patch.object(self.data_service.db_repository, 'load_staging_parts', return_value=True), \
              patch.object(self.data_service.resume_service, 'clear_table_state') as mock_clear:
 
             result = await self.data_service.refresh_single_table("KNS_Person")
@@ -435,10 +761,12 @@ async def test_data_refresh_with_resume_state_integration(self):
     @pytest.mark.asyncio
     async def test_error_handling_preserves_resume_state(self):
         """Test that resume state is preserved when operations fail."""
-        resume_state = {'last_pk': 50, 'total_rows': 25, 'chunk_size': 100}
+        resume_state = {'last_pk': 50, 'total_rows': 25, 'chunk_size': 100, 'part_count': 1}
 
         with patch.object(self.data_service.resume_service, 'get_table_state', return_value=resume_state), \
              patch.object(DatabaseConfig, 'is_cursor_table', return_value=True), \
+             patch.object(self.data_service.db_repository, 'list_staging_parts', return_value=[Path("part-000000.parquet")]), \
+             patch.object(self.data_service.db_repository, 'clear_staging') as mock_clear_staging, \
              patch.object(self.data_service.odata_client, 'download_table', new_callable=AsyncMock, side_effect=Exception("Network error")), \
              patch.object(self.data_service.resume_service, 'clear_table_state') as mock_clear:
 
@@ -447,6 +775,7 @@ async def test_error_handling_preserves_resume_state(self):
             assert result is False
             # Resume state should NOT be cleared on failure
             mock_clear.assert_not_called()
+            mock_clear_staging.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_repository_integration(self):
@@ -476,7 +805,7 @@ def mock_progress_callback(message, progress=None):
 
         tables = ["KNS_Person", "KNS_Faction"]
 
-        async def mock_refresh_single_table(table_name, callback=None):
+        async def mock_refresh_single_table(table_name, callback=None, incremental=False):
             # Simulate progress updates
             if callback:
                 callback(table_name, 100)
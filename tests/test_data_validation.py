@@ -342,9 +342,8 @@ def generate(self, **kwargs):
         mock_logger = MagicMock()
         chart = TestChart(db_path, mock_logger)
 
-        # Test with a connection that has the existing_table but we ask for missing_table
-        with duckdb.connect(str(db_path)) as con:
-            result = chart.check_tables_exist(con, ['missing_table'])
+        # The database has existing_table but we ask for missing_table
+        result = chart.check_tables_exist(['missing_table'])
 
         assert result is False
         mock_warning.assert_called_once()
@@ -478,3 +478,185 @@ def test_execute_query_handles_exception(self):
 
             assert result is None
             mock_logger.error.assert_called()
+
+
+class TestDatabaseRepositoryUpsert:
+    """Test primary-key merge and watermark helpers against a real DuckDB file."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from config.settings import Settings
+
+        with patch.object(Settings, 'PARQUET_DIR', tmp_path / "parquet"), \
+             patch.object(Settings, 'STAGING_DIR', tmp_path / ".staging"):
+            repo = DatabaseRepository(tmp_path / "warehouse.duckdb", Mock())
+            yield repo
+
+    def _seed(self, repo):
+        base_df = pd.DataFrame({
+            'BillID': [1, 2, 3],
+            'Name': ['a', 'b', 'c'],
+            'LastUpdatedDate': ['2024-01-01T10:00:00', '2024-02-01T09:30:15.5', '2023-12-31T00:00:00'],
+        })
+        assert repo.store_table(base_df, 'KNS_Bill')
+
+    def test_upsert_replaces_existing_and_inserts_new_keys(self, repo):
+        self._seed(repo)
+        delta_df = pd.DataFrame({
+            'BillID': [2, 4],
+            'Name': ['b-updated', 'd'],
+            'LastUpdatedDate': ['2024-03-01T00:00:00', '2024-03-02T00:00:00'],
+        })
+
+        assert repo.upsert_table(delta_df, 'KNS_Bill', 'BillID') is True
+
+        with duckdb.connect(str(repo.db_path), read_only=True) as con:
+            rows = con.execute('SELECT BillID, Name FROM KNS_Bill ORDER BY BillID').fetchall()
+        assert rows == [(1, 'a'), (2, 'b-updated'), (3, 'c'), (4, 'd')]
+
+        parquet_df = pd.read_parquet(repo.db_path.parent / "parquet" / "KNS_Bill.parquet")
+        assert sorted(parquet_df['BillID'].tolist()) == [1, 2, 3, 4]
+
+    def test_upsert_rolls_back_on_schema_mismatch(self, repo):
+        self._seed(repo)
+        bad_df = pd.DataFrame({'BillID': [1], 'UnknownColumn': ['x']})
+
+        assert repo.upsert_dataframe(bad_df, 'KNS_Bill', 'BillID') is False
+
+        with duckdb.connect(str(repo.db_path), read_only=True) as con:
+            count = con.execute('SELECT COUNT(*) FROM KNS_Bill').fetchone()[0]
+        assert count == 3
+
+    def test_get_watermark_truncates_to_seconds(self, repo):
+        self._seed(repo)
+
+        assert repo.get_watermark('KNS_Bill', 'LastUpdatedDate') == '2024-02-01T09:30:15'
+
+    def test_get_watermark_missing_table_or_column(self, repo):
+        assert repo.get_watermark('KNS_Bill', 'LastUpdatedDate') is None
+        self._seed(repo)
+        assert repo.get_watermark('KNS_Bill', 'NoSuchColumn') is None
+
+    def test_has_unique_key(self, repo):
+        repo.store_dataframe(
+            pd.DataFrame({'KnessetDateID': [1, 2, 3], 'KnessetNum': [25, 25, None]}),
+            'KNS_KnessetDates',
+        )
+
+        assert repo.has_unique_key('KNS_KnessetDates', 'KnessetDateID') is True
+        assert repo.has_unique_key('KNS_KnessetDates', 'KnessetNum') is False
+        assert repo.has_unique_key('KNS_KnessetDates', 'NoSuchColumn') is False
+        assert repo.has_unique_key('KNS_Missing', 'KnessetNum') is False
+
+    def test_staged_parts_load_with_widened_types(self, repo):
+        """A column that is all-NULL in the first part takes its type from later parts."""
+        first = pd.DataFrame.from_records([{'BillID': 1, 'Name': None}])
+        second = pd.DataFrame.from_records([{'BillID': 2, 'Name': 'late value', 'Extra': 5}])
+
+        assert repo.write_staging_part(first, 'KNS_Bill', 0)
+        assert repo.write_staging_part(second, 'KNS_Bill', 1)
+        assert repo.load_staging_parts('KNS_Bill') is True
+
+        with duckdb.connect(str(repo.db_path), read_only=True) as con:
+            rows = con.execute('SELECT BillID, Name, Extra FROM KNS_Bill ORDER BY BillID').fetchall()
+            name_type = con.execute(
+                "SELECT data_type FROM duckdb_columns() WHERE table_name = 'KNS_Bill' AND column_name = 'Name'"
+            ).fetchone()[0]
+        assert rows == [(1, None, None), (2, 'late value', 5)]
+        assert name_type == 'VARCHAR'
+        assert repo.list_staging_parts('KNS_Bill') == []
+        assert (repo.db_path.parent / "parquet" / "KNS_Bill.parquet").exists()
+
+    def test_failed_staged_load_keeps_previous_table(self, repo):
+        """The old table survives if the swap fails."""
+        self._seed(repo)
+        assert repo.write_staging_part(pd.DataFrame({'BillID': [9]}), 'KNS_Bill', 0)
+
+        with patch.object(repo, 'list_staging_parts', return_value=[repo.get_staging_dir('KNS_Bill') / 'missing.parquet']):
+            assert repo.load_staging_parts('KNS_Bill') is False
+
+        with duckdb.connect(str(repo.db_path), read_only=True) as con:
+            assert con.execute('SELECT COUNT(*) FROM KNS_Bill').fetchone()[0] == 3
+
+
+class TestPartitionedParquetMirror:
+    """Knesset-scoped tables mirrored as ``<table>/KnessetNum=NN/part-*.parquet``."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from config.settings import Settings
+
+        with patch.object(Settings, 'PARQUET_DIR', tmp_path / "parquet"), \
+             patch.object(Settings, 'STAGING_DIR', tmp_path / ".staging"), \
+             patch.object(Settings, 'ENABLE_PARTITIONED_PARQUET', True):
+            yield DatabaseRepository(tmp_path / "warehouse.duckdb", Mock())
+
+    def _bills(self):
+        return pd.DataFrame({
+            'BillID': [1, 2, 3, 4],
+            'KnessetNum': [24.0, 25.0, 25.0, None],
+            'Name': ['a', 'b', 'c', 'd'],
+        })
+
+    def test_store_table_writes_one_directory_per_knesset(self, repo):
+        from backend.partitioned_parquet import list_partitions
+
+        assert repo.store_table(self._bills(), 'KNS_Bill') is True
+
+        table_dir = repo.db_path.parent / "parquet" / "KNS_Bill"
+        assert list(list_partitions(table_dir)) == [
+            'KnessetNum=24', 'KnessetNum=25', 'KnessetNum=__HIVE_DEFAULT_PARTITION__',
+        ]
+        assert not (repo.db_path.parent / "parquet" / "KNS_Bill.parquet").exists()
+        assert not (repo.db_path.parent / "parquet" / "KNS_Bill.new").exists()
+
+    def test_upsert_rewrites_partitions_and_read_prunes(self, repo):
+        from backend.partitioned_parquet import read_parquet_table
+
+        assert repo.store_table(self._bills(), 'KNS_Bill')
+        delta_df = pd.DataFrame({'BillID': [2, 5], 'KnessetNum': [25.0, 25.0], 'Name': ['b2', 'e']})
+        assert repo.upsert_table(delta_df, 'KNS_Bill', 'BillID') is True
+
+        table_dir = repo.db_path.parent / "parquet" / "KNS_Bill"
+        df = read_parquet_table(table_dir, knesset_nums=[25])
+        assert sorted(df['BillID'].tolist()) == [2, 3, 5]
+        assert set(df['KnessetNum']) == {25}
+
+        with duckdb.connect(":memory:") as con:
+            plan = con.execute(
+                f"EXPLAIN ANALYZE SELECT * FROM read_parquet('{table_dir.as_posix()}/*/*.parquet', "
+                "hive_partitioning = true) WHERE KnessetNum IN (25)"
+            ).fetchall()[0][1]
+        assert "Scanning Files: 1/3" in plan
+
+    def test_empty_result_reads_back_as_empty_frame(self, tmp_path):
+        from backend.partitioned_parquet import read_parquet_table, write_partitioned
+
+        table_dir = tmp_path / "parquet" / "KNS_Bill"
+        with duckdb.connect(":memory:") as con:
+            rows = write_partitioned(
+                con, "SELECT 1 AS BillID, 25 AS KnessetNum WHERE FALSE", table_dir
+            )
+
+        assert rows == 0
+        assert table_dir.is_dir()
+        assert read_parquet_table(table_dir).empty
+        assert read_parquet_table(table_dir, knesset_nums=[25]).empty
+
+    def test_unlisted_table_keeps_single_file(self, repo):
+        assert repo.store_table(pd.DataFrame({'PersonID': [1], 'KnessetNum': [25]}), 'KNS_Person')
+
+        parquet_dir = repo.db_path.parent / "parquet"
+        assert (parquet_dir / "KNS_Person.parquet").exists()
+        assert not (parquet_dir / "KNS_Person").exists()
+
+    def test_disabling_partitioning_removes_partition_tree(self, repo):
+        from config.settings import Settings
+
+        assert repo.store_table(self._bills(), 'KNS_Bill')
+        with patch.object(Settings, 'ENABLE_PARTITIONED_PARQUET', False):
+            assert repo.export_table_to_parquet('KNS_Bill') is True
+
+        parquet_dir = repo.db_path.parent / "parquet"
+        assert (parquet_dir / "KNS_Bill.parquet").exists()
+        assert not (parquet_dir / "KNS_Bill").exists()
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import duckdb
 import pandas as pd
@@ -41,12 +41,15 @@ def test_export_full_dataset_csv_uses_duckdb_copy_not_dataframe_fetch(tmp_path:
         "fetch_full_dataset",
         side_effect=AssertionError("CSV export must not materialize a DataFrame"),
     ):
-        csv_data, row_count = exporter.export_full_dataset_csv_bytes(
+        path, row_count = exporter.export_full_dataset_to_file(
             "SELECT BillID FROM bills ORDER BY BillID LIMIT 1"
         )
 
-    assert row_count == 3
-    assert csv_data.decode("utf-8-sig").splitlines() == ["BillID", "0", "1", "2"]
+    try:
+        assert row_count == 3
+        assert path.read_text(encoding="utf-8-sig").splitlines() == ["BillID", "0", "1", "2"]
+    finally:
+        path.unlink(missing_ok=True)
 
 
 def test_export_full_dataset_csv_handles_query_with_trailing_semicolon(
@@ -58,12 +61,15 @@ def test_export_full_dataset_csv_handles_query_with_trailing_semicolon(
 
     exporter = _exporter(db_path)
 
-    csv_data, row_count = exporter.export_full_dataset_csv_bytes(
+    path, row_count = exporter.export_full_dataset_to_file(
         "SELECT BillID FROM bills ORDER BY BillID LIMIT 1;"
     )
 
-    assert row_count == 2
-    assert csv_data.decode("utf-8-sig").splitlines() == ["BillID", "0", "1"]
+    try:
+        assert row_count == 2
+        assert path.read_text(encoding="utf-8-sig").splitlines() == ["BillID", "0", "1"]
+    finally:
+        path.unlink(missing_ok=True)
 
 
 def test_excel_export_keeps_dataframe_path_for_hyperlink_workflow(tmp_path: Path) -> None:
@@ -75,3 +81,84 @@ def test_excel_export_keeps_dataframe_path_for_hyperlink_workflow(tmp_path: Path
         result = exporter.fetch_full_dataset("SELECT 1 AS BillID")
 
     assert result is expected_df
+
+
+def test_export_runs_the_query_once_and_counts_from_copy(tmp_path: Path) -> None:
+    db_path = tmp_path / "warehouse.duckdb"
+    with duckdb.connect(db_path.as_posix()) as con:
+        con.execute("CREATE TABLE bills AS SELECT range AS BillID FROM range(5)")
+
+    exporter = _exporter(db_path)
+
+    with patch.object(
+        DatasetExporter,
+        "get_full_dataset_row_count",
+        side_effect=AssertionError("export must not run a separate COUNT query"),
+    ):
+        path, row_count = exporter.export_full_dataset_to_file(
+            "SELECT BillID FROM bills WHERE BillID >= ? ORDER BY BillID LIMIT 1", "parquet", [2]
+        )
+
+    try:
+        assert row_count == 3
+        assert pd.read_parquet(path)["BillID"].tolist() == [2, 3, 4]
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_xlsx_export_streams_batches_into_write_only_workbook(tmp_path: Path) -> None:
+    from openpyxl import load_workbook
+
+    db_path = tmp_path / "warehouse.duckdb"
+    with duckdb.connect(db_path.as_posix()) as con:
+        con.execute(
+            "CREATE TABLE bills AS SELECT range AS BillID, 'חוק ' || range AS Name FROM range(3)"
+        )
+
+    exporter = _exporter(db_path)
+    path, row_count = exporter.export_full_dataset_to_file(
+        "SELECT BillID, Name FROM bills ORDER BY BillID", "xlsx"
+    )
+
+    try:
+        rows = list(load_workbook(path, read_only=True)["Results"].values)
+        assert row_count == 3
+        assert rows == [("BillID", "Name"), (0, "חוק 0"), (1, "חוק 1"), (2, "חוק 2")]
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_xlsx_export_keeps_url_columns_as_plain_values(tmp_path: Path) -> None:
+    from openpyxl import load_workbook
+
+    db_path = tmp_path / "warehouse.duckdb"
+    with duckdb.connect(db_path.as_posix()) as con:
+        con.execute("CREATE TABLE docs AS SELECT 1 AS BillID, 'https://example.org/a.pdf' AS DocumentURL")
+
+    exporter = _exporter(db_path)
+    path, _ = exporter.export_full_dataset_to_file("SELECT BillID, DocumentURL FROM docs", "xlsx")
+
+    try:
+        rows = list(load_workbook(path, read_only=True)["Results"].values)
+        assert rows == [("BillID", "DocumentURL"), (1, "https://example.org/a.pdf")]
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_render_runs_no_query_until_a_download_is_requested(tmp_path: Path) -> None:
+    exporter = _exporter(tmp_path / "warehouse.duckdb")
+
+    with (
+        patch("ui.renderers.data_refresh.dataset_exporter.st") as st,
+        patch.object(
+            DatasetExporter,
+            "get_full_dataset_row_count",
+            side_effect=AssertionError("rendering must not count rows"),
+        ),
+        patch.object(DatasetExporter, "export_full_dataset_to_file") as export,
+    ):
+        st.columns.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        st.button.return_value = False
+        exporter.render_full_dataset_download("SELECT 1 AS BillID", "bills")
+
+    export.assert_not_called()
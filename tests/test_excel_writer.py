@@ -0,0 +1,42 @@
+"""
+Tests for the write-only hyperlink Excel writer.
+"""
+import pandas as pd
+from openpyxl import load_workbook
+
+from utils.excel_writer import HyperlinkExcelWriter
+
+
+def test_url_columns_become_hyperlink_formulas_with_one_shared_style():
+    df = pd.DataFrame(
+        {
+            "BillID": [1, 2, 3],
+            "BillPrimaryDocumentURL": ["https://fs.knesset.gov.il/a.pdf", None, 'https://x/"q".pdf'],
+            "BillName": ["חוק א", "חוק ב", None],
+        }
+    )
+
+    sheet = load_workbook(HyperlinkExcelWriter().to_buffer(df))["Results"]
+    rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+
+    assert rows[0] == ["BillID", "BillPrimaryDocumentURL", "BillName"]
+    assert rows[1] == [1, '=HYPERLINK("https://fs.knesset.gov.il/a.pdf","Open Link")', "חוק א"]
+    assert rows[2] == [2, None, "חוק ב"]
+    assert rows[3] == [3, '=HYPERLINK("https://x/""q"".pdf","Open Link")', None]
+    assert sheet["B2"].font.color.rgb.endswith("0563C1")
+    assert sheet["B2"].style_id == sheet["B4"].style_id
+
+
+def test_overlong_urls_and_tz_aware_dates_are_written_plainly():
+    long_url = "https://fs.knesset.gov.il/" + "a" * 300
+    df = pd.DataFrame(
+        {
+            "DocumentLinks": [long_url],
+            "LastUpdatedDate": [pd.Timestamp("2024-05-01 10:00", tz="Asia/Jerusalem")],
+        }
+    )
+
+    sheet = load_workbook(HyperlinkExcelWriter().to_buffer(df))["Results"]
+
+    assert sheet["A2"].value == long_url
+    assert sheet["B2"].value == pd.Timestamp("2024-05-01 10:00").to_pydatetime()
@@ -16,6 +16,7 @@
 import aiohttp
 from pathlib import Path
 
+from src.api.adaptive_paging import AdaptivePageSize
 from src.api.odata_client import ODataClient
 from src.config.api import APIConfig
 from src.config.database import DatabaseConfig
@@ -237,6 +238,263 @@ async def test_cursor_pagination_error_retry(self, client):
             assert len(result) == 1
 
 
+class TestDeltaDownloads:
+    """Test LastUpdatedDate watermark filters for delta refreshes."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a fresh client for each test."""
+        return ODataClient(logger_obj=Mock())
+
+    @pytest.mark.asyncio
+    async def test_cursor_delta_combines_pk_and_watermark_filters(self, client):
+        """Cursor paging keeps its PK predicate and ANDs the watermark."""
+        with patch.object(DatabaseConfig, 'get_cursor_config', return_value=('BillID', 100)), \
+             patch.object(client, 'fetch_json', new_callable=AsyncMock) as mock_fetch:
+
+            mock_fetch.side_effect = [{'value': [{'BillID': 5}]}, {'value': []}]
+
+            async with aiohttp.ClientSession() as session:
+                result = await client._download_cursor_table(
+                    session, 'KNS_Bill', 'KNS_Bill()', since='2024-05-01T00:00:00'
+                )
+
+            url = mock_fetch.call_args_list[0][0][1]
+            assert "$filter=BillID%20gt%20-1%20and%20LastUpdatedDate%20gt%20datetime'2024-05-01T00:00:00'" in url
+            assert len(result) == 1
+
+    @pytest.mark.asyncio
+    async def test_skip_delta_filters_count_and_pages(self, client):
+        """Skip paging counts and pages only the changed rows."""
+        count_urls = []
+
+        async def mock_count_response(url, *args, **kwargs):
+            count_urls.append(url)
+            resp = AsyncMock()
+            resp.text.return_value = '1'
+            resp.raise_for_status = Mock()
+            return resp
+
+        with patch.object(client, 'fetch_json', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = {'value': [{'StatusID': 1}]}
+
+            async with aiohttp.ClientSession() as session:
+                with patch.object(session, 'get', side_effect=mock_count_response):
+                    await client._download_skip_table(
+                        session, 'KNS_Status', 'KNS_Status()', since='2024-05-01T00:00:00'
+                    )
+
+        assert count_urls[0].endswith("/$count?$filter=LastUpdatedDate%20gt%20datetime'2024-05-01T00:00:00'")
+        page_url = mock_fetch.call_args_list[0][0][1]
+        assert "&$filter=LastUpdatedDate%20gt%20datetime'2024-05-01T00:00:00'" in page_url
+
+
+class TestStreamingDownloads:
+    """Test page-handler (streaming) mode."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a fresh client for each test."""
+        return ODataClient(logger_obj=Mock())
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_are_handed_off_not_accumulated(self, client):
+        """Each cursor page reaches the handler and nothing is returned."""
+        pages = []
+
+        async def on_page(df):
+            pages.append(df)
+
+        with patch.object(DatabaseConfig, 'get_cursor_config', return_value=('PersonID', 2)), \
+             patch.object(client, 'fetch_json', new_callable=AsyncMock) as mock_fetch:
+
+            mock_fetch.side_effect = [
+                {'value': [{'PersonID': 1}, {'PersonID': 2}]},
+                {'value': [{'PersonID': 3}]},
+                {'value': []},
+            ]
+
+            async with aiohttp.ClientSession() as session:
+                result = await client._download_cursor_table(
+                    session, 'KNS_Person', 'KNS_Person()', on_page=on_page
+                )
+
+        assert result.empty
+        assert [len(p) for p in pages] == [2, 1]
+        assert "gt%202" in mock_fetch.call_args_list[1][0][1]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_handler_sees_in_memory_pages(self, client):
+        """In-memory cursor downloads still return every row and offer each page for checkpointing."""
+        seen = []
+
+        async def checkpoint(table, df):
+            seen.append((table, df['PersonID'].tolist()))
+
+        client.set_checkpoint_handler(checkpoint)
+        with patch.object(DatabaseConfig, 'get_cursor_config', return_value=('PersonID', 2)), \
+             patch.object(client, 'fetch_json', new_callable=AsyncMock) as mock_fetch:
+
+            mock_fetch.side_effect = [
+                {'value': [{'PersonID': 1}, {'PersonID': 2}]},
+                {'value': [{'PersonID': 3}]},
+                {'value': []},
+            ]
+
+            async with aiohttp.ClientSession() as session:
+                result = await client._download_cursor_table(session, 'KNS_Person', 'KNS_Person()')
+
+        assert result['PersonID'].tolist() == [1, 2, 3]
+        assert seen == [('KNS_Person', [1, 2]), ('KNS_Person', [3])]
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_request_overlaps_page_handling(self, client):
+        """The next page is requested before the current one has been handled."""
+        second_request_sent = asyncio.Event()
+        calls = []
+
+        async def fetch(session, url):
+            calls.append(url)
+            if len(calls) == 2:
+                second_request_sent.set()
+            return [{'value': [{'PersonID': 1}, {'PersonID': 2}]}, {'value': [{'PersonID': 3}]}, {'value': []}][len(calls) - 1]
+
+        handled = []
+
+        async def on_page(df):
+            if not handled:
+                # Would deadlock if requests waited for page handling
+                await asyncio.wait_for(second_request_sent.wait(), timeout=2)
+            handled.append(df['PersonID'].tolist())
+
+        with patch.object(client, 'fetch_json', side_effect=fetch):
+            async with aiohttp.ClientSession() as session:
+                await client._download_cursor_table(session, 'KNS_Person', 'KNS_Person()', on_page=on_page)
+
+        assert handled == [[1, 2], [3]]
+        assert "PersonID%20gt%202" in calls[1]
+
+    @pytest.mark.asyncio
+    async def test_stream_table_counts_rows(self, client):
+        """stream_table returns the number of rows delivered."""
+        async def on_page(df):
+            pass
+
+        async def fake_cursor(session, table, entity, resume_state=None, since=None, on_page=None):
+            await on_page(pd.DataFrame({'PersonID': [1, 2, 3]}))
+            return pd.DataFrame()
+
+        with patch.object(DatabaseConfig, 'is_cursor_table', return_value=True), \
+             patch.object(client, '_download_cursor_table', side_effect=fake_cursor):
+            rows = await client.stream_table('KNS_Person', on_page)
+
+        assert rows == 3
+
+    @pytest.mark.asyncio
+    async def test_skip_handler_failure_propagates(self, client):
+        """A sink error aborts the download instead of being logged as a lost page."""
+        async def mock_count_response(*args, **kwargs):
+            resp = AsyncMock()
+            resp.text.return_value = '1'
+            resp.raise_for_status = Mock()
+            return resp
+
+        async def failing_sink(df):
+            raise OSError("disk full")
+
+        with patch.object(client, 'fetch_json', new_callable=AsyncMock, return_value={'value': [{'StatusID': 1}]}):
+            async with aiohttp.ClientSession() as session:
+                with patch.object(session, 'get', side_effect=mock_count_response):
+                    with pytest.raises(OSError, match="disk full"):
+                        await client._download_skip_table(
+                            session, 'KNS_Status', 'KNS_Status()', on_page=failing_sink
+                        )
+
+
+class TestAdaptivePaging:
+    """Test adaptive $top sizing and $select projection."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a fresh client for each test."""
+        return ODataClient(logger_obj=Mock())
+
+    def test_page_size_grows_when_fast_and_shrinks_on_failure(self):
+        """Fast streaks double the size up to the ceiling; failures halve it."""
+        sizer = AdaptivePageSize(initial=100, minimum=50, maximum=400, target_latency=1.0, grow_after=2)
+
+        for _ in range(2):
+            sizer.record_success(0.1)
+        assert sizer.current == 200
+        for _ in range(10):
+            sizer.record_success(0.1)
+        assert sizer.current == 400
+
+        sizer.record_failure()
+        assert sizer.current == 200
+        sizer.record_success(5.0)
+        assert sizer.current == 100
+        for _ in range(5):
+            sizer.record_failure()
+        assert sizer.current == 50
+
+    def test_page_size_respects_server_cap(self):
+        """A short full page lowers the ceiling to what the server serves."""
+        sizer = AdaptivePageSize(initial=400, minimum=50, maximum=1000)
+        sizer.cap(100)
+        assert sizer.current == 100
+        sizer.record_success(0.0)
+        sizer.record_success(0.0)
+        sizer.record_success(0.0)
+        assert sizer.current == 100
+
+    @pytest.mark.asyncio
+    async def test_cursor_requests_grow_and_project_columns(self, client):
+        """Cursor $top grows on fast pages and declared columns are selected."""
+        rows = [{'CmtSessionItemID': i, 'ItemID': i} for i in range(1, 8)]
+
+        async def fetch(session, url):
+            last_pk = int(url.split("gt%20")[1].split("&")[0])
+            top = int(url.split("$top=")[1].split("&")[0])
+            return {'value': [r for r in rows if r['CmtSessionItemID'] > last_pk][:top]}
+
+        # Patch the class the client module resolved (imported as config.database)
+        with patch('config.database.DatabaseConfig.get_cursor_config', return_value=('CmtSessionItemID', 1)), \
+             patch.object(APIConfig, 'PAGE_GROW_AFTER', 1), \
+             patch.object(client, 'fetch_json', side_effect=fetch) as mock_fetch:
+            async with aiohttp.ClientSession() as session:
+                result = await client._download_cursor_table(session, 'KNS_CmtSessionItem', 'KNS_CmtSessionItem()')
+
+        urls = [c[0][1] for c in mock_fetch.call_args_list]
+        assert result['CmtSessionItemID'].tolist() == list(range(1, 8))
+        assert ["$top=1", "$top=2", "$top=4"] == ["$top=" + u.split("$top=")[1].split("&")[0] for u in urls[:3]]
+        assert all("&$select=CmtSessionItemID,ItemID,CommitteeSessionID" in u for u in urls)
+
+    @pytest.mark.asyncio
+    async def test_skip_refetches_rows_a_server_cap_left_out(self, client):
+        """If the server serves fewer rows than $top, the gap is fetched again."""
+        rows = [{'StatusID': i} for i in range(250)]
+
+        async def mock_count_response(*args, **kwargs):
+            resp = AsyncMock()
+            resp.text.return_value = '250'
+            resp.raise_for_status = Mock()
+            return resp
+
+        async def capped_fetch(session, url):
+            skip = int(url.split("$skip=")[1].split("&")[0])
+            top = int(url.split("$top=")[1].split("&")[0])
+            return {'value': rows[skip:skip + min(top, 60)]}
+
+        with patch.object(client, 'fetch_json', side_effect=capped_fetch), \
+             patch.object(client.config, 'PAGE_SIZE', 100):
+            async with aiohttp.ClientSession() as session:
+                with patch.object(session, 'get', side_effect=mock_count_response):
+                    result = await client._download_skip_table(session, 'KNS_Status', 'KNS_Status()')
+
+        assert result['StatusID'].tolist() == list(range(250))
+
+
 class TestSkipBasedPagination:
     """Test skip-based pagination logic."""
 
@@ -391,7 +649,7 @@ async def test_fetch_json_success_records_in_circuit_breaker(self, client):
         from src.api.circuit_breaker import circuit_breaker_manager
 
         mock_response = AsyncMock()
-        mock_response.json.return_value = {'value': []}
+        mock_response.read.return_value = b'{"value": []}'
         mock_response.raise_for_status = Mock()
 
         async with aiohttp.ClientSession() as session:
@@ -404,6 +662,31 @@ async def test_fetch_json_success_records_in_circuit_breaker(self, client):
         breaker = circuit_breaker_manager.get_breaker('http://test.com')
         assert breaker.failure_count == 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_json_decodes_off_the_event_loop(self, client):
+        """Test the response body is parsed in a worker thread."""
+        import threading
+        from src.api import odata_client
+
+        decode_threads = []
+
+        def recording_loads(body):
+            decode_threads.append(threading.get_ident())
+            return {'value': [{'id': 1}]}
+
+        mock_response = AsyncMock()
+        mock_response.read.return_value = b'{"value": [{"id": 1}]}'
+
+        async with aiohttp.ClientSession() as session:
+            with patch.object(session, 'get') as mock_get, \
+                 patch.object(odata_client, '_json_loads', recording_loads):
+                mock_get.return_value.__aenter__.return_value = mock_response
+
+                result = await client.fetch_json(session, 'http://test.com/api/data')
+
+        assert result == {'value': [{'id': 1}]}
+        assert decode_threads and decode_threads[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_fetch_json_circuit_breaker_open_rejects(self, client):
         """Test fetch_json rejects when circuit breaker is open."""
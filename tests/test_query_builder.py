@@ -24,7 +24,7 @@ def test_get_query_definition_returns_typed_values():
     definition = get_query_definition("Parliamentary Queries (Full Details)")
     assert definition is not None
     assert definition.knesset_filter_column == "Q.KnessetNum"
-    assert definition.faction_filter_column == "f.FactionID"
+    assert definition.faction_filter_column == "mfc.FactionID"
     assert "SELECT" in definition.sql
 
 
@@ -71,3 +71,112 @@ def test_build_faction_analysis_query_validates_metric_alias():
             builder=builder,
         )
 
+
+
+def test_every_predefined_query_declares_a_knesset_filter_slot():
+    """Knesset filters should bind inside each pack rather than wrap it."""
+    for name in get_all_query_names():
+        definition = get_query_definition(name)
+        assert definition is not None
+        assert "knesset" in definition.filter_slots, name
+
+
+def test_build_query_binds_filters_into_declared_slots():
+    """Pushed-down filters replace every slot marker and need no outer wrapper."""
+    from data.queries.types import PaginationSpec, QueryRequest
+    from ui.queries.query_executor import QueryExecutor
+
+    definition = get_query_definition("Bills & Legislation (Full Details)")
+    request = QueryRequest(
+        definition=definition,
+        knesset_numbers=(25,),
+        document_types=("Published Law",),
+        pagination=PaginationSpec(limit=1000),
+    )
+    executor = QueryExecutor(db_path=None, connect_func=None, logger=None)
+
+    sql, params, applied = executor._build_query(request)
+    assert "base_query" not in sql
+    assert "/*filter:knesset" not in sql
+    assert "/*filter:document_type" not in sql
+    # No page_after, so the seek slot stays an inert comment
+    assert "/*filter:seek B.KnessetNum, B.BillID*/" in sql
+    assert sql.count("AND B.KnessetNum IN (?)") == 7
+    assert "AND (bd.PublishedLawCount > 0)" in sql
+    assert params == [25] * 7
+    assert applied == ["KnessetNum IN (25)", "Document Types: Published Law"]
+
+    wrapped_sql, wrapped_params, _ = executor._build_query(request, pushdown=False)
+    assert "AS base_query WHERE KnessetNum IN (?) AND (BillPublishedLawDocCount > 0)" in wrapped_sql
+    assert wrapped_params == [25]
+
+
+def test_build_query_seeks_past_the_previous_page_key():
+    """Keyset pages bind the seek slot and drop OFFSET."""
+    from data.queries.types import PaginationSpec, QueryRequest
+    from ui.queries.query_executor import QueryExecutor
+
+    definition = get_query_definition("Parliamentary Queries (Full Details)")
+    assert definition.order_key == ("KnessetNum", "QueryID")
+
+    request = QueryRequest(
+        definition=definition,
+        knesset_numbers=(25,),
+        pagination=PaginationSpec(limit=1000, offset=1000, after=(25, 4711)),
+    )
+    executor = QueryExecutor(db_path=None, connect_func=None, logger=None)
+
+    sql, params, applied = executor._build_query(request)
+    assert "AND ((Q.KnessetNum < ?) OR (Q.KnessetNum = ? AND Q.QueryID < ?))" in sql
+    assert "OFFSET" not in sql
+    assert sql.endswith("LIMIT 1000")
+    assert params == [25, 25, 25, 4711]
+    assert "Offset: 1000" in applied
+
+
+def test_page_seek_key_reads_the_last_row():
+    """The next page's seek key is the last row's ordering key."""
+    import pandas as pd
+
+    from ui.queries.query_executor import QueryExecutor
+
+    page = pd.DataFrame({"KnessetNum": [25, 25], "QueryID": [9, 7], "Name": ["a", "b"]})
+    name = "Parliamentary Queries (Full Details)"
+
+    assert QueryExecutor.page_seek_key(name, page) == (25, 7)
+    assert QueryExecutor.page_seek_key(name, page.iloc[:0]) is None
+    assert QueryExecutor.page_seek_key(name, page.assign(QueryID=[9, None])) is None
+
+
+def test_first_page_fetches_a_bounded_window(monkeypatch):
+    """Page one fetches a few pages; pages past them go back to SQL paging."""
+    import logging
+
+    import pyarrow as pa
+
+    from config.settings import Settings
+    from data.queries.types import PaginationSpec, QueryRequest
+    from ui.queries.query_executor import QueryExecutor
+
+    monkeypatch.setattr(Settings, "QUERY_RESULT_WINDOW_PAGES", 3)
+    fetched: list[str] = []
+
+    def fake_fetch(self, sql, params):
+        fetched.append(sql)
+        return pa.table({"QueryID": list(range(300))})
+
+    monkeypatch.setattr(QueryExecutor, "_fetch_result_table", fake_fetch)
+    executor = QueryExecutor(db_path=None, connect_func=None, logger=logging.getLogger(__name__))
+    definition = get_query_definition("Parliamentary Queries (Full Details)")
+
+    def page(offset):
+        request = QueryRequest(
+            definition=definition, pagination=PaginationSpec(limit=100, offset=offset)
+        )
+        return executor._page_from_result_table(request)
+
+    assert page(0)["QueryID"].tolist()[:2] == [0, 1]
+    assert len(fetched) == 1 and fetched[0].endswith("LIMIT 300")
+    assert page(200)["QueryID"].iloc[0] == 200
+    assert page(300) is None
+    assert len(fetched) == 1
@@ -0,0 +1,203 @@
+"""
+Tests for the data-version-aware query result cache.
+"""
+import os
+from unittest.mock import Mock
+
+import duckdb
+import pandas as pd
+
+from backend import query_cache
+from backend.connection_manager import get_db_connection
+from backend.query_cache import (
+    ANY_TABLE,
+    QueryResultCache,
+    bump_table_versions,
+    data_version_cached,
+    get_query_cache,
+    get_table_version,
+    normalize_sql,
+    referenced_tables,
+    watch_database_file,
+)
+from data.repositories.database_repository import DatabaseRepository
+
+
+class TestQueryResultCache:
+    """Keying, invalidation and LRU bounds."""
+
+    def test_hit_ignores_whitespace_and_trailing_semicolon(self):
+        cache = QueryResultCache(max_entries=8, max_bytes=1 << 20)
+        execute = Mock(return_value=pd.DataFrame({"n": [1]}))
+
+        cache.get_or_execute("SELECT n FROM KNS_Bill;", None, execute)
+        cache.get_or_execute("SELECT n\n   FROM KNS_Bill", None, execute)
+
+        assert execute.call_count == 1
+        assert cache.stats()["hits"] == 1
+        assert normalize_sql(" SELECT  1 ; ") == "SELECT 1"
+
+    def test_params_are_part_of_the_key(self):
+        cache = QueryResultCache(max_entries=8, max_bytes=1 << 20)
+        execute = Mock(side_effect=lambda: pd.DataFrame({"n": [1]}))
+
+        cache.get_or_execute("SELECT * FROM KNS_Bill WHERE KnessetNum = ?", [24], execute)
+        cache.get_or_execute("SELECT * FROM KNS_Bill WHERE KnessetNum = ?", [25], execute)
+
+        assert execute.call_count == 2
+
+    def test_returned_frames_are_copies(self):
+        cache = QueryResultCache(max_entries=8, max_bytes=1 << 20)
+        first = cache.get_or_execute("SELECT 1 FROM t", None, lambda: pd.DataFrame({"n": [1]}))
+        first["n"] = 99
+
+        second = cache.get_or_execute("SELECT 1 FROM t", None, Mock())
+        assert second["n"].tolist() == [1]
+
+    def test_arrow_tables_are_shared_and_peekable(self):
+        import pyarrow as pa
+
+        cache = QueryResultCache(max_entries=8, max_bytes=1 << 20)
+        table = pa.table({"n": [1, 2, 3]})
+
+        assert cache.get("SELECT n FROM KNS_Bill", None) is None
+        cache.get_or_execute("SELECT n FROM KNS_Bill", None, lambda: table)
+
+        assert cache.get("SELECT n FROM KNS_Bill", None) is table
+        assert cache.stats()["bytes"] == table.nbytes
+
+    def test_none_results_are_not_cached(self):
+        cache = QueryResultCache(max_entries=8, max_bytes=1 << 20)
+        execute = Mock(return_value=None)
+
+        cache.get_or_execute("SELECT 1 FROM t", None, execute)
+        cache.get_or_execute("SELECT 1 FROM t", None, execute)
+
+        assert execute.call_count == 2
+
+    def test_bump_evicts_only_dependent_entries(self):
+        cache = get_query_cache()
+        bills = Mock(side_effect=lambda: pd.DataFrame({"n": [1]}))
+        queries = Mock(side_effect=lambda: pd.DataFrame({"n": [2]}))
+        bill_sql = "SELECT b.BillID FROM KNS_Bill b JOIN KNS_Status s ON b.StatusID = s.StatusID"
+        query_sql = "SELECT QueryID FROM KNS_Query"
+
+        cache.get_or_execute(bill_sql, None, bills)
+        cache.get_or_execute(query_sql, None, queries)
+        version = get_table_version("KNS_Status")
+
+        bump_table_versions("KNS_Status")
+
+        assert get_table_version("kns_status") == version + 1
+        assert cache.stats()["entries"] == 1
+        cache.get_or_execute(bill_sql, None, bills)
+        cache.get_or_execute(query_sql, None, queries)
+        assert bills.call_count == 2
+        assert queries.call_count == 1
+
+    def test_any_table_entries_are_evicted_by_every_bump(self):
+        cache = get_query_cache()
+        execute = Mock(side_effect=lambda: ["KNS_Bill"])
+
+        cache.get_or_execute("SHOW TABLES", None, execute, tables=(ANY_TABLE,))
+        bump_table_versions("SomethingElse")
+        cache.get_or_execute("SHOW TABLES", None, execute, tables=(ANY_TABLE,))
+
+        assert execute.call_count == 2
+
+    def test_lru_respects_entry_and_byte_bounds(self):
+        frame = pd.DataFrame({"n": range(1000)})
+        size = query_cache.estimate_size(frame)
+        cache = QueryResultCache(max_entries=3, max_bytes=size * 2 + 1)
+
+        for i in range(3):
+            cache.get_or_execute(f"SELECT {i} FROM t", None, lambda: frame)
+        # The byte budget holds two frames; the oldest was dropped.
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+        execute = Mock(return_value=frame)
+        cache.get_or_execute("SELECT 0 FROM t", None, execute)
+        assert execute.call_count == 1
+        assert cache.stats()["evictions"] >= 1
+
+    def test_referenced_tables_falls_back_to_identifiers(self):
+        assert referenced_tables(
+            "SELECT * FROM KNS_Bill b JOIN KNS_Status s ON b.StatusID = s.StatusID"
+        ) == {"kns_bill", "kns_status"}
+        # Parameterized or unparsable SQL over-approximates.
+        assert "kns_bill" in referenced_tables('SELECT * FROM "KNS_Bill" WHERE KnessetNum = ?')
+        assert "kns_bill" in referenced_tables('SELECT * FROM "KNS_Bill" WHERE ((')
+
+
+def test_data_version_cached_helper_ignores_logger_arguments():
+    calls = []
+
+    @data_version_cached(tables=("KNS_Faction",))
+    def helper(db_path, _logger_obj=None):
+        calls.append(db_path)
+        return [str(db_path)]
+
+    assert helper("a.duckdb", _logger_obj=Mock()) == ["a.duckdb"]
+    assert helper("a.duckdb", _logger_obj=Mock()) == ["a.duckdb"]
+    assert len(calls) == 1
+
+    bump_table_versions("KNS_Faction")
+    helper("a.duckdb")
+    assert len(calls) == 2
+
+
+def test_repository_store_invalidates_cached_reads(tmp_path):
+    """A chart-style read is served from cache until the table is stored again."""
+    repo = DatabaseRepository(db_path=tmp_path / "warehouse.duckdb")
+    repo.store_dataframe(pd.DataFrame({"BillID": [1, 2]}), "KNS_Bill")
+
+    def count():
+        with duckdb.connect(str(repo.db_path), read_only=True) as con:
+            return con.execute("SELECT COUNT(*) AS n FROM KNS_Bill").df()
+
+    cache = get_query_cache()
+    assert cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, count)["n"][0] == 2
+
+    repo.store_dataframe(pd.DataFrame({"BillID": [1, 2, 3]}), "KNS_Bill")
+
+    assert cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, count)["n"][0] == 3
+
+
+def test_unannotated_writer_invalidates_every_cached_read(tmp_path):
+    """A read-write get_db_connection that names no tables evicts everything on exit."""
+    db_path = tmp_path / "warehouse.duckdb"
+    with get_db_connection(db_path, read_only=False) as con:
+        con.execute("CREATE TABLE UserBillCAP AS SELECT 1 AS BillID")
+
+    cache = get_query_cache()
+    execute = Mock(return_value=pd.DataFrame({"n": [1]}))
+    cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, execute)
+
+    with get_db_connection(db_path, read_only=False) as con:
+        con.execute("INSERT INTO UserBillCAP VALUES (2)")
+
+    cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, execute)
+    assert execute.call_count == 2
+
+
+def test_outside_change_to_watched_file_invalidates(tmp_path):
+    """A write the process never recorded (another process, raw connect) is noticed."""
+    db_path = tmp_path / "warehouse.duckdb"
+    with duckdb.connect(str(db_path)) as con:
+        con.execute("CREATE TABLE KNS_Bill AS SELECT 1 AS BillID")
+    watch_database_file(db_path)
+
+    cache = get_query_cache()
+    execute = Mock(return_value=pd.DataFrame({"n": [1]}))
+    cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, execute)
+    cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, execute)
+    assert execute.call_count == 1
+
+    with duckdb.connect(str(db_path)) as con:
+        con.execute("INSERT INTO KNS_Bill VALUES (2)")
+    stat = db_path.stat()
+    os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    cache.get_or_execute("SELECT COUNT(*) AS n FROM KNS_Bill", None, execute)
+    assert execute.call_count == 2
@@ -0,0 +1,154 @@
+"""
+Tests for the shared chart query execution service.
+"""
+from unittest.mock import MagicMock, patch
+
+import duckdb
+import pandas as pd
+import pytest
+
+from backend.connection_manager import get_db_connection
+from backend.query_service import QueryExecutionService, query_label
+from ui.charts.factory import ChartFactory
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    db_path = tmp_path / "warehouse.duckdb"
+    with duckdb.connect(str(db_path)) as con:
+        con.execute("CREATE TABLE KNS_Query AS SELECT range AS QueryID, 25 AS KnessetNum FROM range(5)")
+        con.execute("CREATE TABLE KNS_Agenda AS SELECT range AS AgendaID FROM range(3)")
+    return db_path
+
+
+class TestQueryExecutionService:
+    """Caching and per-label accounting."""
+
+    def test_repeated_query_is_served_from_cache(self, warehouse):
+        service = QueryExecutionService()
+        with query_label("queries"):
+            first = service.execute(warehouse, "SELECT * FROM KNS_Query WHERE KnessetNum = ?", [25])
+            second = service.execute(warehouse, "SELECT * FROM KNS_Query WHERE KnessetNum = ?", [25])
+
+        assert len(first) == len(second) == 5
+        [stats] = service.stats()
+        assert stats["label"] == "queries"
+        assert stats["calls"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["executions"] == 1
+        assert stats["last_rows"] == 5
+        assert stats["last_bytes"] > 0
+
+    def test_table_rewrite_forces_reexecution(self, warehouse):
+        service = QueryExecutionService()
+        service.execute(warehouse, "SELECT COUNT(*) AS n FROM KNS_Query", label="count")
+
+        with get_db_connection(warehouse, read_only=False, writes=("KNS_Bill",)) as con:
+            con.execute("CREATE TABLE KNS_Bill AS SELECT 1 AS BillID")
+        # A write to an unrelated table keeps the result cached.
+        assert service.execute(warehouse, "SELECT COUNT(*) AS n FROM KNS_Query", label="count")["n"][0] == 5
+
+        with get_db_connection(warehouse, read_only=False) as con:
+            con.execute("INSERT INTO KNS_Query VALUES (99, 25)")
+        assert service.execute(warehouse, "SELECT COUNT(*) AS n FROM KNS_Query", label="count")["n"][0] == 6
+
+    def test_errors_return_empty_frame_and_are_not_cached(self, warehouse):
+        service = QueryExecutionService()
+        logger = MagicMock()
+        with patch("backend.query_service.default_ui_notifier", return_value=lambda msg, lvl: None):
+            for _ in range(2):
+                result = service.execute(warehouse, "SELECT * FROM missing_table", logger_obj=logger, label="broken")
+                assert result.empty
+
+        [stats] = service.stats()
+        assert stats["errors"] == 2
+        assert stats["cache_hits"] == 0
+        logger.error.assert_called()
+
+    def test_slow_queries_are_logged(self, warehouse):
+        service = QueryExecutionService(slow_query_seconds=0)
+        logger = MagicMock()
+
+        service.execute(warehouse, "SELECT * FROM KNS_Agenda", logger_obj=logger, label="agendas")
+
+        assert any("Slow query for 'agendas'" in str(c) for c in logger.warning.call_args_list)
+
+    def test_transform_runs_once_before_caching(self, warehouse):
+        service = QueryExecutionService()
+        transform = MagicMock(side_effect=lambda df: df.assign(extra=1))
+
+        for _ in range(3):
+            result = service.execute(warehouse, "SELECT * FROM KNS_Agenda", transform=transform)
+
+        assert transform.call_count == 1
+        assert "extra" in result.columns
+
+
+    def test_rewrite_runs_on_the_miss_connection_only(self, warehouse):
+        service = QueryExecutionService()
+        rewrite = MagicMock(side_effect=lambda con, sql: sql.replace("KNS_Agenda", "KNS_Query"))
+
+        for _ in range(2):
+            result = service.execute(warehouse, "SELECT * FROM KNS_Agenda", rewrite=rewrite)
+
+        assert rewrite.call_count == 1
+        assert isinstance(rewrite.call_args.args[0], duckdb.DuckDBPyConnection)
+        assert len(result) == 5
+
+
+def test_chart_queries_use_derived_tables():
+    """The chart mixin supplies the derived-table rewrite to the service."""
+    from data.queries.derived_tables import use_derived_tables
+
+    service = MagicMock()
+    chart = ChartFactory("unused.duckdb", MagicMock()).generators["distribution"]
+    with patch("ui.charts.mixins.data_mixin.get_query_service", return_value=service):
+        chart.run_query("SELECT 1")
+
+    assert service.execute.call_args.kwargs["rewrite"] is use_derived_tables
+
+def test_factory_charts_are_recorded_under_their_chart_key(warehouse):
+    """Queries a chart runs through run_query are labelled with its factory key."""
+    service = QueryExecutionService()
+    factory = ChartFactory(warehouse, MagicMock())
+    chart = factory.generators["distribution"]
+
+    def generate(chart_type, **kwargs):
+        chart.run_query("SELECT QueryID FROM KNS_Query")
+        return None
+
+    with patch("ui.charts.mixins.data_mixin.get_query_service", return_value=service), \
+            patch.object(chart, "generate", side_effect=generate):
+        factory.create_chart("distribution", "query_types_distribution")
+        factory.create_chart("distribution", "query_types_distribution")
+
+    [stats] = service.stats()
+    assert stats["label"] == "distribution.query_types_distribution"
+    assert stats["calls"] == 2
+    assert stats["cache_hits"] == 1
+
+
+def test_chart_cache_hit_checks_out_no_connection(warehouse):
+    """A chart query served from the cache never touches the database."""
+    service = QueryExecutionService()
+    chart = ChartFactory(warehouse, MagicMock()).generators["distribution"]
+
+    with patch("ui.charts.mixins.data_mixin.get_query_service", return_value=service):
+        chart.run_query("SELECT QueryID FROM KNS_Query")
+        with patch(
+            "backend.query_service.get_db_connection",
+            side_effect=AssertionError("cache hit opened a connection"),
+        ):
+            result = chart.run_query("SELECT QueryID FROM KNS_Query")
+
+    assert len(result) == 5
+
+
+def test_stats_are_sorted_by_total_time():
+    service = QueryExecutionService()
+    service._record("fast", pd.DataFrame({"a": [1]}), True, False, 0.01)
+    service._record("slow", pd.DataFrame({"a": [1]}), True, False, 1.5)
+
+    assert [s["label"] for s in service.stats()] == ["slow", "fast"]
+    service.reset_stats()
+    assert service.stats() == []
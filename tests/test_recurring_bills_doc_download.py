@@ -0,0 +1,212 @@
+"""Unit tests for src/data/recurring_bills/doc_download.py."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+import requests
+
+from data.recurring_bills import doc_download
+from data.recurring_bills.doc_download import (
+    CACHED,
+    DOWNLOADED,
+    FAILED,
+    NOT_FOUND,
+    UNSUPPORTED,
+    TokenBucket,
+    fetch_to_cache,
+    prefetch_docs,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: bytes = b"", headers: dict | None = None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, _chunk_size):
+        yield self.body[: len(self.body) // 2]
+        yield self.body[len(self.body) // 2 :]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Serves scripted responses per URL; the last one repeats."""
+
+    def __init__(self, responses: dict[str, list]):
+        self.responses = responses
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **_kwargs):
+        with self._lock:
+            self.calls.append(url)
+            queue = self.responses[url]
+            item = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    """Retries penalize a real bucket; keep the back-off pauses out of test time."""
+    monkeypatch.setattr(doc_download, "_BACKOFF_BASE_S", 0.0)
+
+
+def _bucket() -> TokenBucket:
+    clock = FakeClock()
+    return TokenBucket(100.0, burst=10, clock=clock, sleep=clock.sleep)
+
+
+def test_token_bucket_spaces_requests_at_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(2.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        bucket.acquire()
+
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_penalize_pauses_and_halves_then_recovers():
+    clock = FakeClock()
+    bucket = TokenBucket(4.0, burst=1, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+
+    bucket.penalize(10.0)
+    bucket.acquire()
+
+    assert clock.now >= 10.0
+    assert bucket.rate == 2.0
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == 4.0
+
+
+def test_fetch_retries_429_and_writes_atomically(tmp_path: Path):
+    url = "https://fs/1.doc"
+    session = FakeSession({url: [FakeResponse(429, headers={"Retry-After": "0"}), FakeResponse(200, b"document")]})
+    bucket = _bucket()
+
+    outcome = fetch_to_cache(session, url, tmp_path / "1.doc", bucket)
+
+    assert outcome == DOWNLOADED
+    assert (tmp_path / "1.doc").read_bytes() == b"document"
+    assert not list(tmp_path.glob("*.part"))
+    assert session.calls == [url, url]
+    assert bucket.rate < bucket.target_rate
+
+
+def test_fetch_404_is_final_and_writes_nothing(tmp_path: Path):
+    url = "https://fs/2.doc"
+    session = FakeSession({url: [FakeResponse(404)]})
+
+    assert fetch_to_cache(session, url, tmp_path / "2.doc", _bucket()) == NOT_FOUND
+    assert session.calls == [url]
+    assert not list(tmp_path.iterdir())
+
+
+def test_fetch_gives_up_after_max_attempts(tmp_path: Path):
+    url = "https://fs/3.doc"
+    session = FakeSession({url: [requests.ConnectionError("reset")]})
+
+    assert fetch_to_cache(session, url, tmp_path / "3.doc", _bucket(), max_attempts=3) == FAILED
+    assert len(session.calls) == 3
+
+
+def test_interrupted_write_leaves_no_cached_file(tmp_path: Path):
+    class BrokenResponse(FakeResponse):
+        def iter_content(self, _chunk_size):
+            yield b"half"
+            raise requests.ConnectionError("dropped mid-body")
+
+    url = "https://fs/4.doc"
+    session = FakeSession({url: [BrokenResponse(200), FakeResponse(200, b"complete")]})
+
+    assert fetch_to_cache(session, url, tmp_path / "4.doc", _bucket()) == DOWNLOADED
+    assert (tmp_path / "4.doc").read_bytes() == b"complete"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_body_cut_off_mid_stream_is_retried(tmp_path: Path):
+    class TruncatedResponse(FakeResponse):
+        def iter_content(self, _chunk_size):
+            yield b"half"
+            raise requests.exceptions.ChunkedEncodingError("connection broken: incomplete read")
+
+    url = "https://fs/5.doc"
+    session = FakeSession({url: [TruncatedResponse(200), FakeResponse(200, b"complete")]})
+
+    assert fetch_to_cache(session, url, tmp_path / "5.doc", _bucket()) == DOWNLOADED
+    assert (tmp_path / "5.doc").read_bytes() == b"complete"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_disk_error_fails_only_that_document(tmp_path: Path, monkeypatch):
+    def disk_full(_resp, _cache_path):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(doc_download, "_write_atomically", disk_full)
+    urls = {6: "https://fs/6.doc", 7: "https://fs/7.doc"}
+    session = FakeSession({url: [FakeResponse(200, b"x")] for url in urls.values()})
+
+    outcomes = prefetch_docs(urls.items(), tmp_path, workers=2, requests_per_s=1000, session=session)
+
+    assert outcomes == {6: FAILED, 7: FAILED}
+    assert len(session.calls) == 2
+
+
+def test_prefetch_skips_cached_and_unsupported(tmp_path: Path):
+    (tmp_path / "1.doc").write_bytes(b"cached")
+    (tmp_path / "9.pdf.part").write_bytes(b"stray")
+    session = FakeSession({
+        "https://fs/2.pdf": [FakeResponse(200, b"pdf")],
+        "https://fs/3.docx": [FakeResponse(404)],
+    })
+    progress: list[tuple[int, str]] = []
+
+    outcomes = prefetch_docs(
+        [
+            (1, "https://fs/1.doc"),
+            (2, "https://fs/2.pdf"),
+            (3, "https://fs/3.docx"),
+            (4, "https://fs/4.html"),
+        ],
+        tmp_path,
+        workers=4,
+        requests_per_s=1000.0,
+        session=session,
+        progress_cb=lambda done, total, bid, outcome: progress.append((bid, outcome)),
+    )
+
+    assert outcomes == {1: CACHED, 2: DOWNLOADED, 3: NOT_FOUND, 4: UNSUPPORTED}
+    assert sorted(session.calls) == ["https://fs/2.pdf", "https://fs/3.docx"]
+    assert sorted(progress) == [(2, DOWNLOADED), (3, NOT_FOUND)]
+    assert (tmp_path / "2.pdf").read_bytes() == b"pdf"
+    assert not (tmp_path / "9.pdf.part").exists()
@@ -0,0 +1,152 @@
+"""Unit tests for src/data/recurring_bills/full_scan.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from data.recurring_bills.full_scan import _best_doc_urls, build_doc_based_full
+
+_PRELIMINARY = "הצעת חוק לדיון מוקדם"
+_FIRST_READING = "הצעת חוק לקריאה הראשונה"
+
+
+@pytest.fixture()
+def warehouse(tmp_path: Path) -> Path:
+    path = tmp_path / "warehouse.duckdb"
+    con = duckdb.connect(str(path))
+    con.execute(
+        "CREATE TABLE KNS_Bill (BillID BIGINT, KnessetNum BIGINT, Name VARCHAR, PrivateNumber DOUBLE)"
+    )
+    con.execute(
+        """
+        INSERT INTO KNS_Bill VALUES
+            (1, 20, 'both doc types', 101),
+            (2, 20, 'first reading only', 102),
+            (3, 21, 'no documents', 103),
+            (4, 21, 'preliminary without a path', 104),
+            (5, 21, 'government bill', NULL)
+        """
+    )
+    con.execute(
+        "CREATE TABLE KNS_DocumentBill (BillID BIGINT, GroupTypeDesc VARCHAR, FilePath VARCHAR, LastUpdatedDate TIMESTAMP)"
+    )
+    con.execute(
+        f"""
+        INSERT INTO KNS_DocumentBill VALUES
+            (1, '{_FIRST_READING}', 'https://fs/1_first.doc', '2010-01-01'),
+            (1, '{_PRELIMINARY}', 'https://fs/1_late.doc', '2012-01-01'),
+            (1, '{_PRELIMINARY}', 'https://fs/1_early.doc', '2011-01-01'),
+            (2, 'דברי הסבר', 'https://fs/2_other.doc', '2009-01-01'),
+            (2, '{_FIRST_READING}', 'https://fs/2_first.doc', '2010-01-01'),
+            (4, '{_PRELIMINARY}', NULL, '2009-01-01'),
+            (4, '{_FIRST_READING}', 'https://fs/4_first.pdf', '2010-01-01'),
+            (5, '{_PRELIMINARY}', 'https://fs/5_gov.doc', '2010-01-01')
+        """
+    )
+    con.close()
+    return path
+
+
+def test_best_doc_urls_prefers_doc_type_then_earliest(warehouse: Path) -> None:
+    con = duckdb.connect(str(warehouse), read_only=True)
+    try:
+        bills = con.execute("SELECT BillID FROM KNS_Bill WHERE PrivateNumber IS NOT NULL").df()
+        urls = _best_doc_urls(con, bills)
+    finally:
+        con.close()
+
+    assert urls == {
+        1: "https://fs/1_early.doc",
+        2: "https://fs/2_first.doc",
+        4: "https://fs/4_first.pdf",
+    }
+
+
+def test_build_doc_based_full_classifies_from_batched_urls(warehouse: Path, tmp_path: Path) -> None:
+    def fake_classify(*, bill_id, doc_url, **_kwargs):
+        return {
+            "is_recurring": False,
+            "original_bill_id": None,
+            "matched_phrase": None,
+            "method": "no_phrase_found",
+        }
+
+    progress: list[tuple[int, int, int]] = []
+    with patch(
+        "data.recurring_bills.full_scan.classify_bill_from_doc", side_effect=fake_classify
+    ) as classify, patch("data.recurring_bills.full_scan.prefetch_docs") as prefetch:
+        df = build_doc_based_full(
+            warehouse_path=warehouse,
+            cache_dir=tmp_path / "cache",
+            progress_cb=lambda i, total, bid, _method: progress.append((i, total, bid)),
+        )
+
+    assert dict(prefetch.call_args.args[0]) == {
+        1: "https://fs/1_early.doc",
+        2: "https://fs/2_first.doc",
+        4: "https://fs/4_first.pdf",
+    }
+    assert classify.call_count == 3
+    assert all(call.kwargs["download"] is False for call in classify.call_args_list)
+    assert df["BillID"].tolist() == [1, 2, 3, 4]
+    assert df.set_index("BillID")["method"].to_dict() == {
+        1: "no_phrase_found",
+        2: "no_phrase_found",
+        3: "no_doc_url",
+        4: "no_phrase_found",
+    }
+    assert df.set_index("BillID").loc[1, "doc_url"] == "https://fs/1_early.doc"
+    assert df.set_index("BillID").loc[4, "Name"] == "preliminary without a path"
+    assert progress == [(1, 4, 1), (2, 4, 2), (3, 4, 3), (4, 4, 4)]
+
+
+def test_classification_error_is_confined_to_its_bill(warehouse: Path, tmp_path: Path) -> None:
+    def flaky_classify(*, bill_id, **_kwargs):
+        if bill_id == 2:
+            raise ValueError("corrupt document")
+        return {
+            "is_recurring": True,
+            "original_bill_id": 99,
+            "matched_phrase": "הצעת חוק זהה",
+            "method": "doc_pattern_linked",
+        }
+
+    with patch(
+        "data.recurring_bills.full_scan.classify_bill_from_doc", side_effect=flaky_classify
+    ), patch("data.recurring_bills.full_scan.prefetch_docs"):
+        df = build_doc_based_full(warehouse_path=warehouse, cache_dir=tmp_path / "cache")
+
+    methods = df.set_index("BillID")["method"].to_dict()
+    assert methods == {
+        1: "doc_pattern_linked",
+        2: "doc_fetch_failed",
+        3: "no_doc_url",
+        4: "doc_pattern_linked",
+    }
+    assert df.set_index("BillID").loc[2, "is_original"]
+
+
+def test_process_pool_matches_serial_scan(warehouse: Path, tmp_path: Path) -> None:
+    """Workers open their own connections and return rows in bill order."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    # Not a readable document, so every worker classifies it the same way
+    (cache_dir / "1.doc").write_bytes(b"not a word document")
+
+    with patch("data.recurring_bills.full_scan.prefetch_docs"):
+        serial = build_doc_based_full(warehouse_path=warehouse, cache_dir=cache_dir)
+        progress: list[int] = []
+        parallel = build_doc_based_full(
+            warehouse_path=warehouse,
+            cache_dir=cache_dir,
+            workers=2,
+            progress_cb=lambda i, _total, _bid, _method: progress.append(i),
+        )
+
+    columns = [c for c in serial.columns if c != "last_updated"]
+    assert parallel[columns].equals(serial[columns])
+    assert progress == [1, 2, 3, 4]
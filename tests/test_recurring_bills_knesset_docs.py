@@ -7,11 +7,13 @@
 
 import duckdb
 
+from data.recurring_bills import knesset_docs
 from data.recurring_bills.knesset_docs import (
     classify_recurrence_phrase,
     classify_bill_from_doc,
     download_doc,
     extract_submission_date,
+    extract_text_cached,
     parse_recurrence_signals,
     resolve_link_back,
     validate_submission_date,
@@ -129,10 +131,7 @@ def _classify_from_text(
 ) -> dict:
     cache = tmp_path / f"{bill_id}.doc"
     cache.write_bytes(b"cached")
-    extraction = MagicMock(returncode=0, stdout=text.encode(), stderr=b"")
-    with patch(
-        "data.recurring_bills.knesset_docs.subprocess.run", return_value=extraction
-    ):
+    with patch("data.recurring_bills.knesset_docs.extract_text", return_value=text):
         return classify_bill_from_doc(
             bill_id=bill_id,
             current_knesset=current_knesset,
@@ -259,6 +258,27 @@ def test_extracts_previous_knesset_phrase(self):
         signals = parse_recurrence_signals(text, current_knesset=12)
         assert signals["recurrence_phrases"][0]["contextual_knesset"] == 11
 
+    def test_overlapping_phrases_from_different_patterns_are_all_found(self):
+        text = "בהמשך להצעת חוק דומה, וכן הצעת חוק דומה נוספת."
+        phrases = parse_recurrence_signals(text)["recurrence_phrases"]
+        assert [(p["phrase_start"], p["phrase_text"]) for p in phrases] == [
+            (0, "בהמשך להצעת חוק"),
+            (7, "הצעת חוק דומה"),
+            (26, "הצעת חוק דומה"),
+        ]
+
+    def test_contextual_knesset_precedence(self):
+        def knesset(text: str, current: int | None = 20) -> int | None:
+            signals = parse_recurrence_signals(f"הצעת חוק זהה {text}", current_knesset=current)
+            return signals["recurrence_phrases"][0]["contextual_knesset"]
+
+        # "the previous Knesset" wins, then the first number, then the longest ordinal
+        assert knesset("הוגשה בכנסת ה-14 ובכנסת הקודמת") == 19
+        assert knesset("הוגשה בכנסת הקודמת", current=None) is None
+        assert knesset("הוגשה בכנסת העשרים ובכנסת ה-18 ובכנסת ה-17") == 18
+        assert knesset("הוגשה בכנסת ה-30 ובכנסת העשרים") is None
+        assert knesset("הוגשה בכנסת העשרים ובכנסת העשרים ואחת") == 21
+
     def test_empty_text_returns_default(self):
         signals = parse_recurrence_signals("")
         assert signals == {
@@ -710,3 +730,52 @@ def test_no_pattern(self, tmp_path: Path):
         )
         assert result["is_recurring"] is False
         assert result["method"] == "doc_no_pattern"
+
+
+class TestExtractTextCached:
+    def test_second_call_reads_cache(self, tmp_path: Path):
+        doc = tmp_path / "1.pdf"
+        doc.write_bytes(b"%PDF body")
+        text_dir = tmp_path / "text"
+        with patch(
+            "data.recurring_bills.knesset_docs.extract_text", return_value="טקסט"
+        ) as extract:
+            assert extract_text_cached(doc, text_dir) == "טקסט"
+            assert extract_text_cached(doc, text_dir) == "טקסט"
+        assert extract.call_count == 1
+        assert len(list(text_dir.glob("*.json.gz"))) == 1
+
+    def test_extractor_version_bump_re_extracts(self, tmp_path: Path, monkeypatch):
+        doc = tmp_path / "1.pdf"
+        doc.write_bytes(b"%PDF body")
+        text_dir = tmp_path / "text"
+        with patch(
+            "data.recurring_bills.knesset_docs.extract_text", side_effect=["old", "new"]
+        ) as extract:
+            assert extract_text_cached(doc, text_dir) == "old"
+            monkeypatch.setattr(
+                knesset_docs, "EXTRACTOR_VERSION", knesset_docs.EXTRACTOR_VERSION + 1
+            )
+            assert extract_text_cached(doc, text_dir) == "new"
+        assert extract.call_count == 2
+
+    def test_failed_extraction_is_not_cached(self, tmp_path: Path):
+        doc = tmp_path / "1.doc"
+        doc.write_bytes(b"doc body")
+        text_dir = tmp_path / "text"
+        with patch(
+            "data.recurring_bills.knesset_docs.extract_text", side_effect=[None, "ok"]
+        ):
+            assert extract_text_cached(doc, text_dir) is None
+            assert extract_text_cached(doc, text_dir) == "ok"
+
+    def test_corrupt_entry_is_replaced(self, tmp_path: Path):
+        doc = tmp_path / "1.pdf"
+        doc.write_bytes(b"%PDF body")
+        text_dir = tmp_path / "text"
+        with patch("data.recurring_bills.knesset_docs.extract_text", return_value="a"):
+            extract_text_cached(doc, text_dir)
+            (entry,) = text_dir.glob("*.json.gz")
+            entry.write_bytes(b"not gzip")
+            assert extract_text_cached(doc, text_dir) == "a"
+        assert not list(text_dir.glob("*.part"))
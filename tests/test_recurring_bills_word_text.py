@@ -0,0 +1,207 @@
+"""Unit tests for src/data/recurring_bills/word_text.py."""
+
+from __future__ import annotations
+
+import io
+import struct
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data.recurring_bills.knesset_docs import extract_text
+from data.recurring_bills.word_text import (
+    WordExtractionError,
+    doc_text,
+    docx_text,
+    sniff_word_format,
+    word_text,
+)
+
+_ENDOFCHAIN = 0xFFFFFFFE
+_FREESECT = 0xFFFFFFFF
+_NOSTREAM = 0xFFFFFFFF
+
+_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p>
+      <w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>
+      <w:r><w:t>דברי הסבר</w:t></w:r>
+    </w:p>
+    <w:p>
+      <w:r><w:t xml:space="preserve">הצעת חוק זהה </w:t></w:r>
+      <w:r><w:instrText> HYPERLINK "x" </w:instrText></w:r>
+      <w:r><w:t>(פ/1915/19)</w:t><w:tab/><w:t>סוף</w:t><w:br/><w:t>שורה</w:t></w:r>
+      <w:del><w:r><w:delText>נמחק</w:delText></w:r></w:del>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def _docx_bytes(document_xml: str = _DOCUMENT_XML) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+def _ole_bytes(streams: dict[str, bytes]) -> bytes:
+    """Version 3 compound file with every stream in the root storage."""
+    sector_size, mini_size, cutoff = 512, 64, 4096
+    body = bytearray()
+    fat = [0xFFFFFFFD]  # sector 0 holds the FAT itself
+
+    def alloc(blob: bytes) -> int:
+        start = len(fat)
+        count = max(1, -(-len(blob) // sector_size))
+        fat.extend(range(start + 1, start + count))
+        fat.append(_ENDOFCHAIN)
+        body.extend(blob.ljust(count * sector_size, b"\0"))
+        return start
+
+    mini_stream = bytearray()
+    mini_fat: list[int] = []
+    starts: dict[str, int] = {}
+    for name, data in streams.items():
+        if len(data) >= cutoff:
+            starts[name] = alloc(data)
+        else:
+            starts[name] = len(mini_fat)
+            count = max(1, -(-len(data) // mini_size))
+            mini_fat.extend(range(len(mini_fat) + 1, len(mini_fat) + count))
+            mini_fat.append(_ENDOFCHAIN)
+            mini_stream.extend(data.ljust(count * mini_size, b"\0"))
+    root_start = alloc(bytes(mini_stream)) if mini_stream else _ENDOFCHAIN
+    minifat_start = alloc(struct.pack(f"<{len(mini_fat)}I", *mini_fat)) if mini_fat else _ENDOFCHAIN
+
+    def entry(name: str, entry_type: int, start: int, size: int, right: int, child: int) -> bytes:
+        raw = bytearray(128)
+        encoded = name.encode("utf-16-le") + b"\0\0"
+        raw[: len(encoded)] = encoded
+        struct.pack_into("<HBB", raw, 64, len(encoded), entry_type, 1)
+        struct.pack_into("<III", raw, 68, _NOSTREAM, right, child)
+        struct.pack_into("<IQ", raw, 116, start, size)
+        return bytes(raw)
+
+    names = list(streams)
+    directory = entry("Root Entry", 5, root_start, len(mini_stream), _NOSTREAM, 1)
+    for i, name in enumerate(names, start=1):
+        right = i + 1 if i < len(names) else _NOSTREAM
+        directory += entry(name, 2, starts[name], len(streams[name]), right, _NOSTREAM)
+    dir_start = alloc(directory)
+
+    header = bytearray(512)
+    header[:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into("<HHHHH", header, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into(
+        "<IIIIIIIII", header, 0x28, 0, 1, dir_start, 0, cutoff, minifat_start,
+        1 if mini_fat else 0, _ENDOFCHAIN, 0,
+    )
+    struct.pack_into("<109I", header, 0x4C, 0, *([_FREESECT] * 108))
+    fat_sector = struct.pack(f"<{len(fat)}I", *fat).ljust(sector_size, b"\xff")
+    return bytes(header) + fat_sector + bytes(body)
+
+
+def _word_document(
+    pieces: list[tuple[str, bool]], ccp_text: int, flags: int = 0x0200, nfib: int = 0x00C1
+) -> dict[str, bytes]:
+    """WordDocument + 1Table streams holding ``pieces`` as (text, compressed)."""
+    fib = bytearray(0x20)
+    struct.pack_into("<HH", fib, 0, 0xA5EC, nfib)
+    struct.pack_into("<H", fib, 0x0A, flags)
+    fib += struct.pack("<H", 14) + bytes(28)
+    rg_lw = [0] * 22
+    rg_lw[3] = ccp_text
+    fib += struct.pack("<H", 22) + struct.pack("<22i", *rg_lw)
+    fc_lcb_offset = len(fib) + 2
+    fib += struct.pack("<H", 93) + bytes(93 * 8)
+
+    word = bytearray(fib.ljust(1024, b"\0"))
+    cps, pcds = [0], b""
+    for text, compressed in pieces:
+        if compressed:
+            fc = (len(word) * 2) | 0x40000000
+            word += text.encode("cp1252")
+        else:
+            fc = len(word)
+            word += text.encode("utf-16-le")
+        cps.append(cps[-1] + len(text))
+        pcds += struct.pack("<HIH", 0, fc, 0)
+    word = word.ljust(5000, b"\0")
+
+    plc = struct.pack(f"<{len(cps)}I", *cps) + pcds
+    clx = b"\x01" + struct.pack("<H", 2) + b"\0\0" + b"\x02" + struct.pack("<I", len(plc)) + plc
+    table = bytes(16) + clx
+    struct.pack_into("<II", word, fc_lcb_offset + 33 * 8, 16, len(clx))
+    return {"WordDocument": bytes(word), "1Table": table}
+
+
+@pytest.fixture()
+def doc_file(tmp_path: Path) -> Path:
+    main_text = "הצעת חוק זהה\rהונחה (פ/285).\r"
+    field = "\x13 HYPERLINK \"x\" \x14link\x15 end\x07"
+    footnote = "footnote text\r"
+    streams = _word_document(
+        [(main_text, False), (field, True), (footnote, True)],
+        ccp_text=len(main_text) + len(field),
+    )
+    path = tmp_path / "1.doc"
+    path.write_bytes(_ole_bytes(streams))
+    return path
+
+
+def test_docx_text_keeps_runs_tabs_and_paragraphs(tmp_path: Path):
+    path = tmp_path / "1.docx"
+    path.write_bytes(_docx_bytes())
+
+    assert docx_text(path) == "דברי הסבר\nהצעת חוק זהה (פ/1915/19)\tסוף\nשורה\n"
+
+
+def test_doc_text_reads_pieces_and_drops_field_codes(doc_file: Path):
+    assert doc_text(doc_file) == "הצעת חוק זהה\nהונחה (פ/285).\nlink end\n"
+
+
+def test_word_text_goes_by_content_not_extension(tmp_path: Path, doc_file: Path):
+    misnamed = tmp_path / "2.doc"
+    misnamed.write_bytes(_docx_bytes())
+
+    assert sniff_word_format(misnamed) == "docx"
+    assert sniff_word_format(doc_file) == "doc"
+    assert word_text(misnamed).startswith("דברי הסבר")
+
+
+def test_unsupported_doc_variants_raise(tmp_path: Path):
+    encrypted = tmp_path / "enc.doc"
+    encrypted.write_bytes(_ole_bytes(_word_document([("x\r", False)], 2, flags=0x0300)))
+    word95 = tmp_path / "w95.doc"
+    word95.write_bytes(_ole_bytes(_word_document([("x\r", False)], 2, nfib=0x0065)))
+    rtf = tmp_path / "rtf.doc"
+    rtf.write_bytes(b"{\\rtf1 text}")
+
+    for path in (encrypted, word95, rtf):
+        with pytest.raises(WordExtractionError):
+            word_text(path)
+
+
+def test_extract_text_uses_in_process_reader(doc_file: Path):
+    with patch("data.recurring_bills.knesset_docs.subprocess.run") as run:
+        assert extract_text(doc_file).startswith("הצעת חוק זהה")
+    run.assert_not_called()
+
+
+def test_extract_text_falls_back_to_textutil_when_available(tmp_path: Path):
+    path = tmp_path / "1.doc"
+    path.write_bytes(b"{\\rtf1 text}")
+    converted = MagicMock(returncode=0, stdout="טקסט".encode(), stderr=b"")
+
+    with patch("data.recurring_bills.knesset_docs.shutil.which", return_value=None):
+        assert extract_text(path) is None
+    with (
+        patch("data.recurring_bills.knesset_docs.shutil.which", return_value="/usr/bin/textutil"),
+        patch("data.recurring_bills.knesset_docs.subprocess.run", return_value=converted),
+    ):
+        assert extract_text(path) == "טקסט"
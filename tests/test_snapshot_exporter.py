@@ -10,9 +10,19 @@
 import duckdb
 import pytest
 
+from backend.partitioned_parquet import read_parquet_table
 from data.snapshots.bill_status import UnmappedBillStatusError
-from data.snapshots.exporter import SNAPSHOTS, export_all
+from data.snapshots.exporter import (
+    PARTITIONED_SNAPSHOTS,
+    SHARED_INTERMEDIATES,
+    SNAPSHOT_LAYOUTS,
+    SNAPSHOTS,
+    export_all,
+    export_snapshot,
+)
+from data.snapshots.layout import SnapshotLayout
 from data.snapshots.manifest import read_manifest
+from data.snapshots.planner import materialize_intermediates, plan_exports
 
 
 @pytest.fixture()
@@ -271,10 +281,10 @@ def tiny_warehouse(tmp_path: Path) -> Path:
             vote_id BIGINT, knesset_num INTEGER, vote_date VARCHAR,
             vote_type VARCHAR, item_title VARCHAR, is_accepted BOOLEAN,
             is_electronic BOOLEAN, total_for INTEGER, total_against INTEGER,
-            total_abstain INTEGER, total_present INTEGER
+            total_abstain INTEGER, total_present INTEGER, decision VARCHAR
         );
         INSERT INTO WebVoteHeader VALUES
-            (10, 26, '2026-06-01T00:00:00', 'אלקטרונית', 'הצבעה לדוגמה', TRUE, TRUE, 2, 1, 0, 0);
+            (10, 26, '2026-06-01T00:00:00', 'אלקטרונית', 'הצבעה לדוגמה', TRUE, TRUE, 2, 1, 0, 0, 'לקבל בקריאה שנייה');
 
         CREATE TABLE WebVoteMk (
             vote_id BIGINT, mk_id BIGINT, mk_name VARCHAR,
@@ -385,7 +395,8 @@ def replace_that_fails_on_third_call(src: str | Path, dst: str | Path, /) -> Non
         side_effect=replace_that_fails_on_third_call,
     ):
         with pytest.raises(OSError, match="simulated rename failure"):
-            export_all(tiny_warehouse, out)
+            # force: an unchanged warehouse would otherwise replace nothing
+            export_all(tiny_warehouse, out, force=True)
 
     # Prior snapshots untouched (some later-in-order parquets may have been
     # replaced before the third call, but none AFTER the failure).
@@ -1157,3 +1168,220 @@ def test_bills_list_flags_continuation_bills(
     # ordinary bill. The flag is COALESCEd to FALSE for that reason.
     assert all(flag is not None for flag, _ in rows)
     assert rows == [(False, 3)]  # the fixture holds three private-member bills
+
+
+def test_planner_materializes_only_shared_intermediates() -> None:
+    plan = plan_exports(SNAPSHOTS, SHARED_INTERMEDIATES)
+    assert {i.name for i in plan.intermediates} == {
+        "latest_faction",
+        "private_bills",
+        "committee_ids",
+    }
+    users = {s.name: set(s.intermediates) for s in plan.snapshots if s.intermediates}
+    assert users == {
+        "mk_summary": {"latest_faction"},
+        "mk_bills": {"private_bills"},
+        "bills_list": {"private_bills"},
+        "committee_members_by_faction": {"latest_faction", "committee_ids"},
+        "mk_committees": {"committee_ids"},
+    }
+    # Order is the SNAPSHOTS order, so the manifest stays byte-stable.
+    assert [s.name for s in plan.snapshots] == [name for name, _sql in SNAPSHOTS]
+    for snapshot in plan.snapshots:
+        for intermediate in plan.intermediates:
+            assert intermediate.sql not in snapshot.sql
+
+
+def test_planned_snapshots_return_the_same_rows(tiny_warehouse: Path) -> None:
+    """Reading an intermediate from scratch must not change any snapshot."""
+    plan = plan_exports(SNAPSHOTS, SHARED_INTERMEDIATES)
+    con = duckdb.connect(str(tiny_warehouse), read_only=True)
+    try:
+        materialize_intermediates(con, plan.intermediates)
+        for (name, sql), planned in zip(SNAPSHOTS, plan.snapshots):
+            assert con.execute(planned.sql).fetchall() == con.execute(sql).fetchall(), name
+    finally:
+        con.close()
+
+
+def test_concurrent_export_matches_sequential(
+    tiny_warehouse: Path, tmp_path: Path
+) -> None:
+    sequential = export_all(tiny_warehouse, tmp_path / "seq", workers=1)
+    concurrent = export_all(tiny_warehouse, tmp_path / "par", workers=8)
+    assert concurrent.snapshots == sequential.snapshots
+    assert list(concurrent.snapshots) == [name for name, _sql in SNAPSHOTS]
+
+
+def _mtimes(out: Path) -> dict[str, int]:
+    return {f.stem: f.stat().st_mtime_ns for f in out.glob("*.parquet")}
+
+
+def test_manifest_records_snapshot_sources(tiny_warehouse: Path, tmp_path: Path) -> None:
+    out = tmp_path / "snapshots"
+    manifest = export_all(tiny_warehouse, out)
+    assert set(manifest.snapshots["mk_votes"].sources) == {"WebVoteHeader", "WebVoteMk"}
+    assert set(manifest.snapshots["votes_list"].sources) == {"WebVoteHeader"}
+    (seed,) = manifest.snapshots["party_metadata"].sources
+    assert seed.startswith("file:") and seed.endswith("party_metadata.csv")
+    assert all(entry.query_sha256 for entry in manifest.snapshots.values())
+    assert read_manifest(out / "manifest.json").snapshots == manifest.snapshots
+
+
+def test_unchanged_warehouse_rewrites_nothing(tiny_warehouse: Path, tmp_path: Path) -> None:
+    out = tmp_path / "snapshots"
+    first = export_all(tiny_warehouse, out)
+    before = _mtimes(out)
+    second = export_all(tiny_warehouse, out)
+    assert _mtimes(out) == before
+    assert second.snapshots == first.snapshots
+
+
+def test_vote_changes_rewrite_only_vote_snapshots(
+    tiny_warehouse: Path, tmp_path: Path
+) -> None:
+    out = tmp_path / "snapshots"
+    export_all(tiny_warehouse, out)
+    before = _mtimes(out)
+    con = duckdb.connect(str(tiny_warehouse))
+    con.execute(
+        "INSERT INTO WebVoteHeader VALUES "
+        "(11, 26, '2026-06-02T00:00:00', 'אלקטרונית', 'הצבעה נוספת', FALSE, TRUE, 0, 2, 0, 0, NULL)"
+    )
+    con.close()
+
+    manifest = export_all(tiny_warehouse, out)
+    after = _mtimes(out)
+    rewritten = {name for name in before if after[name] != before[name]}
+    assert rewritten == {"votes_list", "mk_votes"}
+    assert manifest.snapshots["votes_list"].rows == 2
+
+
+def test_force_rewrites_every_snapshot(tiny_warehouse: Path, tmp_path: Path) -> None:
+    out = tmp_path / "snapshots"
+    export_all(tiny_warehouse, out)
+    before = _mtimes(out)
+    export_all(tiny_warehouse, out, force=True)
+    after = _mtimes(out)
+    assert all(after[name] != before[name] for name in before)
+
+
+def test_missing_snapshot_file_is_reexported(tiny_warehouse: Path, tmp_path: Path) -> None:
+    out = tmp_path / "snapshots"
+    export_all(tiny_warehouse, out)
+    (out / "mk_cv.parquet").unlink()
+    export_all(tiny_warehouse, out)
+    assert (out / "mk_cv.parquet").exists()
+
+
+def test_row_counts_come_from_copy_and_timings_are_logged(
+    tiny_warehouse: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    out = tmp_path / "snapshots"
+    with caplog.at_level("INFO", logger="data.snapshots.exporter"):
+        manifest = export_all(tiny_warehouse, out)
+    con = duckdb.connect(":memory:")
+    for name, entry in manifest.snapshots.items():
+        row = con.execute(f"SELECT COUNT(*) FROM read_parquet('{out}/{name}.parquet')").fetchone()
+        assert row == (entry.rows,), name
+    assert any("copy=" in r.getMessage() and "hash=" in r.getMessage() for r in caplog.records)
+    assert any(r.getMessage().startswith("export timings:") for r in caplog.records)
+
+
+def test_layout_builds_copy_options_and_cluster_order() -> None:
+    layout = SnapshotLayout(
+        sort_by=("mk_id", "knesset_num"),
+        row_group_size=61_440,
+        compression_level=9,
+        dictionary_size_limit=6_144,
+    )
+    assert layout.copy_options() == (
+        "FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 9, "
+        "ROW_GROUP_SIZE 61440, DICTIONARY_SIZE_LIMIT 6144"
+    )
+    assert layout.ordered_sql("SELECT 1").endswith("ORDER BY mk_id, knesset_num, COLUMNS(*)")
+    assert SnapshotLayout().ordered_sql("SELECT 1") == "SELECT 1"
+
+
+def test_clustered_snapshot_row_groups_do_not_overlap(tmp_path: Path) -> None:
+    """Sorted row groups carry disjoint min/max, so a point read prunes."""
+    con = duckdb.connect(":memory:")
+    sql = "SELECT (i * 7919) % 20000 AS mk_id, 'תווית ' || (i % 5) AS label FROM range(20000) t(i)"
+    layout = SnapshotLayout(sort_by=("mk_id",), row_group_size=2048)
+    entry = export_snapshot(con, "clustered", sql, tmp_path, layout)
+    assert entry.rows == 20000
+    stats = con.execute(
+        f"""
+        SELECT row_group_id, path_in_schema, CAST(stats_min AS BIGINT), CAST(stats_max AS BIGINT)
+        FROM parquet_metadata('{tmp_path}/clustered.parquet')
+        WHERE path_in_schema = 'mk_id'
+        ORDER BY row_group_id
+        """
+    ).fetchall()
+    assert len(stats) > 1
+    for (_, _, _, prev_max), (_, _, next_min, _) in zip(stats, stats[1:]):
+        assert prev_max < next_min
+
+
+def test_snapshot_label_columns_are_dictionary_encoded(tmp_path: Path) -> None:
+    """Shrunken row groups still dictionary-encode Hebrew label columns."""
+    con = duckdb.connect(":memory:")
+    sql = (
+        "SELECT i % 600 AS mk_id, 25 AS knesset_num, "
+        "'סטטוס ' || (i % 40) AS status_desc FROM range(100000) t(i)"
+    )
+    export_snapshot(con, "labels", sql, tmp_path, SNAPSHOT_LAYOUTS["mk_bills"])
+    encodings = con.execute(
+        f"SELECT DISTINCT encodings FROM parquet_metadata('{tmp_path}/labels.parquet') "
+        "WHERE path_in_schema = 'status_desc'"
+    ).fetchall()
+    assert encodings and all("DICTIONARY" in e for (e,) in encodings)
+
+
+def test_partitioned_export_writes_knesset_directories(
+    tiny_warehouse: Path, tmp_path: Path
+) -> None:
+    out = tmp_path / "snapshots"
+    single = export_all(tiny_warehouse, tmp_path / "single")
+    manifest = export_all(tiny_warehouse, out, partitioned=True)
+
+    for name in PARTITIONED_SNAPSHOTS:
+        entry = manifest.snapshots[name]
+        assert entry.partition_by == "knesset_num"
+        assert entry.rows == single.snapshots[name].rows
+        assert entry.rows == sum(p.rows for p in entry.partitions.values())
+        assert not (out / f"{name}.parquet").exists()
+        for partition, part in entry.partitions.items():
+            assert partition.startswith("knesset_num=")
+            assert [f.name for f in sorted((out / name / partition).iterdir())] == list(part.files)
+    assert manifest.snapshots["mk_summary"].partitions == {}
+    assert read_manifest(out / "manifest.json").snapshots == manifest.snapshots
+    assert not list(out.glob("*.new")) and not list(out.glob("*.old"))
+
+
+def test_partitioned_snapshot_reads_prune_to_one_knesset(
+    tiny_warehouse: Path, tmp_path: Path
+) -> None:
+    out = tmp_path / "snapshots"
+    manifest = export_all(tiny_warehouse, out, partitioned=True)
+    entry = manifest.snapshots["bills_list"]
+    knesset = sorted(entry.partitions)[0].split("=")[1]
+
+    df = read_parquet_table(out / "bills_list", [int(knesset)], partition_column="knesset_num")
+    assert len(df) == entry.partitions[f"knesset_num={knesset}"].rows
+    assert set(df["knesset_num"]) == {int(knesset)}
+
+
+def test_partitioned_export_is_incremental_and_reversible(
+    tiny_warehouse: Path, tmp_path: Path
+) -> None:
+    out = tmp_path / "snapshots"
+    first = export_all(tiny_warehouse, out, partitioned=True)
+    second = export_all(tiny_warehouse, out, partitioned=True)
+    assert second.snapshots == first.snapshots
+
+    single = export_all(tiny_warehouse, out)
+    for name in PARTITIONED_SNAPSHOTS:
+        assert single.snapshots[name].partitions == {}
+        assert (out / f"{name}.parquet").exists()
+        assert not (out / name).exists()
@@ -344,3 +344,114 @@ def test_get_standard_faction_lookup_method(self):
         result_custom = SQLTemplates.get_standard_faction_lookup('custom_alias')
         assert 'StandardFactionLookup' in result_custom
         assert 'custom_alias.' in result_custom
+
+
+class TestDerivedTables:
+    """Tests for materializing the shared CTEs as physical tables."""
+
+    def test_materialize_builds_tables_whose_sources_exist(self, in_memory_db):
+        """Derived tables are built only when every source table is present."""
+        from data.queries.derived_tables import materialize_derived_tables
+
+        built = materialize_derived_tables(in_memory_db)
+
+        assert "DerivedStandardFactionLookup" in built
+        assert "DerivedBillFirstSubmission" in built
+        # KNS_Faction / UserFactionCoalitionStatus are not in the fixture
+        assert "DerivedMemberFactionCoalition" not in built
+
+    def test_rewritten_query_matches_inline_cte(self, in_memory_db):
+        """Queries read the derived table and return the same rows as the inline CTE."""
+        from data.queries.derived_tables import materialize_derived_tables, use_derived_tables
+        from ui.queries.sql_templates import SQLTemplates
+
+        query = f"""
+        WITH {SQLTemplates.STANDARD_FACTION_LOOKUP},
+        {SQLTemplates.BILL_FIRST_SUBMISSION}
+        SELECT bfs.BillID, bfs.FirstSubmissionDate, sfl.FactionID
+        FROM BillFirstSubmission bfs
+        LEFT JOIN KNS_BillInitiator bi ON bfs.BillID = bi.BillID AND bi.Ordinal = 1
+        LEFT JOIN StandardFactionLookup sfl ON bi.PersonID = sfl.PersonID AND sfl.rn = 1
+        ORDER BY bfs.BillID, sfl.FactionID
+        """
+        assert use_derived_tables(in_memory_db, query) == query
+
+        expected = in_memory_db.execute(query).fetchdf()
+        materialize_derived_tables(in_memory_db)
+        rewritten = use_derived_tables(in_memory_db, query)
+
+        assert '"DerivedStandardFactionLookup"' in rewritten
+        assert '"DerivedBillFirstSubmission"' in rewritten
+        assert in_memory_db.execute(rewritten).fetchdf().equals(expected)
+
+    def test_bound_slots_move_into_the_derived_scan(self, in_memory_db):
+        """A Knesset filter bound inside the CTE still applies after the rewrite."""
+        from data.queries.derived_tables import materialize_derived_tables, use_derived_tables
+        from data.queries.filter_slots import bind_filter_slots
+        from ui.queries.sql_templates import SQLTemplates
+
+        in_memory_db.execute("INSERT INTO KNS_Bill VALUES (4, 24, 118, '2020-01-01', '2020-06-01')")
+        template = f"""
+        WITH {SQLTemplates.BILL_FIRST_SUBMISSION}
+        SELECT bfs.BillID, bfs.FirstSubmissionDate
+        FROM BillFirstSubmission bfs
+        WHERE bfs.BillID <> ?
+        ORDER BY bfs.BillID
+        """
+        query, params = bind_filter_slots(template, {"knesset": lambda col: (f"{col} IN (?)", [25])})
+        params.append(3)
+
+        expected = in_memory_db.execute(query, params).fetchdf()
+        materialize_derived_tables(in_memory_db)
+        rewritten = use_derived_tables(in_memory_db, query)
+
+        assert (
+            '"DerivedBillFirstSubmission" WHERE BillID IN '
+            "(SELECT B.BillID FROM KNS_Bill B WHERE TRUE AND B.KnessetNum IN (?))"
+        ) in rewritten
+        result = in_memory_db.execute(rewritten, params).fetchdf()
+        assert result.equals(expected)
+        assert result["BillID"].tolist() == [1, 2]
+
+    def test_changed_source_drops_dependent_tables(self, in_memory_db):
+        """Replacing a source table drops only the derived tables built from it."""
+        from data.queries.derived_tables import (
+            drop_derived_tables_reading,
+            materialize_derived_tables,
+        )
+
+        materialize_derived_tables(in_memory_db)
+        dropped = drop_derived_tables_reading(in_memory_db, ["kns_persontoposition"])
+
+        assert dropped == ["DerivedStandardFactionLookup"]
+        remaining = {
+            row[0] for row in in_memory_db.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+        }
+        assert "DerivedStandardFactionLookup" not in remaining
+        assert "DerivedBillFirstSubmission" in remaining
+
+    def test_edited_cte_is_reported_as_unmatched(self):
+        """A derived CTE whose text drifted from the template is caught, not skipped."""
+        from data.queries.derived_tables import check_derived_ctes, unmatched_derived_ctes
+        from ui.queries.sql_templates import SQLTemplates
+
+        verbatim = f"WITH {SQLTemplates.BILL_FIRST_SUBMISSION} SELECT * FROM BillFirstSubmission"
+        edited = verbatim.replace("GROUP BY B.BillID", "GROUP BY  B.BillID")
+
+        assert unmatched_derived_ctes(verbatim) == []
+        assert unmatched_derived_ctes(edited) == ["BillFirstSubmission"]
+        check_derived_ctes(verbatim)
+        with pytest.raises(ValueError, match="BillFirstSubmission"):
+            check_derived_ctes(edited)
+
+    def test_every_pack_embeds_derived_ctes_verbatim(self):
+        """The registry only contains packs the derived-table rewrite applies to."""
+        from data.queries.derived_tables import DERIVED_TABLES, unmatched_derived_ctes
+        from data.queries.predefined_queries import PREDEFINED_QUERIES
+
+        embedded = set()
+        for query in PREDEFINED_QUERIES.values():
+            assert unmatched_derived_ctes(query["sql"]) == []
+            embedded.update(d.name for d in DERIVED_TABLES if d.cte in query["sql"])
+        assert "BillFirstSubmission" in embedded
+        assert "MemberFactionCoalition" in embedded
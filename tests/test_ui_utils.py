@@ -288,6 +288,16 @@ def test_file_exists(self, tmp_path):
         # Should contain today's date or recent date
         assert result != "Never (or N/A)"
 
+    def test_partition_directory_exists(self, tmp_path):
+        """Test get_last_updated_for_table for a KnessetNum-partitioned mirror."""
+        partition_dir = tmp_path / "KNS_Bill" / "KnessetNum=25"
+        partition_dir.mkdir(parents=True)
+        (partition_dir / "part-0.parquet").touch()
+
+        result = get_last_updated_for_table(tmp_path, "KNS_Bill")
+
+        assert "UTC" in result
+
     def test_file_not_exists(self, tmp_path):
         """Test get_last_updated_for_table when parquet file doesn't exist."""
         parquet_dir = tmp_path